@@ -40,6 +40,78 @@ def _add_input_arguments(parser):
         help="The name of the files to read the data from.")
 
 
+def _add_statistics_arguments(parser):
+    """
+    Add shared statistics arguments for GUI and TUI modes.
+    """
+
+    parser.add_argument(
+        "--quantiles",
+        choices=("exact", "sketch"),
+        default="exact",
+        help="Compute medians exactly or from streaming quantile sketches.")
+    parser.add_argument(
+        "--quantile-error",
+        type=float,
+        default=0.01,
+        help="Target rank error of sketch-mode medians (default: 0.01).")
+    parser.add_argument(
+        "--cache-size",
+        type=float,
+        default=64,
+        metavar="MIB",
+        help="Memory budget of the statistics cache in MiB; 0 disables "
+        "caching (default: 64).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Threads that evaluate statistics of different parameters and "
+        "features concurrently; 0 uses all cores (default: 1).")
+    parser.add_argument(
+        "--max-drift",
+        type=float,
+        default=None,
+        metavar="RATE",
+        help="Alert when E(TOT) drifts faster than RATE energy units per "
+        "simulation-time unit.")
+    parser.add_argument(
+        "--max-fluctuation",
+        type=float,
+        default=None,
+        metavar="RATIO",
+        help="Alert when the detrended E(TOT) RMS fluctuation exceeds RATIO "
+        "times the E(KIN) RMS fluctuation.")
+    parser.add_argument(
+        "--difference-spacing",
+        type=float,
+        default=None,
+        metavar="DT",
+        help="Resample difference plots onto a common time grid with step "
+        "DT instead of the reference run's time axis.")
+    parser.add_argument(
+        "--target-time",
+        type=float,
+        default=None,
+        metavar="T",
+        help="Estimate when every run reaches simulation time T from its "
+        "recent LOOPTIME throughput.")
+    parser.add_argument(
+        "--derive",
+        action="append",
+        default=[],
+        metavar="NAME=EXPR",
+        help="Add a derived column such as 'EQM_PER_ATOM=E(QM)/N(QM-ATOMS)' "
+        "or 'P_ATM[atm]=PRESSURE/1.01325'; may be repeated.")
+    parser.add_argument(
+        "--unit",
+        action="append",
+        default=[],
+        metavar="LABEL=UNIT",
+        help="Show a column in another unit, such as 'PRESSURE=GPa' or "
+        "'E(TOT)=kJ/mol'; may be repeated.")
+
+
 def _input_format(args, parser):
     """
     Resolve explicit input-format arguments into a reader format.
@@ -83,16 +155,46 @@ def main():
     )
     gui_parser = subparsers.add_parser("gui", help="Open the graphical app.")
     _add_input_arguments(gui_parser)
+    _add_statistics_arguments(gui_parser)
+    gui_parser.add_argument(
+        "--kde",
+        choices=("auto", "binned", "exact", "streaming"),
+        default="auto",
+        help="Histogram density estimate: binned FFT, exact gaussian_kde, "
+        "exact only for small series, or a live histogram updated with "
+        "appended rows (default: auto).")
     tui_parser = subparsers.add_parser(
         "tui",
         help="Open the terminal dashboard.",
     )
     _add_input_arguments(tui_parser)
+    _add_statistics_arguments(tui_parser)
 
     args = parser.parse_args()
     configure_logging()
 
-    from .readers import create_reader
+    if not 0 < args.quantile_error < 1:
+        parser.error("--quantile-error must be between zero and one.")
+    if args.cache_size < 0:
+        parser.error("--cache-size must not be negative.")
+    if args.workers < 0:
+        parser.error("--workers must not be negative.")
+    if args.max_drift is not None and args.max_drift <= 0:
+        parser.error("--max-drift must be greater than zero.")
+    if args.max_fluctuation is not None and args.max_fluctuation <= 0:
+        parser.error("--max-fluctuation must be greater than zero.")
+    if args.difference_spacing is not None and args.difference_spacing <= 0:
+        parser.error("--difference-spacing must be greater than zero.")
+    if args.target_time is not None and args.target_time <= 0:
+        parser.error("--target-time must be greater than zero.")
+
+    from .readers import ConvertedReader, DerivedReader, create_reader
+    from .statistics import ConservationLimits
+
+    conservation_limits = ConservationLimits(
+        max_drift=args.max_drift,
+        max_fluctuation_ratio=args.max_fluctuation,
+    )
 
     try:
         reader = create_reader(
@@ -104,14 +206,45 @@ def main():
             logger.error("%s", e)
         sys.exit(1)
 
+    if args.unit:
+        try:
+            reader = ConvertedReader(reader, args.unit)
+        except ValueError as error:
+            parser.error(f"--unit: {error}")
+
+    if args.derive:
+        try:
+            reader = DerivedReader(reader, args.derive)
+        except ValueError as error:
+            parser.error(f"--derive: {error}")
+
     if args.mode == "tui":
         from .apps import TuiApp
 
-        TuiApp(reader).run()
+        TuiApp(
+            reader,
+            quantile_mode=args.quantiles,
+            quantile_error=args.quantile_error,
+            cache_size=int(args.cache_size * 2**20),
+            workers=args.workers,
+            conservation_limits=conservation_limits,
+            difference_spacing=args.difference_spacing,
+            target_time=args.target_time,
+        ).run()
     else:
         from .apps import App
 
-        app = App(reader)
+        app = App(
+            reader,
+            quantile_mode=args.quantiles,
+            quantile_error=args.quantile_error,
+            cache_size=int(args.cache_size * 2**20),
+            kde_method=args.kde,
+            workers=args.workers,
+            conservation_limits=conservation_limits,
+            difference_spacing=args.difference_spacing,
+            target_time=args.target_time,
+        )
         app.build()
         app.mainloop()
 
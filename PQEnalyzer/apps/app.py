@@ -8,10 +8,18 @@ import customtkinter as ctk
 import matplotlib.pyplot as plt
 
 from .._logging import get_logger
-from ..plots import PlotDashboard, PlotTime, PlotHistogram
+from ..plots import (
+    PlotCorrelation,
+    PlotDashboard,
+    PlotFluctuation,
+    PlotHistogram,
+    PlotSpectrum,
+    PlotTime,
+)
 from ..plots.features import PLOT_FEATURES
 from ..plots.options import PlotOptions
 from ..plots.theme import apply_matplotlib_theme, resolve_appearance_mode
+from ..statistics import StatisticsCache, statistics_executor
 from .file_watcher import FileChangeWatcher
 from .app_layout import (
     configure_default_theme,
@@ -38,6 +46,25 @@ class App(ctk.CTk):
     ----------
     reader : Reader
         The reader object that contains the data.
+    quantile_mode : str
+        ``"exact"`` or ``"sketch"`` median evaluation for new plots.
+    quantile_error : float
+        Target rank error of sketch-mode medians.
+    kde_method : str
+        ``"auto"``, ``"binned"``, ``"exact"`` or ``"streaming"`` density
+        estimates for histogram plots.
+    statistics_cache : StatisticsCache
+        Statistic results shared by all plot windows.
+    conservation_limits : ConservationLimits or None
+        ``E(TOT)`` drift and fluctuation limits of the live monitor.
+    statistics_executor : concurrent.futures.Executor or None
+        Thread pool that evaluates plot statistics concurrently, or ``None``
+        for sequential evaluation.
+    difference_spacing : float or None
+        Time step of the common grid that differences are resampled onto,
+        or ``None`` to use the reference run's time axis.
+    target_time : float or None
+        Simulation time that the live monitor estimates ETAs for.
 
     Methods
     -------
@@ -45,7 +72,10 @@ class App(ctk.CTk):
         Create the GUI view objects and attach their widgets.
     """
 
-    def __init__(self, reader=None):
+    def __init__(self, reader=None, quantile_mode="exact",
+                 quantile_error=0.01, cache_size=64 * 2**20,
+                 kde_method="auto", workers=1, conservation_limits=None,
+                 difference_spacing=None, target_time=None):
         """
         Initialize the root window and derive selectable parameters.
         """
@@ -56,6 +86,14 @@ class App(ctk.CTk):
         configure_window(self)
 
         self.reader = reader
+        self.quantile_mode = quantile_mode
+        self.quantile_error = quantile_error
+        self.kde_method = kde_method
+        self.conservation_limits = conservation_limits
+        self.difference_spacing = difference_spacing
+        self.target_time = target_time
+        self.statistics_cache = StatisticsCache(cache_size)
+        self.statistics_executor = statistics_executor(workers)
         self.info = [
             *self.reader.energies[0].info
         ][1:]
@@ -74,6 +112,9 @@ class App(ctk.CTk):
         Destroy the app.
         """
         self.__stop_file_watcher()
+        executor = self.__dict__.get("statistics_executor")
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
         plt.close("all")
         self.quit()
         super().destroy()
@@ -176,6 +217,11 @@ class App(ctk.CTk):
 
             plot.refresh(show=show)
 
+        statistics_cache = self.__dict__.get("statistics_cache")
+        if statistics_cache is not None:
+            logger.debug("Statistics cache: %s",
+                         statistics_cache.stats().describe())
+
     def __schedule_auto_refresh(self):
         """
         Debounce file-change events into one GUI-thread refresh.
@@ -281,13 +327,15 @@ class App(ctk.CTk):
 
     def __plot_button_event(self, event):
         """
-        Create a time-series or histogram plot from the current GUI state.
+        Create a plot window from the current GUI state.
 
         Parameters
         ----------
         event : int
-            Plot selector: ``0`` creates a time plot, ``1`` creates a
-            histogram plot.
+            Plot selector: ``0`` creates a time plot, ``1`` a histogram plot,
+            ``2`` the live monitor, ``3`` the correlation heatmap, ``4`` a
+            power spectrum plot and ``5`` the fluctuation-property
+            convergence plot.
         """
 
         if event == 0:
@@ -296,6 +344,12 @@ class App(ctk.CTk):
             plot_factory = PlotHistogram
         elif event == 2:
             plot_factory = PlotDashboard
+        elif event == 3:
+            plot_factory = PlotCorrelation
+        elif event == 4:
+            plot_factory = PlotSpectrum
+        elif event == 5:
+            plot_factory = PlotFluctuation
         else:
             raise ValueError(f"Unknown plot event: {event}")
 
@@ -303,7 +357,7 @@ class App(ctk.CTk):
 
         self.list_of_plots.append(plot)
 
-        if event == 2:
+        if event in (2, 3, 5):
             self.select_plot(None)
             info_parameter = None
         else:
@@ -344,7 +398,13 @@ class App(ctk.CTk):
         if self.__syncing_plot_controls:
             return None
 
-        if self.difference.get():
+        derived_controls = [
+            self.__dict__.get(feature.option_attribute)
+            for feature in PLOT_FEATURES
+            if feature.replaces_main
+        ]
+        if any(control is not None and control.get()
+               for control in derived_controls):
             self.plot_main_data.set(True)
 
         if self.selected_plot is None:
@@ -364,13 +424,25 @@ class App(ctk.CTk):
         self.__syncing_plot_controls = True
         try:
             for feature in PLOT_FEATURES:
+                control = self.__dict__.get(feature.option_attribute)
+                if control is None:
+                    continue
                 self.__set_checkbox(
-                    getattr(self, feature.option_attribute),
+                    control,
                     getattr(options, feature.option_attribute),
                 )
             self.__set_checkbox(self.plot_main_data, options.plot_main)
             self.__set_entry(self.window_size, options.window_size)
-            if options.running_average:
+            reference = self.__dict__.get("difference_reference")
+            if reference is not None:
+                values = reference.cget("values")
+                reference.set(
+                    values[options.difference_reference % len(values)])
+            if any(
+                getattr(options, feature.option_attribute)
+                for feature in PLOT_FEATURES
+                if feature.windowed
+            ):
                 self.window_size.configure(state="normal")
             else:
                 self.window_size.configure(state="disabled")
@@ -15,6 +15,8 @@ from PIL import Image, ImageTk
 
 ICON_PATH = Path(__file__).resolve().parents[1] / "icons" / "icon.png"
 from ..plots.features import STATISTIC_FEATURES, TIME_SERIES_FEATURES
+from ..plots.labels import unique_path_labels
+from ..plots.options import reference_label
 
 
 def configure_default_theme():
@@ -130,7 +132,7 @@ class PlotControlsView:
                         sticky="nsew",
                         padx=(20, 20),
                         pady=(10, 10))
-        self.frame.grid_rowconfigure(4, weight=1)
+        self.frame.grid_rowconfigure(7, weight=1)
         self.frame.grid_columnconfigure(2, weight=1)
 
         self.auto_refresh = tkinter.BooleanVar()
@@ -212,6 +214,45 @@ class PlotControlsView:
                                    pady=(10, 10),
                                    sticky="nsew")
 
+        self.correlation_button = ctk.CTkButton(
+            master=self.frame,
+            border_width=2,
+            text="Correlations",
+            command=lambda: plot_button_callback(3),
+        )
+        self.correlation_button.grid(row=5,
+                                     column=0,
+                                     columnspan=2,
+                                     padx=(10, 10),
+                                     pady=(10, 10),
+                                     sticky="nsew")
+
+        self.spectrum_button = ctk.CTkButton(
+            master=self.frame,
+            border_width=2,
+            text="Spectrum",
+            command=lambda: plot_button_callback(4),
+        )
+        self.spectrum_button.grid(row=6,
+                                  column=0,
+                                  columnspan=2,
+                                  padx=(10, 10),
+                                  pady=(10, 10),
+                                  sticky="nsew")
+
+        self.fluctuation_button = ctk.CTkButton(
+            master=self.frame,
+            border_width=2,
+            text="Fluctuations",
+            command=lambda: plot_button_callback(5),
+        )
+        self.fluctuation_button.grid(row=7,
+                                     column=0,
+                                     columnspan=2,
+                                     padx=(10, 10),
+                                     pady=(10, 10),
+                                     sticky="nsew")
+
         app.plot_frame = self.frame
         app.auto_refresh = self.auto_refresh
         app.check_auto_refresh = self.auto_refresh_checkbox
@@ -221,6 +262,9 @@ class PlotControlsView:
         app.button_plot = self.plot_button
         app.button_hist = self.histogram_button
         app.button_dashboard = self.dashboard_button
+        app.button_correlation = self.correlation_button
+        app.button_spectrum = self.spectrum_button
+        app.button_fluctuation = self.fluctuation_button
 
 
 class ParameterSelectorView:
@@ -302,7 +346,7 @@ class StatisticsControlsView:
                                     padx=0,
                                     pady=0)
         self.time_series_frame.grid_rowconfigure(
-            len(TIME_SERIES_FEATURES) + 4,
+            len(TIME_SERIES_FEATURES) + 6,
             weight=1,
         )
         self.time_series_frame.grid_columnconfigure(0, weight=1)
@@ -360,6 +404,11 @@ class StatisticsControlsView:
                               sticky="we")
         self.window_size.configure(state="disabled")
 
+        self.difference_reference = None
+        filenames = getattr(app.__dict__.get("reader"), "filenames", [])
+        if len(filenames) > 1:
+            self.__create_reference_control(filenames)
+
         app.settings_frame = self.frame
         app.statistics_frame = self.statistics_frame
         app.time_series_frame = self.time_series_frame
@@ -368,6 +417,47 @@ class StatisticsControlsView:
         app.running_average_window_size_label = self.window_size_label
         app.window_size = self.window_size
 
+    def __create_reference_control(self, filenames):
+        """
+        Create the menu that selects the reference run of differences.
+        """
+
+        row = len(TIME_SERIES_FEATURES) + 3
+        self.difference_reference_label = ctk.CTkLabel(
+            self.time_series_frame,
+            text="Difference Reference:",
+            anchor="w",
+        )
+        self.difference_reference_label.grid(row=row,
+                                             column=0,
+                                             padx=10,
+                                             pady=5,
+                                             sticky="w")
+        values = [
+            reference_label(index, label)
+            for index, label in enumerate(unique_path_labels(filenames))
+        ]
+        self.difference_reference = ctk.CTkOptionMenu(
+            self.time_series_frame,
+            values=values,
+            command=lambda value: self.__reference_changed(),
+        )
+        self.difference_reference.set(values[-1])
+        self.difference_reference.grid(row=row + 1,
+                                       column=0,
+                                       padx=10,
+                                       pady=5,
+                                       sticky="we")
+        self.app.difference_reference = self.difference_reference
+
+    def __reference_changed(self):
+        """
+        Redraw the selected plot after a new difference reference is chosen.
+        """
+
+        if self.statistics_changed_callback is not None:
+            self.statistics_changed_callback()
+
     def __create_feature_control(self, frame, feature, row):
         """
         Create one registry-backed checkbox and expose it on the app.
@@ -384,24 +474,37 @@ class StatisticsControlsView:
         setattr(self.app, feature.option_attribute, control)
         self.feature_controls[feature.key] = control
 
-    def __enable_no_data_for_difference(self, feature):
+    def __enable_no_data_for_derived_series(self, feature):
         """
-        Hide raw series by default when plotting a derived difference.
+        Hide raw series by default when plotting a difference or ensemble.
         """
 
-        if feature.key == "difference" and self.difference.get():
+        if (
+            feature.replaces_main
+            and self.feature_controls[feature.key].get()
+        ):
             self.app.plot_main_data.set(True)
 
-    def __toggle_running_average_entry(self, feature):
+    def __toggle_window_entry(self, feature):
         """
-        Toggle the running-average window entry for the running-average feature.
+        Toggle the shared window entry for window-based smoothing features.
+
+        The entry stays enabled, keeping its value, while any other windowed
+        feature is still selected.
         """
 
-        if feature.key != "running_average":
+        if not feature.windowed:
+            return
+
+        if any(
+            self.feature_controls[other.key].get()
+            for other in TIME_SERIES_FEATURES
+            if other.windowed and other.key != feature.key
+        ):
             return
 
         self.app.toggle_entry_state(
-            self.running_average,
+            self.feature_controls[feature.key],
             self.window_size,
             default="10",
         )
@@ -412,8 +515,8 @@ class StatisticsControlsView:
         """
 
         def command():
-            self.__enable_no_data_for_difference(feature)
-            self.__toggle_running_average_entry(feature)
+            self.__enable_no_data_for_derived_series(feature)
+            self.__toggle_window_entry(feature)
             if self.statistics_changed_callback is not None:
                 self.statistics_changed_callback()
 
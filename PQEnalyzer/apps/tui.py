@@ -2,7 +2,6 @@
 Textual terminal dashboard for live simulation monitoring.
 """
 
-from dataclasses import dataclass
 from datetime import datetime
 
 import numpy as np
@@ -13,122 +12,77 @@ from textual.containers import Horizontal, Vertical
 from textual.widgets import DataTable, Footer, Header, Sparkline, Static
 
 from .._logging import get_logger
-from ..energy_access import concatenate_series, simulation_time
+from ..energy_access import concatenate_block, simulation_time
 from ..plots.features import (
     PLOT_FEATURES,
     PLOT_FEATURES_BY_KEY,
     enabled_feature_labels,
 )
+from ..plots.labels import unique_path_labels
 from ..plots.options import PlotOptions
+from ..plots.series_statistics import cached_statistic
 from ..plots.terminal_chart import build_terminal_chart
+from ..statistics import (
+    ConservationMonitor,
+    FluctuationMonitor,
+    LiveStatistics,
+    StatisticsCache,
+    ThroughputMonitor,
+    correlation_matrix,
+    statistics_executor,
+)
 from .file_watcher import FileChangeWatcher
+from .tui_summary import (
+    change_points_label,
+    decorrelation_label,
+    equilibration_label,
+    fluctuation_label,
+    format_value,
+    outliers_label,
+    summarize_parameters,
+)
 
 
 logger = get_logger(__name__)
 
 
-TREND_BLOCKS = "▁▂▃▄▅▆▇█"
-
-
-@dataclass(frozen=True)
-class ParameterSummary:
-    """
-    Dashboard-ready summary for one parameter.
-    """
-
-    parameter: str
-    unit: str
-    rows: int
-    latest: float
-    mean: float
-    median: float
-    std_dev: float
-    minimum: float
-    maximum: float
-    values: np.ndarray
-
-    @property
-    def trend(self) -> str:
-        """
-        Return a compact visual trend for table display.
-        """
-
-        return sparkline_text(self.values)
+FEATURES_PER_ROW = 3
 
 
-def summarize_parameter(energies, parameter: str) -> ParameterSummary:
-    """
-    Summarize one parameter across all loaded energy objects.
+def correlation_rows(matrix, parameters) -> list:
     """
+    Return compact correlation table rows with numbered parameter columns.
 
-    energy_series = concatenate_series(energies, parameter)
-    values = np.asarray(energy_series.values, dtype=float)
-
-    if values.size == 0:
-        latest = mean = median = std_dev = minimum = maximum = float("nan")
-    else:
-        latest = float(values[-1])
-        mean = float(np.nanmean(values))
-        median = float(np.nanmedian(values))
-        std_dev = float(np.nanstd(values))
-        minimum = float(np.nanmin(values))
-        maximum = float(np.nanmax(values))
-
-    return ParameterSummary(
-        parameter=parameter,
-        unit=energy_series.unit,
-        rows=int(values.size),
-        latest=latest,
-        mean=mean,
-        median=median,
-        std_dev=std_dev,
-        minimum=minimum,
-        maximum=maximum,
-        values=values,
-    )
-
-
-def sparkline_text(values, width=18) -> str:
+    Row labels carry the column number so wide matrices fit the terminal.
     """
-    Return a small unicode sparkline for a numeric series.
-    """
-
-    values = np.asarray(values, dtype=float)
-    values = values[np.isfinite(values)]
-    if values.size == 0:
-        return ""
 
-    if values.size > width:
-        indices = np.linspace(0, values.size - 1, width).astype(int)
-        values = values[indices]
-
-    minimum = float(np.min(values))
-    maximum = float(np.max(values))
-    if minimum == maximum:
-        return TREND_BLOCKS[0] * values.size
+    rows = []
+    for index, (parameter, coefficients) in enumerate(
+            zip(parameters, matrix), start=1):
+        rows.append([
+            f"{index} {parameter}",
+            *(
+                Text("n/a", style="#8b949e") if np.isnan(value) else Text(
+                    f"{value:+.2f}",
+                    style=correlation_style(value),
+                )
+                for value in coefficients
+            ),
+        ])
 
-    scaled = (values - minimum) / (maximum - minimum)
-    block_indices = np.clip(
-        np.round(scaled * (len(TREND_BLOCKS) - 1)).astype(int),
-        0,
-        len(TREND_BLOCKS) - 1,
-    )
-    return "".join(TREND_BLOCKS[index] for index in block_indices)
+    return rows
 
 
-def format_value(value) -> str:
+def correlation_style(value) -> str:
     """
-    Format a dashboard numeric value compactly without hiding scale.
+    Return the table style for one correlation coefficient.
     """
 
-    if not np.isfinite(value):
-        return "n/a"
-
-    magnitude = abs(value)
-    if magnitude != 0 and (magnitude < 1e-3 or magnitude >= 1e5):
-        return f"{value:.3e}"
-
-    return f"{value:.5g}"
+    if abs(value) >= 0.8:
+        return "bold #f85149" if value > 0 else "bold #58a6ff"
+    if abs(value) >= 0.4:
+        return "#ffa657" if value > 0 else "#79c0ff"
+    return "#8b949e"
 
 
 def feature_help_text() -> str:
@@ -136,27 +90,30 @@ def feature_help_text() -> str:
     Return compact feature help generated from the shared feature registry.
     """
 
-    first_row = "  ".join(
-        f"{feature.shortcut} {feature.short_label}"
-        for feature in PLOT_FEATURES[:3]
-    )
-    second_row = "  ".join(
-        f"{feature.shortcut} {feature.short_label}"
-        for feature in PLOT_FEATURES[3:5]
-    )
-    third_row = "  ".join(
-        f"{feature.shortcut} {feature.short_label}"
-        for feature in PLOT_FEATURES[5:]
-    )
+    rows = [
+        "  ".join(f"{feature.shortcut} {feature.short_label}"
+                  for feature in row)
+        for row in feature_rows(PLOT_FEATURES)
+    ]
     return "\n".join([
         "up/j down/k move  enter focus chart",
         "esc back  q quit  r refresh  w watch",
-        first_row,
-        second_row,
-        third_row,
+        "o correlations  X diff reference",
+        *rows,
     ])
 
 
+def feature_rows(features, size=FEATURES_PER_ROW) -> list:
+    """
+    Split features into fixed-size rows for compact terminal help.
+    """
+
+    return [
+        features[start:start + size]
+        for start in range(0, len(features), size)
+    ]
+
+
 class ParameterTable(DataTable):
     """
     Data table with vim-style row navigation.
@@ -193,7 +150,7 @@ class TuiApp(App):
     }
 
     #analysis-panel {
-        height: 17;
+        height: 23;
     }
 
     #plot-panel {
@@ -215,7 +172,8 @@ class TuiApp(App):
     }
 
     #status {
-        height: 4;
+        height: auto;
+        max-height: 6;
         color: #c9d1d9;
     }
 
@@ -237,11 +195,11 @@ class TuiApp(App):
     }
 
     #detail-stats {
-        height: 8;
+        height: 12;
     }
 
     #help {
-        height: 7;
+        height: 11;
         color: #8b949e;
     }
 
@@ -265,9 +223,22 @@ class TuiApp(App):
     }
 
     #chart-controls {
-        height: 6;
+        height: 10;
         color: #8b949e;
     }
+
+    #correlation-title {
+        height: 3;
+        border: tall #30363d;
+        padding: 0 1;
+        color: #58a6ff;
+        text-style: bold;
+    }
+
+    #correlations {
+        height: 1fr;
+        border: tall #1f6feb;
+    }
     """
 
     BINDINGS = [
@@ -276,6 +247,8 @@ class TuiApp(App):
         Binding("w", "toggle_watch", "Watch"),
         Binding("enter", "show_chart", "Chart"),
         Binding("escape", "show_dashboard", "Dashboard"),
+        Binding("o", "show_correlations", "Correlations"),
+        Binding("X", "cycle_difference_reference", "Reference"),
         Binding("j", "select_next_parameter", "Down"),
         Binding("k", "select_previous_parameter", "Up"),
         *[
@@ -288,9 +261,22 @@ class TuiApp(App):
         ],
     ]
 
-    def __init__(self, reader, watch=True):
+    def __init__(self, reader, watch=True, quantile_mode="exact",
+                 quantile_error=0.01, cache_size=64 * 2**20, workers=1,
+                 conservation_limits=None, difference_spacing=None,
+                 target_time=None):
         """
         Initialize the terminal dashboard.
+
+        ``quantile_mode`` selects exact medians or medians from incrementally
+        updated quantile sketches with the given target rank error.
+        ``cache_size`` is the memory budget in bytes for memoized chart
+        statistics. ``workers`` threads evaluate summaries and chart overlays
+        concurrently; ``0`` uses all cores. ``conservation_limits`` sets the
+        ``E(TOT)`` drift and fluctuation limits that raise an alert in the
+        status bar. ``difference_spacing`` resamples difference charts onto
+        a common grid with that time step. ``target_time`` is the simulation
+        time that the throughput ETA of every run is estimated for.
         """
 
         super().__init__()
@@ -303,7 +289,25 @@ class TuiApp(App):
         self.summaries = {}
         self.active_view = "dashboard"
         self.chart_options = PlotOptions.with_enabled("mean", "median")
+        self.chart_options.quantile_mode = quantile_mode
+        self.chart_options.difference_spacing = difference_spacing
         self.running_average_window_size = 20
+        self.live_statistics = LiveStatistics(quantile_error)
+        self.statistics_cache = StatisticsCache(cache_size)
+        self.statistics_executor = statistics_executor(workers)
+        self.conservation_monitor = (
+            ConservationMonitor(conservation_limits)
+            if ConservationMonitor.supports(self.reader.energies) else None
+        )
+        self.throughput_monitor = (
+            ThroughputMonitor(target_time,
+                              executor=self.statistics_executor)
+            if ThroughputMonitor.supports(self.reader.energies) else None
+        )
+        self.fluctuation_monitor = (
+            FluctuationMonitor(executor=self.statistics_executor)
+            if FluctuationMonitor.supports(self.reader.energies) else None
+        )
 
     def compose(self):
         """
@@ -329,6 +333,9 @@ class TuiApp(App):
             yield Static(id="chart-title")
             yield Static(id="chart-canvas")
             yield Static(id="chart-controls")
+        with Vertical(id="correlation-view", classes="hidden"):
+            yield Static(id="correlation-title")
+            yield DataTable(id="correlations", cursor_type="none")
         yield Footer()
 
     def on_mount(self) -> None:
@@ -349,6 +356,7 @@ class TuiApp(App):
             "Mean",
             "Min",
             "Max",
+            "Drift",
         )
 
         self.refresh_dashboard(read_file=False)
@@ -359,10 +367,12 @@ class TuiApp(App):
 
     def on_unmount(self) -> None:
         """
-        Stop the file watcher when the terminal app exits.
+        Stop the file watcher and statistics threads when the app exits.
         """
 
         self.stop_file_watcher()
+        if self.statistics_executor is not None:
+            self.statistics_executor.shutdown(wait=False, cancel_futures=True)
 
     def on_data_table_row_highlighted(
             self, event: DataTable.RowHighlighted) -> None:
@@ -422,6 +432,15 @@ class TuiApp(App):
         self.update_detail(self.selected_parameter())
         self.focus_parameter_table()
 
+    def action_show_correlations(self) -> None:
+        """
+        Switch to the correlation table of all parameters.
+        """
+
+        self.active_view = "correlation"
+        self.sync_view()
+        self.render_correlations()
+
     def action_select_next_parameter(self) -> None:
         """
         Select the next parameter using vim-style navigation.
@@ -436,6 +455,16 @@ class TuiApp(App):
 
         self.select_relative_parameter(-1)
 
+    def action_cycle_difference_reference(self) -> None:
+        """
+        Use the next input file as the reference run of differences.
+        """
+
+        runs = len(self.reader.energies)
+        reference = self.chart_options.difference_reference % runs
+        self.chart_options.difference_reference = (reference + 1) % runs
+        self.render_active_statistics()
+
     def action_toggle_feature(self, feature_key) -> None:
         """
         Toggle one registry-backed chart feature.
@@ -444,8 +473,11 @@ class TuiApp(App):
         feature = PLOT_FEATURES_BY_KEY[feature_key]
         enabled = not getattr(self.chart_options, feature.option_attribute)
         setattr(self.chart_options, feature.option_attribute, enabled)
-        if feature.key == "difference":
+        if feature.replaces_main:
             self.chart_options.plot_main = enabled
+        if feature.key in ("discard_equilibration", "outliers"):
+            self.update_summaries()
+            self.render_table()
         self.render_active_statistics()
 
     def render_active_statistics(self) -> None:
@@ -514,32 +546,56 @@ class TuiApp(App):
                 self.refresh_warning = None
 
         self.last_refresh = datetime.now()
-        self.summaries = {
-            parameter: summarize_parameter(self.reader.energies, parameter)
-            for parameter in self.info
-        }
+        self.update_summaries()
+        if self.conservation_monitor is not None:
+            self.conservation_monitor.update(self.reader.energies)
+        if self.throughput_monitor is not None:
+            self.throughput_monitor.update(
+                self.reader.energies,
+                unique_path_labels(self.reader.filenames),
+            )
+        if self.fluctuation_monitor is not None:
+            self.fluctuation_monitor.update(self.reader.energies)
         self.render_status()
         self.render_table()
         self.render_chart_controls()
         if self.active_view == "chart":
             self.render_chart()
+        elif self.active_view == "correlation":
+            self.render_correlations()
         else:
             self.update_detail(self.selected_parameter())
             self.focus_parameter_table()
 
+    def update_summaries(self) -> None:
+        """
+        Recompute dashboard summaries with the current statistic options.
+        """
+
+        live = (
+            self.live_statistics
+            if self.chart_options.quantile_mode == "sketch" else None
+        )
+        self.summaries = summarize_parameters(
+            self.reader.energies,
+            self.info,
+            live=live,
+            discard_equilibration=self.chart_options.discard_equilibration,
+            executor=self.statistics_executor,
+            exclude_outliers=self.chart_options.outliers,
+        )
+
     def sync_view(self) -> None:
         """
-        Show the active TUI view and hide the inactive one.
+        Show the active TUI view and hide the inactive ones.
         """
 
-        dashboard = self.query_one("#dashboard-view")
-        chart = self.query_one("#chart-view")
-        if self.active_view == "chart":
-            dashboard.add_class("hidden")
-            chart.remove_class("hidden")
-        else:
-            chart.add_class("hidden")
-            dashboard.remove_class("hidden")
+        for view in ("dashboard", "chart", "correlation"):
+            widget = self.query_one(f"#{view}-view")
+            if view == self.active_view:
+                widget.remove_class("hidden")
+            else:
+                widget.add_class("hidden")
 
     def focus_parameter_table(self) -> None:
         """
@@ -590,11 +646,30 @@ class TuiApp(App):
         status.append(self.watch_label, style="bold #3fb950")
         status.append("  Updated ", style="#8b949e")
         status.append(updated, style="bold #e6edf3")
+        status.append("  Cache ", style="#8b949e")
+        status.append(self.statistics_cache.stats().describe(),
+                      style="#c9d1d9")
         status.append("\n")
         status.append(" | ".join(file_rows), style="#c9d1d9")
 
-        if self.refresh_warning:
+        throughput = getattr(self.throughput_monitor, "status", None)
+        if throughput is not None:
+            status.append("\n")
+            status.append(
+                throughput.describe(),
+                style="bold #f85149" if throughput.alarm else "#3fb950",
+            )
+
+        conservation = getattr(self.conservation_monitor, "status", None)
+        if conservation is not None or self.refresh_warning:
             status.append("\n")
+        if conservation is not None:
+            status.append(
+                conservation.describe(),
+                style="bold #f85149" if conservation.alarm else "#3fb950",
+            )
+        if self.refresh_warning:
+            status.append("  " if conservation is not None else "")
             status.append(f"Warning: {self.refresh_warning}",
                           style="bold #f85149")
 
@@ -619,6 +694,7 @@ class TuiApp(App):
                 format_value(summary.mean),
                 format_value(summary.minimum),
                 format_value(summary.maximum),
+                format_value(summary.drift),
                 key=parameter,
             )
 
@@ -648,6 +724,8 @@ class TuiApp(App):
         finite_values = summary.values[np.isfinite(summary.values)]
         trend.data = finite_values.tolist()
 
+        options = self.chart_options
+        data_version = getattr(self.reader, "data_version", None)
         stats = "\n".join([
             f"Latest: {format_value(summary.latest)}  "
             f"Mean: {format_value(summary.mean)}",
@@ -655,8 +733,18 @@ class TuiApp(App):
             f"Std: {format_value(summary.std_dev)}",
             f"Min: {format_value(summary.minimum)}  "
             f"Max: {format_value(summary.maximum)}",
-            f"Range: {format_value(summary.maximum - summary.minimum)}",
-            "",
+            f"Range: {format_value(summary.maximum - summary.minimum)}"
+            + outliers_label(summary, options),
+            f"Drift: {format_value(summary.drift)} "
+            f"± {format_value(summary.drift_stderr)} "
+            f"{summary.unit}/{summary.time_unit}",
+            equilibration_label(summary, options),
+            decorrelation_label(summary, options, self.statistics_cache,
+                                data_version),
+            change_points_label(summary, self.reader.energies, options,
+                                self.statistics_cache, data_version,
+                                self.live_statistics),
+            fluctuation_label(summary, self.fluctuation_monitor),
             f"Chart stats: {self.statistics_label}",
         ])
         self.query_one("#detail-stats", Static).update(stats)
@@ -673,7 +761,7 @@ class TuiApp(App):
         )
         controls.append("Stats: ", style="bold #8b949e")
         for index, feature in enumerate(PLOT_FEATURES):
-            if index == len(PLOT_FEATURES) // 2:
+            if index > 0 and index % FEATURES_PER_ROW == 0:
                 controls.append("\n")
             elif index > 0:
                 controls.append(" | ", style="#8b949e")
@@ -719,12 +807,44 @@ class TuiApp(App):
                 width=width,
                 height=height,
                 options=self.chart_options,
+                live=self.live_statistics,
+                cache=self.statistics_cache,
+                executor=self.statistics_executor,
             )
         except ValueError as error:
             canvas.update(Text(str(error), style="bold #f85149"))
         else:
             canvas.update(Text.from_ansi(chart))
 
+    def render_correlations(self) -> None:
+        """
+        Render the Pearson correlation matrix of all parameters.
+        """
+
+        matrix = cached_statistic(
+            self.statistics_cache,
+            getattr(self.reader, "data_version", None),
+            ("correlation", tuple(self.info)),
+            lambda: correlation_matrix(
+                concatenate_block(self.reader.energies, self.info)),
+        )
+        rows = sum(len(energy.simulation_time)
+                   for energy in self.reader.energies)
+        self.query_one("#correlation-title", Static).update(
+            Text.assemble(
+                ("Parameter correlations", "bold #58a6ff"),
+                f"  Pearson r over {rows} rows  esc back",
+            ))
+
+        table = self.query_one("#correlations", DataTable)
+        table.clear(columns=True)
+        table.add_columns(
+            "Parameter",
+            *(str(index) for index in range(1, len(self.info) + 1)),
+        )
+        for row in correlation_rows(matrix, self.info):
+            table.add_row(*row)
+
     def selected_parameter(self):
         """
         Return the currently highlighted parameter.
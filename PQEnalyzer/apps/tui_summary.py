@@ -0,0 +1,317 @@
+"""
+Parameter summaries and detail-panel labels for the terminal dashboard.
+
+These helpers turn loaded energy data into the rows and text shown by
+``TuiApp`` and do not depend on Textual, so they can be tested without
+running the app.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..energy_access import (
+    concatenate_block,
+    concatenate_time,
+    parameter_unit,
+    time_unit,
+)
+from ..plots.series_statistics import (
+    cached_statistic,
+    change_point_rows,
+    statistics_key,
+    statistics_series,
+)
+from ..statistics import (
+    detect_equilibration,
+    linear_drift,
+    ordered_map,
+    outlier_mask,
+    subsampling_stride,
+    summarize_columns,
+)
+
+
+TREND_BLOCKS = "▁▂▃▄▅▆▇█"
+
+LISTED_CHANGE_POINTS = 4
+# Change points listed in the detail panel; later ones are only counted.
+
+
+@dataclass(frozen=True)
+class ParameterSummary:
+    """
+    Dashboard-ready summary for one parameter.
+    """
+
+    parameter: str
+    unit: str
+    rows: int
+    latest: float
+    mean: float
+    median: float
+    std_dev: float
+    minimum: float
+    maximum: float
+    values: np.ndarray
+    equilibration_start: int = 0
+    drift: float = float("nan")
+    drift_stderr: float = float("nan")
+    outliers: int = 0
+    time_unit: str = "time"
+
+    @property
+    def trend(self) -> str:
+        """
+        Return a compact visual trend for table display.
+        """
+
+        return sparkline_text(self.values)
+
+
+def summarize_parameter(energies, parameter: str, live=None,
+                        discard_equilibration=False, executor=None,
+                        exclude_outliers=False) -> ParameterSummary:
+    """
+    Summarize one parameter across all loaded energy objects.
+    """
+
+    return summarize_parameters(
+        energies,
+        [parameter],
+        live=live,
+        discard_equilibration=discard_equilibration,
+        executor=executor,
+        exclude_outliers=exclude_outliers,
+    )[parameter]
+
+
+def summarize_parameters(energies, parameters, live=None,
+                         discard_equilibration=False, executor=None,
+                         exclude_outliers=False) -> dict:
+    """
+    Summarize several parameters from one batched column-wise pass.
+
+    All parameters are concatenated into a single ``(rows, parameters)``
+    block and reduced together. When ``live`` state is supplied, medians come
+    from its incrementally updated quantile sketches instead, unless outliers
+    are excluded. With ``discard_equilibration`` the reductions skip rows
+    before each column's detected equilibration start; row count, latest
+    value and trend keep all rows. With ``exclude_outliers`` they also skip
+    rolling median/MAD spikes, which are counted per parameter; ``live``
+    detectors then only rescan the tail of each column, and medians are
+    exact. Drift is the least-squares slope per unit simulation time, fitted
+    for all columns at once. With an ``executor``, column reductions,
+    equilibration detection and per-column drift fits run concurrently.
+    """
+
+    parameters = list(parameters)
+    block = concatenate_block(energies, parameters)
+    time = concatenate_time(energies)
+    starts = np.zeros(len(parameters), dtype=int)
+    if discard_equilibration and block.shape[0] > 0:
+        starts = np.array(ordered_map(
+            lambda column: detect_equilibration(block[:, column]).start,
+            range(len(parameters)),
+            executor,
+        ), dtype=int)
+
+    # the sketches summarize every row, so they cannot skip outliers
+    sketched = live is not None and not exclude_outliers
+    excluded = None
+    if exclude_outliers and block.shape[0] > 0:
+
+        def detect(column):
+            values = block[starts[column]:, column]
+            if live is None:
+                return outlier_mask(values)
+            return live.outliers(parameters[column], values, starts[column])
+
+        # live detectors share one registry, so only offline scans run pooled
+        masks = ordered_map(detect, range(len(parameters)),
+                            executor if live is None else None)
+        excluded = np.zeros(block.shape, dtype=bool)
+        for column, mask in enumerate(masks):
+            excluded[starts[column]:, column] = mask
+
+    summary = summarize_columns(
+        block,
+        starts=starts if discard_equilibration else None,
+        executor=executor,
+        excluded=excluded,
+        median=not sketched,
+    )
+    if discard_equilibration:
+        drifts = ordered_map(
+            lambda column: linear_drift(time[starts[column]:],
+                                        block[starts[column]:, column]),
+            range(len(parameters)),
+            executor,
+        )
+        drift = np.array([result.slope for result in drifts])
+        drift_stderr = np.array([result.stderr for result in drifts])
+    else:
+        drift_result = linear_drift(time, block)
+        drift = drift_result.slope
+        drift_stderr = drift_result.stderr
+
+    summaries = {}
+    for column, parameter in enumerate(parameters):
+        values = block[:, column]
+        median = float(summary.median[column])
+        if sketched and values.size > 0:
+            median = live.quantiles(parameter, values[starts[column]:],
+                                    starts[column]).median()
+
+        summaries[parameter] = ParameterSummary(
+            parameter=parameter,
+            unit=parameter_unit(energies[0], parameter),
+            rows=int(summary.rows),
+            latest=float(summary.latest[column]),
+            mean=float(summary.mean[column]),
+            median=median,
+            std_dev=float(summary.std_dev[column]),
+            minimum=float(summary.minimum[column]),
+            maximum=float(summary.maximum[column]),
+            values=values,
+            equilibration_start=int(starts[column]),
+            drift=float(np.atleast_1d(drift)[column]),
+            drift_stderr=float(np.atleast_1d(drift_stderr)[column]),
+            outliers=(0 if excluded is None
+                      else int(np.count_nonzero(excluded[:, column]))),
+            time_unit=time_unit(energies[0]),
+        )
+
+    return summaries
+
+
+def sparkline_text(values, width=18) -> str:
+    """
+    Return a small unicode sparkline for a numeric series.
+    """
+
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        return ""
+
+    if values.size > width:
+        indices = np.linspace(0, values.size - 1, width).astype(int)
+        values = values[indices]
+
+    minimum = float(np.min(values))
+    maximum = float(np.max(values))
+    if minimum == maximum:
+        return TREND_BLOCKS[0] * values.size
+
+    scaled = (values - minimum) / (maximum - minimum)
+    block_indices = np.clip(
+        np.round(scaled * (len(TREND_BLOCKS) - 1)).astype(int),
+        0,
+        len(TREND_BLOCKS) - 1,
+    )
+    return "".join(TREND_BLOCKS[index] for index in block_indices)
+
+
+def format_value(value) -> str:
+    """
+    Format a dashboard numeric value compactly without hiding scale.
+    """
+
+    if not np.isfinite(value):
+        return "n/a"
+
+    magnitude = abs(value)
+    if magnitude != 0 and (magnitude < 1e-3 or magnitude >= 1e5):
+        return f"{value:.3e}"
+
+    return f"{value:.5g}"
+
+
+def equilibration_label(summary, options) -> str:
+    """
+    Return the detail-panel line describing discarded equilibration rows.
+    """
+
+    if not options.discard_equilibration:
+        return ""
+
+    return (f"Equilibrated from row {summary.equilibration_start} "
+            f"of {summary.rows}")
+
+
+def outliers_label(summary, options) -> str:
+    """
+    Return the Range-line suffix counting excluded outlier rows.
+    """
+
+    if not options.outliers:
+        return ""
+
+    return f"  Outliers: {summary.outliers}"
+
+
+def decorrelation_label(summary, options, cache=None,
+                        data_version=None) -> str:
+    """
+    Return the detail-panel line describing the decorrelated subsample.
+    """
+
+    if not options.decorrelate:
+        return ""
+
+    values = summary.values[summary.equilibration_start:]
+    stride = cached_statistic(
+        cache,
+        data_version,
+        ("stride", summary.parameter, summary.equilibration_start),
+        lambda: subsampling_stride(values),
+    )
+    samples = -(-values.size // stride)
+    return f"Decorrelated: stride {stride}, {samples} samples"
+
+
+def change_points_label(summary, energies, options, cache=None,
+                        data_version=None, live=None) -> str:
+    """
+    Return the detail-panel line listing detected regime changes.
+    """
+
+    if not options.change_points:
+        return ""
+
+    energy_series = cached_statistic(
+        cache,
+        data_version,
+        (summary.parameter, "series", *statistics_key(options)),
+        lambda: statistics_series(energies, summary.parameter, options),
+    )
+    rows = cached_statistic(
+        cache,
+        data_version,
+        (summary.parameter, "change_point_rows", *statistics_key(options)),
+        lambda: change_point_rows(energy_series, options, live),
+    )
+    if len(rows) == 0:
+        return "Changes: none"
+
+    # statistics series may start after the discarded equilibration
+    offset = summary.rows - energy_series.values.size
+    listed = ", ".join(str(offset + row)
+                       for row in rows[:LISTED_CHANGE_POINTS])
+    more = len(rows) - LISTED_CHANGE_POINTS
+    return (f"Changes: rows {listed}"
+            + (f" +{more} more" if more > 0 else ""))
+
+
+def fluctuation_label(summary, monitor) -> str:
+    """
+    Return the detail-panel line with the property derived from the
+    fluctuations of the selected parameter.
+    """
+
+    estimate = getattr(monitor, "status", {}).get(summary.parameter)
+    if estimate is None:
+        return ""
+
+    return estimate.describe()
@@ -7,7 +7,7 @@ mapping. This module keeps that fallback in one place so plots and statistics
 do not need to know PQAnalysis internals.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 import numpy as np
 
@@ -44,12 +44,16 @@ class EnergySeries:
         Original PQ info parameter label.
     unit : str
         Display unit for ``values``.
+    start : int
+        Row of the full series that ``values`` begin at, for example after a
+        discarded equilibration.
     """
 
     time: np.ndarray
     values: np.ndarray
     label: str
     unit: str
+    start: int = 0
 
 
 def parameter_values(energy, info_parameter: str) -> np.ndarray:
@@ -92,6 +96,17 @@ def simulation_time(energy) -> np.ndarray:
     return np.asarray(energy.simulation_time)
 
 
+def time_unit(energy) -> str:
+    """
+    Return the simulation-time unit, or ``"time"`` if the reader has none.
+    """
+
+    try:
+        return parameter_unit(energy, "SIMULATION-TIME")
+    except KeyError:
+        return "time"
+
+
 def series(energy, info_parameter: str) -> EnergySeries:
     """
     Return one file's normalized parameter series for plotting.
@@ -122,6 +137,32 @@ def concatenate_parameter(energies: list, info_parameter: str) -> np.ndarray:
         [parameter_values(energy, info_parameter) for energy in energies])
 
 
+def concatenate_block(energies: list, parameters: list) -> np.ndarray:
+    """
+    Concatenate several parameters into one ``(rows, parameters)`` block.
+
+    The block is column-major, so each parameter occupies one contiguous
+    column and column-wise reductions stream through memory once.
+    """
+
+    columns = [[parameter_values(energy, parameter)
+                for parameter in parameters]
+               for energy in energies]
+    sizes = [
+        len(energy_columns[0]) if energy_columns else 0
+        for energy_columns in columns
+    ]
+    block = np.empty((sum(sizes), len(parameters)), order="F")
+
+    start = 0
+    for energy_columns, size in zip(columns, sizes):
+        for column, values in enumerate(energy_columns):
+            block[start:start + size, column] = values
+        start += size
+
+    return block
+
+
 def concatenate_series(energies: list, info_parameter: str) -> EnergySeries:
     """
     Return one normalized parameter series across multiple energy files.
@@ -140,30 +181,142 @@ def concatenate_series(energies: list, info_parameter: str) -> EnergySeries:
 
 def difference_series(energies: list, info_parameter: str) -> EnergySeries:
     """
-    Return the pointwise difference between two aligned energy series.
+    Return the pointwise difference between two energy series.
 
-    The returned values are ``first - second``. Simulation-time axes must match
-    exactly so the subtraction never hides shifted or differently sampled runs.
+    The returned values are ``first - second`` on the second file's
+    simulation-time axis, see ``difference_stack``.
     """
 
     if len(energies) != 2:
         raise ValueError(
             "Difference plotting requires exactly two input files.")
 
-    first = series(energies[0], info_parameter)
-    second = series(energies[1], info_parameter)
+    stack = difference_stack(energies, info_parameter)
+    return replace(stack, values=stack.values[0])
+
+
+def difference_stack(energies: list, info_parameter: str, reference=-1,
+                     spacing=None) -> EnergySeries:
+    """
+    Return the differences of all runs to a reference run.
+
+    Runs are compared on the reference's simulation-time axis, or, with a
+    ``spacing``, on an evenly spaced grid, limited to the time range covered
+    by every run. Runs sampled on other axes are linearly interpolated onto
+    that grid; runs that already share it are subtracted directly.
+
+    Parameters
+    ----------
+    energies : list
+        Energy objects of all runs.
+    info_parameter : str
+        The info parameter to compare.
+    reference : int, optional
+        Reader index of the reference run; the last run by default.
+    spacing : float, optional
+        Time step of a common resampling grid.
+
+    Returns
+    -------
+    EnergySeries
+        ``values`` has one row per non-reference run in reader order, each
+        holding ``run - reference``.
+
+    Raises
+    ------
+    ValueError
+        If fewer than two runs are given, the reference index or spacing is
+        invalid, or the runs do not overlap in simulation time.
+    """
+
+    if len(energies) < 2:
+        raise ValueError(
+            "Difference plotting requires at least two input files.")
+
+    if not -len(energies) <= reference < len(energies):
+        raise ValueError(
+            f"Difference reference {reference} is not an input file index.")
+
+    if spacing is not None and not spacing > 0:
+        raise ValueError("Difference spacing must be positive.")
+
+    runs = [series(energy, info_parameter) for energy in energies]
+    reference = reference % len(runs)
+    if any(run.time.size == 0 for run in runs):
+        raise ValueError(
+            "Difference plotting requires overlapping simulation-time axes.")
+
+    start = max(run.time[0] for run in runs)
+    end = min(run.time[-1] for run in runs)
+    if spacing is None:
+        grid = runs[reference].time
+        grid = grid[(grid >= start) & (grid <= end)]
+    else:
+        grid = start + spacing * np.arange(
+            int(np.floor((end - start) / spacing + 1e-9)) + 1)
+    if end < start or grid.size == 0:
+        raise ValueError(
+            "Difference plotting requires overlapping simulation-time axes.")
+
+    aligned = np.stack([_values_on_grid(run, grid) for run in runs])
+    others = [index for index in range(len(runs)) if index != reference]
+
+    return EnergySeries(
+        time=grid,
+        values=aligned[others] - aligned[reference],
+        label=info_parameter,
+        unit=runs[reference].unit,
+    )
+
+
+def _values_on_grid(energy_series: EnergySeries, grid) -> np.ndarray:
+    """
+    Return series values at the grid times, interpolating if needed.
+    """
+
+    time, values = energy_series.time, energy_series.values
+    if time.shape == grid.shape and np.array_equal(time, grid):
+        return values
+
+    if np.any(np.diff(time) <= 0):
+        raise ValueError(
+            "Difference plotting requires increasing simulation-time axes.")
+
+    # locate every grid time between two samples in one sorted search
+    right = np.clip(np.searchsorted(time, grid), 1, time.size - 1)
+    left = right - 1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = (grid - time[left]) / (time[right] - time[left])
+
+    return values[left] + weight * (values[right] - values[left])
 
-    if (
-        first.time.shape != second.time.shape
-        or first.values.shape != second.values.shape
-        or not np.array_equal(first.time, second.time)
+
+def stack_series(energies: list, info_parameter: str) -> EnergySeries:
+    """
+    Return aligned replica series stacked into one ``(replicas, steps)`` array.
+
+    Replicas of a live ensemble may have written different numbers of rows,
+    so the stack is truncated to the shortest file. The common
+    simulation-time prefix must match exactly.
+    """
+
+    if len(energies) < 2:
+        raise ValueError(
+            "Ensemble plotting requires at least two input files.")
+
+    replicas = [series(energy, info_parameter) for energy in energies]
+    steps = min(replica.values.size for replica in replicas)
+    time = replicas[0].time[:steps]
+    if any(
+        not np.array_equal(replica.time[:steps], time)
+        for replica in replicas[1:]
     ):
         raise ValueError(
-            "Difference plotting requires matching simulation-time axes.")
+            "Ensemble plotting requires matching simulation-time axes.")
 
     return EnergySeries(
-        time=first.time,
-        values=first.values - second.values,
+        time=time,
+        values=np.stack([replica.values[:steps] for replica in replicas]),
         label=info_parameter,
-        unit=first.unit,
+        unit=replicas[0].unit,
     )
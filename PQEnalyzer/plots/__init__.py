@@ -2,7 +2,10 @@
 Plot implementations for GUI and terminal rendering.
 """
 
+from .plot_correlation import PlotCorrelation
 from .plot_histogram import PlotHistogram
 from .plot_dashboard import PlotDashboard
+from .plot_fluctuation import PlotFluctuation
+from .plot_spectrum import PlotSpectrum
 from .plot_time import PlotTime
 from .terminal_chart import build_terminal_chart
@@ -2,13 +2,34 @@
 Shared plot feature definitions and evaluators.
 """
 
+import functools
 from dataclasses import dataclass, field
 
-from ..energy_access import (
-    concatenate_series,
-    difference_series,
+import numpy as np
+
+from ..energy_access import difference_stack, stack_series
+from ..statistics import Statistic, block_bootstrap, ensemble_statistics
+from .series_statistics import (
+    cached_statistic,
+    change_point_rows,
+    decorrelated_series,
+    inlier_series,
+    median_sketch,
+    outlier_rows,
+    percentile_band_stride,
+    rolling_quantiles,
+    running_average_window,
+    statistics_key,
+    statistics_series,
 )
-from ..statistics import Statistic
+from .value_readout import format_readout_value
+
+
+PERCENTILE_BAND = (0.05, 0.95)
+# Lower and upper quantiles of the rolling percentile band.
+
+CONFIDENCE_LEVEL = 0.95
+# Confidence level of bootstrap intervals around means and medians.
 
 
 @dataclass(frozen=True)
@@ -25,6 +46,9 @@ class PlotFeature:
     time_series: bool = True
     histogram: bool = False
     default: bool = False
+    windowed: bool = False
+    replaces_main: bool = False
+    points: bool = False
     matplotlib_style: dict = field(default_factory=dict)
 
     @property
@@ -55,8 +79,30 @@ class PlotFeature:
             return "self-corr"
         if self.key == "difference":
             return "difference"
+        if self.key == "ensemble":
+            return "ensemble"
         if self.key == "running_average":
             return "running avg"
+        if self.key == "discard_equilibration":
+            return "equilibrated"
+        if self.key == "decorrelate":
+            return "decorrelated"
+        if self.key == "confidence_interval":
+            return "ci"
+        if self.key == "trend":
+            return "trend"
+        if self.key == "exponential_moving_average":
+            return "ema"
+        if self.key == "savitzky_golay":
+            return "savgol"
+        if self.key == "rolling_std":
+            return "std band"
+        if self.key == "rolling_min_max":
+            return "min/max band"
+        if self.key == "rolling_percentile":
+            return "pct band"
+        if self.key == "change_points":
+            return "changes"
         return self.label.lower()
 
 
@@ -64,23 +110,94 @@ class PlotFeature:
 class PlotSeries:
     """
     A computed time-series overlay.
+
+    Band overlays also carry ``lower`` and ``upper`` edges aligned with
+    ``time``; ``values`` is then the band center. Marker overlays have no
+    ``values`` and are drawn as vertical lines at ``time``. Point overlays
+    mark single rows and are drawn without connecting lines.
     """
 
     feature: PlotFeature
     label: str
     time: object
     values: object
+    lower: object = None
+    upper: object = None
+
+    @property
+    def band(self):
+        """
+        Return whether the overlay is drawn as a shaded band.
+        """
+
+        return self.lower is not None and self.upper is not None
+
+    @property
+    def markers(self):
+        """
+        Return whether the overlay is drawn as vertical marker lines.
+        """
+
+        return self.values is None
+
+    @property
+    def points(self):
+        """
+        Return whether the overlay is drawn as unconnected points.
+        """
+
+        return self.feature.points
 
 
 @dataclass(frozen=True)
 class HistogramGuide:
     """
     A computed vertical guide for histogram plots.
+
+    Interval guides also carry ``lower`` and ``upper`` edges and are drawn
+    as shaded spans around ``value``.
     """
 
     feature: PlotFeature
     label: str
     value: float
+    lower: float | None = None
+    upper: float | None = None
+
+    @property
+    def span(self):
+        """
+        Return whether the guide is drawn as a shaded span.
+        """
+
+        return self.lower is not None and self.upper is not None
+
+
+@dataclass(frozen=True)
+class OverlayContext:
+    """
+    Inputs shared by the time-series overlays of one parameter.
+
+    The series and its outlier mask are callables that load them on first
+    use, so overlays answered from the statistics cache never load them.
+
+    Attributes
+    ----------
+    energy_series : callable
+        Returns the ``EnergySeries`` that statistics are evaluated on.
+    excluded : callable
+        Returns the outlier mask of the series, or ``None`` when outliers
+        are kept.
+    options : PlotOptions
+        Enabled features and their settings.
+    live : LiveStatistics or None
+        Incremental statistic state of the calling view.
+    """
+
+    energy_series: object
+    excluded: object
+    options: object
+    live: object = None
 
 
 STATISTIC_FEATURES = (
@@ -110,6 +227,48 @@ STATISTIC_FEATURES = (
             "zorder": 3,
         },
     ),
+    PlotFeature(
+        key="discard_equilibration",
+        label="Discard Equilibration",
+        shortcut="i",
+        group="statistics",
+        histogram=True,
+    ),
+    PlotFeature(
+        key="decorrelate",
+        label="Decorrelated Samples",
+        shortcut="l",
+        group="statistics",
+        time_series=False,
+        histogram=True,
+    ),
+    PlotFeature(
+        key="outliers",
+        label="Outliers",
+        shortcut="u",
+        group="statistics",
+        histogram=True,
+        points=True,
+        matplotlib_style={
+            "linestyle": "none",
+            "marker": "x",
+            "markersize": 6,
+            "alpha": 0.9,
+            "zorder": 5,
+        },
+    ),
+    PlotFeature(
+        key="confidence_interval",
+        label="Bootstrap CI",
+        shortcut="f",
+        group="statistics",
+        histogram=True,
+        matplotlib_style={
+            "alpha": 0.18,
+            "linewidth": 0,
+            "zorder": 1,
+        },
+    ),
 )
 
 TIME_SERIES_FEATURES = (
@@ -140,9 +299,10 @@ TIME_SERIES_FEATURES = (
     ),
     PlotFeature(
         key="difference",
-        label="Difference (1 - 2)",
+        label="Difference",
         shortcut="x",
         group="time_series",
+        replaces_main=True,
         matplotlib_style={
             "linestyle": "-",
             "linewidth": 1.9,
@@ -150,11 +310,24 @@ TIME_SERIES_FEATURES = (
             "zorder": 4,
         },
     ),
+    PlotFeature(
+        key="ensemble",
+        label="Ensemble Band",
+        shortcut="y",
+        group="time_series",
+        replaces_main=True,
+        matplotlib_style={
+            "alpha": 0.3,
+            "linewidth": 0,
+            "zorder": 2,
+        },
+    ),
     PlotFeature(
         key="running_average",
         label="Running Average",
         shortcut="a",
         group="time_series",
+        windowed=True,
         matplotlib_style={
             "linestyle": "-",
             "linewidth": 2.0,
@@ -162,6 +335,92 @@ TIME_SERIES_FEATURES = (
             "zorder": 4,
         },
     ),
+    PlotFeature(
+        key="exponential_moving_average",
+        label="Exponential Moving Average",
+        shortcut="e",
+        group="time_series",
+        windowed=True,
+        matplotlib_style={
+            "linestyle": "-",
+            "linewidth": 1.8,
+            "alpha": 0.9,
+            "zorder": 4,
+        },
+    ),
+    PlotFeature(
+        key="savitzky_golay",
+        label="Savitzky-Golay",
+        shortcut="g",
+        group="time_series",
+        windowed=True,
+        matplotlib_style={
+            "linestyle": "-",
+            "linewidth": 1.8,
+            "alpha": 0.9,
+            "zorder": 4,
+        },
+    ),
+    PlotFeature(
+        key="rolling_std",
+        label="Rolling Std Band",
+        shortcut="v",
+        group="time_series",
+        windowed=True,
+        matplotlib_style={
+            "alpha": 0.2,
+            "linewidth": 0,
+            "zorder": 1,
+        },
+    ),
+    PlotFeature(
+        key="rolling_min_max",
+        label="Rolling Min/Max Band",
+        shortcut="h",
+        group="time_series",
+        windowed=True,
+        matplotlib_style={
+            "alpha": 0.15,
+            "linewidth": 0,
+            "zorder": 1,
+        },
+    ),
+    PlotFeature(
+        key="rolling_percentile",
+        label="Rolling Percentile Band",
+        shortcut="p",
+        group="time_series",
+        windowed=True,
+        matplotlib_style={
+            "alpha": 0.2,
+            "linewidth": 0,
+            "zorder": 1,
+        },
+    ),
+    PlotFeature(
+        key="trend",
+        label="Trend Line",
+        shortcut="t",
+        group="time_series",
+        matplotlib_style={
+            "linestyle": (0, (6, 3)),
+            "linewidth": 1.6,
+            "alpha": 0.95,
+            "zorder": 4,
+        },
+    ),
+    PlotFeature(
+        key="change_points",
+        label="Change Points",
+        shortcut="z",
+        group="time_series",
+        matplotlib_style={
+            "linestyles": "--",
+            "linewidth": 1.2,
+            "alpha": 0.8,
+            "zorder": 3,
+        },
+    ),
 )
 
 PLOT_FEATURES = STATISTIC_FEATURES + TIME_SERIES_FEATURES
@@ -188,6 +447,8 @@ def enabled_feature_labels(options):
 
     if options.difference:
         return [PLOT_FEATURES_BY_KEY["difference"].short_label]
+    if options.ensemble:
+        return [PLOT_FEATURES_BY_KEY["ensemble"].short_label]
 
     labels = [
         feature.short_label
@@ -202,129 +463,512 @@ def iter_time_series_overlays(
     options,
     *,
     window_policy="strict",
+    live=None,
+    cache=None,
+    data_version=None,
+    executor=None,
 ):
     """
     Yield enabled time-series overlays for a parameter.
+
+    ``live`` is the optional ``LiveStatistics`` state of the calling view. It
+    backs incremental statistics such as sketch-mode medians and cumulative
+    averages that extend with appended rows instead of being recomputed.
+    With a ``StatisticsCache`` and the reader ``data_version``, overlays are
+    memoized so repeated renders of unchanged data skip the computation.
+    With an ``executor``, the enabled overlays are computed concurrently and
+    still yielded in registry order. With ``outliers`` enabled, detected
+    spikes are marked and left out of means, medians and their confidence
+    intervals. Differences and ensemble bands replace the raw series and are
+    yielded alone.
     """
 
+    def cached(name, compute, *extra):
+        return cached_statistic(
+            cache,
+            data_version,
+            (info_parameter, name, *statistics_key(options), *extra),
+            compute,
+        )
+
     if options.difference:
         feature = PLOT_FEATURES_BY_KEY["difference"]
-        delta_series = difference_series(energies, info_parameter)
-        yield PlotSeries(
-            feature=feature,
-            label=feature.label,
-            time=delta_series.time,
-            values=delta_series.values,
-        )
+
+        def difference_overlays():
+            delta_series = difference_stack(
+                energies,
+                info_parameter,
+                reference=options.difference_reference,
+                spacing=options.difference_spacing,
+            )
+            reference = options.difference_reference % len(energies)
+            runs = [index for index in range(len(energies))
+                    if index != reference]
+            return tuple(
+                PlotSeries(
+                    feature=feature,
+                    label=f"{feature.label} ({run + 1} - {reference + 1})",
+                    time=delta_series.time,
+                    values=values,
+                )
+                for run, values in zip(runs, delta_series.values)
+            )
+
+        yield from cached(feature.key, difference_overlays,
+                          options.difference_reference,
+                          options.difference_spacing)
         return
 
-    energy_series = concatenate_series(energies, info_parameter)
+    if options.ensemble:
+        feature = PLOT_FEATURES_BY_KEY["ensemble"]
+
+        def ensemble_overlay():
+            stack = stack_series(energies, info_parameter)
+            ensemble = ensemble_statistics(stack.values)
+            return PlotSeries(
+                feature=feature,
+                label=(f"{feature.label} mean ± std "
+                       f"({ensemble.replicas} replicas)"),
+                time=stack.time,
+                values=ensemble.mean,
+                lower=ensemble.mean - ensemble.std_dev,
+                upper=ensemble.mean + ensemble.std_dev,
+            )
+
+        yield cached(feature.key, ensemble_overlay)
+        return
 
-    if options.mean:
-        feature = PLOT_FEATURES_BY_KEY["mean"]
-        time, values = Statistic.mean_values(
-            energy_series.time,
-            energy_series.values,
+    @functools.cache
+    def energy_series():
+        return cached(
+            "series",
+            lambda: statistics_series(energies, info_parameter, options),
         )
-        yield PlotSeries(feature, feature.label, time, values)
 
-    if options.median:
-        feature = PLOT_FEATURES_BY_KEY["median"]
-        time, values = Statistic.median_values(
+    @functools.cache
+    def excluded():
+        if not options.outliers:
+            return None
+
+        return cached(
+            "outliers",
+            lambda: outlier_rows(energy_series(), options, live),
+        )
+
+    context = OverlayContext(energy_series, excluded, options, live)
+    tasks = []
+    for feature in enabled_features(options):
+        overlay = TIME_SERIES_OVERLAYS.get(feature.key)
+        if overlay is None:
+            continue
+
+        for extra in overlay_arguments(feature, energy_series, options,
+                                       window_policy):
+            # bind the feature and window now; tasks may run after the loop
+            tasks.append((feature.key,
+                          functools.partial(overlay, context, feature, *extra),
+                          extra))
+
+    def evaluate(task):
+        name, overlay, extra = task
+        return cached(name, overlay, *extra)
+
+    if executor is None or len(tasks) < 2:
+        yield from map(evaluate, tasks)
+        return
+
+    # tasks share the series and mask; load them once, not once per thread
+    energy_series()
+    excluded()
+    yield from executor.map(evaluate, tasks)
+
+
+def overlay_arguments(feature, energy_series, options, window_policy):
+    """
+    Return the extra builder arguments of each overlay of one feature.
+
+    Confidence intervals yield one overlay per enabled statistic and windowed
+    features take the window size resolved for the series.
+    """
+
+    if feature.key == "confidence_interval":
+        return [(statistic,)
+                for statistic in confidence_interval_statistics(options)]
+
+    if feature.windowed:
+        return [(running_average_window(energy_series().values,
+                                        options.window_size,
+                                        policy=window_policy),)]
+
+    return [()]
+
+
+def mean_overlay(context, feature):
+    """
+    Return the mean of the series, leaving out excluded outliers.
+    """
+
+    energy_series = context.energy_series()
+    return PlotSeries(
+        feature,
+        feature.label,
+        *Statistic.mean_values(energy_series.time, energy_series.values,
+                               mask=context.excluded()),
+    )
+
+
+def median_overlay(context, feature):
+    """
+    Return the median of the series, leaving out excluded outliers.
+    """
+
+    energy_series = context.energy_series()
+    return PlotSeries(
+        feature,
+        feature.label,
+        *Statistic.median_values(
             energy_series.time,
             energy_series.values,
-        )
-        yield PlotSeries(feature, feature.label, time, values)
+            sketch=median_sketch(energy_series, context.options,
+                                 context.live),
+            mask=context.excluded(),
+        ),
+    )
+
+
+def outliers_overlay(context, feature):
+    """
+    Return the detected outlier rows as points.
+    """
+
+    energy_series = context.energy_series()
+    mask = context.excluded()
+    return PlotSeries(feature,
+                      f"{feature.label} ({np.count_nonzero(mask)})",
+                      energy_series.time[mask],
+                      energy_series.values[mask])
+
+
+def confidence_interval_overlay(context, feature, statistic):
+    """
+    Return the bootstrap confidence band of ``statistic``.
+    """
+
+    energy_series = context.energy_series()
+    time, lower, upper = Statistic.confidence_interval_values(
+        energy_series.time,
+        energy_series.values,
+        statistic,
+        confidence=CONFIDENCE_LEVEL,
+        mask=context.excluded(),
+    )
+    return PlotSeries(feature, confidence_interval_label(statistic),
+                      time, (lower + upper) / 2, lower, upper)
 
-    if options.cummulative_average:
-        feature = PLOT_FEATURES_BY_KEY["cummulative_average"]
+
+def cumulative_average_overlay(context, feature):
+    """
+    Return the cumulative average, extended incrementally with live state.
+    """
+
+    energy_series = context.energy_series()
+    if context.live is None:
         time, values = Statistic.cumulative_average_values(
             energy_series.time,
             energy_series.values,
         )
-        yield PlotSeries(feature, feature.label, time, values)
+    else:
+        time = energy_series.time
+        values = context.live.cumulative_average(energy_series.label,
+                                                 energy_series.values,
+                                                 energy_series.start)
+    return PlotSeries(feature, feature.label, time, values)
+
+
+def self_correlation_mean_overlay(context, feature):
+    """
+    Return the self-correlation weighted mean.
+    """
+
+    energy_series = context.energy_series()
+    return PlotSeries(
+        feature,
+        feature.label,
+        *Statistic.self_correlation_mean_values(energy_series.time,
+                                                energy_series.values),
+    )
+
+
+def running_average_overlay(context, feature, window_size):
+    """
+    Return the running average over ``window_size`` rows.
+    """
 
-    if options.self_correlation_mean:
-        feature = PLOT_FEATURES_BY_KEY["self_correlation_mean"]
-        time, values = Statistic.self_correlation_mean_values(
+    energy_series = context.energy_series()
+    return PlotSeries(
+        feature,
+        f"{feature.label} ({window_size})",
+        *Statistic.running_average_values(energy_series.time,
+                                          energy_series.values,
+                                          window_size),
+    )
+
+
+def exponential_moving_average_overlay(context, feature, span):
+    """
+    Return the exponential moving average, extended with live state.
+    """
+
+    energy_series = context.energy_series()
+    if context.live is None:
+        time, values = Statistic.exponential_moving_average_values(
             energy_series.time,
             energy_series.values,
+            span,
         )
-        yield PlotSeries(feature, feature.label, time, values)
+    else:
+        time = energy_series.time
+        values = context.live.exponential_moving_average(
+            energy_series.label, energy_series.values, span,
+            energy_series.start)
+    return PlotSeries(feature, f"{feature.label} ({span})", time, values)
 
-    if options.running_average:
-        feature = PLOT_FEATURES_BY_KEY["running_average"]
-        window_size = running_average_window(
-            energy_series.values,
-            options.window_size,
-            policy=window_policy,
-        )
-        time, values = Statistic.running_average_values(
+
+def savitzky_golay_overlay(context, feature, window_size):
+    """
+    Return the Savitzky-Golay smoothed series, extended with live state.
+    """
+
+    energy_series = context.energy_series()
+    if context.live is None:
+        time, values = Statistic.savitzky_golay_values(
             energy_series.time,
             energy_series.values,
             window_size,
         )
-        yield PlotSeries(
-            feature,
-            f"{feature.label} ({window_size})",
-            time,
-            values,
-        )
+    else:
+        time = energy_series.time
+        values = context.live.savitzky_golay(
+            energy_series.label, energy_series.values, window_size,
+            energy_series.start)
+    return PlotSeries(feature, f"{feature.label} ({window_size})",
+                      time, values)
 
 
-def iter_histogram_guides(energies, info_parameter, options):
+def rolling_std_overlay(context, feature, window_size):
     """
-    Yield enabled histogram guide values for a parameter.
+    Return the rolling mean with a band of one rolling standard deviation.
     """
 
-    energy_series = concatenate_series(energies, info_parameter)
+    energy_series = context.energy_series()
+    time, mean, std_dev = Statistic.rolling_std_values(
+        energy_series.time,
+        energy_series.values,
+        window_size,
+    )
+    return PlotSeries(feature, f"{feature.label} ({window_size})",
+                      time, mean, mean - std_dev, mean + std_dev)
 
-    if options.mean:
-        feature = PLOT_FEATURES_BY_KEY["mean"]
-        _, values = Statistic.mean_values(
-            energy_series.time,
-            energy_series.values,
-        )
-        yield HistogramGuide(feature, feature.label, float(values[0]))
 
-    if options.median:
-        feature = PLOT_FEATURES_BY_KEY["median"]
-        _, values = Statistic.median_values(
-            energy_series.time,
-            energy_series.values,
-        )
-        yield HistogramGuide(feature, feature.label, float(values[0]))
+def rolling_min_max_overlay(context, feature, window_size):
+    """
+    Return the band between the rolling minimum and maximum.
+    """
 
+    energy_series = context.energy_series()
+    time, minimum = Statistic.rolling_min_values(
+        energy_series.time,
+        energy_series.values,
+        window_size,
+    )
+    _, maximum = Statistic.rolling_max_values(
+        energy_series.time,
+        energy_series.values,
+        window_size,
+    )
+    return PlotSeries(feature, f"{feature.label} ({window_size})",
+                      time, (minimum + maximum) / 2, minimum, maximum)
+
+
+def rolling_percentile_overlay(context, feature, window_size):
+    """
+    Return the rolling median with a ``PERCENTILE_BAND`` band.
+    """
 
-def running_average_window(values, requested_window_size, *, policy):
+    energy_series = context.energy_series()
+    stride = percentile_band_stride(energy_series.values.size, window_size,
+                                    context.options)
+    time, quantiles = rolling_quantiles(
+        energy_series, window_size, (0.5, *PERCENTILE_BAND), stride)
+    median, lower, upper = quantiles
+    low, high = (round(100 * quantile) for quantile in PERCENTILE_BAND)
+    return PlotSeries(
+        feature,
+        f"{feature.label} {low}-{high}% ({window_size})",
+        time,
+        median,
+        lower,
+        upper,
+    )
+
+
+def trend_overlay(context, feature):
     """
-    Return a positive running-average window for a series.
+    Return the least-squares trend line labelled with its slope.
     """
 
-    try:
-        window_size = _parse_window_size(requested_window_size)
-    except ValueError:
-        if policy != "clamp":
-            raise
-        window_size = len(values)
+    energy_series = context.energy_series()
+    time, values = Statistic.trend_values(energy_series.time,
+                                          energy_series.values)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = (values[-1] - values[0]) / (time[-1] - time[0])
+    return PlotSeries(
+        feature,
+        f"{feature.label} (slope {format_readout_value(slope)})",
+        time,
+        values,
+    )
 
-    if policy == "clamp":
-        window_size = min(window_size, len(values))
 
-    return window_size
+def change_points_overlay(context, feature):
+    """
+    Return markers at the first rows of detected regimes.
+    """
+
+    energy_series = context.energy_series()
+    rows = change_point_rows(energy_series, context.options, context.live)
+    return PlotSeries(feature, f"{feature.label} ({len(rows)})",
+                      energy_series.time[rows], None)
+
+
+TIME_SERIES_OVERLAYS = {
+    "mean": mean_overlay,
+    "median": median_overlay,
+    "outliers": outliers_overlay,
+    "confidence_interval": confidence_interval_overlay,
+    "cummulative_average": cumulative_average_overlay,
+    "self_correlation_mean": self_correlation_mean_overlay,
+    "running_average": running_average_overlay,
+    "exponential_moving_average": exponential_moving_average_overlay,
+    "savitzky_golay": savitzky_golay_overlay,
+    "rolling_std": rolling_std_overlay,
+    "rolling_min_max": rolling_min_max_overlay,
+    "rolling_percentile": rolling_percentile_overlay,
+    "trend": trend_overlay,
+    "change_points": change_points_overlay,
+}
+# Overlay builders by feature key; features without one, such as
+# ``decorrelate``, only change how the series is prepared.
+
+
+def iter_histogram_guides(energies, info_parameter, options, *, live=None,
+                          cache=None, data_version=None):
+    """
+    Yield enabled histogram guide values for a parameter.
+
+    Streaming histograms take their guides from the incremental accumulators
+    in ``live``: the mean from running moments and the median from the
+    quantile sketch. Otherwise, with ``decorrelate`` enabled, guides are
+    evaluated on the decorrelated subsample that the densities are drawn
+    from; with ``outliers`` enabled, detected spikes are left out first.
+    """
+
+    streaming = live is not None and options.kde_method == "streaming"
+    subsampled = options.decorrelate and not streaming
+    filtered = options.outliers and not streaming
+
+    def cached(name, compute, *extra):
+        return cached_statistic(
+            cache,
+            data_version,
+            (info_parameter, name, *statistics_key(options), *extra),
+            compute,
+        )
 
+    @functools.cache
+    def energy_series():
+        energy_series = cached(
+            "series",
+            lambda: statistics_series(energies, info_parameter, options),
+        )
+        if filtered:
+            energy_series = cached(
+                "inliers", lambda: inlier_series(energy_series))
+        if subsampled:
+            energy_series = cached(
+                "decorrelated", lambda: decorrelated_series(energy_series))
+
+        return energy_series
+
+    if options.mean:
+        feature = PLOT_FEATURES_BY_KEY["mean"]
+
+        def mean_guide():
+            if streaming:
+                value = live.moments(energy_series().label,
+                                     energy_series().values,
+                                     energy_series().start).mean
+            else:
+                value = Statistic.mean_values(energy_series().time,
+                                              energy_series().values)[1][0]
+            return HistogramGuide(feature, feature.label, float(value))
+
+        yield cached("guide:mean", mean_guide, streaming, subsampled)
 
-def _parse_window_size(requested_window_size):
+    if options.median:
+        feature = PLOT_FEATURES_BY_KEY["median"]
+
+        def median_guide():
+            if streaming:
+                sketch = live.quantiles(energy_series().label,
+                                        energy_series().values,
+                                        energy_series().start)
+            elif subsampled:
+                sketch = None
+            else:
+                sketch = median_sketch(energy_series(), options, live)
+            return HistogramGuide(feature, feature.label, float(
+                Statistic.median_values(
+                    energy_series().time,
+                    energy_series().values,
+                    sketch=sketch,
+                )[1][0]))
+
+        yield cached("guide:median", median_guide, streaming, subsampled)
+
+    if options.confidence_interval:
+        feature = PLOT_FEATURES_BY_KEY["confidence_interval"]
+
+        def confidence_interval_guide(statistic):
+            interval = block_bootstrap(energy_series().values, statistic,
+                                       confidence=CONFIDENCE_LEVEL)
+            return HistogramGuide(feature,
+                                  confidence_interval_label(statistic),
+                                  interval.estimate, interval.lower,
+                                  interval.upper)
+
+        for statistic in confidence_interval_statistics(options):
+            yield cached(
+                "guide:confidence_interval",
+                functools.partial(confidence_interval_guide, statistic),
+                statistic,
+                subsampled,
+            )
+
+
+def confidence_interval_statistics(options):
     """
-    Parse a positive running-average window size.
+    Return the enabled statistics that get bootstrap confidence intervals.
     """
 
-    requested = str(requested_window_size).strip()
-    if requested in {"", "."}:
-        return 1000
+    return [statistic for statistic in ("mean", "median")
+            if getattr(options, statistic)]
 
-    window_size = int(float(requested))
-    if window_size < 1:
-        raise ValueError("Window size must be positive")
 
-    return window_size
+def confidence_interval_label(statistic):
+    """
+    Return the legend label of a statistic's confidence interval.
+    """
+
+    return (f"{PLOT_FEATURES_BY_KEY[statistic].label} "
+            f"{CONFIDENCE_LEVEL:.0%} CI")
@@ -0,0 +1,137 @@
+"""
+Shared lifecycle for whole-figure plot windows.
+"""
+
+import signal
+from abc import ABCMeta, abstractmethod
+
+import matplotlib.animation as animation
+import matplotlib.pyplot as plt
+
+from .._logging import get_logger
+from .theme import apply_matplotlib_theme
+
+
+logger = get_logger(__name__)
+
+
+class FigurePlot(metaclass=ABCMeta):
+    """
+    Base class for windows that redraw their whole figure on every refresh.
+
+    Unlike ``Plot``, these views do not show one selected parameter with
+    overlays; they recompute all of their panels in ``redraw``. This class
+    owns the SIGINT handling, static and live rendering and read-error
+    handling shared by the live monitor, correlation and fluctuation
+    windows.
+
+    Attributes
+    ----------
+    app : App
+        The main application object.
+    refresh_warning : str or None
+        Error of the last failed refresh, if any.
+    """
+
+    refresh_name = "Plot"
+    # Name of the view in refresh warnings.
+
+    def __init__(self, app):
+        """
+        Initialize shared state; subclasses then create ``self.figure``.
+        """
+
+        self.app = app
+        self.reader = app.reader
+        self.refresh_warning = None
+        self.ani = None
+
+        apply_matplotlib_theme(getattr(self.app, "appearance_mode", None))
+
+        signal.signal(
+            signal.SIGINT,
+            lambda signal, frame: self.signal_handler(signal, frame),
+        )
+
+    def signal_handler(self, signal, frame):
+        """
+        Close plot and application windows after SIGINT.
+        """
+
+        plt.close("all")
+        self.app.destroy()
+
+    def simple(self, info_parameter=None) -> None:
+        """
+        Render a static figure.
+        """
+
+        self.redraw()
+        plt.show()
+
+    def follow(self, info_parameter=None, interval: float = 1.0) -> None:
+        """
+        Render a live figure and refresh it at the configured interval.
+        """
+
+        def update(frame):
+            self.safe_read_last()
+            self.redraw()
+            return []
+
+        self.redraw()
+        self.ani = animation.FuncAnimation(
+            self.figure,
+            update,
+            blit=True,
+            interval=interval * 1000,
+            cache_frame_data=False,
+        )
+        plt.show()
+
+    def refresh(self, show=True) -> None:
+        """
+        Refresh the figure while keeping the previous view on read errors.
+        """
+
+        if self.safe_read_last():
+            self.redraw()
+
+        if show:
+            plt.show()
+
+    @abstractmethod
+    def redraw(self) -> None:
+        """
+        Recompute and redraw every panel of the figure.
+
+        Raises
+        ------
+        NotImplementedError
+            If the method is not implemented in the subclass.
+        """
+        raise NotImplementedError
+
+    def safe_read_last(self) -> bool:
+        """
+        Read the growing output file without closing the view on failures.
+        """
+
+        try:
+            self.reader.read_last()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.refresh_warning = str(error)
+            logger.warning("%s refresh skipped: %s", self.refresh_name, error)
+            return False
+
+        self.refresh_warning = None
+        return True
+
+    def set_window_title(self, title: str) -> None:
+        """
+        Name the native matplotlib window when the backend supports it.
+        """
+
+        manager = getattr(self.figure.canvas, "manager", None)
+        if manager is not None and hasattr(manager, "set_window_title"):
+            manager.set_window_title(f"PQEnalyzer - {title}")
@@ -15,12 +15,28 @@ class PlotOptions:
 
     mean: bool = False
     median: bool = False
+    discard_equilibration: bool = False
+    decorrelate: bool = False
+    outliers: bool = False
+    confidence_interval: bool = False
     cummulative_average: bool = False
     self_correlation_mean: bool = False
     difference: bool = False
+    ensemble: bool = False
     running_average: bool = False
+    exponential_moving_average: bool = False
+    savitzky_golay: bool = False
+    rolling_std: bool = False
+    rolling_min_max: bool = False
+    rolling_percentile: bool = False
+    trend: bool = False
+    change_points: bool = False
+    difference_reference: int = -1
+    difference_spacing: float | None = None
     window_size: str = ""
     plot_main: bool = False
+    quantile_mode: str = "exact"
+    kde_method: str = "auto"
 
     def __getattr__(self, name):
         """
@@ -40,15 +56,24 @@ class PlotOptions:
         Read the current option widgets from the GUI app.
         """
 
+        reference = app.__dict__.get("difference_reference")
         options = cls(
+            difference_reference=(
+                -1 if reference is None
+                else reference_index(reference.get())
+            ),
+            difference_spacing=app.__dict__.get("difference_spacing"),
             window_size=app.window_size.get(),
             plot_main=bool(app.plot_main_data.get()),
+            quantile_mode=app.__dict__.get("quantile_mode", "exact"),
+            kde_method=app.__dict__.get("kde_method", "auto"),
         )
         for feature in PLOT_FEATURES:
+            control = app.__dict__.get(feature.option_attribute)
             setattr(
                 options,
                 feature.option_attribute,
-                bool(getattr(app, feature.option_attribute).get()),
+                feature.default if control is None else bool(control.get()),
             )
 
         return options
@@ -63,3 +88,29 @@ class PlotOptions:
         for feature_key in feature_keys:
             setattr(options, feature_key, True)
         return options
+
+
+def reference_label(index, label) -> str:
+    """
+    Return the difference-reference menu entry of one input file.
+
+    Examples
+    --------
+    >>> reference_label(0, "md-01.en")
+    '1: md-01.en'
+    """
+
+    return f"{index + 1}: {label}"
+
+
+def reference_index(menu_value) -> int:
+    """
+    Return the reader index encoded in a difference-reference menu entry.
+
+    Examples
+    --------
+    >>> reference_index("2: md-02.en")
+    1
+    """
+
+    return int(menu_value.split(":", 1)[0]) - 1
@@ -8,6 +8,7 @@ import matplotlib.animation as animation
 
 from ..energy_access import parameter_unit
 from .._logging import get_logger
+from ..statistics import LiveStatistics
 from .features import PLOT_FEATURES
 from .options import PlotOptions
 from .theme import apply_figure_theme, apply_matplotlib_theme
@@ -37,6 +38,8 @@ class Plot(metaclass=ABCMeta):
         Refresh the plot at a fixed interval in seconds.
     refresh()
         Re-read the latest data and redraw an existing plot.
+    update_data()
+        Update existing artists in place after new rows were read.
     """
 
     def __init__(self, app):
@@ -56,6 +59,14 @@ class Plot(metaclass=ABCMeta):
         self.app = app
         self.reader = app.reader
         self.options = PlotOptions.from_app(app)
+        self.live_statistics = LiveStatistics(
+            app.__dict__.get("quantile_error", 0.01))
+        # shared by all windows of the app; None disables memoization
+        self.statistics_cache = app.__dict__.get("statistics_cache")
+        # shared thread pool; None evaluates statistics sequentially
+        self.statistics_executor = app.__dict__.get("statistics_executor")
+        # artists keyed by series so live refreshes can update them in place
+        self.lines = {}
 
         # read parameters from the app
         self.get_app_parameters()
@@ -166,9 +177,10 @@ class Plot(metaclass=ABCMeta):
                 logger.warning("Plot refresh skipped: %s", error)
                 return []
 
-            self.ax.clear()
-            self.apply_theme()
-            self.plot_data()
+            if not self.update_data():
+                self.ax.clear()
+                self.apply_theme()
+                self.plot_data()
             return []
 
         self.ani = animation.FuncAnimation(
@@ -196,7 +208,11 @@ class Plot(metaclass=ABCMeta):
             logger.warning("Plot refresh skipped: %s", error)
             return None
 
-        self.redraw()
+        self.get_app_parameters()
+        if self.update_data():
+            self.figure.canvas.draw_idle()
+        else:
+            self.redraw()
 
         # Show the plot
         if show:
@@ -232,6 +248,21 @@ class Plot(metaclass=ABCMeta):
 
         self.app.select_plot(self)
 
+    def update_data(self) -> bool:
+        """
+        Update the existing artists with refreshed data, if supported.
+
+        Subclasses that can extend their artists in place return ``True``.
+        Returning ``False`` makes the caller clear the axes and redraw.
+
+        Returns
+        -------
+        bool
+            Whether the plot was updated in place.
+        """
+
+        return False
+
     def plot_data(self) -> None:
         """
         Render main data, enabled statistics and plot labels.
@@ -241,6 +272,7 @@ class Plot(metaclass=ABCMeta):
         None
         """
 
+        self.lines = {}
         if not self.plot_main:
             self.main_data(self.info_parameter)
 
@@ -292,7 +324,10 @@ class Plot(metaclass=ABCMeta):
         self.ax.set_title(title, loc="left", pad=10)
         self.ax.set_xlabel(xlabel)
         self.ax.set_ylabel(ylabel)
-        self.ax.ticklabel_format(axis="both", style="sci")
+        for axis in ("x", "y"):
+            # log axes keep their own tick formatter
+            if getattr(self.ax, f"get_{axis}scale")() == "linear":
+                self.ax.ticklabel_format(axis=axis, style="sci")
         self.ax.margins(x=0.02, y=0.08)
 
     def set_window_title(self, title: str) -> None:
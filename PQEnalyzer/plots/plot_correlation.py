@@ -0,0 +1,106 @@
+"""
+Correlation heatmap across all energy parameters.
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from ..energy_access import concatenate_block
+from ..statistics import correlation_matrix
+from .figure_plot import FigurePlot
+from .series_statistics import cached_statistic
+from .theme import apply_figure_theme
+
+MAX_ANNOTATED_PARAMETERS = 16
+# Larger matrices are drawn without per-cell coefficient labels.
+
+
+class PlotCorrelation(FigurePlot):
+    """
+    Render the Pearson correlation matrix of all parameters as a heatmap.
+
+    The matrix is computed from one ``(rows, parameters)`` block with a single
+    matrix product and memoized per reader data version.
+    """
+
+    refresh_name = "Correlation"
+
+    def __init__(self, app):
+        """
+        Create a heatmap figure for all selectable app parameters.
+        """
+
+        super().__init__(app)
+        self.parameters = list(app.info)
+        self.statistics_cache = app.__dict__.get("statistics_cache")
+        self.matrix = None
+        self.colorbar = None
+
+        size = min(12.0, 3.0 + 0.55 * len(self.parameters))
+        self.figure = plt.figure(figsize=(size + 1.2, size))
+        self.ax = self.figure.add_subplot(111)
+        self.set_window_title("Correlations")
+
+    def redraw(self) -> None:
+        """
+        Recompute the correlation matrix and redraw the heatmap.
+        """
+
+        if self.colorbar is not None:
+            self.colorbar.remove()
+            self.colorbar = None
+        self.ax.clear()
+        palette = apply_figure_theme(
+            self.figure,
+            self.ax,
+            getattr(self.app, "appearance_mode", None),
+        )
+
+        self.matrix = cached_statistic(
+            self.statistics_cache,
+            getattr(self.reader, "data_version", None),
+            ("correlation", tuple(self.parameters)),
+            lambda: correlation_matrix(
+                concatenate_block(self.reader.energies, self.parameters)),
+        )
+
+        image = self.ax.imshow(
+            np.ma.masked_invalid(self.matrix),
+            cmap="coolwarm",
+            vmin=-1.0,
+            vmax=1.0,
+        )
+        self.colorbar = self.figure.colorbar(image, ax=self.ax,
+                                             fraction=0.046, pad=0.04)
+        self.colorbar.set_label("Pearson correlation")
+
+        positions = np.arange(len(self.parameters))
+        self.ax.set_xticks(positions, self.parameters, rotation=45,
+                           ha="right", fontsize=8)
+        self.ax.set_yticks(positions, self.parameters, fontsize=8)
+        self.ax.grid(False)
+        self.ax.set_title("Parameter correlations", loc="left",
+                          fontweight="bold", color=palette["text.color"])
+
+        if len(self.parameters) <= MAX_ANNOTATED_PARAMETERS:
+            self.__annotate()
+
+        self.figure.tight_layout()
+        self.figure.canvas.draw_idle()
+
+    def __annotate(self):
+        """
+        Write the coefficient into every heatmap cell.
+        """
+
+        for (row, column), value in np.ndenumerate(self.matrix):
+            text = "n/a" if np.isnan(value) else f"{value:.2f}"
+            self.ax.text(
+                column,
+                row,
+                text,
+                ha="center",
+                va="center",
+                fontsize=7,
+                color="white" if abs(value) > 0.6 else "black",
+            )
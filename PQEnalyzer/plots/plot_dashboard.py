@@ -3,99 +3,62 @@ Live dashboard plotting for all available time-series parameters.
 """
 
 import math
-import signal
 
-import matplotlib.animation as animation
 import matplotlib.pyplot as plt
 
 from .._logging import get_logger
 from ..energy_access import parameter_unit, series
+from ..statistics import ConservationMonitor, ThroughputMonitor
+from .figure_plot import FigurePlot
 from .labels import unique_path_labels
-from .theme import (
-    apply_figure_theme,
-    apply_matplotlib_theme,
-    palette_for_appearance_mode,
-)
+from .theme import apply_figure_theme, palette_for_appearance_mode
 from .value_readout import ValueReadoutEntry, format_readout_value
 
 
 logger = get_logger(__name__)
 
 
-class PlotDashboard:
+class PlotDashboard(FigurePlot):
     """
     Render a raw overview grid for every parameter in the reader.
     """
 
+    refresh_name = "Dashboard"
+
     def __init__(self, app):
         """
         Create a dashboard figure for all selectable app parameters.
         """
 
-        self.app = app
-        self.reader = app.reader
+        super().__init__(app)
         self.parameters = list(app.info)
         self.axis_parameters = {}
         self.latest_values = {}
         self.selected_parameter = None
-        self.refresh_warning = None
         self.subtitle_text = None
+        self.conservation_monitor = (
+            ConservationMonitor(app.__dict__.get("conservation_limits"))
+            if ConservationMonitor.supports(self.reader.energies) else None
+        )
+        self.throughput_monitor = (
+            ThroughputMonitor(app.__dict__.get("target_time"),
+                              executor=app.__dict__.get(
+                                  "statistics_executor"))
+            if ThroughputMonitor.supports(self.reader.energies) else None
+        )
 
-        apply_matplotlib_theme(getattr(self.app, "appearance_mode", None))
         self.figure = plt.figure(figsize=self.__figure_size())
         self.axes = self.__create_axes()
-        self.ani = None
-        self.__set_window_title()
-
-        signal.signal(
-            signal.SIGINT,
-            lambda signal, frame: self.signal_handler(signal, frame),
-        )
+        self.set_window_title("Live Monitor")
         self.figure.canvas.mpl_connect("button_press_event",
                                        self.__button_press_event)
 
-    def signal_handler(self, signal, frame):
-        """
-        Close plot and application windows after SIGINT.
-        """
-
-        plt.close("all")
-        self.app.destroy()
-
-    def simple(self, info_parameter=None) -> None:
-        """
-        Render a static dashboard.
-        """
-
-        self.redraw()
-        plt.show()
-
-    def follow(self, info_parameter=None, interval: float = 1.0) -> None:
-        """
-        Render a live dashboard and refresh it at the configured interval.
-        """
-
-        def update(frame):
-            self.__safe_read_last()
-            self.redraw()
-            return []
-
-        self.redraw()
-        self.ani = animation.FuncAnimation(
-            self.figure,
-            update,
-            blit=True,
-            interval=interval * 1000,
-            cache_frame_data=False,
-        )
-        plt.show()
-
     def refresh(self, show=True) -> None:
         """
         Refresh the dashboard while keeping the previous view on read errors.
         """
 
-        if not self.__safe_read_last():
+        if not self.safe_read_last():
             self.__set_title()
             self.figure.canvas.draw_idle()
             return None
@@ -132,6 +95,10 @@ class PlotDashboard:
             ax.set_visible(False)
 
         self.__show_legend()
+        if self.conservation_monitor is not None:
+            self.conservation_monitor.update(self.reader.energies)
+        if self.throughput_monitor is not None:
+            self.throughput_monitor.update(self.reader.energies, labels)
         self.__set_title()
         self.figure.tight_layout(rect=(0, 0.03, 1, 0.92),
                                  h_pad=1.0,
@@ -253,21 +220,6 @@ class PlotDashboard:
 
         logger.warning("No data to plot.")
 
-    def __safe_read_last(self):
-        """
-        Read the growing output file without closing the dashboard on failures.
-        """
-
-        try:
-            self.reader.read_last()
-        except Exception as error:  # pylint: disable=broad-exception-caught
-            self.refresh_warning = str(error)
-            logger.warning("Dashboard refresh skipped: %s", error)
-            return False
-
-        self.refresh_warning = None
-        return True
-
     def __button_press_event(self, event):
         """
         Open a focused plot when a dashboard panel is double-clicked.
@@ -336,7 +288,8 @@ class PlotDashboard:
 
     def __set_title(self):
         """
-        Set a compact dashboard title with refresh status.
+        Set a compact dashboard title with refresh, conservation and
+        throughput status.
         """
 
         palette = palette_for_appearance_mode(
@@ -356,6 +309,18 @@ class PlotDashboard:
             subtitle = "watching for file changes - double-click a panel to focus"
             color = palette["subtle.text"]
 
+        conservation = getattr(self.conservation_monitor, "status", None)
+        if conservation is not None:
+            subtitle = f"{conservation.describe()} | {subtitle}"
+            if conservation.alarm:
+                color = palette["warning.color"]
+
+        throughput = getattr(self.throughput_monitor, "status", None)
+        if throughput is not None:
+            subtitle = f"{throughput.describe()} | {subtitle}"
+            if throughput.alarm:
+                color = palette["warning.color"]
+
         self.figure.suptitle(
             "Simulation Monitor",
             x=0.012,
@@ -379,12 +344,3 @@ class PlotDashboard:
         else:
             self.subtitle_text.set_text(subtitle)
             self.subtitle_text.set_color(color)
-
-    def __set_window_title(self):
-        """
-        Name the native matplotlib window when the backend supports it.
-        """
-
-        manager = getattr(self.figure.canvas, "manager", None)
-        if manager is not None and hasattr(manager, "set_window_title"):
-            manager.set_window_title("PQEnalyzer - Live Monitor")
@@ -0,0 +1,124 @@
+"""
+Convergence plots of fluctuation-derived thermodynamic properties.
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from .._logging import get_logger
+from ..energy_access import concatenate_time, time_unit
+from ..statistics import FluctuationMonitor
+from .figure_plot import FigurePlot
+from .theme import apply_figure_theme
+
+
+logger = get_logger(__name__)
+
+
+class PlotFluctuation(FigurePlot):
+    """
+    Render the running estimate of every fluctuation property.
+
+    One panel per property shows its estimate after every row together with
+    the current value and block-averaged error band. A single
+    ``FluctuationMonitor`` consumes appended rows only, so live refreshes do
+    not rescan the run.
+    """
+
+    refresh_name = "Fluctuation"
+
+    def __init__(self, app):
+        """
+        Create one convergence panel per property available in the input.
+        """
+
+        super().__init__(app)
+        self.monitor = FluctuationMonitor(
+            executor=app.__dict__.get("statistics_executor"))
+        self.properties = FluctuationMonitor.properties(self.reader.energies)
+
+        self.figure = plt.figure(
+            figsize=(9, 1.5 + 3.0 * max(1, len(self.properties))))
+        self.axes = self.figure.subplots(max(1, len(self.properties)), 1,
+                                         sharex=True, squeeze=False)[:, 0]
+        self.set_window_title("Fluctuations")
+
+    def redraw(self) -> None:
+        """
+        Consume appended rows and redraw every convergence panel.
+        """
+
+        palette = None
+        for ax in self.axes:
+            ax.clear()
+            palette = apply_figure_theme(
+                self.figure,
+                ax,
+                getattr(self.app, "appearance_mode", None),
+            )
+
+        if not self.properties:
+            logger.warning("No E(TOT) or VOLUME with TEMPERATURE to plot.")
+            self.axes[0].set_title("No fluctuation properties available",
+                                   loc="left", color=palette["text.color"])
+            self.figure.canvas.draw_idle()
+            return
+
+        estimates = self.monitor.update(self.reader.energies)
+        time = concatenate_time(self.reader.energies)
+        for ax, fluctuation_property in zip(self.axes, self.properties):
+            self.__plot_property(
+                ax,
+                time,
+                self.monitor.accumulators[fluctuation_property.column],
+                estimates[fluctuation_property.column],
+                palette,
+            )
+
+        self.axes[-1].set_xlabel(
+            f"Simulation Time / {time_unit(self.reader.energies[0])}")
+        self.figure.tight_layout()
+        self.figure.canvas.draw_idle()
+
+    @staticmethod
+    def __plot_property(ax, time, accumulator, estimate, palette):
+        """
+        Draw one running estimate with its final value and error band.
+        """
+
+        fluctuation_property = estimate.property
+        ax.plot(
+            time,
+            accumulator.convergence,
+            label="running estimate",
+            linewidth=1.3,
+            zorder=3,
+        )
+        if np.isfinite(estimate.value):
+            ax.axhline(
+                estimate.value,
+                label=estimate.describe(),
+                color=palette["text.color"],
+                linestyle="--",
+                linewidth=1.0,
+                zorder=4,
+            )
+        if np.isfinite(estimate.error):
+            ax.axhspan(
+                estimate.value - estimate.error,
+                estimate.value + estimate.error,
+                label=f"block error ({estimate.blocks} blocks)",
+                alpha=0.2,
+                zorder=2,
+            )
+
+        ax.set_title(
+            f"{fluctuation_property.name.capitalize()} from "
+            f"{fluctuation_property.column} fluctuations",
+            loc="left",
+            fontweight="bold",
+            color=palette["text.color"],
+        )
+        ax.set_ylabel(
+            f"{fluctuation_property.symbol} / {fluctuation_property.unit}")
+        ax.legend(loc="best", fontsize="small")
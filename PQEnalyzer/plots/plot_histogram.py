@@ -1,14 +1,15 @@
 """
 Histogram/KDE plotting for PQ energy parameters.
 """
-from scipy.stats import gaussian_kde
 import numpy as np
 
 from ..energy_access import parameter_values
 from .._logging import get_logger
+from ..statistics import decorrelated, kernel_density, outlier_mask
 from .features import iter_histogram_guides
 from .labels import unique_path_labels
 from .plot import Plot
+from .series_statistics import cached_statistic
 
 
 logger = get_logger(__name__)
@@ -47,6 +48,15 @@ class PlotHistogram(Plot):
         """
         Plot one KDE curve per input file.
 
+        Large series use the binned FFT estimate unless the plot options
+        request the exact ``gaussian_kde``. In ``"streaming"`` mode, each file
+        feeds a live histogram with its appended rows and the curve is its
+        smoothed bin counts. With ``decorrelate`` enabled, the estimate is
+        evaluated on every ``g``-th value only, where ``g`` is the
+        statistical inefficiency of the file's series. With ``outliers``
+        enabled, detected spikes are dropped before that. Streaming
+        histograms keep consuming all appended rows.
+
         Parameters
         ----------
         info_parameter : str
@@ -60,22 +70,12 @@ class PlotHistogram(Plot):
         labels = unique_path_labels(self.reader.filenames)
         for i, energy in enumerate(self.reader.energies):
             data = parameter_values(energy, info_parameter)
-
-            # check if zero data
-            if np.unique(data).size == 1:
+            density = self.__density(data, (info_parameter, labels[i]))
+            if density is None:
                 logger.warning("Data zero. No histogram available.")
                 continue
 
-            # plot kde of histogram
-            kde = gaussian_kde(data)
-
-            x = np.linspace(
-                min(data),
-                max(data),
-                1000,
-            )
-
-            y = kde(x)
+            x, y = density
             line = self.ax.plot(
                 x,
                 y,
@@ -95,6 +95,40 @@ class PlotHistogram(Plot):
 
         return None
 
+    def __density(self, data, key):
+        """
+        Return the density curve of one file, or ``None`` for constant data.
+        """
+
+        if self.options.kde_method == "streaming":
+            histogram = self.live_statistics.histogram(key, data)
+            if not histogram.moments.minimum < histogram.moments.maximum:
+                return None
+            return histogram.density()
+
+        data_version = getattr(self.reader, "data_version", None)
+        if self.options.outliers:
+            data = cached_statistic(
+                self.statistics_cache,
+                data_version,
+                ("inliers", *key),
+                lambda: data[~outlier_mask(data)],
+            )
+
+        if self.options.decorrelate:
+            data = cached_statistic(
+                self.statistics_cache,
+                data_version,
+                ("decorrelated", self.options.outliers, *key),
+                lambda: decorrelated(data),
+            )
+
+        # check if zero data
+        if np.unique(data).size == 1:
+            return None
+
+        return kernel_density(data, method=self.options.kde_method)
+
     def labels(self, info_parameter: str) -> None:
         """
         Set histogram labels and legend.
@@ -127,7 +161,7 @@ class PlotHistogram(Plot):
 
     def statistics(self, info_parameter: str) -> None:
         """
-        Plot enabled mean and median guide lines.
+        Plot enabled mean and median guide lines and confidence spans.
 
         Parameters
         ----------
@@ -143,7 +177,19 @@ class PlotHistogram(Plot):
             self.reader.energies,
             info_parameter,
             self.options,
+            live=self.live_statistics,
+            cache=self.statistics_cache,
+            data_version=getattr(self.reader, "data_version", None),
         ):
+            if guide.span:
+                self.ax.axvspan(
+                    guide.lower,
+                    guide.upper,
+                    label=guide.label,
+                    **guide.feature.matplotlib_style,
+                )
+                continue
+
             style = guide.feature.matplotlib_style.copy()
             style["linewidth"] = max(style["linewidth"], 1.35)
             style["zorder"] = 4
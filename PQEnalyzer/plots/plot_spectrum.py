@@ -0,0 +1,189 @@
+"""
+Power spectral density plotting for PQ energy parameters.
+"""
+import numpy as np
+
+from ..energy_access import parameter_unit, series, time_unit
+from .._logging import get_logger
+from ..statistics import (
+    dominant_frequency,
+    ordered_map,
+    sample_spacing,
+    welch_psd,
+)
+from .labels import unique_path_labels
+from .plot import Plot
+from .series_statistics import cached_statistic
+
+
+logger = get_logger(__name__)
+
+
+class PlotSpectrum(Plot):
+    """
+    Plot Welch power spectral densities for selected energy parameters.
+
+    Peaks reveal periodic coupling, such as thermostat oscillations in
+    ``TEMPERATURE`` or barostat oscillations in ``PRESSURE`` and ``VOLUME``.
+
+    Attributes
+    ----------
+    app : App
+        The main application object.
+
+    """
+
+    def __init__(self, app):
+        """
+        Initialize a spectrum plot window.
+
+        Parameters
+        ----------
+        app : App
+            The main application object.
+
+        Returns
+        -------
+        None
+        """
+
+        super().__init__(app)
+
+        return None
+
+    def main_data(self, info_parameter: str) -> None:
+        """
+        Plot one PSD curve per input file on log-log axes.
+
+        The frequency axis is derived from the median ``SIMULATION-TIME``
+        step of each file; the zero-frequency bin is omitted.
+
+        Parameters
+        ----------
+        info_parameter : str
+            The info parameter to plot.
+
+        Returns
+        -------
+        None
+        """
+
+        labels = unique_path_labels(self.reader.filenames)
+        for i, spectrum in enumerate(self.spectra(info_parameter)):
+            if spectrum is None:
+                logger.warning("Data constant. No spectrum available.")
+                continue
+
+            frequencies, psd = spectrum
+            self.ax.plot(
+                frequencies[1:],
+                psd[1:],
+                label=f"{labels[i]} PSD",
+                linewidth=1.4,
+                alpha=0.95,
+                zorder=3,
+            )
+
+        return None
+
+    def spectra(self, info_parameter: str) -> list:
+        """
+        Return the PSD of every file, or ``None`` for constant series.
+
+        Spectra are memoized per reader data version, so the peak markers and
+        the curves share one estimate. Files are transformed concurrently
+        when the app has a statistics thread pool.
+        """
+
+        return ordered_map(
+            lambda i: cached_statistic(
+                self.statistics_cache,
+                getattr(self.reader, "data_version", None),
+                ("spectrum", info_parameter, i),
+                lambda: self.__spectrum(self.reader.energies[i],
+                                        info_parameter),
+            ),
+            range(len(self.reader.energies)),
+            self.statistics_executor,
+        )
+
+    def __spectrum(self, energy, info_parameter):
+        """
+        Return the Welch PSD of one file's series.
+        """
+
+        energy_series = series(energy, info_parameter)
+        if (
+            energy_series.values.size < 2
+            or np.ptp(energy_series.values) == 0
+        ):
+            return None
+
+        return welch_psd(energy_series.values,
+                         sample_spacing(energy_series.time))
+
+    def labels(self, info_parameter: str) -> None:
+        """
+        Set spectrum labels and legend.
+
+        Parameters
+        ----------
+        info_parameter : str
+            The info parameter to set the labels of the plot frame.
+
+        Returns
+        -------
+        None
+        """
+
+        energy = self.reader.energies[0]
+        unit = parameter_unit(energy, info_parameter)
+        unit_of_time = time_unit(energy)
+        self.ax.set_xscale("log")
+        self.ax.set_yscale("log")
+        self.style_single_plot(
+            title=f"{info_parameter} power spectrum",
+            xlabel=f"Frequency / 1/{unit_of_time}",
+            ylabel=f"PSD / {unit}² {unit_of_time}",
+        )
+
+        _, labels = self.ax.get_legend_handles_labels()
+        if not labels:
+            logger.warning("No data to plot.")
+        else:
+            self.show_legend(loc="best", ncol=min(3, len(labels)))
+
+        return None
+
+    def statistics(self, info_parameter: str) -> None:
+        """
+        Mark the dominant non-zero frequency of every spectrum.
+
+        Parameters
+        ----------
+        info_parameter : str
+            The info parameter to calculate the statistics of.
+
+        Returns
+        -------
+        None
+        """
+
+        unit_of_time = time_unit(self.reader.energies[0])
+        for spectrum in self.spectra(info_parameter):
+            if spectrum is None or spectrum[0].size < 2:
+                continue
+
+            frequencies, psd = spectrum
+            peak = dominant_frequency(frequencies, psd)
+            self.ax.axvline(
+                peak,
+                label=f"peak {peak:.4g} 1/{unit_of_time}",
+                color=self.palette["text.color"],
+                linestyle=":",
+                linewidth=1.1,
+                alpha=0.7,
+                zorder=4,
+            )
+
+        return None
@@ -2,6 +2,8 @@
 Time-series plotting for PQ energy parameters.
 """
 
+from collections import Counter
+
 from ..energy_access import parameter_unit, series
 from .._logging import get_logger
 from .features import iter_time_series_overlays
@@ -55,19 +57,52 @@ class PlotTime(Plot):
         None
         """
 
-        labels = unique_path_labels(self.reader.filenames)
-        for i, energy in enumerate(self.reader.energies):
-            energy_series = series(energy, info_parameter)
-            unit = parameter_unit(energy, info_parameter)
-            self.ax.plot(
-                energy_series.time,
-                energy_series.values,
-                label=latest_value_label(labels[i], energy_series.values,
-                                         unit),
-                linewidth=1.6,
-                alpha=0.92,
-                zorder=2,
-            )
+        for key, *description in self.__main_series(info_parameter):
+            self.lines[key] = self.__draw(*description)
+
+    def update_data(self) -> bool:
+        """
+        Extend the existing line artists with the refreshed series.
+
+        Lines keep their artists and only receive new data and legend labels.
+        Cumulative averages come from live accumulators, so a frame costs time
+        proportional to the appended rows. Shaded bands and marker lines
+        cannot take new data and are replaced by a new artist. A full redraw
+        is requested when the set of plotted series changed.
+
+        Returns
+        -------
+        bool
+            Whether the lines were updated in place.
+        """
+
+        if not self.lines:
+            return False
+
+        keyed_series = []
+        if not self.plot_main:
+            keyed_series.extend(self.__main_series(self.info_parameter))
+        keyed_series.extend(self.__overlay_series(self.info_parameter))
+
+        if [key for key, *_ in keyed_series] != list(self.lines):
+            return False
+
+        for key, time, values, label, style, band in keyed_series:
+            line = self.lines[key]
+            if band is not None or values is None:
+                line.remove()
+                self.lines[key] = self.__draw(time, values, label, style,
+                                              band)
+                continue
+
+            line.set_data(time, values)
+            line.set_label(label)
+
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.labels(self.info_parameter)
+
+        return True
 
     def labels(self, info_parameter: str) -> None:
         """
@@ -115,21 +150,84 @@ class PlotTime(Plot):
         None
         """
 
+        for key, *description in self.__overlay_series(info_parameter):
+            self.lines[key] = self.__draw(*description)
+
+        return None
+
+    def __draw(self, time, values, label, style, band):
+        """
+        Draw one series as a line, a shaded band or vertical markers.
+        """
+
+        if band is not None:
+            return self.ax.fill_between(time, *band, label=label, **style)
+
+        if values is None:
+            return self.ax.vlines(time, 0, 1,
+                                  transform=self.ax.get_xaxis_transform(),
+                                  label=label, **style)
+
+        return self.ax.plot(time, values, label=label, **style)[0]
+
+    def __main_series(self, info_parameter):
+        """
+        Return one raw line description per input file.
+        """
+
+        labels = unique_path_labels(self.reader.filenames)
+        main_series = []
+        for i, energy in enumerate(self.reader.energies):
+            energy_series = series(energy, info_parameter)
+            unit = parameter_unit(energy, info_parameter)
+            main_series.append((
+                ("main", i),
+                energy_series.time,
+                energy_series.values,
+                latest_value_label(labels[i], energy_series.values, unit),
+                {
+                    "linewidth": 1.6,
+                    "alpha": 0.92,
+                    "zorder": 2,
+                },
+                None,
+            ))
+
+        return main_series
+
+    def __overlay_series(self, info_parameter):
+        """
+        Return line descriptions for the enabled statistic overlays.
+        """
+
+        overlay_series = []
+        occurrences = Counter()
         try:
             unit = parameter_unit(self.reader.energies[0], info_parameter)
             for overlay in iter_time_series_overlays(
                 self.reader.energies,
                 info_parameter,
                 self.options,
+                live=self.live_statistics,
+                cache=self.statistics_cache,
+                data_version=getattr(self.reader, "data_version", None),
+                executor=self.statistics_executor,
             ):
-                self.ax.plot(
+                # features such as confidence intervals yield several series
+                index = occurrences[overlay.feature.key]
+                occurrences[overlay.feature.key] += 1
+                overlay_series.append((
+                    ("overlay", overlay.feature.key, index),
                     overlay.time,
                     overlay.values,
-                    label=latest_value_label(overlay.label, overlay.values,
-                                             unit),
-                    **overlay.feature.matplotlib_style,
-                )
+                    overlay.label
+                    if overlay.markers or overlay.points
+                    else latest_value_label(overlay.label, overlay.values,
+                                            unit),
+                    overlay.feature.matplotlib_style,
+                    (overlay.lower, overlay.upper) if overlay.band else None,
+                ))
         except ValueError as error:
             logger.warning("%s", error)
 
-        return None
+        return overlay_series
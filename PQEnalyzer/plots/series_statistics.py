@@ -0,0 +1,221 @@
+"""
+Series preparation and detector helpers shared by plot features and views.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+
+from ..energy_access import concatenate_series
+from ..statistics import (
+    Statistic,
+    decorrelated,
+    detect_change_points,
+    detect_equilibration,
+    outlier_mask,
+    subsampling_stride,
+)
+
+
+STRIDED_BAND_POINTS = 4096
+# Windows evaluated by sketch-mode percentile bands; long series are strided.
+
+
+def cached_statistic(cache, data_version, key, compute):
+    """
+    Return ``compute()``, memoized in ``cache`` for one data version.
+
+    Without a cache or a known data version the value is always computed.
+    """
+
+    if cache is None or data_version is None:
+        return compute()
+
+    return cache.get_or_compute((data_version, *key), compute)
+
+
+def statistics_key(options):
+    """
+    Return the option values that change every statistic of a series.
+    """
+
+    return (options.discard_equilibration, options.outliers,
+            options.quantile_mode)
+
+
+def statistics_series(energies, info_parameter, options):
+    """
+    Return the concatenated series that statistics are evaluated on.
+
+    With ``discard_equilibration`` enabled, rows before the automatically
+    detected equilibration start are dropped.
+    """
+
+    energy_series = concatenate_series(energies, info_parameter)
+    if not options.discard_equilibration or energy_series.values.size == 0:
+        return energy_series
+
+    return equilibrated_series(energy_series)
+
+
+def equilibrated_series(energy_series):
+    """
+    Return an energy series without its detected equilibration transient.
+    """
+
+    start = detect_equilibration(energy_series.values).start
+    return replace(
+        energy_series,
+        time=energy_series.time[start:],
+        values=energy_series.values[start:],
+        start=energy_series.start + start,
+    )
+
+
+def decorrelated_series(energy_series):
+    """
+    Return every ``g``-th row of an energy series.
+
+    ``g`` is the statistical inefficiency of the series, so the remaining
+    rows are approximately uncorrelated.
+    """
+
+    stride = subsampling_stride(energy_series.values)
+    return replace(
+        energy_series,
+        time=energy_series.time[::stride],
+        values=decorrelated(energy_series.values, stride),
+    )
+
+
+def inlier_series(energy_series):
+    """
+    Return an energy series without its detected outlier rows.
+    """
+
+    keep = ~outlier_mask(energy_series.values)
+    return replace(
+        energy_series,
+        time=energy_series.time[keep],
+        values=energy_series.values[keep],
+    )
+
+
+def median_sketch(energy_series, options, live):
+    """
+    Return the live quantile sketch for sketch-mode medians, if any.
+
+    Exact mode, and callers without live state, return ``None`` so medians
+    fall back to a full partition of the series. So does excluding outliers:
+    the sketch summarizes every row, spikes included.
+    """
+
+    if live is None or options.quantile_mode != "sketch" or options.outliers:
+        return None
+
+    return live.quantiles(energy_series.label, energy_series.values,
+                          energy_series.start)
+
+
+def change_point_rows(energy_series, options, live):
+    """
+    Return the rows of an energy series that start a new regime.
+
+    Exact mode segments the full series offline. Sketch mode, meant for
+    long runs, takes the change points of the online CUSUM detector in
+    ``live``, which only scans appended rows.
+    """
+
+    if live is None or options.quantile_mode != "sketch":
+        return detect_change_points(energy_series.values)
+
+    return np.array(
+        live.change_points(energy_series.label, energy_series.values,
+                           energy_series.start),
+        dtype=int,
+    )
+
+
+def outlier_rows(energy_series, options, live):
+    """
+    Return the outlier mask of an energy series.
+
+    Exact mode scans the full series with the rolling median and MAD.
+    Sketch mode, meant for long runs, takes the mask of the live detector in
+    ``live``, which only rescans the tail next to appended rows.
+    """
+
+    if live is None or options.quantile_mode != "sketch":
+        return outlier_mask(energy_series.values)
+
+    return live.outliers(energy_series.label, energy_series.values,
+                         energy_series.start)
+
+
+def rolling_quantiles(energy_series, window_size, quantiles, stride):
+    """
+    Return window-center times and a list of one rolling series per quantile.
+    """
+
+    time = None
+    values = []
+    for quantile in quantiles:
+        time, quantile_values = Statistic.rolling_quantile_values(
+            energy_series.time,
+            energy_series.values,
+            window_size,
+            quantile,
+            stride,
+        )
+        values.append(quantile_values)
+
+    return time, values
+
+
+def percentile_band_stride(rows, window_size, options):
+    """
+    Return the window stride of rolling percentile bands.
+
+    Exact mode evaluates every window. Sketch mode, meant for long runs,
+    evaluates at most ``STRIDED_BAND_POINTS`` evenly spaced windows.
+    """
+
+    if options.quantile_mode != "sketch":
+        return 1
+
+    windows = max(rows - window_size + 1, 1)
+    return -(-windows // STRIDED_BAND_POINTS)
+
+
+def running_average_window(values, requested_window_size, *, policy):
+    """
+    Return a positive running-average window for a series.
+    """
+
+    try:
+        window_size = _parse_window_size(requested_window_size)
+    except ValueError:
+        if policy != "clamp":
+            raise
+        window_size = len(values)
+
+    if policy == "clamp":
+        window_size = min(window_size, len(values))
+
+    return window_size
+
+
+def _parse_window_size(requested_window_size):
+    """
+    Parse a positive running-average window size.
+    """
+
+    requested = str(requested_window_size).strip()
+    if requested in {"", "."}:
+        return 1000
+
+    window_size = int(float(requested))
+    if window_size < 1:
+        raise ValueError("Window size must be positive")
+
+    return window_size
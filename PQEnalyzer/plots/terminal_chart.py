@@ -10,9 +10,15 @@ from .labels import unique_path_labels
 
 
 def build_terminal_chart(reader, info_parameter, width=88, height=22,
-                         options=None):
+                         options=None, live=None, cache=None, executor=None):
     """
     Return a plotext chart for one parameter as ANSI text.
+
+    ``live`` is the optional ``LiveStatistics`` state of the terminal view and
+    ``cache`` an optional ``StatisticsCache`` for its overlays, which are
+    computed concurrently on ``executor`` if given. Band overlays are drawn
+    as their lower and upper edges, marker overlays as vertical lines and
+    point overlays as scattered points.
     """
 
     plt.clear_figure()
@@ -34,7 +40,30 @@ def build_terminal_chart(reader, info_parameter, width=88, height=22,
             info_parameter,
             options,
             window_policy="clamp",
+            live=live,
+            cache=cache,
+            data_version=getattr(reader, "data_version", None),
+            executor=executor,
         ):
+            if overlay.band:
+                plt.plot(overlay.time, overlay.lower,
+                         label=f"{overlay.label} lower")
+                plt.plot(overlay.time, overlay.upper,
+                         label=f"{overlay.label} upper")
+                continue
+
+            if overlay.markers:
+                for time in overlay.time:
+                    plt.vline(time)
+                continue
+
+            if overlay.points:
+                # plotext cannot draw a legend entry without points
+                if len(overlay.time):
+                    plt.scatter(overlay.time, overlay.values, marker="x",
+                                label=overlay.label)
+                continue
+
             plt.plot(
                 overlay.time,
                 overlay.values,
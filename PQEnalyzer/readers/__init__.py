@@ -2,5 +2,7 @@
 This module includes reader classes that read data using PQAnalysis.
 """
 from .box_reader import BoxReader
+from .converted import ConvertedReader
+from .derived import DerivedReader
 from .factory import create_reader
 from .reader import Reader
@@ -96,6 +96,7 @@ class BoxReader:
 
         self.energies = []
         self.filenames = list(filenames)
+        self.data_version = 0
         self.read()
 
     def read(self):
@@ -107,6 +108,7 @@ class BoxReader:
         self.energies = [
             self.__read_box_file(filename) for filename in self.filenames
         ]
+        self.data_version += 1
 
     def read_last(self):
         """
@@ -115,6 +117,7 @@ class BoxReader:
 
         self.__validate_filenames()
         self.energies[-1] = self.__read_box_file(self.filenames[-1])
+        self.data_version += 1
 
     def __read_box_file(self, filename):
         """
@@ -0,0 +1,130 @@
+"""
+Display units for energy columns.
+
+A target such as ``PRESSURE=GPa`` converts the column of every read energy to
+the requested unit with one in-place multiply-add, see ``PQEnalyzer.units``.
+``ConvertedReader`` wraps any reader and converts only the energies that a
+read replaced, so a refresh converts the rows of the refreshed file once.
+"""
+
+import re
+
+from ..units import convert_energy, unit_conversion
+
+
+_TARGET = re.compile(r"^\s*(?P<label>[^=]+?)\s*=\s*(?P<unit>\S+)\s*$")
+
+
+def parse_unit_targets(definitions, energy) -> dict:
+    """
+    Parse ``LABEL=UNIT`` definitions into target units keyed by label.
+
+    Parameters
+    ----------
+    definitions : list of str
+        Target definitions; a later definition of a label wins.
+    energy : object
+        Energy object whose columns and units the targets must match.
+
+    Returns
+    -------
+    dict
+        Target units keyed by column label.
+
+    Raises
+    ------
+    ValueError
+        If a definition is malformed, names an unknown column or requests a
+        unit that the column cannot be converted to.
+    """
+
+    targets = {}
+    for definition in definitions:
+        match = _TARGET.match(definition)
+        if match is None:
+            raise ValueError(
+                f"Unit target {definition!r} must have the form LABEL=UNIT")
+
+        label, unit = match["label"], match["unit"]
+        if label not in energy.info:
+            raise ValueError(f"Unknown column {label!r}")
+
+        try:
+            unit_conversion(energy.units[label], unit)
+        except ValueError as error:
+            raise ValueError(f"Column {label!r}: {error}") from error
+
+        targets[label] = unit
+
+    return targets
+
+
+class ConvertedReader:
+    """
+    Reader adapter that shows energy columns in requested units.
+
+    Parameters
+    ----------
+    reader : Reader or BoxReader
+        Reader of the columns in their file units.
+    definitions : list of str
+        ``LABEL=UNIT`` targets.
+
+    Raises
+    ------
+    ValueError
+        If a target is invalid for the reader's columns.
+    """
+
+    def __init__(self, reader, definitions):
+        self.reader = reader
+        self.targets = parse_unit_targets(definitions, reader.energies[0])
+        for energy in self.energies:
+            convert_energy(energy, self.targets)
+
+    @property
+    def energies(self) -> list:
+        """
+        Return the converted energies of the wrapped reader.
+        """
+
+        return self.reader.energies
+
+    @property
+    def filenames(self) -> list:
+        """
+        Return the filenames of the wrapped reader.
+        """
+
+        return self.reader.filenames
+
+    @property
+    def data_version(self):
+        """
+        Return the data version of the wrapped reader, if it has one.
+        """
+
+        return getattr(self.reader, "data_version", None)
+
+    def read(self):
+        """
+        Read all files and convert every energy.
+        """
+
+        self.reader.read()
+        for energy in self.energies:
+            convert_energy(energy, self.targets)
+
+    def read_last(self):
+        """
+        Refresh the last file and convert only its energy.
+        """
+
+        self.reader.read_last()
+        convert_energy(self.energies[-1], self.targets)
+
+    def __getattr__(self, name):
+        if name == "reader":
+            raise AttributeError(name)
+
+        return getattr(self.reader, name)
@@ -0,0 +1,389 @@
+"""
+Derived columns computed from expressions over energy columns.
+
+A definition such as ``EQM_PER_ATOM=E(QM)/N(QM-ATOMS)`` or
+``P_ATM[atm]=PRESSURE/1.01325`` names a new column, optionally gives its unit
+in brackets and defines it by an arithmetic expression over existing column
+labels, earlier derived columns, numeric constants and the functions in
+``FUNCTIONS``. Column labels are matched literally, longest first, so labels
+containing parentheses or hyphens need no quoting. Each expression is
+validated once and compiled into a Python code object whose operators act on
+whole NumPy arrays, so evaluating a column is a handful of vectorized
+operations.
+
+``DerivedReader`` wraps any reader and presents every energy with the derived
+columns appended to ``info``, ``units`` and ``data``. After ``read_last`` only
+the rows appended to the refreshed file are evaluated.
+"""
+
+import ast
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..energy_access import parameter_values, simulation_time
+
+
+FUNCTIONS = {
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "exp": np.exp,
+    "log": np.log,
+    "log10": np.log10,
+}
+# Functions available in derived-column expressions.
+
+DEFAULT_DERIVED_UNIT = "-"
+
+_DEFINITION = re.compile(
+    r"^\s*(?P<name>[^=\[\]\s]+)\s*(?:\[(?P<unit>[^\]]*)\])?\s*="
+    r"(?P<expression>.+)$")
+
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod,
+              ast.UAdd, ast.USub)
+
+
+@dataclass(frozen=True)
+class DerivedColumn:
+    """
+    Compiled definition of one derived column.
+
+    Attributes
+    ----------
+    name : str
+        Label of the derived column.
+    expression : str
+        Source expression of the definition.
+    unit : str
+        Unit of the derived column.
+    labels : tuple
+        Referenced column labels in the order of their placeholders.
+    code : types.CodeType
+        Compiled expression over the placeholders ``_c0``, ``_c1``, ...
+    """
+
+    name: str
+    expression: str
+    unit: str
+    labels: tuple
+    code: object
+
+    def evaluate(self, values) -> np.ndarray:
+        """
+        Evaluate the expression for arrays of the referenced labels.
+
+        Parameters
+        ----------
+        values : dict
+            Equally long arrays keyed by every label in ``labels``.
+
+        Returns
+        -------
+        np.ndarray
+            Derived values; invalid operations give ``nan`` or ``inf``.
+        """
+
+        namespace = {
+            f"_c{index}": np.asarray(values[label], dtype=float)
+            for index, label in enumerate(self.labels)
+        }
+        scope = {"__builtins__": {}, **FUNCTIONS}
+        with np.errstate(all="ignore"):
+            # the code was validated to contain arithmetic on arrays only
+            # pylint: disable-next=eval-used
+            result = eval(self.code, scope, namespace)
+
+        return np.asarray(result, dtype=float)
+
+
+def parse_derived_column(definition: str, labels) -> DerivedColumn:
+    """
+    Parse and compile one ``NAME[unit]=EXPRESSION`` definition.
+
+    Parameters
+    ----------
+    definition : str
+        Column definition; the bracketed unit is optional.
+    labels : iterable of str
+        Column labels the expression may reference.
+
+    Returns
+    -------
+    DerivedColumn
+        Compiled derived column.
+
+    Raises
+    ------
+    ValueError
+        If the definition is malformed, redefines a column or uses anything
+        other than column labels, numbers, arithmetic and ``FUNCTIONS``.
+
+    Examples
+    --------
+    >>> column = parse_derived_column("E_SUM[kcal/mol]=E(QM)+2*E(KIN)",
+    ...                               ["E(QM)", "E(KIN)"])
+    >>> column.labels, column.unit
+    (('E(QM)', 'E(KIN)'), 'kcal/mol')
+    >>> column.evaluate({"E(QM)": np.array([1.0]), "E(KIN)": np.array([2.0])})
+    array([5.])
+    """
+
+    match = _DEFINITION.match(definition)
+    if match is None:
+        raise ValueError(
+            f"Derived column {definition!r} must have the form NAME=EXPR")
+
+    labels = list(labels)
+    name = match["name"]
+    if name in labels:
+        raise ValueError(f"Derived column {name!r} already exists")
+
+    referenced = []
+
+    def placeholder(label_match):
+        label = label_match.group(0)
+        if label not in referenced:
+            referenced.append(label)
+        return f"_c{referenced.index(label)}"
+
+    expression = match["expression"].strip()
+    pattern = "|".join(re.escape(label)
+                       for label in sorted(labels, key=len, reverse=True))
+    source = re.sub(pattern, placeholder, expression) if labels else expression
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as error:
+        raise ValueError(
+            f"Invalid expression of derived column {name!r}: "
+            f"{expression}") from error
+
+    _validate(tree, name, len(referenced))
+    if not referenced:
+        raise ValueError(
+            f"Derived column {name!r} must reference at least one column")
+
+    return DerivedColumn(
+        name=name,
+        expression=expression,
+        unit=(match["unit"] or DEFAULT_DERIVED_UNIT).strip(),
+        labels=tuple(referenced),
+        code=compile(tree, f"<derived {name}>", "eval"),
+    )
+
+
+def parse_derived_columns(definitions, labels) -> list:
+    """
+    Parse definitions in order; later ones may reference earlier ones.
+    """
+
+    labels = list(labels)
+    columns = []
+    for definition in definitions:
+        column = parse_derived_column(definition, labels)
+        columns.append(column)
+        labels.append(column.name)
+
+    return columns
+
+
+def _validate(tree, name, placeholders):
+    """
+    Reject syntax other than arithmetic on placeholders and constants.
+    """
+
+    allowed_names = {f"_c{index}" for index in range(placeholders)}
+    functions = {id(node.func) for node in ast.walk(tree)
+                 if isinstance(node, ast.Call)}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            if (
+                not isinstance(node.func, ast.Name)
+                or node.func.id not in FUNCTIONS
+                or len(node.args) != 1
+                or node.keywords
+            ):
+                raise ValueError(
+                    f"Derived column {name!r} calls an unsupported function; "
+                    f"use one of {', '.join(FUNCTIONS)}")
+        elif isinstance(node, ast.Name):
+            if node.id not in allowed_names and id(node) not in functions:
+                raise ValueError(
+                    f"Derived column {name!r} references unknown column "
+                    f"{node.id!r}")
+        elif isinstance(node, ast.Constant):
+            if (
+                not isinstance(node.value, (int, float))
+                or isinstance(node.value, bool)
+            ):
+                raise ValueError(
+                    f"Derived column {name!r} may only use numeric constants")
+        elif not isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp,
+                                   ast.Load, *_OPERATORS)):
+            raise ValueError(
+                f"Derived column {name!r} uses unsupported syntax "
+                f"{type(node).__name__}")
+
+
+class DerivedData:
+    """
+    ``data`` mapping of a ``DerivedEnergy``.
+
+    Derived labels return their arrays; every other key is looked up in the
+    wrapped energy's ``data``.
+    """
+
+    def __init__(self, data, derived):
+        self.base = data
+        self.derived = derived
+
+    def __getitem__(self, key):
+        if isinstance(key, str) and key in self.derived:
+            return self.derived[key]
+
+        return self.base[key]
+
+
+class DerivedEnergy:
+    """
+    Energy object with derived columns appended.
+
+    All attributes other than ``info``, ``units`` and ``data`` are forwarded
+    to the wrapped energy, so PQAnalysis attributes keep working.
+
+    Attributes
+    ----------
+    energy : object
+        Wrapped energy object.
+    derived : dict
+        Derived arrays keyed by column label.
+    """
+
+    def __init__(self, energy, columns, derived):
+        self.energy = energy
+        self.derived = derived
+        self.info = {**energy.info, **{column.name: column.name
+                                       for column in columns}}
+        self.units = {**energy.units, **{column.name: column.unit
+                                         for column in columns}}
+        self.data = DerivedData(energy.data, derived)
+
+    def __getattr__(self, name):
+        if name == "energy":
+            raise AttributeError(name)
+
+        return getattr(self.energy, name)
+
+
+def derive_energy(energy, columns, previous=None) -> DerivedEnergy:
+    """
+    Return ``energy`` with derived columns appended.
+
+    When ``previous`` is the derived view of an earlier read of the same file
+    and the file only grew, only the appended rows are evaluated.
+    """
+
+    start = _consumed_rows(energy, columns, previous)
+    values = {}
+    derived = {}
+    for column in columns:
+        inputs = {
+            label: (values[label] if label in values
+                    else parameter_values(energy, label)[start:])
+            for label in column.labels
+        }
+        values[column.name] = column.evaluate(inputs)
+        derived[column.name] = values[column.name]
+        if start > 0:
+            derived[column.name] = np.concatenate(
+                (previous.derived[column.name][:start], values[column.name]))
+
+    return DerivedEnergy(energy, columns, derived)
+
+
+def _consumed_rows(energy, columns, previous):
+    """
+    Return how many leading rows of ``previous`` are still valid.
+    """
+
+    if previous is None:
+        return 0
+
+    rows = len(simulation_time(previous.energy))
+    if rows == 0 or len(simulation_time(energy)) < rows:
+        return 0
+
+    labels = {label for column in columns for label in column.labels
+              if label not in previous.derived}
+    for label in labels:
+        old = parameter_values(previous.energy, label)[rows - 1]
+        new = parameter_values(energy, label)[rows - 1]
+        if not (old == new or (np.isnan(old) and np.isnan(new))):
+            return 0
+
+    return rows
+
+
+class DerivedReader:
+    """
+    Reader adapter that appends derived columns to every energy.
+
+    Parameters
+    ----------
+    reader : Reader or BoxReader
+        Reader of the raw columns.
+    definitions : list of str
+        ``NAME[unit]=EXPRESSION`` definitions, evaluated in order.
+
+    Raises
+    ------
+    ValueError
+        If a definition is invalid for the reader's columns.
+    """
+
+    def __init__(self, reader, definitions):
+        self.reader = reader
+        self.columns = parse_derived_columns(definitions,
+                                             reader.energies[0].info)
+        self.energies = [derive_energy(energy, self.columns)
+                         for energy in reader.energies]
+
+    @property
+    def filenames(self) -> list:
+        """
+        Return the filenames of the wrapped reader.
+        """
+
+        return self.reader.filenames
+
+    @property
+    def data_version(self):
+        """
+        Return the data version of the wrapped reader, if it has one.
+        """
+
+        return getattr(self.reader, "data_version", None)
+
+    def read(self):
+        """
+        Read all files and evaluate the derived columns of every row.
+        """
+
+        self.reader.read()
+        self.energies = [derive_energy(energy, self.columns)
+                         for energy in self.reader.energies]
+
+    def read_last(self):
+        """
+        Refresh the last file and evaluate derived columns of appended rows.
+        """
+
+        self.reader.read_last()
+        self.energies[-1] = derive_energy(self.reader.energies[-1],
+                                          self.columns, self.energies[-1])
+
+    def __getattr__(self, name):
+        if name == "reader":
+            raise AttributeError(name)
+
+        return getattr(self.reader, name)
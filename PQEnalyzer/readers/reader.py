@@ -8,6 +8,8 @@ can compare multiple files.
 
 from PQAnalysis.io import EnergyFileReader
 
+from ..units import convert_energy, convertible
+
 
 class Reader:
     """
@@ -15,7 +17,8 @@ class Reader:
 
     PQAnalysis owns the energy-file parsing. This wrapper keeps the
     PQEnalyzer-specific behavior around multi-file reads: every selected file
-    must expose the same parameter mapping and units before plotting.
+    must expose the same parameter mapping and units, or units convertible to
+    those of the first file, before plotting.
 
     Attributes
     ----------
@@ -25,6 +28,9 @@ class Reader:
         The energy filenames to read.
     md_format : MDEngineFormat
         The molecular dynamics engine format.
+    data_version : int
+        Counter incremented whenever ``energies`` is replaced or refreshed.
+        Caches key computed statistics on it.
 
     Methods
     -------
@@ -63,6 +69,7 @@ class Reader:
         self.energies = []
         self.filenames = list(filenames)
         self.md_format = md_format
+        self.data_version = 0
         self.read()
 
     def read(self):
@@ -82,6 +89,7 @@ class Reader:
         self.__validate_energy_compatibility(energies)
 
         self.energies = energies
+        self.data_version += 1
 
     def read_last(self):
         """
@@ -99,6 +107,7 @@ class Reader:
 
         self.__validate_energy_compatibility(refreshed_energies)
         self.energies[-1] = refreshed_energy
+        self.data_version += 1
 
     def __read_energy_file(self, filename):
         """
@@ -122,12 +131,14 @@ class Reader:
         Check if all energy files expose the same parameters and units.
 
         Multi-file plots assume each parameter label refers to the same column
-        and unit in every file. Rejecting mismatches here keeps plotting and
-        statistics code simple.
+        and unit in every file. Columns in a different but convertible unit
+        are converted in place to the first file's unit; other mismatches are
+        rejected, which keeps plotting and statistics code simple.
         """
 
         reference_info = energies[0].info
         reference_units = energies[0].units
+        conversions = []
 
         for index, energy in enumerate(energies[1:], start=1):
             if energy.info != reference_info:
@@ -136,6 +147,20 @@ class Reader:
                     f"{self.filenames[0]} and {self.filenames[index]}.")
 
             if energy.units != reference_units:
-                raise ValueError(
-                    "The energy files do not have the same units: "
-                    f"{self.filenames[0]} and {self.filenames[index]}.")
+                targets = {
+                    label: unit
+                    for label, unit in reference_units.items()
+                    if energy.units.get(label) != unit
+                }
+                if not all(
+                    convertible(energy.units.get(label, ""), unit)
+                    for label, unit in targets.items()
+                ):
+                    raise ValueError(
+                        "The energy files do not have the same units: "
+                        f"{self.filenames[0]} and {self.filenames[index]}.")
+
+                conversions.append((energy, targets))
+
+        for energy, targets in conversions:
+            convert_energy(energy, targets)
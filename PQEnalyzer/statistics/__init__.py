@@ -1,4 +1,68 @@
 """
 Init of the statistics module.
 """
+from .bootstrap import BootstrapInterval, block_bootstrap
+from .cache import CacheStats, StatisticsCache
+from .changepoint import cusum, detect_change_points, long_run_variance
+from .conservation import (
+    ConservationLimits,
+    ConservationMonitor,
+    ConservationStatus,
+)
+from .correlation import (
+    CrossCorrelation,
+    correlation_matrix,
+    cross_correlation,
+)
+from .density import kde_bandwidth, kernel_density
+from .drift import DriftResult, linear_drift, rolling_drift
+from .ensemble import EnsembleStatistics, ensemble_statistics
+from .equilibration import (
+    EquilibrationResult,
+    autocorrelation,
+    detect_equilibration,
+    statistical_inefficiency,
+)
+from .outliers import outlier_mask, rolling_median_mad
+from .parallel import default_workers, ordered_map, statistics_executor
+from .quantile_sketch import QuantileSketch
+from .rolling import (
+    rolling_max,
+    rolling_mean_std,
+    rolling_min,
+    rolling_quantile,
+    window_centers,
+)
+from .smoothing import exponential_moving_average, savitzky_golay
+from .spectrum import dominant_frequency, sample_spacing, welch_psd
 from .statistic import Statistic
+from .subsampling import decorrelated, subsampling_stride
+from .streaming import (
+    CumulativeAverage,
+    CusumDetector,
+    ExponentialMovingAverage,
+    LiveStatistics,
+    OutlierDetector,
+    SavitzkyGolaySmoother,
+    SeriesAccumulator,
+    StreamingHistogram,
+    StreamingMoments,
+    StreamingQuantiles,
+)
+from .summary import ColumnSummary, summarize_columns
+from .throughput import (
+    RunThroughput,
+    ThroughputMonitor,
+    ThroughputReport,
+    ThroughputStatus,
+    format_duration,
+)
+from .fluctuation import (
+    COMPRESSIBILITY,
+    FLUCTUATION_PROPERTIES,
+    HEAT_CAPACITY,
+    FluctuationAccumulator,
+    FluctuationEstimate,
+    FluctuationMonitor,
+    FluctuationProperty,
+)
@@ -0,0 +1,250 @@
+"""
+Moving-block bootstrap confidence intervals for means and medians.
+
+Resampling single rows of a correlated series underestimates the spread of
+its statistics, so resamples are stitched together from blocks of
+consecutive rows whose length defaults to a few statistical inefficiencies of
+the series. Block start indices of many resamples are drawn as one integer
+array and gathered with a single fancy-indexing operation per chunk; chunks
+are sized so the gathered values stay below ``RESAMPLE_CHUNK_ELEMENTS`` and
+can be evaluated on any ``concurrent.futures`` executor. Means do not need the
+gathered values at all: every block has the same length, so the mean of a
+resample is the mean of its precomputed block means.
+"""
+
+import functools
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from .equilibration import statistical_inefficiency
+from .parallel import ordered_map
+from .subsampling import subsampling_stride
+
+
+DEFAULT_RESAMPLES = 1000
+
+BLOCK_INEFFICIENCIES = 4
+# Default block length in statistical inefficiencies; shorter blocks cut
+# correlations at their edges and narrow the interval.
+
+MIN_BLOCKS = 4
+# Longer default blocks are shortened so resamples can still differ.
+
+MAX_BOOTSTRAP_POINTS = 16384
+# Longer series are thinned to about this many rows first.
+
+RESAMPLE_CHUNK_ELEMENTS = 1 << 22
+# Gathered values per chunk; bounds temporary arrays to about 32 MB.
+
+BOOTSTRAP_STATISTICS = ("mean", "median")
+
+
+@dataclass(frozen=True)
+class BootstrapInterval:
+    """
+    Percentile bootstrap confidence interval of one statistic.
+
+    Attributes
+    ----------
+    estimate : float
+        Statistic of the full input series.
+    lower : float
+        Lower interval edge.
+    upper : float
+        Upper interval edge.
+    confidence : float
+        Confidence level of the interval.
+    resamples : int
+        Number of bootstrap resamples.
+    block_size : int
+        Rows per resampled block of the evaluated, possibly thinned, series.
+    """
+
+    estimate: float
+    lower: float
+    upper: float
+    confidence: float
+    resamples: int
+    block_size: int
+
+
+def block_bootstrap(values, statistic="mean", *, confidence=0.95,
+                    resamples=DEFAULT_RESAMPLES, block_size=None, seed=0,
+                    max_points=MAX_BOOTSTRAP_POINTS,
+                    executor=None) -> BootstrapInterval:
+    """
+    Return a moving-block bootstrap confidence interval.
+
+    Parameters
+    ----------
+    values : array-like
+        Time-ordered series.
+    statistic : {"mean", "median"}, optional
+        Statistic to resample.
+    confidence : float, optional
+        Confidence level in ``(0, 1)``.
+    resamples : int, optional
+        Number of bootstrap resamples.
+    block_size : int, optional
+        Rows per block; ``BLOCK_INEFFICIENCIES`` statistical inefficiencies
+        of the series by default, so blocks span its correlation time, but
+        short enough for ``MIN_BLOCKS`` blocks.
+    seed : int, optional
+        Seed of the resampling generator. A fixed seed keeps redrawn
+        intervals from jittering.
+    max_points : int, optional
+        Longer series are thinned before resampling: means of consecutive
+        groups of ``k`` rows for ``"mean"``, which keeps the variance of the
+        mean, and every ``k``-th row for ``"median"``. Explicit block sizes
+        shrink by ``k``, and the interval of the thinned series is shifted
+        onto the full-series estimate. Median intervals are also narrowed by
+        the square root of the ratio of the effective sample sizes of the
+        thinned and full series, since every ``k``-th row carries less
+        information than all rows unless ``k`` is below the correlation
+        time.
+    executor : concurrent.futures.Executor, optional
+        Evaluates resample chunks concurrently, for example a thread or
+        process pool. Results do not depend on the executor.
+
+    Returns
+    -------
+    BootstrapInterval
+        Point estimate and percentile interval.
+
+    Raises
+    ------
+    ValueError
+        If the series is empty or an argument is invalid.
+
+    Examples
+    --------
+    >>> interval = block_bootstrap(np.arange(100.0), block_size=1)
+    >>> interval.lower < interval.estimate == 49.5 < interval.upper
+    True
+    """
+
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        raise ValueError("Bootstrap needs at least one data point")
+
+    if statistic not in BOOTSTRAP_STATISTICS:
+        raise ValueError(f"Unknown bootstrap statistic {statistic!r}")
+
+    if not 0 < confidence < 1:
+        raise ValueError("Confidence must be between zero and one")
+
+    if resamples < 1:
+        raise ValueError("Resample count must be at least one")
+
+    if block_size is not None and block_size < 1:
+        raise ValueError("Block size must be at least one")
+
+    stride = max(1, math.ceil(values.size / max_points))
+    data = _thinned(values, stride, statistic)
+    if block_size is None:
+        block_size = min(BLOCK_INEFFICIENCIES * subsampling_stride(data),
+                         max(1, data.size // MIN_BLOCKS))
+    else:
+        block_size = min(math.ceil(block_size / stride), data.size)
+    blocks = data.size // block_size
+
+    if statistic == "mean":
+        sums = np.concatenate(([0.0], np.cumsum(data)))
+        block_means = (sums[block_size:] - sums[:-block_size]) / block_size
+        evaluate = functools.partial(_resampled_means, block_means)
+    else:
+        evaluate = functools.partial(_resampled_medians, data, block_size)
+
+    rng = np.random.default_rng(seed)
+    chunk = max(1, RESAMPLE_CHUNK_ELEMENTS // (blocks * block_size))
+    starts = [
+        rng.integers(0, data.size - block_size + 1,
+                     size=(min(chunk, resamples - first), blocks))
+        for first in range(0, resamples, chunk)
+    ]
+    estimates = np.concatenate(ordered_map(evaluate, starts, executor))
+
+    tail = (1.0 - confidence) / 2.0
+    lower, upper = np.quantile(estimates, [tail, 1.0 - tail])
+    estimate = _statistic(values, statistic)
+    center, scale = estimate, 1.0
+    if stride > 1:
+        center = _statistic(data, statistic)
+        if statistic == "median":
+            scale = _thinning_scale(values, data, stride)
+
+    return BootstrapInterval(
+        estimate=estimate,
+        lower=float(estimate + (lower - center) * scale),
+        upper=float(estimate + (upper - center) * scale),
+        confidence=confidence,
+        resamples=resamples,
+        block_size=block_size,
+    )
+
+
+def _statistic(values, statistic):
+    """
+    Return the named statistic of a series.
+    """
+
+    if statistic == "mean":
+        return float(np.mean(values))
+
+    return float(np.median(values))
+
+
+def _thinned(values, stride, statistic):
+    """
+    Return the series reduced by ``stride`` for resampling ``statistic``.
+    """
+
+    if stride == 1:
+        return values
+
+    if statistic == "mean":
+        groups = values.size // stride
+        return values[:groups * stride].reshape(groups, stride).mean(axis=1)
+
+    return values[::stride]
+
+
+def _thinning_scale(values, data, stride):
+    """
+    Return the ratio of the standard errors of the full and thinned series.
+
+    Standard errors scale with one over the square root of the effective
+    sample size ``n / g``. The full series is not autocorrelated directly:
+    its mean has the variance of the ``stride``-row group means times their
+    statistical inefficiency over their count, and its effective size is the
+    series variance over that.
+    """
+
+    means = _thinned(values, stride, "mean")
+    mean_variance = (float(np.var(means)) * statistical_inefficiency(means)
+                     / means.size)
+    if mean_variance == 0:
+        return 1.0
+
+    full = float(np.var(values)) / mean_variance
+    thinned = data.size / statistical_inefficiency(data)
+    return min(1.0, math.sqrt(thinned / full))
+
+
+def _resampled_means(block_means, starts):
+    """
+    Return the means of resamples built from the blocks at ``starts``.
+    """
+
+    return block_means[starts].mean(axis=1)
+
+
+def _resampled_medians(data, block_size, starts):
+    """
+    Return the medians of resamples built from the blocks at ``starts``.
+    """
+
+    indices = starts[:, :, np.newaxis] + np.arange(block_size)
+    return np.median(data[indices.reshape(len(starts), -1)], axis=1)
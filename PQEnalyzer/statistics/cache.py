@@ -0,0 +1,211 @@
+"""
+Memoization of computed statistics across views and refreshes.
+
+Plot windows and terminal charts evaluate statistics statelessly, so switching
+parameters, toggling features or opening several windows on one parameter
+repeat identical work. ``StatisticsCache`` keeps recent results under a
+memory budget; keys start with the reader data version so a refresh that read
+new rows never returns stale values.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Snapshot of cache effectiveness for tuning its memory budget.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups answered from the cache.
+    misses : int
+        Lookups that computed a new value.
+    evictions : int
+        Entries dropped to stay within the budget.
+    entries : int
+        Number of cached values.
+    nbytes : int
+        Estimated memory held by cached values.
+    max_bytes : int
+        Memory budget of the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Return the fraction of lookups answered from the cache.
+        """
+
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def describe(self) -> str:
+        """
+        Return a compact one-line description for status displays and logs.
+        """
+
+        return (f"{self.hit_rate:.0%} hits ({self.hits}/"
+                f"{self.hits + self.misses}), {self.entries} entries, "
+                f"{self.nbytes / 2**20:.1f}/{self.max_bytes / 2**20:.0f} MiB")
+
+
+class StatisticsCache:
+    """
+    Least-recently-used cache of statistic results with a memory budget.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory budget for cached values. Values larger than the budget are
+        returned without being stored; ``0`` disables caching.
+    max_entries : int, optional
+        Upper bound on the number of cached values.
+
+    Lookups are thread-safe. Values are computed outside the lock, so
+    concurrent misses of different keys compute in parallel.
+
+    Examples
+    --------
+    >>> cache = StatisticsCache()
+    >>> cache.get_or_compute(("v1", "TEMPERATURE", "mean"), lambda: 300.0)
+    300.0
+    >>> cache.stats().misses
+    1
+    """
+
+    def __init__(self, max_bytes=64 * 2**20, max_entries=1024):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for ``key`` or compute and store it.
+
+        ``key`` must be hashable and should contain everything the result
+        depends on, including the data version.
+        """
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return self.__entries[key][0]
+
+            self.misses += 1
+
+        value = compute()
+        nbytes = estimate_nbytes(value)
+        if nbytes <= self.max_bytes and self.max_entries > 0:
+            with self.__lock:
+                if key not in self.__entries:
+                    self.__entries[key] = (value, nbytes)
+                    self.nbytes += nbytes
+                    self.__evict()
+
+        return value
+
+    def stats(self) -> CacheStats:
+        """
+        Return the current hit, miss and size counters.
+        """
+
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self.__entries),
+            nbytes=self.nbytes,
+            max_bytes=self.max_bytes,
+        )
+
+    def clear(self) -> None:
+        """
+        Drop all cached values while keeping the hit and miss counters.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+            self.nbytes = 0
+
+    def __evict(self):
+        """
+        Drop least recently used values until the budget is respected.
+        """
+
+        while (
+            self.nbytes > self.max_bytes
+            or len(self.__entries) > self.max_entries
+        ):
+            _, (_, nbytes) = self.__entries.popitem(last=False)
+            self.nbytes -= nbytes
+            self.evictions += 1
+
+
+def estimate_nbytes(value) -> int:
+    """
+    Estimate the memory held by a cached value.
+
+    Array buffers dominate statistic results, so arrays inside tuples, lists
+    and dataclasses are counted by ``nbytes`` and other objects by
+    ``sys.getsizeof``. Views, such as strided subsamples or slices of a
+    series, keep their whole base array alive and are counted by the base's
+    ``nbytes``; bases shared by several arrays of one value count once.
+
+    Examples
+    --------
+    >>> values = np.zeros(100)
+    >>> estimate_nbytes(values[::10])
+    800
+    >>> estimate_nbytes((values[:50], values[50:]))
+    800
+    """
+
+    return _estimate_nbytes(value, set())
+
+
+def _estimate_nbytes(value, seen):
+    """
+    Estimate the memory held by ``value``, skipping array bases in ``seen``.
+    """
+
+    if isinstance(value, np.ndarray):
+        while isinstance(value.base, np.ndarray):
+            value = value.base
+        if id(value) in seen:
+            return 0
+
+        seen.add(id(value))
+        return int(value.nbytes)
+
+    if is_dataclass(value) and not isinstance(value, type):
+        return sum(
+            _estimate_nbytes(getattr(value, field.name), seen)
+            for field in fields(value))
+
+    if isinstance(value, (tuple, list)):
+        return sum(_estimate_nbytes(item, seen) for item in value)
+
+    return sys.getsizeof(value)
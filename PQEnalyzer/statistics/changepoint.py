@@ -0,0 +1,173 @@
+"""
+Change-point detection for simulation time series.
+
+A run changes regime when, for example, a barostat is kicked, the QM region
+is redefined or a restart uses different settings; the mean of a parameter
+then jumps. Offline detection uses binary segmentation with a squared-error
+cost: prefix sums of the series give the cost reduction of every split of a
+segment in one vectorized pass, so segmenting ``n`` rows costs
+``O(n log n)`` for balanced splits. A split is kept when it lowers the cost
+by more than a BIC-like penalty times the long-run variance of the series,
+the variance of its mean times its length. The long-run variance includes
+the noise correlations of MD output, so correlated noise does not produce
+spurious changes, and it is estimated from differences of adjacent block
+means, which a few mean jumps do not distort.
+
+Growing series are monitored online with a two-sided CUSUM, whose recursion
+``S_t = max(0, S_{t-1} + x_t)`` is evaluated for whole blocks of appended
+rows at once, see ``cusum`` and ``CusumDetector``.
+"""
+
+import math
+
+import numpy as np
+
+
+PENALTY_FACTOR = 3.0
+# Default split penalty in units of log(n) times the long-run variance.
+
+MIN_BLOCK_PAIRS = 16
+# Fewest adjacent block pairs of a long-run variance estimate.
+
+CHI2_MEDIAN = 0.4549364231195724
+# Median of a chi-squared distribution with one degree of freedom.
+
+
+def detect_change_points(values, *, penalty=None,
+                         min_size=2) -> np.ndarray:
+    """
+    Return the rows that start a new regime of the series mean.
+
+    Parameters
+    ----------
+    values : array-like
+        Time-ordered series.
+    penalty : float, optional
+        Smallest cost reduction of an accepted split in units of the
+        long-run variance; ``PENALTY_FACTOR * log(n)`` by default.
+    min_size : int, optional
+        Fewest rows of a segment.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the first row of every segment after the first.
+
+    Raises
+    ------
+    ValueError
+        If ``penalty`` is negative or ``min_size`` is smaller than one.
+
+    Examples
+    --------
+    >>> noise = np.random.default_rng(0).normal(scale=0.1, size=200)
+    >>> detect_change_points(np.r_[np.zeros(80), np.ones(120)] + noise)
+    array([80])
+    """
+
+    values = np.asarray(values, dtype=float)
+    if penalty is not None and penalty < 0:
+        raise ValueError("Change-point penalty must not be negative")
+
+    if min_size < 1:
+        raise ValueError("Minimum segment size must be at least one")
+
+    if values.size < 2 * min_size:
+        return np.empty(0, dtype=int)
+
+    if penalty is None:
+        penalty = PENALTY_FACTOR * math.log(values.size)
+
+    sums = np.concatenate(([0.0], np.cumsum(values - np.mean(values))))
+    threshold = penalty * long_run_variance(values)
+
+    change_points = []
+    segments = [(0, values.size)]
+    while segments:
+        start, stop = segments.pop()
+        split = _best_split(sums, start, stop, min_size)
+        if split is None or not split[1] > threshold:
+            continue
+
+        change_points.append(split[0])
+        segments.extend([(start, split[0]), (split[0], stop)])
+
+    return np.array(sorted(change_points), dtype=int)
+
+
+def long_run_variance(values) -> float:
+    """
+    Estimate the variance of the series mean times the series length.
+
+    For uncorrelated samples this is the variance of the series; correlated
+    samples multiply it by their statistical inefficiency. Means of blocks
+    of ``b`` rows are compared with their neighbours, and the median squared
+    difference, rescaled to a variance of ``b``-row means times ``b``, is
+    taken for every power-of-two ``b`` with at least ``MIN_BLOCK_PAIRS``
+    block pairs. The estimate grows with ``b`` until blocks are longer than
+    the correlation time, so the largest value is returned. Medians ignore
+    the few block pairs that straddle a jump of the mean.
+
+    Examples
+    --------
+    >>> noise = np.random.default_rng(0).normal(size=4096)
+    >>> 2 * long_run_variance(noise) < long_run_variance(np.repeat(noise, 4))
+    True
+    """
+
+    values = np.asarray(values, dtype=float)
+    estimates = [0.0]
+    block = 1
+    while values.size // block > MIN_BLOCK_PAIRS:
+        count = values.size // block
+        means = values[:count * block].reshape(count, block).mean(axis=1)
+        differences = np.diff(means)
+        estimates.append(block * float(np.median(differences**2))
+                         / (2 * CHI2_MEDIAN))
+        block *= 2
+
+    return max(estimates)
+
+
+def cusum(steps, start=0.0) -> np.ndarray:
+    """
+    Return the one-sided CUSUM ``S_t = max(0, S_{t-1} + steps[t])``.
+
+    ``start`` is the sum before the first step. The recursion is evaluated
+    without a Python loop: the sum equals the cumulative steps minus their
+    running minimum, which starts at ``-start``.
+
+    Examples
+    --------
+    >>> cusum([1.0, -3.0, 2.0, 1.0], start=1.0)
+    array([2., 0., 2., 3.])
+    """
+
+    totals = np.cumsum(np.asarray(steps, dtype=float))
+    if totals.size == 0:
+        return totals
+
+    floor = np.minimum(np.minimum.accumulate(totals), -start)
+    return totals - floor
+
+
+def _best_split(sums, start, stop, min_size):
+    """
+    Return the split row and cost reduction of the best split of a segment.
+    """
+
+    rows = np.arange(start + min_size, stop - min_size + 1)
+    if rows.size == 0:
+        return None
+
+    count = stop - start
+    left_count = rows - start
+    right_count = stop - rows
+    left = sums[rows] - sums[start]
+    right = sums[stop] - sums[rows]
+    total = sums[stop] - sums[start]
+    gains = (left * left / left_count + right * right / right_count
+             - total * total / count)
+    best = int(np.argmax(gains))
+
+    return int(rows[best]), float(gains[best])
@@ -0,0 +1,288 @@
+"""
+Energy-conservation monitoring for NVE runs.
+
+In a microcanonical run ``E(TOT)`` should stay constant up to integration
+noise. Two numbers summarize how well it is conserved: the drift, the
+least-squares slope of ``E(TOT)`` per unit simulation time, and the RMS
+fluctuation of ``E(TOT)`` around that trend relative to the RMS fluctuation
+of ``E(KIN)``. Both follow from the means and co-moments of simulation time,
+``E(TOT)`` and ``E(KIN)``, which are merged block by block so each refresh
+only reads the appended rows.
+"""
+
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from ..energy_access import parameter_unit, parameter_values, time_unit
+
+
+TOTAL_ENERGY = "E(TOT)"
+KINETIC_ENERGY = "E(KIN)"
+
+
+@dataclass(frozen=True)
+class ConservationLimits:
+    """
+    Alarm thresholds of a ``ConservationMonitor``.
+
+    Attributes
+    ----------
+    max_drift : float, optional
+        Largest tolerated absolute drift of ``E(TOT)`` per unit simulation
+        time, in the units of the input file. ``None`` disables the check.
+    max_fluctuation_ratio : float, optional
+        Largest tolerated ratio of the detrended ``E(TOT)`` RMS fluctuation
+        to the ``E(KIN)`` RMS fluctuation. ``None`` disables the check.
+    """
+
+    max_drift: float | None = None
+    max_fluctuation_ratio: float | None = None
+
+
+@dataclass(frozen=True)
+class ConservationStatus:
+    """
+    Energy-conservation state after the latest update.
+
+    Attributes
+    ----------
+    rows : int
+        Number of rows evaluated.
+    drift : float
+        Least-squares slope of ``E(TOT)`` per unit simulation time.
+    fluctuation : float
+        RMS deviation of ``E(TOT)`` from its linear trend.
+    kinetic_fluctuation : float
+        RMS fluctuation of ``E(KIN)``, ``nan`` if the input has no ``E(KIN)``.
+    unit : str
+        Energy unit of the input.
+    time_unit : str
+        Simulation-time unit of the input.
+    alerts : tuple
+        Descriptions of the exceeded limits.
+    """
+
+    rows: int
+    drift: float
+    fluctuation: float
+    kinetic_fluctuation: float
+    unit: str
+    time_unit: str
+    alerts: tuple = ()
+
+    @property
+    def fluctuation_ratio(self) -> float:
+        """
+        Return the ``E(TOT)`` to ``E(KIN)`` fluctuation ratio.
+        """
+
+        if not self.kinetic_fluctuation > 0:
+            return float("nan")
+
+        return self.fluctuation / self.kinetic_fluctuation
+
+    @property
+    def alarm(self) -> bool:
+        """
+        Return whether any configured limit is exceeded.
+        """
+
+        return bool(self.alerts)
+
+    def describe(self) -> str:
+        """
+        Return a compact one-line description for status displays.
+        """
+
+        text = (f"E(TOT) drift {self.drift:.3g} {self.unit}/{self.time_unit}, "
+                f"RMS/E(KIN) {self.fluctuation_ratio:.2%}")
+        if self.alarm:
+            text += " - ALERT: " + "; ".join(self.alerts)
+
+        return text
+
+
+class ConservationMonitor:
+    """
+    Incremental ``E(TOT)`` drift and fluctuation monitor.
+
+    ``update`` receives the reader energies after every refresh and only
+    consumes rows appended since the previous call. Like the live
+    accumulators, it starts over when the consumed rows were rewritten.
+
+    Parameters
+    ----------
+    limits : ConservationLimits, optional
+        Alarm thresholds; the default raises no alarms.
+
+    Attributes
+    ----------
+    status : ConservationStatus or None
+        Result of the latest update.
+    """
+
+    def __init__(self, limits=None):
+        self.limits = ConservationLimits() if limits is None else limits
+        self.status = None
+        self.reset()
+
+    @staticmethod
+    def supports(energies) -> bool:
+        """
+        Return whether the energies contain the columns to monitor.
+        """
+
+        return bool(energies) and TOTAL_ENERGY in energies[0].info
+
+    def reset(self) -> None:
+        """
+        Forget all consumed rows.
+        """
+
+        self.rows = 0
+        self.count = 0
+        self.means = None
+        self.comoments = None
+        self.__last_row = None
+
+    def update(self, energies) -> ConservationStatus:
+        """
+        Consume appended rows of all files and return the updated status.
+
+        Files are concatenated in reader order. Rows with missing values are
+        skipped.
+        """
+
+        columns = [self.__columns(energy) for energy in energies]
+        rows = sum(len(energy_columns[0]) for energy_columns in columns)
+        if not self.__continues(columns, rows):
+            self.reset()
+
+        if rows > self.rows:
+            self.__extend(_tail(columns, self.rows))
+            self.rows = rows
+            self.__last_row = _row(columns, rows - 1)
+
+        self.status = self.__status(energies[0])
+        return self.status
+
+    def __columns(self, energy):
+        """
+        Return time, ``E(TOT)`` and, if present, ``E(KIN)`` of one file.
+        """
+
+        names = ["SIMULATION-TIME", TOTAL_ENERGY]
+        if KINETIC_ENERGY in energy.info:
+            names.append(KINETIC_ENERGY)
+
+        return [np.asarray(parameter_values(energy, name), dtype=float)
+                for name in names]
+
+    def __continues(self, columns, rows):
+        """
+        Return whether the files extend the previously consumed rows.
+        """
+
+        if self.rows == 0:
+            return True
+
+        if rows < self.rows:
+            return False
+
+        return np.array_equal(_row(columns, self.rows - 1), self.__last_row,
+                              equal_nan=True)
+
+    def __extend(self, block):
+        """
+        Merge the means and co-moments of a block of new rows.
+        """
+
+        block = block[~np.isnan(block).any(axis=1)]
+        count = block.shape[0]
+        if count == 0:
+            return
+
+        means = block.mean(axis=0)
+        centered = block - means
+        comoments = centered.T @ centered
+        if self.count == 0:
+            self.count, self.means, self.comoments = count, means, comoments
+            return
+
+        total = self.count + count
+        delta = means - self.means
+        weight = self.count * count / total
+        self.comoments += comoments + weight * np.outer(delta, delta)
+        self.means = self.means + delta * count / total
+        self.count = total
+
+    def __status(self, energy):
+        """
+        Return drift, fluctuations and alerts of the consumed rows.
+        """
+
+        drift = fluctuation = kinetic_fluctuation = float("nan")
+        if self.count > 1 and self.comoments[0, 0] > 0:
+            time_moment = self.comoments[0, 0]
+            drift = float(self.comoments[0, 1] / time_moment)
+            residual = (self.comoments[1, 1]
+                        - self.comoments[0, 1]**2 / time_moment)
+            fluctuation = float(np.sqrt(max(residual, 0.0) / self.count))
+
+        if self.count > 0 and self.means.size > 2:
+            kinetic_fluctuation = float(
+                np.sqrt(self.comoments[2, 2] / self.count))
+
+        status = ConservationStatus(
+            rows=self.rows,
+            drift=drift,
+            fluctuation=fluctuation,
+            kinetic_fluctuation=kinetic_fluctuation,
+            unit=parameter_unit(energy, TOTAL_ENERGY),
+            time_unit=time_unit(energy),
+        )
+        alerts = []
+        if (
+            self.limits.max_drift is not None
+            and abs(status.drift) > self.limits.max_drift
+        ):
+            alerts.append(f"|drift| > {self.limits.max_drift:g}")
+        if (
+            self.limits.max_fluctuation_ratio is not None
+            and status.fluctuation_ratio > self.limits.max_fluctuation_ratio
+        ):
+            alerts.append(
+                f"RMS/E(KIN) > {self.limits.max_fluctuation_ratio:.2%}")
+
+        return replace(status, alerts=tuple(alerts))
+
+
+def _tail(columns, start):
+    """
+    Return the concatenated rows from ``start`` on as a ``(rows, k)`` block.
+    """
+
+    pieces = []
+    for energy_columns in columns:
+        size = len(energy_columns[0])
+        if start < size:
+            pieces.append(np.column_stack(
+                [column[start:] for column in energy_columns]))
+        start = max(start - size, 0)
+
+    return np.concatenate(pieces)
+
+
+def _row(columns, index):
+    """
+    Return one row of the concatenated files.
+    """
+
+    for energy_columns in columns:
+        size = len(energy_columns[0])
+        if index < size:
+            return np.array([column[index] for column in energy_columns])
+        index -= size
+
+    raise IndexError("Row index out of range")
@@ -0,0 +1,131 @@
+"""
+Correlations between all parameters of a ``(rows, parameters)`` block.
+
+Coupled observables such as ``PRESSURE`` and ``VOLUME`` are diagnosed from
+their correlation matrix. All pairs are computed together: Pearson
+coefficients from one matrix product of the centered block, and lagged
+cross-correlations from one FFT of the block and one inverse FFT of cross
+spectra per column.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.fft import irfft, next_fast_len, rfft
+
+
+@dataclass(frozen=True)
+class CrossCorrelation:
+    """
+    Lagged cross-correlations between all columns of a block.
+
+    Attributes
+    ----------
+    lags : np.ndarray
+        Row lags from ``-max_lag`` to ``max_lag``.
+    values : np.ndarray
+        Array of shape ``(lags, parameters, parameters)``; ``values[k, i, j]``
+        correlates column ``i`` at row ``t + lags[k]`` with column ``j`` at
+        row ``t``.
+    """
+
+    lags: np.ndarray
+    values: np.ndarray
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        Return the zero-lag Pearson correlation matrix.
+        """
+
+        return self.values[self.lags.size // 2]
+
+    def peak_lags(self) -> np.ndarray:
+        """
+        Return the lag of the largest absolute correlation for every pair.
+        """
+
+        magnitudes = np.nan_to_num(np.abs(self.values), nan=-1.0)
+        return self.lags[np.argmax(magnitudes, axis=0)]
+
+
+def correlation_matrix(block) -> np.ndarray:
+    """
+    Return the Pearson correlation matrix of the columns of a block.
+
+    Rows containing ``nan`` are skipped. Constant columns have no defined
+    correlation and yield ``nan`` entries.
+
+    Examples
+    --------
+    >>> correlation_matrix([[1.0, 2.0], [2.0, 4.0], [3.0, 5.0]]).round(3)
+    array([[1.   , 0.982],
+           [0.982, 1.   ]])
+    """
+
+    centered = _centered(block)
+    return _normalized(centered.T @ centered, centered)
+
+
+def cross_correlation(block, max_lag) -> CrossCorrelation:
+    """
+    Return lagged cross-correlations of all column pairs by FFT.
+
+    Columns are centered and zero-padded, so correlations at lag ``k``
+    are normalized by the full row count like the biased autocorrelation
+    estimate; lag zero equals ``correlation_matrix``.
+
+    Raises
+    ------
+    ValueError
+        If ``max_lag`` is negative or not smaller than the number of rows.
+    """
+
+    centered = _centered(block)
+    rows, columns = centered.shape
+    if not 0 <= max_lag < rows:
+        raise ValueError("Maximum lag must be between zero and the row count")
+
+    size = next_fast_len(rows + max_lag, real=True)
+    spectra = rfft(centered, n=size, axis=0)
+    lags = np.arange(-max_lag, max_lag + 1)
+    values = np.empty((lags.size, columns, columns))
+    for column in range(columns):
+        products = irfft(spectra[:, [column]] * spectra.conj(), n=size,
+                         axis=0)
+        values[:, column, :] = products[lags % size]
+
+    return CrossCorrelation(lags=lags, values=_normalized(values, centered))
+
+
+def _centered(block):
+    """
+    Return the complete rows of a block with zero-mean columns.
+    """
+
+    block = np.asarray(block, dtype=float)
+    if block.ndim != 2:
+        raise ValueError("Correlation block must be two-dimensional")
+
+    incomplete = np.isnan(block).any(axis=1)
+    if incomplete.any():
+        block = block[~incomplete]
+    if block.shape[0] == 0:
+        raise ValueError("Correlation needs at least one complete row")
+
+    return block - block.mean(axis=0)
+
+
+def _normalized(products, centered):
+    """
+    Divide summed column products by the column norms and clip to [-1, 1].
+
+    Normalizing the small product arrays instead of the block avoids a second
+    copy of the data.
+    """
+
+    norms = np.sqrt(np.einsum("ij,ij->j", centered, centered))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        correlations = products / np.outer(norms, norms)
+
+    return np.clip(correlations, -1.0, 1.0)
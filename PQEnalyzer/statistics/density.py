@@ -0,0 +1,129 @@
+"""
+Kernel density estimates for histogram plots.
+
+``scipy.stats.gaussian_kde`` sums one kernel per sample at every evaluation
+point, which costs ``O(n * g)`` for ``n`` samples and ``g`` grid points. The
+binned estimate spreads the samples linearly onto the grid and convolves the
+grid counts with the Gaussian kernel by FFT, costing ``O(n + g log g)`` with
+the same Scott or Silverman bandwidth.
+"""
+
+import numpy as np
+from scipy.signal import fftconvolve
+from scipy.stats import gaussian_kde
+
+
+KDE_METHODS = ("auto", "binned", "exact")
+
+EXACT_KDE_MAX_POINTS = 4096
+# Largest series evaluated exactly in "auto" mode.
+
+MAX_BINNED_GRID_POINTS = 2**16
+# Upper bound of the binned grid refined for narrow bandwidths.
+
+
+def kernel_density(values, grid_points=1000, method="auto",
+                   bw_method="scott") -> tuple:
+    """
+    Return a Gaussian kernel density estimate on a grid spanning the data.
+
+    Parameters
+    ----------
+    values : array-like
+        Samples to estimate the density of.
+    grid_points : int, optional
+        Minimum number of evaluation points between the smallest and largest
+        sample.
+    method : {"auto", "binned", "exact"}, optional
+        ``"exact"`` evaluates ``scipy.stats.gaussian_kde``; ``"binned"`` uses
+        linear binning and FFT convolution; ``"auto"`` is exact for at most
+        ``EXACT_KDE_MAX_POINTS`` samples and binned otherwise.
+    bw_method : {"scott", "silverman"}, optional
+        Bandwidth rule, applied to the sample standard deviation as in
+        ``gaussian_kde``.
+
+    Returns
+    -------
+    tuple
+        Grid positions and density values.
+
+    Raises
+    ------
+    ValueError
+        If the method or bandwidth rule is unknown, or if the data contain
+        fewer than two distinct values.
+
+    Examples
+    --------
+    >>> x, y = kernel_density(np.random.default_rng(0).normal(size=10000))
+    >>> x.shape == y.shape
+    True
+    >>> bool(abs(np.sum(y) * (x[1] - x[0]) - 1) < 0.01)
+    True
+    """
+
+    if method not in KDE_METHODS:
+        raise ValueError(f"Unknown KDE method: {method}")
+
+    values = np.asarray(values, dtype=float)
+    minimum, maximum = np.min(values), np.max(values)
+    if not minimum < maximum:
+        raise ValueError("KDE needs at least two distinct values")
+
+    if method == "exact" or (
+        method == "auto" and values.size <= EXACT_KDE_MAX_POINTS
+    ):
+        grid = np.linspace(minimum, maximum, grid_points)
+        return grid, gaussian_kde(values, bw_method=bw_method)(grid)
+
+    return _binned_density(values, minimum, maximum, grid_points,
+                           kde_bandwidth(values, bw_method))
+
+
+def kde_bandwidth(values, bw_method="scott") -> float:
+    """
+    Return the Gaussian kernel width used by ``gaussian_kde``.
+
+    Examples
+    --------
+    >>> round(kde_bandwidth([0.0, 1.0, 2.0, 3.0]), 6)
+    0.978391
+    """
+
+    values = np.asarray(values, dtype=float)
+    if bw_method == "scott":
+        factor = values.size ** (-1 / 5)
+    elif bw_method == "silverman":
+        factor = (values.size * 3 / 4) ** (-1 / 5)
+    else:
+        raise ValueError(f"Unknown bandwidth rule: {bw_method}")
+
+    return float(factor * np.std(values, ddof=1))
+
+
+def _binned_density(values, minimum, maximum, grid_points, bandwidth):
+    """
+    Evaluate a Gaussian KDE by linear binning and FFT convolution.
+
+    The grid is refined so that its spacing stays below a quarter bandwidth,
+    otherwise the binning error would show for heavy-tailed data.
+    """
+
+    span = maximum - minimum
+    size = int(min(max(grid_points, np.ceil(4 * span / bandwidth) + 1),
+                   MAX_BINNED_GRID_POINTS))
+    grid = np.linspace(minimum, maximum, size)
+    spacing = span / (size - 1)
+
+    positions = (values - minimum) / spacing
+    lower = np.minimum(positions.astype(np.intp), size - 2)
+    weights = positions - lower
+    counts = (np.bincount(lower, weights=1.0 - weights, minlength=size)
+              + np.bincount(lower + 1, weights=weights, minlength=size))
+
+    offsets = np.arange(-(size - 1), size) * (spacing / bandwidth)
+    kernel = np.exp(-0.5 * offsets * offsets)
+    density = fftconvolve(counts, kernel)[size - 1:2 * size - 1]
+    density /= values.size * bandwidth * np.sqrt(2 * np.pi)
+
+    return grid, np.maximum(density, 0.0)
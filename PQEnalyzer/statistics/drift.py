@@ -0,0 +1,197 @@
+"""
+Least-squares drift of simulation parameters over time.
+
+Drift in conserved quantities such as ``E(TOT)`` is the main health signal of
+NVE production runs. Slopes are computed in closed form from the sums of
+``t``, ``y``, ``t**2``, ``t*y`` and ``y**2``; sliding windows take these sums
+from prefix sums, so every window costs ``O(1)`` and all columns of a
+``(rows, parameters)`` block are fitted together.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class DriftResult:
+    """
+    Least-squares line fits ``y = intercept + slope * t``.
+
+    For one-dimensional input the attributes are scalars; for
+    ``(rows, parameters)`` blocks and sliding windows they are arrays.
+
+    Attributes
+    ----------
+    slope : float or np.ndarray
+        Drift per unit time.
+    stderr : float or np.ndarray
+        Standard error of the slope; ``nan`` for fewer than three points.
+    intercept : float or np.ndarray
+        Fitted value at ``t = 0``.
+    """
+
+    slope: object
+    stderr: object
+    intercept: object
+
+
+def linear_drift(time, values) -> DriftResult:
+    """
+    Fit a least-squares line to a series or to every column of a block.
+
+    Parameters
+    ----------
+    time : array-like
+        Time axis with one entry per row.
+    values : array-like
+        One-dimensional series or ``(rows, parameters)`` block.
+
+    Returns
+    -------
+    DriftResult
+        Slope, slope standard error and intercept.
+
+    Examples
+    --------
+    >>> linear_drift([0, 1, 2, 3], [1.0, 3.0, 5.0, 7.0]).slope
+    2.0
+    """
+
+    time, values = _aligned(time, values)
+    time_offset = np.mean(time) if time.size else 0.0
+    value_offset = np.mean(values, axis=0) if time.size else 0.0
+    centered_time = time - time_offset
+    centered_values = values - value_offset
+
+    result = _fit(time.size, *(
+        np.sum(terms, axis=0)
+        for terms in _terms(centered_time, centered_values)
+    ))
+    intercept = (value_offset + result.intercept
+                 - result.slope * time_offset)
+    return DriftResult(
+        slope=_scalar(result.slope),
+        stderr=_scalar(result.stderr),
+        intercept=_scalar(intercept),
+    )
+
+
+def rolling_drift(time, values, window_size) -> DriftResult:
+    """
+    Fit least-squares lines over all sliding windows of ``window_size`` rows.
+
+    Returns one fit per complete window, ordered by window start. Series are
+    centered once before the prefix sums are formed, which keeps the
+    cancellation between prefix sums small for long runs.
+
+    Raises
+    ------
+    ValueError
+        If ``window_size`` is not positive or larger than the series.
+    """
+
+    time, values = _aligned(time, values)
+    if window_size < 1:
+        raise ValueError("Window size must be positive")
+    if window_size > time.size:
+        raise ValueError("Window size is larger than given data point")
+
+    time_offset = np.mean(time)
+    value_offset = np.mean(values, axis=0)
+    result = _fit(window_size, *_window_sums(
+        time - time_offset,
+        values - value_offset,
+        window_size,
+    ))
+    return DriftResult(
+        slope=result.slope,
+        stderr=result.stderr,
+        intercept=(value_offset + result.intercept
+                   - result.slope * time_offset),
+    )
+
+
+def _aligned(time, values):
+    """
+    Return float arrays with ``time`` broadcastable against ``values``.
+    """
+
+    time = np.asarray(time, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if values.shape[:1] != time.shape:
+        raise ValueError("Time and values must have the same number of rows")
+
+    if values.ndim == 2:
+        time = time[:, np.newaxis]
+
+    return time, values
+
+
+def _window_sums(time, values, window_size):
+    """
+    Return sums of t, y, t**2, t*y and y**2 over sliding windows.
+
+    Time-only sums are formed once per row and broadcast against the value
+    columns afterwards.
+    """
+
+    return [
+        _sliding_sum(terms, window_size)
+        for terms in _terms(time, values)
+    ]
+
+
+def _terms(time, values):
+    """
+    Yield the per-row terms t, y, t**2, t*y and y**2 of the normal equations.
+    """
+
+    yield time
+    yield values
+    yield time * time
+    yield time * values
+    yield values * values
+
+
+def _sliding_sum(terms, window_size):
+    """
+    Return sums over all complete windows from one prefix sum.
+    """
+
+    prefix = np.empty((terms.shape[0] + 1, *terms.shape[1:]))
+    prefix[0] = 0.0
+    np.cumsum(terms, axis=0, out=prefix[1:])
+    return prefix[window_size:] - prefix[:prefix.shape[0] - window_size]
+
+
+def _fit(count, time_sum, value_sum, time_squares, cross_sum, value_squares):
+    """
+    Solve the least-squares line from window sums.
+    """
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        time_variance = time_squares - time_sum * time_sum / count
+        covariance = cross_sum - time_sum * value_sum / count
+        value_variance = value_squares - value_sum * value_sum / count
+
+        slope = covariance / time_variance
+        intercept = (value_sum - slope * time_sum) / count
+        residuals = np.maximum(value_variance - slope * covariance, 0.0)
+        stderr = np.sqrt(residuals / (count - 2) / time_variance)
+
+    if count < 3:
+        stderr = np.full(np.shape(slope), np.nan)
+
+    return DriftResult(slope=slope, stderr=stderr, intercept=intercept)
+
+
+def _scalar(value):
+    """
+    Return zero-dimensional results as Python floats.
+    """
+
+    value = np.asarray(value)
+    if value.ndim == 0:
+        return float(value)
+    return value
@@ -0,0 +1,69 @@
+"""
+Per-step statistics across independent simulation replicas.
+
+Replicas are stacked into one ``(replicas, steps)`` array so the mean,
+spread and extremes of every step come from reductions along the replica
+axis, each a single vectorized pass over the stack.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class EnsembleStatistics:
+    """
+    Ensemble mean, spread and extremes of every step.
+
+    Attributes
+    ----------
+    mean : np.ndarray
+        Replica mean of every step.
+    std_dev : np.ndarray
+        Sample standard deviation across replicas of every step.
+    minimum : np.ndarray
+        Smallest replica value of every step.
+    maximum : np.ndarray
+        Largest replica value of every step.
+    replicas : int
+        Number of stacked replicas.
+    """
+
+    mean: np.ndarray
+    std_dev: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    replicas: int
+
+
+def ensemble_statistics(stack) -> EnsembleStatistics:
+    """
+    Return per-step statistics of a ``(replicas, steps)`` stack.
+
+    Raises
+    ------
+    ValueError
+        If the stack is not two-dimensional or has fewer than two replicas.
+
+    Examples
+    --------
+    >>> result = ensemble_statistics([[1.0, 2.0], [3.0, 6.0]])
+    >>> result.mean, result.std_dev
+    (array([2., 4.]), array([1.41421356, 2.82842712]))
+    """
+
+    stack = np.asarray(stack, dtype=float)
+    if stack.ndim != 2:
+        raise ValueError("Ensemble stack must be two-dimensional")
+
+    if stack.shape[0] < 2:
+        raise ValueError("Ensemble statistics need at least two replicas")
+
+    return EnsembleStatistics(
+        mean=stack.mean(axis=0),
+        std_dev=stack.std(axis=0, ddof=1),
+        minimum=stack.min(axis=0),
+        maximum=stack.max(axis=0),
+        replicas=stack.shape[0],
+    )
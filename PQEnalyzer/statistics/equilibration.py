@@ -0,0 +1,151 @@
+"""
+Automatic equilibration detection for simulation time series.
+
+The detector follows the effective-sample criterion used by Chodera's
+``detectEquilibration``: for each candidate start index ``t0`` the statistical
+inefficiency ``g`` of the remaining series is estimated from its
+autocorrelation function, and the start that maximizes the number of
+uncorrelated samples ``(N - t0) / g`` is chosen. Candidates lie on a geometric
+grid and autocorrelations are computed with FFTs, so the scan stays well below
+a second for million-row series.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.fft
+
+
+@dataclass(frozen=True)
+class EquilibrationResult:
+    """
+    Detected start of the equilibrated part of a series.
+
+    Attributes
+    ----------
+    start : int
+        Index of the first equilibrated row.
+    statistical_inefficiency : float
+        Statistical inefficiency of the series from ``start`` onwards, in
+        input rows.
+    effective_samples : float
+        Estimated number of uncorrelated samples from ``start`` onwards.
+    """
+
+    start: int
+    statistical_inefficiency: float
+    effective_samples: float
+
+
+def autocorrelation(values) -> np.ndarray:
+    """
+    Return the normalized autocorrelation function of a series.
+
+    The series is zero-padded to avoid circular wrap-around, so all lags are
+    computed in ``O(n log n)`` total. Constant series are treated as
+    uncorrelated.
+
+    Examples
+    --------
+    >>> autocorrelation([1.0, 2.0, 1.0, 2.0])[:2]
+    array([ 1.  , -0.75])
+    """
+
+    values = np.asarray(values, dtype=float)
+    fluctuations = values - np.mean(values)
+    size = scipy.fft.next_fast_len(2 * values.size, real=True)
+    spectrum = scipy.fft.rfft(fluctuations, size)
+    correlation = scipy.fft.irfft(spectrum * np.conj(spectrum),
+                                  size)[:values.size]
+
+    if correlation[0] <= 0:
+        return (np.arange(values.size) == 0).astype(float)
+
+    return correlation / correlation[0]
+
+
+def statistical_inefficiency(values) -> float:
+    """
+    Estimate the statistical inefficiency ``g`` of a series.
+
+    ``g = 1 + 2 * sum((1 - t / N) * C(t))`` is summed up to the first lag where
+    the autocorrelation ``C`` is no longer positive. ``g`` is at least one;
+    every ``g``-th sample is approximately uncorrelated.
+    """
+
+    values = np.asarray(values, dtype=float)
+    if values.size < 2:
+        return 1.0
+
+    correlation = autocorrelation(values)[1:]
+    non_positive = np.flatnonzero(correlation <= 0)
+    cutoff = non_positive[0] if non_positive.size else correlation.size
+    lags = np.arange(1, cutoff + 1)
+    inefficiency = 1.0 + 2.0 * np.sum(
+        (1.0 - lags / values.size) * correlation[:cutoff])
+
+    return max(1.0, float(inefficiency))
+
+
+def detect_equilibration(values, *, grid_points=48,
+                         max_points=65536) -> EquilibrationResult:
+    """
+    Detect the start of the equilibrated region of a series.
+
+    Parameters
+    ----------
+    values : array-like
+        Time-ordered series, for example one energy parameter.
+    grid_points : int, optional
+        Number of geometrically spaced candidate start indices.
+    max_points : int, optional
+        Series longer than this are averaged over consecutive blocks first.
+        Block means keep the correlation structure on scales longer than one
+        block, which is the regime where discarding data matters.
+
+    Returns
+    -------
+    EquilibrationResult
+        Start index in the input series with its inefficiency and effective
+        sample count.
+
+    Raises
+    ------
+    ValueError
+        If the series is empty.
+
+    Examples
+    --------
+    >>> rng = np.random.default_rng(0)
+    >>> values = np.r_[np.linspace(10, 0, 200), np.zeros(800)]
+    >>> detect_equilibration(values + rng.normal(size=1000)).start
+    171
+    """
+
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        raise ValueError("Cannot detect equilibration of an empty series")
+
+    block_size = max(1, -(-values.size // max_points))
+    blocks = values.size // block_size
+    offset = values.size - blocks * block_size
+    coarse = values[offset:].reshape(blocks, block_size).mean(axis=1)
+
+    candidates = np.unique(np.concatenate([
+        [0],
+        np.geomspace(1, max(1, blocks - 3), grid_points).astype(int),
+    ]))
+
+    best = None
+    for start in candidates:
+        inefficiency = statistical_inefficiency(coarse[start:])
+        effective_samples = float((blocks - start) / inefficiency)
+        if best is None or effective_samples > best[2]:
+            best = (int(start), inefficiency, effective_samples)
+
+    start, inefficiency, effective_samples = best
+    return EquilibrationResult(
+        start=offset + start * block_size if start else 0,
+        statistical_inefficiency=inefficiency * block_size,
+        effective_samples=effective_samples,
+    )
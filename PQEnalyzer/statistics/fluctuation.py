@@ -0,0 +1,401 @@
+"""
+Thermodynamic response properties from equilibrium fluctuations.
+
+In a canonical run the heat capacity follows from the variance of the total
+energy, ``C_V = var(E) / (k_B T^2)``, and in an isothermal-isobaric run the
+isothermal compressibility follows from the variance of the volume,
+``kappa_T = var(V) / (k_B T <V>)``. Both only need the count, the sums of the
+shifted column and its square, and the temperature sum, so a growing run is
+consumed in a single pass: appended rows extend the running convergence curve
+with cumulative sums and fill fixed-size blocks whose estimates give a
+block-averaged error. When the block count reaches twice
+``FLUCTUATION_BLOCKS``, adjacent blocks are merged and the block size doubles,
+so memory stays bounded while blocks grow with the run and keep exceeding its
+correlation time.
+
+Columns are converted to the PQ units ``E(TOT)`` in kcal/mol, ``VOLUME`` in
+A^3 and ``TEMPERATURE`` in K when their unit is a known, different one;
+columns in unknown units are assumed to be in PQ units already.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..energy_access import concatenate_parameter, parameter_unit
+from ..units import convertible, unit_conversion
+from .parallel import ordered_map
+from .streaming import _reserve
+
+
+TEMPERATURE = "TEMPERATURE"
+
+TEMPERATURE_UNIT = "K"
+
+BOLTZMANN_KCAL_PER_MOL_K = 0.0019872043
+# Boltzmann constant in kcal/mol/K.
+
+BOLTZMANN_BAR_A3_PER_K = 138.0649
+# Boltzmann constant in bar A^3/K.
+
+FLUCTUATION_BLOCKS = 16
+# Fewest blocks after a merge; at most twice as many are kept.
+
+MIN_FLUCTUATION_BLOCKS = 4
+# Fewest complete blocks of a block-averaged error.
+
+INITIAL_BLOCK_ROWS = 16
+# Rows per block before the first merge.
+
+
+@dataclass(frozen=True)
+class FluctuationProperty:
+    """
+    Response property derived from the variance of one column.
+
+    The property is ``var(X) / (k_B <T>^a <X>^b)``.
+
+    Attributes
+    ----------
+    name : str
+        Display name of the property.
+    symbol : str
+        Short symbol for compact displays.
+    column : str
+        PQ info label of the fluctuating column ``X``.
+    column_unit : str
+        Unit of ``X`` that ``boltzmann`` refers to.
+    unit : str
+        Unit of the property.
+    boltzmann : float
+        Boltzmann constant in the units of ``X`` per kelvin.
+    temperature_power : int
+        Power ``a`` of the mean temperature.
+    mean_power : int
+        Power ``b`` of the mean of ``X``.
+    """
+
+    name: str
+    symbol: str
+    column: str
+    column_unit: str
+    unit: str
+    boltzmann: float
+    temperature_power: int
+    mean_power: int
+
+    def evaluate(self, mean, variance, temperature):
+        """
+        Return the property from the mean and variance of ``X`` and ``T``.
+        """
+
+        return variance / (self.boltzmann
+                           * temperature**self.temperature_power
+                           * mean**self.mean_power)
+
+
+HEAT_CAPACITY = FluctuationProperty(
+    name="heat capacity",
+    symbol="C_V",
+    column="E(TOT)",
+    column_unit="kcal/mol",
+    unit="kcal/mol/K",
+    boltzmann=BOLTZMANN_KCAL_PER_MOL_K,
+    temperature_power=2,
+    mean_power=0,
+)
+
+COMPRESSIBILITY = FluctuationProperty(
+    name="isothermal compressibility",
+    symbol="kappa_T",
+    column="VOLUME",
+    column_unit="A^3",
+    unit="1/bar",
+    boltzmann=BOLTZMANN_BAR_A3_PER_K,
+    temperature_power=1,
+    mean_power=1,
+)
+
+FLUCTUATION_PROPERTIES = (HEAT_CAPACITY, COMPRESSIBILITY)
+
+
+@dataclass(frozen=True)
+class FluctuationEstimate:
+    """
+    Current estimate of one fluctuation property.
+
+    Attributes
+    ----------
+    property : FluctuationProperty
+        Estimated property.
+    value : float
+        Estimate from all consumed rows.
+    error : float
+        Standard error of the mean of the block estimates, ``nan`` with
+        fewer than ``MIN_FLUCTUATION_BLOCKS`` blocks.
+    rows : int
+        Number of rows consumed.
+    blocks : int
+        Number of complete blocks of the error.
+    """
+
+    property: FluctuationProperty
+    value: float
+    error: float
+    rows: int
+    blocks: int
+
+    def describe(self) -> str:
+        """
+        Return a compact one-line description for status displays.
+        """
+
+        text = f"{self.property.symbol}: {self.value:.4g}"
+        if not np.isnan(self.error):
+            text += f" ± {self.error:.2g}"
+
+        return f"{text} {self.property.unit}"
+
+
+class FluctuationAccumulator:
+    """
+    Single-pass estimate, convergence curve and block error of a property.
+
+    Like the live accumulators, it only consumes rows appended since the
+    previous update and starts over when the consumed rows were rewritten.
+    Rows with a missing value or temperature are skipped.
+
+    Parameters
+    ----------
+    fluctuation_property : FluctuationProperty
+        Property to estimate.
+    blocks : int, optional
+        Fewest blocks after a merge.
+    """
+
+    def __init__(self, fluctuation_property, blocks=FLUCTUATION_BLOCKS):
+        self.property = fluctuation_property
+        self.max_blocks = 2 * blocks
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget all consumed rows.
+        """
+
+        self.rows = 0
+        self.shift = None
+        # count, shifted sum, shifted square sum and temperature sum
+        self.totals = np.zeros(4)
+        self.block_size = INITIAL_BLOCK_ROWS
+        self.blocks = np.empty((0, 3))
+        self.__partial = np.zeros(3)
+        self.__partial_rows = 0
+        self.__curve = np.empty(0)
+        self.__last_row = None
+
+    @property
+    def convergence(self) -> np.ndarray:
+        """
+        Return the running estimate after every consumed row.
+        """
+
+        return self.__curve[:self.rows]
+
+    def update(self, values, temperature) -> "FluctuationAccumulator":
+        """
+        Consume rows appended since the previous update and return ``self``.
+        """
+
+        values = np.asarray(values, dtype=float)
+        temperature = np.asarray(temperature, dtype=float)
+        if self.rows > 0 and (
+            values.size < self.rows
+            or not np.array_equal(
+                [values[self.rows - 1], temperature[self.rows - 1]],
+                self.__last_row, equal_nan=True)
+        ):
+            self.reset()
+
+        if values.size > self.rows:
+            self.__extend(values[self.rows:], temperature[self.rows:])
+            self.rows = int(values.size)
+            self.__last_row = [values[-1], temperature[-1]]
+
+        return self
+
+    def estimate(self) -> FluctuationEstimate:
+        """
+        Return the property of all consumed rows and its block error.
+        """
+
+        value = float("nan")
+        if self.rows > 0:
+            value = float(self.convergence[-1])
+
+        error = float("nan")
+        count = self.blocks.shape[0]
+        if count >= MIN_FLUCTUATION_BLOCKS:
+            estimates = self.__evaluate(self.blocks, self.block_size)
+            error = float(np.std(estimates, ddof=1) / np.sqrt(count))
+
+        return FluctuationEstimate(self.property, value, error, self.rows,
+                                   count)
+
+    def __extend(self, values, temperature):
+        """
+        Extend the convergence curve and the blocks by appended rows.
+        """
+
+        valid = ~(np.isnan(values) | np.isnan(temperature))
+        if self.shift is None and valid.any():
+            self.shift = float(values[valid][0])
+        contributions = np.empty((values.size, 4))
+        contributions[:, 0] = valid
+        np.subtract(values, self.shift or 0.0, out=contributions[:, 1])
+        np.square(contributions[:, 1], out=contributions[:, 2])
+        contributions[:, 3] = temperature
+        if not valid.all():
+            contributions[~valid] = 0.0
+
+        totals = self.totals + np.cumsum(contributions, axis=0)
+        end = self.rows + values.size
+        self.__curve = _reserve(self.__curve, self.rows, end)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.__curve[self.rows:end] = self.__evaluate(totals[:, 1:],
+                                                          totals[:, 0])
+        self.totals = totals[-1]
+        self.__add_to_blocks(contributions[valid, 1:]
+                             if not valid.all() else contributions[:, 1:])
+
+    def __add_to_blocks(self, contributions):
+        """
+        Fill the partial block, append complete blocks and merge pairs.
+        """
+
+        needed = self.block_size - self.__partial_rows
+        self.__partial += contributions[:needed].sum(axis=0)
+        self.__partial_rows += min(needed, contributions.shape[0])
+        if self.__partial_rows < self.block_size:
+            return
+
+        rest = contributions[needed:]
+        complete = rest.shape[0] // self.block_size
+        blocks = np.concatenate((
+            self.blocks,
+            self.__partial[np.newaxis],
+            rest[:complete * self.block_size].reshape(
+                complete, self.block_size, 3).sum(axis=1),
+        ))
+        self.__partial = rest[complete * self.block_size:].sum(axis=0)
+        self.__partial_rows = rest.shape[0] - complete * self.block_size
+
+        while blocks.shape[0] >= self.max_blocks:
+            if blocks.shape[0] % 2:
+                # an unpaired last block starts the next, larger block
+                self.__partial += blocks[-1]
+                self.__partial_rows += self.block_size
+                blocks = blocks[:-1]
+            blocks = blocks[0::2] + blocks[1::2]
+            self.block_size *= 2
+
+        self.blocks = blocks
+
+    def __evaluate(self, sums, count):
+        """
+        Return the property of shifted sums over ``count`` rows.
+        """
+
+        mean = sums[..., 0] / count
+        variance = np.maximum(sums[..., 1] / count - mean**2, 0.0)
+        return self.property.evaluate(mean + (self.shift or 0.0), variance,
+                                      sums[..., 2] / count)
+
+
+class FluctuationMonitor:
+    """
+    Incremental fluctuation properties of all monitored files.
+
+    Files are concatenated in reader order and every property available in
+    the input gets its own ``FluctuationAccumulator``.
+
+    Parameters
+    ----------
+    blocks : int, optional
+        Fewest blocks after a merge.
+    executor : concurrent.futures.Executor, optional
+        Thread pool that updates the properties concurrently.
+
+    Attributes
+    ----------
+    status : dict
+        ``FluctuationEstimate`` of the latest update keyed by column.
+    """
+
+    def __init__(self, blocks=FLUCTUATION_BLOCKS, executor=None):
+        self.blocks = blocks
+        self.executor = executor
+        self.accumulators = {}
+        self.status = {}
+
+    @staticmethod
+    def properties(energies) -> list:
+        """
+        Return the fluctuation properties the energies provide columns for.
+        """
+
+        if not energies or TEMPERATURE not in energies[0].info:
+            return []
+
+        return [fluctuation_property
+                for fluctuation_property in FLUCTUATION_PROPERTIES
+                if fluctuation_property.column in energies[0].info]
+
+    @classmethod
+    def supports(cls, energies) -> bool:
+        """
+        Return whether the energies contain any fluctuation property.
+        """
+
+        return bool(cls.properties(energies))
+
+    def update(self, energies) -> dict:
+        """
+        Consume appended rows of all files and return the estimates.
+        """
+
+        for fluctuation_property in self.properties(energies):
+            self.accumulators.setdefault(
+                fluctuation_property.column,
+                FluctuationAccumulator(fluctuation_property, self.blocks),
+            )
+
+        temperature = _column_in_unit(energies, TEMPERATURE, TEMPERATURE_UNIT)
+        estimates = ordered_map(
+            lambda accumulator: accumulator.update(
+                _column_in_unit(energies, accumulator.property.column,
+                                accumulator.property.column_unit),
+                temperature,
+            ).estimate(),
+            list(self.accumulators.values()),
+            self.executor,
+        )
+        self.status = dict(zip(self.accumulators, estimates))
+        return self.status
+
+
+def _column_in_unit(energies, label, unit):
+    """
+    Concatenate a column and convert it to ``unit`` when that is possible.
+    """
+
+    values = concatenate_parameter(energies, label)
+    try:
+        source = parameter_unit(energies[0], label)
+    except (AttributeError, KeyError):
+        return values
+
+    if source == unit or not convertible(source, unit):
+        return values
+
+    return unit_conversion(source, unit).apply(values)
@@ -0,0 +1,129 @@
+"""
+Spike detection with a rolling median and median absolute deviation.
+
+A failed SCF step writes a single row far away from its neighbours. Compared
+with its centered window, such a row deviates from the rolling median by many
+robust standard deviations, while the median and the deviation scale of the
+window are barely moved by it. Both are rank statistics of sliding windows:
+the rolling median is evaluated with SciPy's 1-D rank filter, which keeps the
+sorted window in a pair of heaps at ``O(log w)`` per row, and the scale is the
+rolling median of the absolute deviations from it, scaled to a standard
+deviation for normal noise. Detection therefore costs two rank-filter passes,
+``O(n log w)``, independent of the number of spikes.
+
+The result is a boolean mask aligned with the series, so statistics can skip
+the flagged rows without copying the values.
+"""
+
+import numpy as np
+from scipy.ndimage import rank_filter
+
+
+OUTLIER_WINDOW = 51
+# Rows of the centered window that a row is compared with.
+
+OUTLIER_THRESHOLD = 5.0
+# Robust standard deviations beyond which a row is flagged.
+
+MAD_TO_STD = 1.4826
+# Ratio of standard deviation and median absolute deviation of normal noise.
+
+
+def rolling_median_mad(values, window_size=OUTLIER_WINDOW) -> tuple:
+    """
+    Return the centered rolling median and median absolute deviation.
+
+    Even windows are extended by one row. Rows within half a window of
+    either end take the statistics of the first or last complete window, so
+    both arrays are aligned with ``values``; series shorter than one window
+    form a single window. The deviation of a window is the median of the
+    absolute deviations of its rows from their own rolling medians, which
+    keeps both passes rank filters.
+
+    Raises
+    ------
+    ValueError
+        If the window has fewer than three rows.
+
+    Examples
+    --------
+    >>> median, mad = rolling_median_mad([1.0, 2.0, 9.0, 3.0, 4.0], 3)
+    >>> median
+    array([2., 2., 3., 4., 4.])
+    >>> mad
+    array([1., 1., 1., 1., 1.])
+    """
+
+    values = np.asarray(values, dtype=float)
+    if window_size < 3:
+        raise ValueError("Outlier window must have at least three rows")
+
+    window_size = int(window_size) | 1
+    median = _rolling_median(values, window_size)
+    mad = _rolling_median(np.abs(values - median), window_size)
+    return median, mad
+
+
+def outlier_mask(values, window_size=OUTLIER_WINDOW,
+                 threshold=OUTLIER_THRESHOLD) -> np.ndarray:
+    """
+    Return a mask of the rows that deviate strongly from their window.
+
+    A row is flagged when it deviates from its rolling median by more than
+    ``threshold`` times the robust standard deviation ``MAD_TO_STD * MAD``.
+    Windows without spread, such as atom counts that rarely change, flag
+    nothing; missing values are never flagged.
+
+    Parameters
+    ----------
+    values : array-like
+        Series to scan.
+    window_size : int, optional
+        Rows of the centered window.
+    threshold : float, optional
+        Flagging threshold in robust standard deviations.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask aligned with ``values``.
+
+    Raises
+    ------
+    ValueError
+        If the window has fewer than three rows or the threshold is not
+        positive.
+
+    Examples
+    --------
+    >>> noise = np.random.default_rng(0).normal(size=400)
+    >>> noise[[50, 300]] += 40.0
+    >>> np.flatnonzero(outlier_mask(noise))
+    array([ 50, 300])
+    """
+
+    if not threshold > 0:
+        raise ValueError("Outlier threshold must be positive")
+
+    values = np.asarray(values, dtype=float)
+    median, mad = rolling_median_mad(values, window_size)
+    scale = threshold * MAD_TO_STD * mad
+    with np.errstate(invalid="ignore"):
+        return (np.abs(values - median) > scale) & (scale > 0)
+
+
+def _rolling_median(values, window_size):
+    """
+    Return centered window medians, repeating the outermost complete ones.
+    """
+
+    size = values.size
+    if size <= window_size:
+        median = np.partition(values, size // 2)[size // 2] if size else 0.0
+        return np.full(size, median)
+
+    half = window_size // 2
+    median = rank_filter(values, half, size=window_size, mode="nearest")
+    median[:half] = median[half]
+    median[size - half:] = median[size - half - 1]
+    return median
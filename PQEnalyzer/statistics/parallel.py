@@ -0,0 +1,70 @@
+"""
+Thread pools for evaluating independent statistics concurrently.
+
+NumPy and SciPy release the GIL inside reductions, sorts and FFTs, so
+statistics of different parameters or features computed on a thread pool run
+on several cores without copying the series into worker processes. Results
+are always collected in submission order, so concurrent evaluation renders
+exactly like sequential evaluation.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+def default_workers() -> int:
+    """
+    Return the number of CPU cores available to this process.
+    """
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def statistics_executor(workers=1):
+    """
+    Return a thread pool for ``workers`` threads, or ``None``.
+
+    ``None`` means sequential evaluation in the calling thread and is
+    returned for a single worker. ``workers=0`` uses all available cores.
+
+    Raises
+    ------
+    ValueError
+        If ``workers`` is negative.
+
+    Examples
+    --------
+    >>> statistics_executor(1) is None
+    True
+    """
+
+    if workers < 0:
+        raise ValueError("Worker count must not be negative")
+
+    if workers == 0:
+        workers = default_workers()
+
+    if workers == 1:
+        return None
+
+    return ThreadPoolExecutor(max_workers=workers,
+                              thread_name_prefix="pqenalyzer-statistics")
+
+
+def ordered_map(function, items, executor=None) -> list:
+    """
+    Apply ``function`` to every item and return the results in item order.
+
+    Examples
+    --------
+    >>> ordered_map(abs, [-2, 1, -3])
+    [2, 1, 3]
+    """
+
+    if executor is None:
+        return [function(item) for item in items]
+
+    return list(executor.map(function, items))
@@ -0,0 +1,227 @@
+"""
+Mergeable streaming quantile sketch for live medians and percentiles.
+
+The sketch follows the KLL construction: new values enter a level-0 buffer and
+full levels are compacted by sorting them and promoting every second item with
+twice the weight. Memory stays bounded by a few multiples of ``k`` items, so
+medians of growing series can be answered without keeping or partitioning the
+full data on every refresh.
+"""
+
+import math
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Bounded-memory KLL sketch answering approximate quantiles.
+
+    Parameters
+    ----------
+    rank_error : float, optional
+        Target normalized rank error of returned quantiles. Smaller values
+        retain more items per level.
+    seed : int, optional
+        Seed for the random compaction offsets. A fixed default keeps repeated
+        renders of the same data identical.
+
+    Attributes
+    ----------
+    count : int
+        Number of finite values added to the sketch.
+    minimum : float
+        Exact minimum of all added values.
+    maximum : float
+        Exact maximum of all added values.
+
+    Raises
+    ------
+    ValueError
+        If ``rank_error`` is not between zero and one.
+
+    Examples
+    --------
+    >>> sketch = QuantileSketch(rank_error=0.01)
+    >>> sketch.update([1.0, 2.0, 3.0, 4.0])
+    >>> sketch.median()
+    2.5
+    """
+
+    # Empirical KLL error model, eps ~= 2.446 / k**0.9433.
+    ERROR_CONSTANT = 2.446
+    ERROR_EXPONENT = 0.9433
+    CAPACITY_DECAY = 2 / 3
+
+    def __init__(self, rank_error=0.01, seed=0):
+        if not 0 < rank_error < 1:
+            raise ValueError("Rank error must be between zero and one")
+
+        self.rank_error = rank_error
+        self.k = max(8, math.ceil(
+            (self.ERROR_CONSTANT / rank_error) ** (1 / self.ERROR_EXPONENT)))
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.__levels = [np.empty(0)]
+        self.__rng = np.random.default_rng(seed)
+        self.__sorted_view = None
+
+    @property
+    def size(self):
+        """
+        Return the number of items currently retained by the sketch.
+        """
+
+        return sum(level.size for level in self.__levels)
+
+    def update(self, values) -> None:
+        """
+        Add a block of values to the sketch.
+
+        Non-finite values are ignored, matching the ``nan``-aware reductions
+        used for dashboard summaries.
+        """
+
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+
+        self.count += int(values.size)
+        self.minimum = min(self.minimum, float(np.min(values)))
+        self.maximum = max(self.maximum, float(np.max(values)))
+        self.__levels[0] = np.concatenate([self.__levels[0], values])
+        self.__compress()
+
+    def merge(self, other) -> None:
+        """
+        Merge another sketch into this one.
+
+        Levels with equal weight are concatenated and then compacted with this
+        sketch's capacity, so sketches of separate files or replicas can be
+        combined without revisiting their data.
+        """
+
+        if other.count == 0:
+            return
+
+        other_levels = other.__levels
+        while len(self.__levels) < len(other_levels):
+            self.__levels.append(np.empty(0))
+
+        for level, items in enumerate(other_levels):
+            self.__levels[level] = np.concatenate([self.__levels[level],
+                                                   items])
+
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.__compress()
+
+    def quantile(self, quantile) -> float:
+        """
+        Return one approximate quantile in the closed interval ``[0, 1]``.
+        """
+
+        return float(self.quantiles([quantile])[0])
+
+    def quantiles(self, quantiles) -> np.ndarray:
+        """
+        Return approximate quantiles for an array of probabilities.
+
+        Retained items are interpolated at the center of their weighted rank,
+        so a sketch that has not compacted yet reproduces ``np.quantile``
+        exactly. Empty sketches return ``nan``.
+
+        Raises
+        ------
+        ValueError
+            If a requested quantile is outside ``[0, 1]``.
+        """
+
+        quantiles = np.asarray(quantiles, dtype=float)
+        if np.any((quantiles < 0) | (quantiles > 1)):
+            raise ValueError("Quantiles must be between zero and one")
+
+        if self.count == 0:
+            return np.full(quantiles.shape, np.nan)
+
+        items, centers = self.__sorted_items()
+        return np.interp(quantiles * (self.count - 1), centers, items)
+
+    def median(self) -> float:
+        """
+        Return the approximate median.
+        """
+
+        return self.quantile(0.5)
+
+    def __sorted_items(self):
+        """
+        Return retained items sorted with their weighted rank centers.
+
+        The exact minimum and maximum are pinned to the first and last rank so
+        the extreme quantiles stay exact after compaction. The sorted view is
+        cached until the next update so several percentile queries per refresh
+        cost one interpolation each.
+        """
+
+        if self.__sorted_view is None:
+            items = np.concatenate(self.__levels)
+            weights = np.concatenate([
+                np.full(level.size, 2.0**height)
+                for height, level in enumerate(self.__levels)
+            ])
+            order = np.argsort(items, kind="stable")
+            items = items[order]
+            weights = weights[order]
+            centers = np.cumsum(weights) - weights / 2 - 0.5
+            self.__sorted_view = (
+                np.concatenate([[self.minimum], items, [self.maximum]]),
+                np.concatenate([[0.0], centers, [self.count - 1.0]]),
+            )
+
+        return self.__sorted_view
+
+    def __capacity(self, level):
+        """
+        Return the item capacity of one level.
+
+        Lower levels hold fewer items because their items carry less weight,
+        which keeps the total memory close to ``3 * k``.
+        """
+
+        depth = len(self.__levels) - level - 1
+        return max(2, math.ceil(self.k * self.CAPACITY_DECAY**depth))
+
+    def __compress(self):
+        """
+        Compact every level that exceeds its capacity.
+        """
+
+        self.__sorted_view = None
+        compacted = True
+        while compacted:
+            compacted = False
+            for level in range(len(self.__levels)):
+                if self.__levels[level].size > self.__capacity(level):
+                    self.__compact(level)
+                    compacted = True
+
+    def __compact(self, level):
+        """
+        Promote every second sorted item of one level with doubled weight.
+        """
+
+        if level + 1 == len(self.__levels):
+            self.__levels.append(np.empty(0))
+
+        items = np.sort(self.__levels[level])
+        leftover = items.size % 2
+        paired = items[:items.size - leftover]
+        offset = int(self.__rng.integers(2))
+
+        self.__levels[level + 1] = np.concatenate(
+            [self.__levels[level + 1], paired[offset::2]])
+        self.__levels[level] = items[items.size - leftover:]
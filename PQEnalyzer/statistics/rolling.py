@@ -0,0 +1,177 @@
+"""
+Linear-time rolling window statistics.
+
+Window means and standard deviations come from prefix sums of ``x`` and
+``x**2``; window minima and maxima use the van Herk/Gil-Werman block
+decomposition. Every statistic costs ``O(n)`` independent of the window
+length, so wide windows on long runs stay cheap. Rolling quantiles keep a
+sorted window that is updated in ``O(log w)`` per step, or are evaluated on a
+strided subset of windows for very long series.
+"""
+
+import numpy as np
+from scipy.ndimage import rank_filter
+
+
+def window_centers(time, window_size, stride=1) -> np.ndarray:
+    """
+    Return the mean time of every ``stride``-th complete window.
+    """
+
+    time = np.asarray(time, dtype=float)
+    return _window_sums(time, window_size)[::stride] / window_size
+
+
+def rolling_mean_std(values, window_size) -> tuple:
+    """
+    Return the mean and population standard deviation of every window.
+
+    The series is centered on its global mean before the prefix sums are
+    formed, which limits cancellation between large prefix sums.
+
+    Examples
+    --------
+    >>> rolling_mean_std([1.0, 3.0, 5.0, 7.0], 2)
+    (array([2., 4., 6.]), array([1., 1., 1.]))
+    """
+
+    values = _checked(values, window_size)
+    offset = np.mean(values)
+    centered = values - offset
+    sums = _window_sums(centered, window_size)
+    squares = _window_sums(centered * centered, window_size)
+
+    means = sums / window_size
+    variances = np.maximum(squares / window_size - means * means, 0.0)
+    return means + offset, np.sqrt(variances)
+
+
+def rolling_min(values, window_size) -> np.ndarray:
+    """
+    Return the minimum of every complete window.
+
+    Examples
+    --------
+    >>> rolling_min([3.0, 1.0, 4.0, 1.0, 5.0], 3)
+    array([1., 1., 1.])
+    """
+
+    return _rolling_extreme(_checked(values, window_size), window_size,
+                            np.minimum, np.inf)
+
+
+def rolling_max(values, window_size) -> np.ndarray:
+    """
+    Return the maximum of every complete window.
+
+    Examples
+    --------
+    >>> rolling_max([3.0, 1.0, 4.0, 1.0, 5.0], 3)
+    array([4., 4., 5.])
+    """
+
+    return _rolling_extreme(_checked(values, window_size), window_size,
+                            np.maximum, -np.inf)
+
+
+def rolling_quantile(values, window_size, quantile, stride=1) -> np.ndarray:
+    """
+    Return a quantile of every ``stride``-th complete window.
+
+    The quantile is the order statistic of rank ``floor(quantile * w)``
+    (clipped to the window), so all values are samples of the series. With
+    ``stride=1`` every window is evaluated by SciPy's 1-D rank filter, which
+    maintains the sorted window in a pair of heaps. Larger strides partition
+    each evaluated window, costing ``O(w)`` per window instead of
+    ``O(n log w)`` for the whole series.
+
+    Parameters
+    ----------
+    values : array-like
+        Series to evaluate.
+    window_size : int
+        Number of rows per window.
+    quantile : float
+        Quantile in the closed interval ``[0, 1]``.
+    stride : int, optional
+        Distance between the starts of evaluated windows.
+
+    Raises
+    ------
+    ValueError
+        If the window, quantile or stride is invalid.
+
+    Examples
+    --------
+    >>> rolling_quantile([5.0, 1.0, 4.0, 2.0, 3.0], 3, 0.5)
+    array([4., 2., 3.])
+    >>> rolling_quantile([5.0, 1.0, 4.0, 2.0, 3.0], 3, 0.5, stride=2)
+    array([4., 3.])
+    """
+
+    values = _checked(values, window_size)
+    if not 0 <= quantile <= 1:
+        raise ValueError("Quantile must be between zero and one")
+
+    if stride < 1:
+        raise ValueError("Stride must be positive")
+
+    rank = min(int(quantile * window_size), window_size - 1)
+    if stride == 1:
+        filtered = rank_filter(values, rank, size=window_size,
+                               mode="nearest")
+        start = window_size // 2
+        return filtered[start:start + values.size - window_size + 1]
+
+    starts = range(0, values.size - window_size + 1, stride)
+    return np.array([
+        np.partition(values[start:start + window_size], rank)[rank]
+        for start in starts
+    ])
+
+
+def _checked(values, window_size):
+    """
+    Validate a window against a series and return the series as floats.
+    """
+
+    values = np.asarray(values, dtype=float)
+    if window_size < 1:
+        raise ValueError("Window size must be positive")
+
+    if values.size < window_size:
+        raise ValueError("Window size is larger than given data point")
+
+    return values
+
+
+def _window_sums(values, window_size):
+    """
+    Return sums over all complete windows from one prefix sum.
+    """
+
+    prefix = np.empty(values.size + 1)
+    prefix[0] = 0.0
+    np.cumsum(values, out=prefix[1:])
+    return prefix[window_size:] - prefix[:values.size + 1 - window_size]
+
+
+def _rolling_extreme(values, window_size, ufunc, fill):
+    """
+    Return rolling extrema by van Herk/Gil-Werman block decomposition.
+
+    Within blocks of ``window_size`` rows, running extrema from the left and
+    from the right are formed; every window spans at most two blocks and is
+    the extremum of one suffix and one prefix value.
+    """
+
+    size = values.size
+    blocks = -(-size // window_size)
+    padded = np.full(blocks * window_size, fill)
+    padded[:size] = values
+    padded = padded.reshape(blocks, window_size)
+
+    prefix = ufunc.accumulate(padded, axis=1).ravel()
+    suffix = ufunc.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    return ufunc(suffix[:size - window_size + 1],
+                 prefix[window_size - 1:size])
@@ -9,6 +9,16 @@ operate only on aligned time/value arrays.
 import numpy as np
 
 from ..energy_access import concatenate_series
+from .bootstrap import block_bootstrap
+from .drift import linear_drift, rolling_drift
+from .rolling import (
+    rolling_max,
+    rolling_mean_std,
+    rolling_min,
+    rolling_quantile,
+    window_centers,
+)
+from .smoothing import exponential_moving_average, savitzky_golay
 
 
 class Statistic:
@@ -19,12 +29,16 @@ class Statistic:
     -------
     mean(energies, info_parameter)
         Calculate a horizontal mean line for a Reader energy parameter.
-    mean_values(time, values)
+    mean_values(time, values, mask=None)
         Calculate a horizontal mean line for numeric arrays.
     median(energies, info_parameter)
         Calculate a horizontal median line for a Reader energy parameter.
-    median_values(time, values)
+    median_values(time, values, sketch=None, mask=None)
         Calculate a horizontal median line for numeric arrays.
+    quantile_values(time, values, quantile, sketch=None, mask=None)
+        Calculate a horizontal quantile line for numeric arrays.
+    confidence_interval_values(time, values, statistic="mean", ...)
+        Calculate a block-bootstrap confidence band for numeric arrays.
     cumulative_average(energies, info_parameter)
         Calculate cumulative average values for a Reader energy parameter.
     cumulative_average_values(time, values)
@@ -39,6 +53,22 @@ class Statistic:
         Calculate a centered running average for a Reader energy parameter.
     running_average_values(time, values, window_size)
         Calculate a centered running average for numeric arrays.
+    exponential_moving_average_values(time, values, span)
+        Calculate an exponential moving average for numeric arrays.
+    savitzky_golay_values(time, values, window_size)
+        Calculate a Savitzky-Golay smoothed series for numeric arrays.
+    trend_values(time, values)
+        Calculate the least-squares trend line for numeric arrays.
+    rolling_drift_values(time, values, window_size)
+        Calculate least-squares slopes over sliding windows.
+    rolling_std_values(time, values, window_size)
+        Calculate rolling means and standard deviations for numeric arrays.
+    rolling_min_values(time, values, window_size)
+        Calculate rolling minima for numeric arrays.
+    rolling_max_values(time, values, window_size)
+        Calculate rolling maxima for numeric arrays.
+    rolling_quantile_values(time, values, window_size, quantile, stride=1)
+        Calculate rolling quantiles for numeric arrays.
 
     Raises
     ------
@@ -81,16 +111,27 @@ class Statistic:
         return Statistic.mean_values(energy_series.time, energy_series.values)
 
     @staticmethod
-    def mean_values(time, values) -> tuple:
+    def mean_values(time, values, mask=None) -> tuple:
         """
         Calculate the mean line for a numeric series.
 
         The returned time axis contains the first and last input time so the
-        line spans the plotted data range.
+        line spans the plotted data range. Rows where the boolean ``mask`` is
+        set, for example detected outliers, are left out of the mean without
+        copying the values.
+
+        Examples
+        --------
+        >>> Statistic.mean_values([1, 2, 3], [1.0, 50.0, 3.0],
+        ...                       mask=np.array([False, True, False]))
+        (array([1, 3]), array([2., 2.]))
         """
 
         time, data = Statistic.__arrays(time, values)
-        mean = np.mean(data)
+        if mask is None:
+            mean = np.mean(data)
+        else:
+            mean = np.mean(data, where=~np.asarray(mask))
 
         return np.array([time[0], time[-1]]), np.array([mean, mean])
 
@@ -122,18 +163,104 @@ class Statistic:
                                        energy_series.values)
 
     @staticmethod
-    def median_values(time, values) -> tuple:
+    def median_values(time, values, sketch=None, mask=None) -> tuple:
         """
         Calculate the median line for a numeric series.
 
         The returned time axis contains the first and last input time so the
-        line spans the plotted data range.
+        line spans the plotted data range. When a ``QuantileSketch`` of the
+        values is supplied, its approximate median is used instead of
+        partitioning the full series. Rows where ``mask`` is set are left out.
+        """
+
+        return Statistic.quantile_values(time, values, 0.5, sketch=sketch,
+                                         mask=mask)
+
+    @staticmethod
+    def quantile_values(time, values, quantile, sketch=None,
+                        mask=None) -> tuple:
+        """
+        Calculate a horizontal quantile line for a numeric series.
+
+        Parameters
+        ----------
+        time : array-like
+            Simulation-time values of the series.
+        values : array-like
+            Numeric values aligned with ``time``.
+        quantile : float
+            Quantile in the closed interval ``[0, 1]``.
+        sketch : QuantileSketch, optional
+            Sketch of ``values`` answering the quantile approximately; it
+            already summarizes all rows, so ``mask`` does not apply to it.
+        mask : array-like of bool, optional
+            Rows to leave out of the exact quantile.
+
+        Returns
+        -------
+        tuple
+            A tuple containing the time span and the quantile line.
+
+        Raises
+        ------
+        ValueError
+            If the quantile is outside ``[0, 1]``.
+
+        Examples
+        --------
+        >>> Statistic.quantile_values([1, 2, 3, 4], [1, 2, 3, 4], 0.25)
+        (array([1, 4]), array([1.75, 1.75]))
+        """
+
+        time, data = Statistic.__arrays(time, values)
+        if not 0 <= quantile <= 1:
+            raise ValueError("Quantile must be between zero and one")
+
+        if sketch is None:
+            # the partition copies the series anyway, so compress first
+            value = np.quantile(
+                data if mask is None else data[~np.asarray(mask)], quantile)
+        else:
+            value = sketch.quantile(quantile)
+
+        return np.array([time[0], time[-1]]), np.array([value, value])
+
+    @staticmethod
+    def confidence_interval_values(time, values, statistic="mean",
+                                   confidence=0.95, executor=None,
+                                   mask=None) -> tuple:
+        """
+        Calculate a horizontal bootstrap confidence band for a series.
+
+        The band spans the first and last input time. Its edges are the
+        moving-block bootstrap interval of the mean or median, so they
+        account for the autocorrelation of the series. Rows where ``mask``
+        is set are left out before blocks are drawn.
+
+        Returns
+        -------
+        tuple
+            Time, lower edge and upper edge of the band.
+
+        Examples
+        --------
+        >>> time, lower, upper = Statistic.confidence_interval_values(
+        ...     [1, 2, 3, 4], [1.0, 2.0, 3.0, 4.0])
+        >>> time
+        array([1, 4])
+        >>> bool(lower[0] < 2.5 < upper[0])
+        True
         """
 
         time, data = Statistic.__arrays(time, values)
-        median = np.median(data)
+        if mask is not None:
+            data = data[~np.asarray(mask)]
+        interval = block_bootstrap(data, statistic, confidence=confidence,
+                                   executor=executor)
 
-        return np.array([time[0], time[-1]]), np.array([median, median])
+        return (np.array([time[0], time[-1]]),
+                np.full(2, interval.lower),
+                np.full(2, interval.upper))
 
     @staticmethod
     def cumulative_average(energies: list, info_parameter: str) -> tuple:
@@ -301,6 +428,135 @@ class Statistic:
 
         return time, running_average
 
+    @staticmethod
+    def exponential_moving_average_values(time, values, span) -> tuple:
+        """
+        Calculate the exponential moving average for a numeric series.
+
+        The output keeps the input time axis; the average starts at the first
+        value and uses the smoothing factor ``2 / (span + 1)``.
+        """
+
+        time, data = Statistic.__arrays(time, values)
+
+        return time, exponential_moving_average(data, span)
+
+    @staticmethod
+    def savitzky_golay_values(time, values, window_size) -> tuple:
+        """
+        Calculate a cubic Savitzky-Golay smoothed series.
+
+        The output keeps the input time axis. Windows longer than the series
+        are shrunk to it.
+        """
+
+        time, data = Statistic.__arrays(time, values)
+
+        return time, savitzky_golay(data, window_size)
+
+    @staticmethod
+    def trend_values(time, values) -> tuple:
+        """
+        Calculate the least-squares trend line for a numeric series.
+
+        The line is returned at the first and last time value, which is enough
+        to draw it.
+
+        Examples
+        --------
+        >>> Statistic.trend_values([0, 1, 2], [1.0, 2.0, 3.0])
+        (array([0, 2]), array([1., 3.]))
+        """
+
+        time, data = Statistic.__arrays(time, values)
+        drift = linear_drift(time, data)
+        time = time[[0, -1]]
+
+        return time, drift.intercept + drift.slope * time
+
+    @staticmethod
+    def rolling_drift_values(time, values, window_size) -> tuple:
+        """
+        Calculate least-squares slopes over all sliding windows.
+
+        Output time values are window centers. Every window costs ``O(1)``
+        from prefix sums.
+        """
+
+        time, data = Statistic.__arrays(time, values)
+        drift = rolling_drift(time, data, window_size)
+
+        return window_centers(time, window_size), drift.slope
+
+    @staticmethod
+    def rolling_std_values(time, values, window_size) -> tuple:
+        """
+        Calculate rolling means and standard deviations over sliding windows.
+
+        Returns window-center times, window means and population standard
+        deviations. Both statistics come from prefix sums of the values and
+        their squares, so the cost does not depend on ``window_size``.
+
+        Examples
+        --------
+        >>> Statistic.rolling_std_values([0, 1, 2], [1.0, 3.0, 3.0], 2)
+        (array([0.5, 1.5]), array([2., 3.]), array([1., 0.]))
+        """
+
+        time, data = Statistic.__arrays(time, values)
+        mean, std_dev = rolling_mean_std(data, window_size)
+
+        return window_centers(time, window_size), mean, std_dev
+
+    @staticmethod
+    def rolling_min_values(time, values, window_size) -> tuple:
+        """
+        Calculate the minimum over all sliding windows.
+
+        Output time values are window centers. Minima use a block
+        decomposition with ``O(1)`` work per window.
+        """
+
+        time, data = Statistic.__arrays(time, values)
+        minimum = rolling_min(data, window_size)
+
+        return window_centers(time, window_size), minimum
+
+    @staticmethod
+    def rolling_max_values(time, values, window_size) -> tuple:
+        """
+        Calculate the maximum over all sliding windows.
+
+        Output time values are window centers. Maxima use a block
+        decomposition with ``O(1)`` work per window.
+        """
+
+        time, data = Statistic.__arrays(time, values)
+        maximum = rolling_max(data, window_size)
+
+        return window_centers(time, window_size), maximum
+
+    @staticmethod
+    def rolling_quantile_values(time, values, window_size, quantile,
+                                stride=1) -> tuple:
+        """
+        Calculate a quantile over every ``stride``-th sliding window.
+
+        Output time values are window centers. Quantiles are order statistics
+        of the window, see ``rolling_quantile``.
+
+        Examples
+        --------
+        >>> Statistic.rolling_quantile_values([0, 1, 2, 3],
+        ...                                   [4.0, 1.0, 3.0, 2.0], 2, 0.0)
+        (array([0.5, 1.5, 2.5]), array([1., 1., 2.]))
+        """
+
+        time, data = Statistic.__arrays(time, values)
+        quantiles = rolling_quantile(data, window_size, quantile, stride)
+
+        return window_centers(time, window_size, stride), quantiles
+
     @staticmethod
     def __arrays(time, values) -> tuple:
         """
@@ -0,0 +1,886 @@
+"""
+Incremental statistic state for growing simulation output.
+
+Live views re-read the newest file on every refresh, but simulation output only
+grows at its end. The accumulators in this module receive the full current
+series and consume only the rows appended since their previous update, so a
+refresh costs time proportional to the new rows instead of the run length.
+"""
+
+import threading
+from abc import ABCMeta, abstractmethod
+
+import numpy as np
+from scipy.signal import fftconvolve
+
+from .changepoint import cusum, long_run_variance
+from .outliers import OUTLIER_THRESHOLD, OUTLIER_WINDOW, outlier_mask
+from .quantile_sketch import QuantileSketch
+from .smoothing import (
+    exponential_moving_average,
+    savitzky_golay,
+    savitzky_golay_window,
+)
+from .subsampling import subsampling_stride
+
+
+SCAN_ROWS = 8192
+# Rows per CUSUM block; bounds the rescanned rows after an alarm.
+
+WARMUP_STRIDES = 256
+# Decorrelated samples that estimate the reference of a CUSUM regime.
+
+FINGERPRINT_ROWS = 8
+# Evenly spaced consumed rows compared to tell appends from rewrites.
+
+
+class SeriesAccumulator(metaclass=ABCMeta):
+    """
+    Base class for accumulators fed with a growing series.
+
+    ``update`` forwards only the appended tail to ``extend``. When a series
+    becomes shorter or any of ``FINGERPRINT_ROWS`` evenly spaced consumed
+    rows, including the first and the last, changed, the series was
+    rewritten or shifted rather than appended and the accumulator starts
+    over.
+
+    Attributes
+    ----------
+    rows : int
+        Number of series rows consumed so far.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.__fingerprint = None
+
+    def update(self, values):
+        """
+        Consume rows appended since the previous update and return ``self``.
+        """
+
+        values = np.asarray(values)
+        if not self.__continues(values):
+            self.reset()
+
+        if values.size > self.rows:
+            self.extend(values[self.rows:])
+            self.rows = int(values.size)
+            self.__fingerprint = values[_fingerprint_rows(self.rows)]
+
+        return self
+
+    def reset(self) -> None:
+        """
+        Forget all consumed rows.
+        """
+
+        self.rows = 0
+        self.__fingerprint = None
+        self.clear()
+
+    @abstractmethod
+    def extend(self, values) -> None:
+        """
+        Consume a block of newly appended values.
+
+        Raises
+        ------
+        NotImplementedError
+            If the method is not implemented in the subclass.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Reset subclass state after the consumed series was rewritten.
+
+        Raises
+        ------
+        NotImplementedError
+            If the method is not implemented in the subclass.
+        """
+
+        raise NotImplementedError
+
+    def __continues(self, values):
+        """
+        Return whether ``values`` extends the previously consumed series.
+        """
+
+        if self.rows == 0:
+            return True
+
+        if values.size < self.rows:
+            return False
+
+        return np.array_equal(values[_fingerprint_rows(self.rows)],
+                              self.__fingerprint, equal_nan=True)
+
+
+class StreamingQuantiles(SeriesAccumulator):
+    """
+    Quantile sketch of a growing series.
+
+    Parameters
+    ----------
+    rank_error : float, optional
+        Target normalized rank error of the underlying ``QuantileSketch``.
+    """
+
+    def __init__(self, rank_error=0.01):
+        super().__init__()
+        self.rank_error = rank_error
+        self.sketch = QuantileSketch(rank_error)
+
+    def extend(self, values) -> None:
+        """
+        Add appended values to the sketch.
+        """
+
+        self.sketch.update(values)
+
+    def clear(self) -> None:
+        """
+        Replace the sketch with an empty one.
+        """
+
+        self.sketch = QuantileSketch(self.rank_error)
+
+
+class CumulativeAverage(SeriesAccumulator):
+    """
+    Running cumulative average of a growing series.
+
+    The running sum is carried between updates and averages are written into
+    an amortized growing buffer, so appending ``m`` rows costs ``O(m)``.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.total = 0.0
+        self.__averages = np.empty(0)
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Return cumulative averages for all consumed rows without copying.
+        """
+
+        return self.__averages[:self.rows]
+
+    def extend(self, values) -> None:
+        """
+        Append cumulative averages for newly appended values.
+        """
+
+        values = np.asarray(values, dtype=float)
+        totals = self.total + np.cumsum(values)
+        counts = np.arange(self.rows + 1, self.rows + values.size + 1)
+
+        end = self.rows + values.size
+        self.__averages = _reserve(self.__averages, self.rows, end)
+        self.__averages[self.rows:end] = totals / counts
+        self.total = float(totals[-1])
+
+    def clear(self) -> None:
+        """
+        Drop the running sum and all buffered averages.
+        """
+
+        self.total = 0.0
+        self.__averages = np.empty(0)
+
+
+class ExponentialMovingAverage(SeriesAccumulator):
+    """
+    Exponential moving average of a growing series.
+
+    Appended rows continue the recursive filter from the last average, so an
+    update costs ``O(m)`` for ``m`` new rows.
+
+    Parameters
+    ----------
+    span : float
+        Span of the moving average.
+    """
+
+    def __init__(self, span):
+        super().__init__()
+        self.span = span
+        self.__averages = np.empty(0)
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Return averages for all consumed rows without copying.
+        """
+
+        return self.__averages[:self.rows]
+
+    def extend(self, values) -> None:
+        """
+        Continue the average over newly appended values.
+        """
+
+        previous = self.__averages[self.rows - 1] if self.rows else None
+        averages = exponential_moving_average(values, self.span, previous)
+
+        end = self.rows + averages.size
+        self.__averages = _reserve(self.__averages, self.rows, end)
+        self.__averages[self.rows:end] = averages
+
+    def clear(self) -> None:
+        """
+        Drop all buffered averages.
+        """
+
+        self.__averages = np.empty(0)
+
+
+class SavitzkyGolaySmoother(SeriesAccumulator):
+    """
+    Savitzky-Golay smoothing of a growing series.
+
+    Outputs more than half a window before the end of the series no longer
+    change, so appended rows only recompute the last window of outputs from
+    the retained input tail.
+
+    Parameters
+    ----------
+    window_size : int
+        Filter length; rounded up to an odd number.
+    """
+
+    def __init__(self, window_size):
+        super().__init__()
+        self.window_size = window_size
+        self.__tail = np.empty(0)
+        self.__smoothed = np.empty(0)
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Return smoothed values for all consumed rows without copying.
+        """
+
+        return self.__smoothed[:self.rows]
+
+    def extend(self, values) -> None:
+        """
+        Smooth newly appended values and refresh the affected tail outputs.
+        """
+
+        values = np.asarray(values, dtype=float)
+        end = self.rows + values.size
+        window = int(self.window_size) | 1
+        segment = np.concatenate([self.__tail, values])
+        start = end - segment.size
+
+        smoothed = savitzky_golay(segment, self.window_size)
+        settled = 0
+        if start > 0 and savitzky_golay_window(self.window_size, end):
+            settled = window // 2
+
+        self.__smoothed = _reserve(self.__smoothed, self.rows, end)
+        self.__smoothed[start + settled:end] = smoothed[settled:]
+        self.__tail = segment[-(window - 1):] if window > 1 else np.empty(0)
+
+    def clear(self) -> None:
+        """
+        Drop the retained input tail and all smoothed values.
+        """
+
+        self.__tail = np.empty(0)
+        self.__smoothed = np.empty(0)
+
+
+class StreamingMoments(SeriesAccumulator):
+    """
+    Count, mean, variance and range of a growing series.
+
+    Blocks of appended values are merged with Chan's parallel update, so the
+    moments stay numerically stable for long runs. ``nan`` values are
+    ignored.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.clear()
+
+    @property
+    def variance(self) -> float:
+        """
+        Return the sample variance, or ``nan`` for fewer than two values.
+        """
+
+        if self.count < 2:
+            return np.nan
+
+        return self.m2 / (self.count - 1)
+
+    def extend(self, values) -> None:
+        """
+        Merge the moments of newly appended values.
+        """
+
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+
+        count = self.count + values.size
+        mean = float(np.mean(values))
+        delta = mean - self.mean
+        self.m2 += (float(np.sum((values - mean) ** 2))
+                    + delta * delta * self.count * values.size / count)
+        self.mean += delta * values.size / count
+        self.count = count
+        self.minimum = min(self.minimum, float(np.min(values)))
+        self.maximum = max(self.maximum, float(np.max(values)))
+
+    def clear(self) -> None:
+        """
+        Reset all moments.
+        """
+
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+
+class CusumDetector(SeriesAccumulator):
+    """
+    Online two-sided CUSUM change-point detector for a growing series.
+
+    The first rows of every regime fix its reference mean, the series
+    standard deviation ``sigma`` and its long-run variance ``L``. They span
+    at least ``warmup`` rows and ``WARMUP_STRIDES`` decorrelated samples; the
+    subsampling stride is re-estimated whenever the warmup grows, so ``L`` is
+    estimated from blocks longer than the correlation time.
+    Upper and lower sums accumulate deviations beyond ``drift * sigma`` and
+    raise an alarm once one exceeds ``threshold * L / (2 * drift * sigma)``;
+    for that threshold, false alarms of an unchanged regime arrive roughly
+    every ``exp(threshold)`` rows. The change is placed after the last row
+    at which the alarming sum was zero, and the next regime warms up from
+    the alarm row. Appended rows are scanned in blocks of at most
+    ``SCAN_ROWS`` with ``cusum``, so an update costs ``O(m)`` for ``m`` new
+    rows plus at most one block per alarm.
+
+    Parameters
+    ----------
+    threshold : float, optional
+        Alarm threshold in units of the expected excursion of an unchanged
+        regime.
+    drift : float, optional
+        Allowed slack of the mean in standard deviations.
+    warmup : int, optional
+        Minimum rows that estimate the reference of a new regime.
+
+    Attributes
+    ----------
+    change_points : list
+        First row of every detected regime after the first one.
+    """
+
+    def __init__(self, threshold=20.0, drift=0.5, warmup=1000):
+        super().__init__()
+        self.threshold = threshold
+        self.drift = drift
+        self.warmup = warmup
+        self.change_points = []
+        self.__values = np.empty(0)
+        self.__start = 0
+        self.__warmup = warmup
+        self.__reference = None
+        self.__sums = (0.0, 0.0)
+        self.__position = 0
+        self.__zeros = (0, 0)
+
+    def extend(self, values) -> None:
+        """
+        Scan newly appended values for changes of the regime mean.
+        """
+
+        end = self.rows + len(values)
+        self.__values = _reserve(self.__values, self.rows, end)
+        self.__values[self.rows:end] = values
+
+        while self.__scan(end):
+            pass
+
+    def clear(self) -> None:
+        """
+        Drop all consumed values and detected change points.
+        """
+
+        self.change_points = []
+        self.__values = np.empty(0)
+        self.__start_regime(0)
+
+    def __start_regime(self, start):
+        """
+        Begin a new regime at row ``start`` whose reference is not known yet.
+        """
+
+        self.__start = start
+        self.__warmup = self.warmup
+        self.__reference = None
+        self.__sums = (0.0, 0.0)
+
+    def __scan(self, end):
+        """
+        Scan one block of rows before ``end``; return whether rows remain.
+        """
+
+        if self.__reference is None:
+            if end - self.__start < self.__warmup:
+                return False
+
+            window = self.__values[self.__start:self.__start + self.__warmup]
+            warmup = WARMUP_STRIDES * subsampling_stride(window)
+            if warmup > self.__warmup:
+                # a longer warmup may reveal a longer correlation time
+                self.__warmup = warmup
+                return True
+
+            slack = self.drift * float(np.std(window))
+            limit = 0.0
+            if slack > 0:
+                limit = (self.threshold * long_run_variance(window)
+                         / (2 * slack))
+            self.__reference = (float(np.mean(window)), slack, limit)
+            self.__position = self.__start + self.__warmup
+            self.__zeros = (self.__position, self.__position)
+
+        mean, slack, limit = self.__reference
+        stop = min(end, self.__position + SCAN_ROWS)
+        block = self.__values[self.__position:stop]
+        if block.size == 0:
+            return False
+
+        # rows of the block are before ``stop``, so it marks "no alarm"
+        alarm, change = stop, stop
+        sums, zeros = [], []
+        for sign, start, zero in zip((1.0, -1.0), self.__sums, self.__zeros):
+            side = cusum(sign * (block - mean) - slack, start)
+            exceeded = np.flatnonzero(side > limit)
+            last = side.size if exceeded.size == 0 else int(exceeded[0])
+            resets = np.flatnonzero(side[:last] == 0)
+            if resets.size > 0:
+                zero = self.__position + int(resets[-1]) + 1
+            if self.__position + last < alarm:
+                alarm, change = self.__position + last, zero
+            sums.append(float(side[-1]))
+            zeros.append(zero)
+
+        if alarm == stop:
+            self.__sums, self.__zeros = tuple(sums), tuple(zeros)
+            self.__position = stop
+            return stop < end
+
+        # rows before the alarm may still belong to the previous regime
+        self.change_points.append(int(change))
+        self.__start_regime(alarm)
+        return True
+
+
+class OutlierDetector(SeriesAccumulator):
+    """
+    Rolling median/MAD spike detection of a growing series.
+
+    The mask of a row depends on the rows up to two half windows away, so
+    appended rows only rescan the retained tail of four half windows and
+    replace the masks of its last two half windows; all other masks are
+    final. The masks equal those of ``outlier_mask`` on the full series.
+
+    Parameters
+    ----------
+    window_size : int, optional
+        Rows of the centered window; rounded up to an odd number.
+    threshold : float, optional
+        Flagging threshold in robust standard deviations.
+    """
+
+    def __init__(self, window_size=OUTLIER_WINDOW,
+                 threshold=OUTLIER_THRESHOLD):
+        super().__init__()
+        self.window_size = window_size
+        self.threshold = threshold
+        self.__tail = np.empty(0)
+        self.__mask = np.empty(0, dtype=bool)
+
+    @property
+    def mask(self) -> np.ndarray:
+        """
+        Return the outlier mask of all consumed rows without copying.
+        """
+
+        return self.__mask[:self.rows]
+
+    @property
+    def count(self) -> int:
+        """
+        Return the number of flagged rows.
+        """
+
+        return int(np.count_nonzero(self.mask))
+
+    def extend(self, values) -> None:
+        """
+        Scan newly appended values and refresh the masks of the tail.
+        """
+
+        values = np.asarray(values, dtype=float)
+        end = self.rows + values.size
+        half = int(self.window_size) // 2
+        segment = np.concatenate([self.__tail, values])
+        start = end - segment.size
+
+        mask = outlier_mask(segment, self.window_size, self.threshold)
+        settled = 2 * half if start > 0 else 0
+
+        self.__mask = _reserve(self.__mask, self.rows, end)
+        self.__mask[start + settled:end] = mask[settled:]
+        self.__tail = segment[-4 * half:]
+
+    def clear(self) -> None:
+        """
+        Drop the retained input tail and all masks.
+        """
+
+        self.__tail = np.empty(0)
+        self.__mask = np.empty(0, dtype=bool)
+
+
+class StreamingHistogram(SeriesAccumulator):
+    """
+    Histogram of a growing series with fixed or adaptive bin edges.
+
+    Appended values are added with ``np.bincount``. Without fixed ``edges``
+    the bins start at the range of the first block and double their width
+    whenever a value falls outside, merging pairs of neighbouring bins; the
+    number of bins stays constant, so an update costs ``O(m + bins)``.
+
+    Parameters
+    ----------
+    bins : int, optional
+        Number of bins; must be even for adaptive edges.
+    edges : tuple, optional
+        Fixed ``(lower, upper)`` range. Values outside are not counted.
+
+    Examples
+    --------
+    >>> histogram = StreamingHistogram(bins=4).update([0.0, 1.0, 2.0, 4.0])
+    >>> histogram.counts
+    array([1., 1., 1., 1.])
+    >>> histogram.update([0.0, 1.0, 2.0, 4.0, 8.0]).edges
+    array([0., 2., 4., 6., 8.])
+    """
+
+    def __init__(self, bins=1024, edges=None):
+        super().__init__()
+        if edges is None and bins % 2:
+            raise ValueError("Adaptive histograms need an even bin count")
+
+        self.bins = bins
+        self.fixed_edges = edges
+        self.moments = StreamingMoments()
+        self.clear()
+
+    @property
+    def edges(self) -> np.ndarray:
+        """
+        Return the current bin edges.
+        """
+
+        return self.origin + self.width * np.arange(self.bins + 1)
+
+    @property
+    def centers(self) -> np.ndarray:
+        """
+        Return the current bin centers.
+        """
+
+        return self.origin + self.width * (np.arange(self.bins) + 0.5)
+
+    def extend(self, values) -> None:
+        """
+        Count newly appended values, widening adaptive bins when needed.
+        """
+
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+
+        self.moments.extend(values)
+        if self.fixed_edges is None:
+            self.__cover(self.moments.minimum, self.moments.maximum)
+        else:
+            values = values[(values >= self.origin)
+                            & (values <= self.origin + self.bins * self.width)]
+
+        indices = np.minimum(
+            ((values - self.origin) / self.width).astype(np.intp),
+            self.bins - 1,
+        )
+        self.counts += np.bincount(indices, minlength=self.bins)
+
+    def density(self, bandwidth=None) -> tuple:
+        """
+        Return a Gaussian-smoothed density over the occupied bins.
+
+        The bin counts are convolved with a Gaussian kernel, by default of
+        the Scott bandwidth of the consumed values, so smoothing costs
+        ``O(bins log bins)`` regardless of the series length.
+
+        Returns
+        -------
+        tuple
+            Bin centers between the smallest and largest value and the
+            density at these centers.
+        """
+
+        total = self.counts.sum()
+        if total == 0:
+            return np.empty(0), np.empty(0)
+
+        if bandwidth is None:
+            bandwidth = (self.moments.count ** (-1 / 5)
+                         * np.sqrt(self.moments.variance))
+
+        smoothed = self.counts
+        sigma = bandwidth / self.width
+        if sigma > 0:
+            half = int(min(self.bins - 1, np.ceil(4 * sigma)))
+            offsets = np.arange(-half, half + 1) / sigma
+            kernel = np.exp(-0.5 * offsets * offsets)
+            smoothed = fftconvolve(self.counts, kernel / kernel.sum(),
+                                   mode="same")
+
+        first, last = np.searchsorted(
+            self.edges[1:-1],
+            [self.moments.minimum, self.moments.maximum],
+            side="right",
+        )
+        density = np.maximum(smoothed, 0.0) / (total * self.width)
+        return self.centers[first:last + 1], density[first:last + 1]
+
+    def clear(self) -> None:
+        """
+        Drop all counts and, for adaptive histograms, the bin edges.
+        """
+
+        self.moments.reset()
+        self.counts = np.zeros(self.bins)
+        if self.fixed_edges is None:
+            self.origin = 0.0
+            self.width = 0.0
+        else:
+            lower, upper = self.fixed_edges
+            self.origin = float(lower)
+            self.width = (float(upper) - self.origin) / self.bins
+
+    def __cover(self, minimum, maximum):
+        """
+        Place or double the adaptive bins until they cover a value range.
+        """
+
+        if self.width == 0.0:
+            span = maximum - minimum
+            self.origin = minimum
+            self.width = (span if span > 0
+                          else max(abs(minimum), 1.0) * 1e-9) / self.bins
+
+        while minimum < self.origin:
+            self.__double(left=True)
+
+        while maximum > self.origin + self.bins * self.width:
+            self.__double(left=False)
+
+    def __double(self, left):
+        """
+        Merge neighbouring bin pairs and extend the range to one side.
+        """
+
+        half = self.bins // 2
+        merged = self.counts.reshape(half, 2).sum(axis=1)
+        self.counts = np.zeros(self.bins)
+        if left:
+            self.counts[half:] = merged
+            self.origin -= self.bins * self.width
+        else:
+            self.counts[:half] = merged
+
+        self.width *= 2
+
+
+class LiveStatistics:
+    """
+    Incremental statistic state for one plot or terminal view.
+
+    Accumulators are created lazily per parameter and kept across refreshes.
+    ``start`` is the row of the full series that the passed values begin at,
+    such as a detected equilibration start; an accumulator is replaced when
+    it moves, because a series that lost rows at its head was not appended
+    to. Views that do not pass a ``LiveStatistics`` object keep using the
+    exact stateless reductions. Accumulators may be requested from several
+    threads, but each one must only be updated by one thread at a time.
+
+    Parameters
+    ----------
+    rank_error : float, optional
+        Target normalized rank error for quantile sketches.
+    """
+
+    def __init__(self, rank_error=0.01):
+        self.rank_error = rank_error
+        self.__accumulators = {}
+        self.__lock = threading.Lock()
+
+    def accumulator(self, parameter, name, factory, start=0):
+        """
+        Return the accumulator ``name`` of one parameter, creating it once.
+
+        The accumulator is created again when ``start`` differs from the
+        start it was created for.
+        """
+
+        key = (parameter, name)
+        with self.__lock:
+            current = self.__accumulators.get(key)
+            if current is None or current[0] != start:
+                current = (start, factory())
+                self.__accumulators[key] = current
+
+            return current[1]
+
+    def quantiles(self, parameter, values, start=0) -> QuantileSketch:
+        """
+        Return a quantile sketch updated with the current parameter values.
+        """
+
+        accumulator = self.accumulator(
+            parameter,
+            "quantiles",
+            lambda: StreamingQuantiles(self.rank_error),
+            start,
+        )
+        return accumulator.update(values).sketch
+
+    def cumulative_average(self, parameter, values, start=0) -> np.ndarray:
+        """
+        Return cumulative averages extended with the appended values.
+        """
+
+        accumulator = self.accumulator(
+            parameter,
+            "cumulative_average",
+            CumulativeAverage,
+            start,
+        )
+        return accumulator.update(values).values
+
+    def exponential_moving_average(self, parameter, values, span,
+                                   start=0) -> np.ndarray:
+        """
+        Return exponential moving averages extended with appended values.
+        """
+
+        accumulator = self.accumulator(
+            parameter,
+            ("exponential_moving_average", span),
+            lambda: ExponentialMovingAverage(span),
+            start,
+        )
+        return accumulator.update(values).values
+
+    def savitzky_golay(self, parameter, values, window_size,
+                       start=0) -> np.ndarray:
+        """
+        Return Savitzky-Golay smoothed values extended with appended values.
+        """
+
+        accumulator = self.accumulator(
+            parameter,
+            ("savitzky_golay", window_size),
+            lambda: SavitzkyGolaySmoother(window_size),
+            start,
+        )
+        return accumulator.update(values).values
+
+    def change_points(self, parameter, values, start=0) -> list:
+        """
+        Return CUSUM change points extended with the appended values.
+        """
+
+        accumulator = self.accumulator(parameter, "change_points",
+                                       CusumDetector, start)
+        return accumulator.update(values).change_points
+
+    def outliers(self, parameter, values, start=0) -> np.ndarray:
+        """
+        Return the outlier mask extended with the appended values.
+        """
+
+        accumulator = self.accumulator(parameter, "outliers",
+                                       OutlierDetector, start)
+        return accumulator.update(values).mask
+
+    def moments(self, parameter, values, start=0) -> StreamingMoments:
+        """
+        Return running moments updated with the current parameter values.
+        """
+
+        accumulator = self.accumulator(parameter, "moments",
+                                       StreamingMoments, start)
+        return accumulator.update(values)
+
+    def histogram(self, parameter, values,
+                  bins=1024) -> StreamingHistogram:
+        """
+        Return an adaptive histogram updated with the current values.
+        """
+
+        accumulator = self.accumulator(
+            parameter,
+            ("histogram", bins),
+            lambda: StreamingHistogram(bins),
+        )
+        return accumulator.update(values)
+
+    def clear(self) -> None:
+        """
+        Drop all accumulators, for example after the loaded files changed.
+        """
+
+        self.__accumulators.clear()
+
+
+def _fingerprint_rows(rows):
+    """
+    Return the consumed row indices compared by ``SeriesAccumulator``.
+    """
+
+    return np.unique(np.linspace(0, rows - 1, FINGERPRINT_ROWS, dtype=int))
+
+
+def _reserve(buffer, rows, end):
+    """
+    Return ``buffer`` with room for ``end`` items, keeping its first ``rows``.
+
+    Capacity at least doubles when growing, so appends are amortized
+    ``O(1)`` per row.
+    """
+
+    if end <= buffer.size:
+        return buffer
+
+    grown = np.empty(max(end, 2 * buffer.size), dtype=buffer.dtype)
+    grown[:rows] = buffer[:rows]
+    return grown
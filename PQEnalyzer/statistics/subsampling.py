@@ -0,0 +1,72 @@
+"""
+Decorrelated subsampling of correlated simulation time series.
+
+Consecutive MD frames are strongly correlated, so most rows of a long series
+repeat information that is already in their neighbours. Keeping every
+``g``-th row, where ``g`` is the statistical inefficiency estimated from the
+FFT autocorrelation function, leaves approximately uncorrelated samples.
+Densities, guides and resampling statistics evaluated on that strided view
+cost a fraction of the full evaluation, and their spread reflects the number
+of independent samples instead of the number of rows.
+"""
+
+import math
+
+import numpy as np
+
+from .equilibration import statistical_inefficiency
+
+
+def subsampling_stride(values) -> int:
+    """
+    Return the row stride that leaves approximately uncorrelated samples.
+
+    The stride is the statistical inefficiency rounded up, at least one.
+
+    Examples
+    --------
+    >>> subsampling_stride([1.0, 2.0, 1.0, 2.0])
+    1
+    >>> subsampling_stride(np.repeat(np.arange(50.0) % 2, 10))
+    6
+    """
+
+    return max(1, math.ceil(statistical_inefficiency(values)))
+
+
+def decorrelated(values, stride=None) -> np.ndarray:
+    """
+    Return a strided view with approximately uncorrelated samples.
+
+    Parameters
+    ----------
+    values : array-like
+        Time-ordered series.
+    stride : int, optional
+        Row stride; estimated with ``subsampling_stride`` by default.
+
+    Returns
+    -------
+    np.ndarray
+        Every ``stride``-th value, starting with the first one. Array inputs
+        are not copied.
+
+    Raises
+    ------
+    ValueError
+        If ``stride`` is smaller than one.
+
+    Examples
+    --------
+    >>> decorrelated(np.arange(10.0), stride=4)
+    array([0., 4., 8.])
+    """
+
+    values = np.asarray(values)
+    if stride is None:
+        stride = subsampling_stride(values)
+
+    if stride < 1:
+        raise ValueError("Subsampling stride must be at least one")
+
+    return values[::stride]
@@ -0,0 +1,361 @@
+"""
+Simulation throughput monitoring from ``LOOPTIME``.
+
+PQ writes the wall-clock seconds of each step in the ``LOOPTIME`` column.
+Together with ``SIMULATION-TIME`` it gives the recent speed of a run in steps
+per second and nanoseconds per day, an estimate of the remaining wall time
+to a target simulation time, and a slowdown ratio: the mean loop time of the
+latest window of rows relative to the fastest window seen so far. Each
+monitored file keeps its own accumulator that consumes appended rows only,
+so many concurrently growing runs can be refreshed every second.
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..energy_access import parameter_values, simulation_time, time_unit
+from ..units import convertible, unit_conversion
+from .parallel import ordered_map
+
+
+LOOPTIME = "LOOPTIME"
+
+THROUGHPUT_WINDOW = 100
+# Rows of the recent window that speeds and slowdowns are measured on.
+
+SLOWDOWN_TOLERANCE = 0.25
+# Recent loop times this much slower than the fastest window raise an alert.
+
+SECONDS_PER_DAY = 86400.0
+
+
+@dataclass(frozen=True)
+class ThroughputStatus:
+    """
+    Recent speed of one monitored run.
+
+    Attributes
+    ----------
+    label : str
+        Name of the run.
+    rows : int
+        Number of rows consumed.
+    steps_per_second : float
+        Rows written per wall-clock second in the recent window.
+    time_per_day : float
+        Simulation time advanced per wall-clock day in the recent window.
+    time_unit : str
+        Simulation-time unit of the run.
+    slowdown : float
+        Mean recent loop time relative to the fastest window seen.
+    eta : float
+        Wall-clock seconds until the target simulation time is reached,
+        ``nan`` without a target.
+    alerts : tuple
+        Descriptions of the detected slowdowns.
+    """
+
+    label: str
+    rows: int
+    steps_per_second: float
+    time_per_day: float
+    time_unit: str
+    slowdown: float = 1.0
+    eta: float = float("nan")
+    alerts: tuple = ()
+
+    @property
+    def ns_per_day(self) -> float:
+        """
+        Return the simulated nanoseconds per day, ``nan`` for unknown units.
+        """
+
+        if not convertible(self.time_unit, "ns"):
+            return float("nan")
+
+        return self.time_per_day * unit_conversion(self.time_unit, "ns").scale
+
+    @property
+    def alarm(self) -> bool:
+        """
+        Return whether the run slowed down.
+        """
+
+        return bool(self.alerts)
+
+    def rate_label(self) -> str:
+        """
+        Return the simulation speed in ns/day or in the native time unit.
+        """
+
+        if math.isnan(self.ns_per_day):
+            return f"{self.time_per_day:.3g} {self.time_unit}/day"
+
+        return f"{self.ns_per_day:.3g} ns/day"
+
+    def describe(self) -> str:
+        """
+        Return a compact one-line description for status displays.
+        """
+
+        text = (f"{self.rate_label()}, {self.steps_per_second:.3g} steps/s, "
+                f"slowdown x{self.slowdown:.2f}")
+        if not math.isnan(self.eta):
+            text += f", ETA {format_duration(self.eta)}"
+        if self.alarm:
+            text += " - ALERT: " + "; ".join(self.alerts)
+
+        return text
+
+
+@dataclass(frozen=True)
+class ThroughputReport:
+    """
+    Throughput of all monitored runs after the latest update.
+
+    Attributes
+    ----------
+    runs : tuple
+        ``ThroughputStatus`` of every run in reader order.
+    """
+
+    runs: tuple
+
+    @property
+    def alarm(self) -> bool:
+        """
+        Return whether any run slowed down.
+        """
+
+        return any(run.alarm for run in self.runs)
+
+    def describe(self) -> str:
+        """
+        Return a one-line summary of all runs for status displays.
+
+        A single run is described in full. Several runs report their
+        combined speed, the latest ETA and the runs that slowed down.
+        """
+
+        if len(self.runs) == 1:
+            return f"Throughput {self.runs[0].describe()}"
+
+        total = ThroughputStatus(
+            label="total",
+            rows=sum(run.rows for run in self.runs),
+            steps_per_second=sum(run.steps_per_second for run in self.runs),
+            time_per_day=sum(run.time_per_day for run in self.runs),
+            time_unit=self.runs[0].time_unit,
+        )
+        text = (f"Throughput {len(self.runs)} runs {total.rate_label()}, "
+                f"{total.steps_per_second:.3g} steps/s")
+        etas = [run.eta for run in self.runs if not math.isnan(run.eta)]
+        if etas:
+            text += f", last ETA {format_duration(max(etas))}"
+        alerts = [f"{run.label} {alert}"
+                  for run in self.runs for alert in run.alerts]
+        if alerts:
+            text += " - ALERT: " + "; ".join(alerts)
+
+        return text
+
+
+class RunThroughput:
+    """
+    Incremental throughput accumulator of one growing run.
+
+    Only the last ``window + 1`` rows and the fastest window mean are kept.
+    Like the live accumulators, it starts over when the consumed rows were
+    rewritten.
+
+    Parameters
+    ----------
+    window : int, optional
+        Rows of the recent window.
+    """
+
+    def __init__(self, window=THROUGHPUT_WINDOW):
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget all consumed rows.
+        """
+
+        self.rows = 0
+        self.fastest = float("inf")
+        self.__times = np.empty(0)
+        self.__loop_times = np.empty(0)
+        self.__last_row = None
+
+    def update(self, time, loop_times) -> None:
+        """
+        Consume rows appended since the previous update.
+        """
+
+        time = np.asarray(time, dtype=float)
+        loop_times = np.asarray(loop_times, dtype=float)
+        if self.rows > 0 and (
+            time.size < self.rows
+            or not np.array_equal(self.__row(time, loop_times, self.rows),
+                                  self.__last_row, equal_nan=True)
+        ):
+            self.reset()
+
+        if time.size <= self.rows:
+            return
+
+        # windows that end in a new row; every kept loop time starts one
+        loop_times_tail = np.concatenate(
+            (self.__loop_times, loop_times[self.rows:]))
+        if loop_times_tail.size >= self.window:
+            sums = np.concatenate(([0.0], np.cumsum(loop_times_tail)))
+            means = (sums[self.window:] - sums[:-self.window]) / self.window
+            self.fastest = min(self.fastest, float(np.min(means)))
+
+        self.__loop_times = loop_times_tail[-self.window:]
+        self.__times = np.concatenate(
+            (self.__times, time[self.rows:]))[-(self.window + 1):]
+        self.rows = int(time.size)
+        self.__last_row = self.__row(time, loop_times, self.rows)
+
+    def status(self, label, unit, target_time=None,
+               tolerance=SLOWDOWN_TOLERANCE) -> ThroughputStatus:
+        """
+        Return the recent speed, slowdown and ETA of the consumed rows.
+        """
+
+        steps = min(self.__loop_times.size, self.__times.size - 1)
+        wall_time = 0.0
+        if steps > 0:
+            wall_time = float(np.sum(self.__loop_times[-steps:]))
+        if not wall_time > 0:
+            return ThroughputStatus(label, self.rows, float("nan"),
+                                    float("nan"), unit)
+
+        advanced = float(self.__times[-1] - self.__times[-steps - 1])
+        slowdown = 1.0
+        if math.isfinite(self.fastest) and self.fastest > 0:
+            slowdown = wall_time / steps / self.fastest
+        eta = float("nan")
+        if target_time is not None and advanced > 0:
+            remaining = max(target_time - float(self.__times[-1]), 0.0)
+            eta = remaining * wall_time / advanced
+
+        alerts = ()
+        if slowdown > 1.0 + tolerance:
+            alerts = (f"slowdown x{slowdown:.2f}",)
+
+        return ThroughputStatus(
+            label=label,
+            rows=self.rows,
+            steps_per_second=steps / wall_time,
+            time_per_day=advanced / wall_time * SECONDS_PER_DAY,
+            time_unit=unit,
+            slowdown=slowdown,
+            eta=eta,
+            alerts=alerts,
+        )
+
+    @staticmethod
+    def __row(time, loop_times, rows):
+        """
+        Return the last consumed time and loop time.
+        """
+
+        return np.array([time[rows - 1], loop_times[rows - 1]])
+
+
+class ThroughputMonitor:
+    """
+    Incremental throughput monitor of several concurrently growing runs.
+
+    Every input file is treated as one run with its own ``RunThroughput``
+    accumulator. With an ``executor``, the runs are updated concurrently.
+
+    Parameters
+    ----------
+    target_time : float, optional
+        Simulation time that ETAs are estimated for.
+    window : int, optional
+        Rows of the recent window.
+    tolerance : float, optional
+        Relative slowdown that raises an alert.
+    executor : concurrent.futures.Executor, optional
+        Thread pool that updates the runs concurrently.
+
+    Attributes
+    ----------
+    status : ThroughputReport or None
+        Result of the latest update.
+    """
+
+    def __init__(self, target_time=None, window=THROUGHPUT_WINDOW,
+                 tolerance=SLOWDOWN_TOLERANCE, executor=None):
+        self.target_time = target_time
+        self.window = window
+        self.tolerance = tolerance
+        self.executor = executor
+        self.runs = []
+        self.status = None
+
+    @staticmethod
+    def supports(energies) -> bool:
+        """
+        Return whether the energies contain loop times to monitor.
+        """
+
+        return bool(energies) and LOOPTIME in energies[0].info
+
+    def update(self, energies, labels=None) -> ThroughputReport:
+        """
+        Consume appended rows of all runs and return the updated report.
+        """
+
+        if labels is None:
+            labels = [f"run {index}" for index in range(1, len(energies) + 1)]
+
+        # a changed file list restarts the runs that are no longer aligned
+        self.runs = self.runs[:len(energies)]
+        self.runs.extend(RunThroughput(self.window)
+                         for _ in range(len(energies) - len(self.runs)))
+
+        def update_run(item):
+            run, energy, label = item
+            run.update(simulation_time(energy),
+                       parameter_values(energy, LOOPTIME))
+            return run.status(label, time_unit(energy), self.target_time,
+                              self.tolerance)
+
+        self.status = ThroughputReport(tuple(ordered_map(
+            update_run,
+            list(zip(self.runs, energies, labels)),
+            self.executor,
+        )))
+        return self.status
+
+
+def format_duration(seconds) -> str:
+    """
+    Return a compact duration with its two largest units.
+
+    Examples
+    --------
+    >>> format_duration(11532)
+    '3h 12m'
+    >>> format_duration(42.4)
+    '42s'
+    """
+
+    seconds = int(round(seconds))
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    parts = [(days, "d"), (hours, "h"), (minutes, "m"), (seconds, "s")]
+    while len(parts) > 1 and parts[0][0] == 0:
+        parts.pop(0)
+
+    return " ".join(f"{value}{unit}" for value, unit in parts[:2])
@@ -0,0 +1,262 @@
+"""
+Unit registry and vectorized unit conversion of energy columns.
+
+Every known unit belongs to a dimension and stores the affine map
+``base = value * scale + offset`` to the base unit of that dimension, the PQ
+output unit where there is one. A conversion between two units of the same
+dimension is therefore one precomputed scale and offset, and converting a
+whole column is a single multiply-add over the array, done in place when the
+column is a writable float array. Conversions are cached per unit pair.
+
+``convert_energy`` applies conversions to the columns of an energy object and
+updates its ``units`` and PQAnalysis ``*_unit`` attributes, so plots and
+statistics see the converted values and units without further changes.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .energy_access import PARAMETER_ATTRIBUTES, parameter_values
+
+
+@dataclass(frozen=True)
+class Unit:
+    """
+    Known unit and its affine map to the base unit of its dimension.
+
+    Attributes
+    ----------
+    dimension : str
+        Physical dimension of the unit.
+    scale : float
+        Base units per unit.
+    offset : float
+        Base value of the unit's zero.
+    """
+
+    dimension: str
+    scale: float
+    offset: float = 0.0
+
+
+KCAL_PER_KJ = 1 / 4.184
+
+UNITS = {
+    # energy per particle, in kcal/mol
+    "kcal/mol": Unit("energy", 1.0),
+    "kJ/mol": Unit("energy", KCAL_PER_KJ),
+    "J/mol": Unit("energy", KCAL_PER_KJ / 1000),
+    "eV": Unit("energy", 23.060547830619026),
+    "Hartree": Unit("energy", 627.5094740631),
+    "Eh": Unit("energy", 627.5094740631),
+    # temperature, in K
+    "K": Unit("temperature", 1.0),
+    "C": Unit("temperature", 1.0, 273.15),
+    "°C": Unit("temperature", 1.0, 273.15),
+    # pressure, in bar
+    "bar": Unit("pressure", 1.0),
+    "mbar": Unit("pressure", 1e-3),
+    "kbar": Unit("pressure", 1e3),
+    "atm": Unit("pressure", 1.01325),
+    "Pa": Unit("pressure", 1e-5),
+    "kPa": Unit("pressure", 1e-2),
+    "MPa": Unit("pressure", 10.0),
+    "GPa": Unit("pressure", 1e4),
+    # time, in ps
+    "fs": Unit("time", 1e-3),
+    "ps": Unit("time", 1.0),
+    "ns": Unit("time", 1e3),
+    "us": Unit("time", 1e6),
+    "µs": Unit("time", 1e6),
+    "ms": Unit("time", 1e9),
+    "s": Unit("time", 1e12),
+    "min": Unit("time", 60e12),
+    "h": Unit("time", 3600e12),
+    # length, in Angstrom
+    "A": Unit("length", 1.0),
+    "Å": Unit("length", 1.0),
+    "pm": Unit("length", 1e-2),
+    "nm": Unit("length", 10.0),
+    "bohr": Unit("length", 0.529177210903),
+    # volume, in cubic Angstrom
+    "A^3": Unit("volume", 1.0),
+    "Å^3": Unit("volume", 1.0),
+    "A³": Unit("volume", 1.0),
+    "Å³": Unit("volume", 1.0),
+    "nm^3": Unit("volume", 1e3),
+    "nm³": Unit("volume", 1e3),
+    "cm^3": Unit("volume", 1e24),
+    # density, in g/cm^3
+    "g/cm^3": Unit("density", 1.0),
+    "g/cm³": Unit("density", 1.0),
+    "g/mL": Unit("density", 1.0),
+    "g/L": Unit("density", 1e-3),
+    "kg/m^3": Unit("density", 1e-3),
+    "kg/m³": Unit("density", 1e-3),
+    # angle, in degrees
+    "deg": Unit("angle", 1.0),
+    "°": Unit("angle", 1.0),
+    "rad": Unit("angle", 180 / math.pi),
+}
+# Known units keyed by their spelling in energy info files and on the CLI.
+
+
+@dataclass(frozen=True)
+class UnitConversion:
+    """
+    Affine conversion ``target = source * scale + offset``.
+
+    Attributes
+    ----------
+    source : str
+        Unit of the input values.
+    target : str
+        Unit of the converted values.
+    scale : float
+        Multiplier of the input values.
+    offset : float
+        Shift added after scaling.
+    """
+
+    source: str
+    target: str
+    scale: float = 1.0
+    offset: float = 0.0
+
+    @property
+    def identity(self) -> bool:
+        """
+        Return whether the conversion leaves values unchanged.
+        """
+
+        return self.scale == 1.0 and self.offset == 0.0
+
+    def apply(self, values, out=None) -> np.ndarray:
+        """
+        Return the converted values, written into ``out`` when given.
+
+        Parameters
+        ----------
+        values : array-like
+            Values in the source unit.
+        out : np.ndarray, optional
+            Float array receiving the result; may be ``values`` itself to
+            convert in place.
+
+        Examples
+        --------
+        >>> unit_conversion("kJ/mol", "kcal/mol").apply([4.184, 8.368])
+        array([1., 2.])
+        """
+
+        values = np.asarray(values, dtype=float)
+        if out is None:
+            out = np.empty_like(values)
+        np.multiply(values, self.scale, out=out)
+        if self.offset:
+            np.add(out, self.offset, out=out)
+
+        return out
+
+
+@lru_cache(maxsize=None)
+def unit_conversion(source: str, target: str) -> UnitConversion:
+    """
+    Return the cached conversion between two units of one dimension.
+
+    Identical spellings always convert, even when the unit is unknown.
+
+    Raises
+    ------
+    ValueError
+        If either unit is unknown or the dimensions differ.
+
+    Examples
+    --------
+    >>> conversion = unit_conversion("bar", "GPa")
+    >>> conversion.scale, conversion.offset
+    (0.0001, 0.0)
+    >>> unit_conversion("C", "K").offset
+    273.15
+    """
+
+    if source == target:
+        return UnitConversion(source, target)
+
+    for unit in (source, target):
+        if unit not in UNITS:
+            raise ValueError(f"Unknown unit {unit!r}")
+
+    source_unit, target_unit = UNITS[source], UNITS[target]
+    if source_unit.dimension != target_unit.dimension:
+        raise ValueError(
+            f"Cannot convert {source_unit.dimension} unit {source!r} to "
+            f"{target_unit.dimension} unit {target!r}")
+
+    return UnitConversion(
+        source,
+        target,
+        scale=source_unit.scale / target_unit.scale,
+        offset=(source_unit.offset - target_unit.offset) / target_unit.scale,
+    )
+
+
+def convertible(source: str, target: str) -> bool:
+    """
+    Return whether values in ``source`` can be converted to ``target``.
+    """
+
+    try:
+        unit_conversion(source, target)
+    except ValueError:
+        return False
+
+    return True
+
+
+def convert_energy(energy, targets):
+    """
+    Convert columns of an energy object in place and return it.
+
+    Parameters
+    ----------
+    energy : object
+        Energy object with ``info``, ``units`` and ``data``.
+    targets : dict
+        Target units keyed by column label; columns already in their target
+        unit are left untouched.
+
+    Raises
+    ------
+    ValueError
+        If a column unit cannot be converted to its target.
+    """
+
+    for label, target in targets.items():
+        conversion = unit_conversion(energy.units[label], target)
+        if not conversion.identity:
+            values = parameter_values(energy, label)
+            if values.dtype.kind == "f" and values.flags.writeable:
+                conversion.apply(values, out=values)
+            else:
+                energy.data[energy.info[label]] = conversion.apply(values)
+        _set_unit(energy, label, target)
+
+    return energy
+
+
+def _set_unit(energy, label, unit):
+    """
+    Record a column unit in ``units`` and the PQAnalysis unit attributes.
+    """
+
+    energy.units[label] = unit
+    attribute = PARAMETER_ATTRIBUTES.get(label)
+    if attribute is not None and hasattr(energy, f"{attribute}_unit"):
+        setattr(energy, f"{attribute}_unit", unit)
+        if hasattr(energy, f"{attribute}_with_unit"):
+            setattr(energy, f"{attribute}_with_unit",
+                    (getattr(energy, attribute), unit))
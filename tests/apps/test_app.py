@@ -277,6 +277,12 @@ def test_plot_controls_view_exposes_dashboard_button(monkeypatch):
 
     assert app.button_dashboard is view.dashboard_button
     assert app.button_dashboard.kwargs["text"] == "Live Monitor"
+    assert app.button_correlation is view.correlation_button
+    assert app.button_correlation.kwargs["text"] == "Correlations"
+    assert app.button_spectrum is view.spectrum_button
+    assert app.button_spectrum.kwargs["text"] == "Spectrum"
+    assert app.button_fluctuation is view.fluctuation_button
+    assert app.button_fluctuation.kwargs["text"] == "Fluctuations"
     assert app.check_auto_refresh is view.auto_refresh_checkbox
     assert app.check_auto_refresh.kwargs["text"] == "Auto-Refresh"
     assert app.auto_refresh.value is True
@@ -349,6 +355,37 @@ def test_difference_checkbox_enables_no_data(monkeypatch):
     assert app.plot_main_data.value is True
 
 
+def test_ensemble_checkbox_enables_no_data(monkeypatch):
+    class FakeBoolean:
+
+        def __init__(self):
+            self.value = False
+
+        def set(self, value):
+            self.value = value
+
+    app = SimpleNamespace(
+        register=lambda callback: callback,
+        validate_number=lambda value: True,
+        toggle_entry_state=lambda event, entry, default="": None,
+        plot_main_data=FakeBoolean(),
+    )
+
+    monkeypatch.setattr(app_layout.ctk, "CTkFrame", FakeWidget)
+    monkeypatch.setattr(app_layout.ctk, "CTkLabel", FakeWidget)
+    monkeypatch.setattr(app_layout.ctk, "CTkCheckBox", FakeWidget)
+    monkeypatch.setattr(app_layout.ctk, "CTkEntry", FakeWidget)
+    monkeypatch.setattr(app_layout.ctk, "CTkFont",
+                        lambda *args, **kwargs: ("font", args, kwargs))
+
+    view = app_layout.StatisticsControlsView(app)
+    view.ensemble.get = lambda: True
+
+    view.ensemble.kwargs["command"]()
+
+    assert app.plot_main_data.value is True
+
+
 def test_statistics_control_callback_runs_after_difference_default(
         monkeypatch):
     calls = []
@@ -384,6 +421,36 @@ def test_statistics_control_callback_runs_after_difference_default(
     assert calls == ["run"]
 
 
+def test_window_entry_stays_enabled_while_a_windowed_feature_is_on(
+        monkeypatch):
+    toggles = []
+    app = SimpleNamespace(
+        register=lambda callback: callback,
+        validate_number=lambda value: True,
+        toggle_entry_state=lambda event, entry, default="": toggles.append(
+            event.get()),
+    )
+
+    monkeypatch.setattr(app_layout.ctk, "CTkFrame", FakeWidget)
+    monkeypatch.setattr(app_layout.ctk, "CTkLabel", FakeWidget)
+    monkeypatch.setattr(app_layout.ctk, "CTkCheckBox", FakeWidget)
+    monkeypatch.setattr(app_layout.ctk, "CTkEntry", FakeWidget)
+    monkeypatch.setattr(app_layout.ctk, "CTkFont",
+                        lambda *args, **kwargs: ("font", args, kwargs))
+
+    view = app_layout.StatisticsControlsView(app)
+    view.running_average.value = True
+    view.running_average.kwargs["command"]()
+    view.exponential_moving_average.value = True
+    view.exponential_moving_average.kwargs["command"]()
+    view.running_average.value = False
+    view.running_average.kwargs["command"]()
+    view.exponential_moving_average.value = False
+    view.exponential_moving_average.kwargs["command"]()
+
+    assert toggles == [True, False]
+
+
 def test_plot_button_runs_simple_time_plot_with_auto_refresh(monkeypatch):
     app = make_app(auto_refresh=True)
     monkeypatch.setattr(app_module, "PlotTime", DummyPlot)
@@ -415,9 +482,41 @@ def test_plot_button_runs_dashboard(monkeypatch):
     assert app.selected_plot is None
 
 
+def test_plot_button_runs_correlation_heatmap(monkeypatch):
+    app = make_app(auto_refresh=False)
+    monkeypatch.setattr(app_module, "PlotCorrelation", DummyPlot)
+
+    app_module.App._App__plot_button_event(app, 3)
+
+    assert app.list_of_plots == DummyPlot.instances
+    assert DummyPlot.instances[0].calls == [("simple", None)]
+    assert app.selected_plot is None
+
+
+def test_plot_button_runs_spectrum_for_selected_parameter(monkeypatch):
+    app = make_app(auto_refresh=False)
+    monkeypatch.setattr(app_module, "PlotSpectrum", DummyPlot)
+
+    app_module.App._App__plot_button_event(app, 4)
+
+    assert app.list_of_plots == DummyPlot.instances
+    assert DummyPlot.instances[0].calls == [("simple", "TEMPERATURE")]
+
+
+def test_plot_button_runs_fluctuation_convergence(monkeypatch):
+    app = make_app(auto_refresh=False)
+    monkeypatch.setattr(app_module, "PlotFluctuation", DummyPlot)
+
+    app_module.App._App__plot_button_event(app, 5)
+
+    assert app.list_of_plots == DummyPlot.instances
+    assert DummyPlot.instances[0].calls == [("simple", None)]
+    assert app.selected_plot is None
+
+
 def test_plot_button_rejects_unknown_event():
     with pytest.raises(ValueError, match="Unknown plot event"):
-        app_module.App._App__plot_button_event(make_app(), 3)
+        app_module.App._App__plot_button_event(make_app(), 6)
 
 
 def test_change_appearance_mode_updates_matplotlib_and_open_plots(monkeypatch):
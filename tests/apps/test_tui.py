@@ -1,24 +1,34 @@
 import asyncio
+from types import SimpleNamespace
 
 import numpy as np
+import pytest
 from textual.widgets import DataTable, Static
 
 from PQEnalyzer.apps import tui as tui_module
-from PQEnalyzer.apps.tui import (
-    TuiApp,
-    feature_help_text,
+from PQEnalyzer.apps import tui_summary
+from PQEnalyzer.apps.tui import TuiApp, correlation_rows, feature_help_text
+from PQEnalyzer.apps.tui_summary import (
     format_value,
     sparkline_text,
     summarize_parameter,
+    summarize_parameters,
 )
 from PQEnalyzer.plots.features import PLOT_FEATURES
+from PQEnalyzer.readers import DerivedReader
+from PQEnalyzer.statistics import (
+    ConservationLimits,
+    LiveStatistics,
+    statistics_executor,
+    summarize_columns,
+)
 
 
 class FakeEnergy:
 
     def __init__(self, values, time=None):
         if time is None:
-            time = [1, 2, 3]
+            time = np.arange(1, len(values) + 1)
         self.info = {"SIMULATION-TIME": "TIME", "PARAMETER": "PARAMETER"}
         self.units = {"PARAMETER": "unit"}
         self.data = {"PARAMETER": np.asarray(values)}
@@ -74,6 +84,98 @@ def test_summarize_parameter_keeps_actual_statistics():
     assert summary.maximum == 8.0
 
 
+def test_summarize_parameter_can_discard_equilibration():
+    values = np.r_[np.linspace(40.0, 0.0, 200), np.zeros(1800)]
+    values += np.random.default_rng(0).normal(size=values.size)
+
+    summary = summarize_parameter(
+        [FakeEnergy(values, time=np.arange(values.size))],
+        "PARAMETER",
+        discard_equilibration=True,
+    )
+
+    assert summary.rows == 2000
+    assert 100 <= summary.equilibration_start <= 400
+    assert abs(summary.mean) < 0.5
+    assert summary.values.size == 2000
+
+
+def test_summarize_parameter_reports_drift_with_standard_error():
+    time = np.arange(1000, dtype=float)
+    values = 5.0 + 0.02 * time + np.random.default_rng(0).normal(
+        scale=0.1, size=time.size)
+
+    summary = summarize_parameter([FakeEnergy(values, time=time)],
+                                  "PARAMETER")
+
+    assert abs(summary.drift - 0.02) < 3 * summary.drift_stderr
+    assert 0 < summary.drift_stderr < 1e-3
+
+
+def test_summarize_parameters_batches_all_columns():
+    summaries = summarize_parameters(
+        [FakeMultiParameterEnergy(), FakeMultiParameterEnergy()],
+        ["PARAMETER", "PRESSURE"],
+    )
+
+    assert list(summaries) == ["PARAMETER", "PRESSURE"]
+    assert summaries["PRESSURE"].unit == "bar"
+    assert summaries["PRESSURE"].rows == 6
+    assert summaries["PRESSURE"].median == 20.0
+    assert summaries["PARAMETER"].maximum == 5.0
+    np.testing.assert_array_equal(summaries["PARAMETER"].values,
+                                  [1.0, 2.0, 5.0, 1.0, 2.0, 5.0])
+
+
+def test_summarize_parameters_take_live_medians_from_sketch(monkeypatch):
+    live = LiveStatistics()
+    monkeypatch.setattr(tui_summary, "summarize_columns",
+                        summarize_columns_without_median)
+
+    summaries = summarize_parameters(
+        [FakeMultiParameterEnergy()], ["PARAMETER", "PRESSURE"], live=live)
+
+    assert summaries["PARAMETER"].median == 2.0
+    assert summaries["PRESSURE"].median == 20.0
+
+
+def test_summarize_parameters_exclude_outliers_from_live_medians():
+    values = np.random.default_rng(0).normal(size=200)
+    values[10:200:20] = 1000.0
+
+    summary = summarize_parameter([FakeEnergy(values)], "PARAMETER",
+                                  live=LiveStatistics(),
+                                  exclude_outliers=True)
+
+    assert summary.outliers == 10
+    assert summary.median == np.median(values[values < 1000.0])
+
+
+def summarize_columns_without_median(*args, **kwargs):
+    assert kwargs["median"] is False
+    return summarize_columns(*args, **kwargs)
+
+
+def test_summarize_parameters_on_thread_pool_keeps_parameter_order():
+    energies = [FakeMultiParameterEnergy(), FakeMultiParameterEnergy()]
+    executor = statistics_executor(2)
+
+    try:
+        concurrent = summarize_parameters(energies, ["PRESSURE", "PARAMETER"],
+                                          discard_equilibration=True,
+                                          executor=executor)
+    finally:
+        executor.shutdown()
+    sequential = summarize_parameters(energies, ["PRESSURE", "PARAMETER"],
+                                      discard_equilibration=True)
+
+    assert list(concurrent) == ["PRESSURE", "PARAMETER"]
+    for parameter, summary in sequential.items():
+        assert concurrent[parameter].mean == summary.mean
+        assert concurrent[parameter].median == summary.median
+        assert concurrent[parameter].drift == summary.drift
+
+
 def test_sparkline_text_samples_series_without_changing_length_limit():
     trend = sparkline_text(np.arange(100), width=10)
 
@@ -133,6 +235,236 @@ def test_tui_app_renders_parameter_dashboard():
     asyncio.run(run_scenario())
 
 
+def test_tui_detail_reports_decorrelated_subsample():
+    app = TuiApp(FakeReader(), watch=False)
+
+    async def run_scenario():
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            await pilot.press("l")
+            await pilot.pause()
+
+            detail = str(app.query_one("#detail-stats", Static).content)
+            assert "Decorrelated: stride 1, 3 samples" in detail
+            assert "decorrelated" in app.statistics_label
+
+    asyncio.run(run_scenario())
+
+
+def test_tui_detail_lists_change_points():
+    reader = FakeReader()
+    values = np.r_[np.zeros(40), np.ones(60)] + np.tile([0.05, -0.05], 50)
+    reader.energies = [FakeEnergy(values)]
+    app = TuiApp(reader, watch=False)
+
+    async def run_scenario():
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            await pilot.press("z")
+            await pilot.pause()
+
+            detail = str(app.query_one("#detail-stats", Static).content)
+            assert "Changes: rows 40" in detail
+            assert "changes" in app.statistics_label
+
+    asyncio.run(run_scenario())
+
+
+def test_tui_detail_counts_and_excludes_outliers():
+    reader = FakeReader()
+    values = np.tile([0.05, -0.05, 0.1, -0.1], 50)
+    values[[30, 150]] = 40.0
+    reader.energies = [FakeEnergy(values)]
+    app = TuiApp(reader, watch=False)
+
+    async def run_scenario():
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            assert app.summaries["PARAMETER"].maximum == 40.0
+
+            await pilot.press("u")
+            await pilot.pause()
+
+            summary = app.summaries["PARAMETER"]
+            detail = str(app.query_one("#detail-stats", Static).content)
+            assert "Outliers: 2" in detail
+            assert summary.outliers == 2
+            assert summary.maximum == 0.1
+            assert "outliers" in app.statistics_label
+
+    asyncio.run(run_scenario())
+
+
+class FakeNveReader:
+
+    filenames = ["nve.en"]
+
+    def __init__(self):
+        time = np.arange(1, 101) * 0.5
+        self.energies = [SimpleNamespace(
+            info={"SIMULATION-TIME": "TIME", "E(TOT)": "E(TOT)",
+                  "E(KIN)": "E(KIN)"},
+            units={"SIMULATION-TIME": "ps", "E(TOT)": "kcal/mol",
+                   "E(KIN)": "kcal/mol"},
+            data={"E(TOT)": -500 + 0.1 * time,
+                  "E(KIN)": 80 + np.sin(time)},
+            simulation_time=time,
+        )]
+
+    def read_last(self):
+        return None
+
+
+def test_tui_status_bar_raises_conservation_alert():
+    app = TuiApp(FakeNveReader(), watch=False,
+                 conservation_limits=ConservationLimits(max_drift=0.05))
+
+    async def run_scenario():
+        async with app.run_test(size=(140, 30)) as pilot:
+            await pilot.pause()
+
+            status = str(app.query_one("#status", Static).content)
+            assert "E(TOT) drift 0.1 kcal/mol/ps" in status
+            assert "ALERT: |drift| > 0.05" in status
+
+            detail = str(app.query_one("#detail-stats", Static).content)
+            assert "Drift: 0.1 ± " in detail
+            assert " kcal/mol/ps" in detail
+
+    asyncio.run(run_scenario())
+
+
+class FakeLoopTimeReader:
+    filenames = ["run-a/md.en", "run-b/md.en"]
+
+    def __init__(self):
+        time = np.arange(1, 201) * 0.5
+        loop_times = np.full(200, 0.25)
+        self.energies = [
+            SimpleNamespace(
+                info={"SIMULATION-TIME": "TIME", "LOOPTIME": "LOOPTIME"},
+                units={"SIMULATION-TIME": "ps", "LOOPTIME": "s"},
+                data={"LOOPTIME": loop_times * scale},
+                simulation_time=time,
+            )
+            for scale in (1.0, np.r_[np.ones(100), np.full(100, 2.0)])
+        ]
+
+    def read_last(self):
+        return None
+
+
+def test_tui_status_bar_shows_throughput_of_all_runs():
+    app = TuiApp(FakeLoopTimeReader(), watch=False, target_time=150.0)
+
+    async def run_scenario():
+        async with app.run_test(size=(140, 30)) as pilot:
+            await pilot.pause()
+
+            status = str(app.query_one("#status", Static).content)
+            assert "Throughput 2 runs" in status
+            assert "last ETA 50s" in status
+            assert "ALERT: run-b/md.en slowdown x2.00" in status
+
+    asyncio.run(run_scenario())
+
+
+class FakeNvtReader:
+    filenames = ["nvt.en"]
+
+    def __init__(self):
+        rng = np.random.default_rng(0)
+        self.energies = [SimpleNamespace(
+            info={"SIMULATION-TIME": "TIME", "TEMPERATURE": "TEMPERATURE",
+                  "E(TOT)": "E(TOT)"},
+            units={"SIMULATION-TIME": "ps", "TEMPERATURE": "K",
+                   "E(TOT)": "kcal/mol"},
+            data={"TEMPERATURE": np.full(400, 300.0),
+                  "E(TOT)": -500 + 3 * rng.normal(size=400)},
+            simulation_time=np.arange(400) * 0.5,
+        )]
+
+    def read_last(self):
+        return None
+
+
+def test_tui_detail_reports_heat_capacity_of_energy_row():
+    app = TuiApp(FakeNvtReader(), watch=False)
+
+    async def run_scenario():
+        async with app.run_test(size=(140, 40)) as pilot:
+            await pilot.pause()
+
+            detail = str(app.query_one("#detail-stats", Static).content)
+            assert "C_V" not in detail
+
+            await pilot.press("j")
+            await pilot.pause()
+
+            detail = str(app.query_one("#detail-stats", Static).content)
+            estimate = app.fluctuation_monitor.status["E(TOT)"]
+            assert estimate.describe() in detail
+            assert estimate.value == pytest.approx(
+                9 / (0.0019872043 * 300.0**2), rel=0.1)
+
+    asyncio.run(run_scenario())
+
+
+def test_tui_table_lists_derived_columns_like_native_ones():
+    reader = DerivedReader(FakeNvtReader(),
+                           ["E_PER_T[kcal/mol/K]=E(TOT)/TEMPERATURE"])
+    app = TuiApp(reader, watch=False)
+
+    async def run_scenario():
+        async with app.run_test(size=(140, 40)) as pilot:
+            await pilot.pause()
+
+            table = app.query_one("#parameters", DataTable)
+            assert table.row_count == 3
+            assert "E_PER_T" in str(table.get_row_at(2)[0])
+
+            await pilot.press("j", "j")
+            await pilot.pause()
+
+            detail = str(app.query_one("#detail-stats", Static).content)
+            latest = reader.energies[0].data["E_PER_T"][-1]
+            assert f"Latest: {latest:.5g}" in detail
+
+    asyncio.run(run_scenario())
+
+
+def test_correlation_rows_number_columns_and_mark_undefined_values():
+    rows = correlation_rows(np.array([[1.0, -0.5], [-0.5, np.nan]]),
+                            ["PARAMETER", "PRESSURE"])
+
+    assert rows[0][0] == "1 PARAMETER"
+    assert [str(cell) for cell in rows[0][1:]] == ["+1.00", "-0.50"]
+    assert [str(cell) for cell in rows[1][1:]] == ["-0.50", "n/a"]
+
+
+def test_tui_app_shows_correlation_table():
+    app = TuiApp(FakeMultiParameterReader(), watch=False)
+
+    async def run_scenario():
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            await pilot.press("o")
+            await pilot.pause()
+
+            table = app.query_one("#correlations", DataTable)
+            title = app.query_one("#correlation-title", Static)
+            assert app.active_view == "correlation"
+            assert "Pearson r over 3 rows" in str(title.content)
+            assert table.row_count == 2
+            assert str(table.get_cell_at((0, 2))) == "+1.00"
+
+            await pilot.press("escape")
+            await pilot.pause()
+            assert app.active_view == "dashboard"
+
+    asyncio.run(run_scenario())
+
+
 def test_tui_app_switches_between_dashboard_and_chart():
     app = TuiApp(FakeReader(), watch=False)
 
@@ -177,7 +509,7 @@ def test_tui_app_switches_between_dashboard_and_chart():
             detail = app.query_one("#detail-stats", Static)
             assert app.chart_options.difference is True
             assert app.chart_options.plot_main is True
-            assert "exactly two input files" in str(chart.content)
+            assert "at least two input files" in str(chart.content)
             assert "Chart stats: difference" in str(detail.content)
 
             await pilot.press("escape")
@@ -248,7 +580,8 @@ def test_tui_chart_first_render_waits_for_full_layout(monkeypatch):
     app = TuiApp(FakeReader(), watch=False)
     chart_sizes = []
 
-    def fake_build_terminal_chart(reader, parameter, width, height, options):
+    def fake_build_terminal_chart(reader, parameter, width, height, options,
+                                  live=None, cache=None, executor=None):
         chart_sizes.append((width, height))
         return "PARAMETER / unit\nSimulation Time\nMean\nMedian"
 
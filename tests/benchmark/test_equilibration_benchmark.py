@@ -0,0 +1,26 @@
+"""
+Benchmark the equilibration detection.
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark",
+                    reason="pytest-benchmark is required for benchmark tests")
+
+from PQEnalyzer.statistics import detect_equilibration
+
+
+@pytest.mark.benchmark(group="Equilibration")
+def test_detect_equilibration_benchmark(benchmark):
+    """
+    Benchmark equilibration detection on a million-row series.
+    """
+
+    rng = np.random.default_rng(4)
+    values = rng.normal(size=1_000_000)
+    values[:100_000] += np.linspace(30, 0, 100_000)
+
+    result = benchmark.pedantic(detect_equilibration, args=(values,),
+                                iterations=1, rounds=5)
+
+    assert 50_000 <= result.start <= 150_000
@@ -1,14 +1,24 @@
+from unittest.mock import patch
+
 import numpy as np
+import pytest
 
 from PQEnalyzer.plots.features import (
     PLOT_FEATURES,
     PLOT_FEATURES_BY_KEY,
+    TIME_SERIES_OVERLAYS,
     PlotFeature,
     enabled_feature_labels,
     iter_histogram_guides,
     iter_time_series_overlays,
 )
 from PQEnalyzer.plots.options import PlotOptions
+from PQEnalyzer.statistics import (
+    LiveStatistics,
+    StatisticsCache,
+    statistics_executor,
+    subsampling_stride,
+)
 
 
 class FakeEnergy:
@@ -29,12 +39,25 @@ def test_registry_defines_shared_gui_and_tui_features():
     assert feature_keys == [
         "mean",
         "median",
+        "discard_equilibration",
+        "decorrelate",
+        "outliers",
+        "confidence_interval",
         "cummulative_average",
         "self_correlation_mean",
         "difference",
+        "ensemble",
         "running_average",
+        "exponential_moving_average",
+        "savitzky_golay",
+        "rolling_std",
+        "rolling_min_max",
+        "rolling_percentile",
+        "trend",
+        "change_points",
     ]
-    assert shortcuts == ["m", "n", "c", "s", "x", "a"]
+    assert shortcuts == ["m", "n", "i", "l", "u", "f", "c", "s", "x", "y",
+                         "a", "e", "g", "v", "h", "p", "t", "z"]
 
 
 def test_plot_options_can_read_registry_feature_defaults():
@@ -94,6 +117,45 @@ def test_difference_feature_takes_precedence_over_other_overlays():
     assert enabled_feature_labels(options) == ["difference"]
 
 
+def test_difference_feature_compares_every_run_with_reference():
+    options = PlotOptions.with_enabled("difference")
+    options.difference_reference = 0
+    energies = [
+        FakeEnergy([5, 6, 7]),
+        FakeEnergy([1, 2, 4]),
+        FakeEnergy([0, 0, 0]),
+    ]
+
+    overlays = list(iter_time_series_overlays(energies, "PARAMETER",
+                                              options))
+
+    assert [overlay.label for overlay in overlays] == [
+        "Difference (2 - 1)",
+        "Difference (3 - 1)",
+    ]
+    assert np.all(overlays[0].values == [-4, -4, -3])
+    assert np.all(overlays[1].values == [-5, -6, -7])
+
+
+def test_ensemble_band_replaces_other_overlays():
+    energies = [FakeEnergy([1, 2, 3, 4]), FakeEnergy([3, 4, 5]),
+                FakeEnergy([2, 3, 4, 9])]
+    options = PlotOptions.with_enabled("ensemble", "mean",
+                                       "running_average")
+
+    overlays = list(iter_time_series_overlays(energies, "PARAMETER",
+                                              options))
+
+    assert len(overlays) == 1
+    band = overlays[0]
+    assert band.band
+    assert band.label == "Ensemble Band mean ± std (3 replicas)"
+    assert np.all(band.time == [1, 2, 3])
+    assert np.all(band.values == [2, 3, 4])
+    assert np.allclose(band.upper - band.values, 1.0)
+    assert enabled_feature_labels(options) == ["ensemble"]
+
+
 def test_histogram_guides_use_shared_feature_definitions():
     options = PlotOptions.with_enabled("mean", "median")
 
@@ -105,3 +167,309 @@ def test_histogram_guides_use_shared_feature_definitions():
 
     assert [guide.label for guide in guides] == ["Mean", "Median"]
     assert [guide.value for guide in guides] == [2.0, 2.0]
+
+
+def test_streaming_histogram_guides_use_live_accumulators():
+    options = PlotOptions.with_enabled("mean", "median")
+    options.kde_method = "streaming"
+    live = LiveStatistics()
+
+    for values in ([1, 2, 3], [1, 2, 3, 4, 5, 6, 7]):
+        mean, median = iter_histogram_guides([FakeEnergy(values)],
+                                             "PARAMETER", options, live=live)
+
+    moments = live.accumulator("PARAMETER", "moments", None)
+    assert moments.rows == 7
+    assert mean.value == 4.0
+    assert median.value == 4.0
+
+
+def test_sketch_mode_medians_use_live_quantile_state():
+    options = PlotOptions.with_enabled("median")
+    options.quantile_mode = "sketch"
+    live = LiveStatistics()
+
+    overlays = list(iter_time_series_overlays(
+        [FakeEnergy([1, 2, 4, 8])],
+        "PARAMETER",
+        options,
+        live=live,
+    ))
+    guides = list(iter_histogram_guides(
+        [FakeEnergy([1, 2, 4, 8, 16])],
+        "PARAMETER",
+        options,
+        live=live,
+    ))
+
+    assert np.all(overlays[0].values == [3, 3])
+    assert guides[0].value == 4.0
+    assert live.quantiles("PARAMETER", [1, 2, 4, 8, 16]).count == 5
+
+
+def test_discard_equilibration_drops_transient_from_statistics():
+    rng = np.random.default_rng(1)
+    values = np.r_[np.linspace(50, 0, 300), np.zeros(1700)]
+    values += rng.normal(size=values.size)
+    options = PlotOptions.with_enabled("mean", "discard_equilibration")
+
+    mean, = iter_time_series_overlays([FakeEnergy(values)], "PARAMETER",
+                                      options)
+    guide, = iter_histogram_guides([FakeEnergy(values)], "PARAMETER",
+                                   options)
+
+    assert mean.time[0] > 200
+    assert abs(mean.values[0]) < 0.5
+    assert abs(guide.value) < 0.5
+
+
+def test_decorrelated_guides_use_strided_subsample():
+    values = np.repeat(np.arange(200.0), 10) ** 2
+    options = PlotOptions.with_enabled("mean", "decorrelate")
+
+    guide, = iter_histogram_guides([FakeEnergy(values)], "PARAMETER",
+                                   options)
+    overlay, = iter_time_series_overlays([FakeEnergy(values)], "PARAMETER",
+                                         options)
+
+    stride = subsampling_stride(values)
+    assert stride > 1
+    assert guide.value == np.mean(values[::stride])
+    assert overlay.values[0] == np.mean(values)
+
+
+def test_confidence_intervals_bracket_enabled_means_and_medians():
+    values = np.random.default_rng(2).normal(10.0, 1.0, size=2000)
+    options = PlotOptions.with_enabled("mean", "median",
+                                       "confidence_interval")
+
+    overlays = list(iter_time_series_overlays([FakeEnergy(values)],
+                                              "PARAMETER", options))
+    guides = list(iter_histogram_guides([FakeEnergy(values)], "PARAMETER",
+                                        options))
+
+    assert [overlay.label for overlay in overlays] == [
+        "Mean", "Median", "Mean 95% CI", "Median 95% CI"]
+    assert [guide.label for guide in guides] == [
+        "Mean", "Median", "Mean 95% CI", "Median 95% CI"]
+    for overlay, guide in zip(overlays[2:], guides[2:]):
+        assert overlay.band and guide.span
+        assert np.all(overlay.time == [1, 2000])
+        assert overlay.lower[0] == guide.lower < guide.value
+        assert guide.value < guide.upper == overlay.upper[0]
+    assert guides[2].lower < np.mean(values) < guides[2].upper
+
+
+def test_confidence_interval_needs_mean_or_median():
+    options = PlotOptions.with_enabled("confidence_interval")
+
+    assert not list(iter_time_series_overlays([FakeEnergy([1, 2, 3])],
+                                              "PARAMETER", options))
+
+
+def test_overlays_and_guides_are_memoized_per_data_version():
+    cache = StatisticsCache()
+    energies = [FakeEnergy([1, 2, 4, 8])]
+    options = PlotOptions.with_enabled("mean", "median", "running_average")
+    options.window_size = "2"
+
+    first = list(iter_time_series_overlays(energies, "PARAMETER", options,
+                                           cache=cache, data_version=1))
+    second = list(iter_time_series_overlays(energies, "PARAMETER", options,
+                                            cache=cache, data_version=1))
+    list(iter_histogram_guides(energies, "PARAMETER", options, cache=cache,
+                               data_version=1))
+    list(iter_histogram_guides(energies, "PARAMETER", options, cache=cache,
+                               data_version=1))
+
+    assert all(a is b for a, b in zip(first, second))
+    assert cache.stats().hits == 7
+    assert cache.stats().misses == 6
+
+    list(iter_time_series_overlays(energies, "PARAMETER", options,
+                                   cache=cache, data_version=2))
+    assert cache.stats().misses == 10
+
+
+def test_trend_overlay_draws_least_squares_line_with_slope_label():
+    options = PlotOptions.with_enabled("trend")
+
+    overlay, = iter_time_series_overlays([FakeEnergy([1, 3, 5, 7])],
+                                         "PARAMETER", options)
+
+    assert overlay.label == "Trend Line (slope 2)"
+    np.testing.assert_allclose(overlay.time, [1, 4])
+    np.testing.assert_allclose(overlay.values, [1, 7])
+
+
+def test_smoothing_overlays_keep_input_time_axis():
+    options = PlotOptions.with_enabled("exponential_moving_average",
+                                       "savitzky_golay")
+    options.window_size = "5"
+    values = np.sin(np.linspace(0, 6, 40))
+
+    ema, savgol = iter_time_series_overlays([FakeEnergy(values)],
+                                            "PARAMETER", options)
+
+    assert ema.label == "Exponential Moving Average (5)"
+    assert savgol.label == "Savitzky-Golay (5)"
+    np.testing.assert_array_equal(ema.time, np.arange(1, 41))
+    np.testing.assert_array_equal(savgol.time, np.arange(1, 41))
+    assert ema.values[0] == values[0]
+    np.testing.assert_allclose(savgol.values, values, atol=1e-3)
+
+
+def test_live_smoothing_overlays_extend_incrementally():
+    live = LiveStatistics()
+    options = PlotOptions.with_enabled("exponential_moving_average",
+                                       "savitzky_golay")
+    options.window_size = "7"
+    values = np.random.default_rng(0).normal(size=300).cumsum()
+
+    for rows in (10, 11, 50, 300):
+        live_overlays = list(iter_time_series_overlays(
+            [FakeEnergy(values[:rows])], "PARAMETER", options, live=live))
+        exact_overlays = list(iter_time_series_overlays(
+            [FakeEnergy(values[:rows])], "PARAMETER", options))
+        for live_overlay, exact_overlay in zip(live_overlays,
+                                               exact_overlays):
+            np.testing.assert_allclose(live_overlay.values,
+                                       exact_overlay.values)
+
+
+def test_rolling_band_overlays_carry_lower_and_upper_edges():
+    options = PlotOptions.with_enabled("rolling_std", "rolling_min_max")
+    options.window_size = "2"
+
+    std_band, min_max_band = iter_time_series_overlays(
+        [FakeEnergy([1, 3, 3, 7])], "PARAMETER", options)
+
+    assert std_band.band and min_max_band.band
+    assert std_band.label == "Rolling Std Band (2)"
+    np.testing.assert_allclose(std_band.time, [1.5, 2.5, 3.5])
+    np.testing.assert_allclose(std_band.values, [2, 3, 5])
+    np.testing.assert_allclose(std_band.lower, [1, 3, 3])
+    np.testing.assert_allclose(std_band.upper, [3, 3, 7])
+    np.testing.assert_allclose(min_max_band.lower, [1, 3, 3])
+    np.testing.assert_allclose(min_max_band.upper, [3, 3, 7])
+
+
+def test_rolling_percentile_band_strides_in_sketch_mode():
+    options = PlotOptions.with_enabled("rolling_percentile")
+    options.window_size = "20"
+    values = np.random.default_rng(0).lognormal(size=200)
+
+    exact, = iter_time_series_overlays([FakeEnergy(values)], "PARAMETER",
+                                       options)
+    options.quantile_mode = "sketch"
+    with patch("PQEnalyzer.plots.series_statistics.STRIDED_BAND_POINTS", 50):
+        strided, = iter_time_series_overlays([FakeEnergy(values)],
+                                             "PARAMETER", options)
+
+    assert exact.label == "Rolling Percentile Band 5-95% (20)"
+    assert exact.time.size == 181
+    assert np.all(exact.lower <= exact.values)
+    assert np.all(exact.values <= exact.upper)
+    np.testing.assert_array_equal(strided.time, exact.time[::4])
+    np.testing.assert_array_equal(strided.lower, exact.lower[::4])
+    np.testing.assert_array_equal(strided.upper, exact.upper[::4])
+
+
+def test_concurrent_overlays_match_sequential_order_and_values():
+    values = np.random.default_rng(3).normal(size=3000).cumsum()
+    options = PlotOptions.with_enabled(
+        "mean",
+        "median",
+        "cummulative_average",
+        "running_average",
+        "exponential_moving_average",
+        "rolling_std",
+        "rolling_percentile",
+        "trend",
+    )
+    options.window_size = "50"
+    executor = statistics_executor(4)
+    cache = StatisticsCache()
+
+    try:
+        concurrent = list(iter_time_series_overlays(
+            [FakeEnergy(values)], "PARAMETER", options, live=LiveStatistics(),
+            cache=cache, data_version=1, executor=executor))
+    finally:
+        executor.shutdown()
+    sequential = list(iter_time_series_overlays(
+        [FakeEnergy(values)], "PARAMETER", options, live=LiveStatistics()))
+
+    assert [overlay.label for overlay in concurrent] == [
+        overlay.label for overlay in sequential]
+    for first, second in zip(concurrent, sequential):
+        np.testing.assert_allclose(first.values, second.values)
+    assert cache.stats().misses == 9
+
+
+def test_change_point_markers_use_offline_or_online_detector():
+    noise = np.random.default_rng(3).normal(scale=0.1, size=3000)
+    values = np.where(np.arange(3000) < 1800, 0.0, 1.0) + noise
+    energies = [FakeEnergy(values, time=0.5 * np.arange(3000))]
+    options = PlotOptions.with_enabled("change_points")
+
+    offline, = iter_time_series_overlays(energies, "PARAMETER", options)
+    options.quantile_mode = "sketch"
+    online, = iter_time_series_overlays(energies, "PARAMETER", options,
+                                        live=LiveStatistics())
+
+    assert offline.markers
+    assert offline.label == "Change Points (1)"
+    np.testing.assert_array_equal(offline.time, [900.0])
+    assert online.markers
+    assert abs(online.time[0] - 900.0) < 10
+
+
+def test_outliers_are_marked_and_left_out_of_mean_and_median():
+    values = np.random.default_rng(4).normal(scale=0.1, size=500)
+    values[[100, 350]] = 25.0
+    energies = [FakeEnergy(values)]
+    options = PlotOptions.with_enabled("mean", "median", "outliers")
+
+    mean, median, outliers = iter_time_series_overlays(
+        energies, "PARAMETER", options)
+    options.quantile_mode = "sketch"
+    _, online_median, online = iter_time_series_overlays(
+        energies, "PARAMETER", options, live=LiveStatistics())
+    mean_guide, _ = iter_histogram_guides(energies, "PARAMETER", options)
+
+    kept = np.delete(values, [100, 350])
+    assert outliers.points and not outliers.markers
+    assert outliers.label == "Outliers (2)"
+    np.testing.assert_array_equal(outliers.time, [101, 351])
+    np.testing.assert_array_equal(outliers.values, [25.0, 25.0])
+    np.testing.assert_array_equal(online.time, outliers.time)
+    assert mean.values[0] == pytest.approx(kept.mean())
+    assert median.values[0] == pytest.approx(np.median(kept))
+    assert online_median.values[0] == median.values[0]
+    assert mean_guide.value == pytest.approx(kept.mean())
+
+
+def test_live_overlays_match_offline_while_discarding_equilibration():
+    rng = np.random.default_rng(5)
+    values = np.r_[np.linspace(30.0, 0.0, 300), np.zeros(2700)]
+    values = np.round(values + rng.normal(scale=0.5, size=values.size))
+    options = PlotOptions.with_enabled("discard_equilibration",
+                                       "cummulative_average")
+    live = LiveStatistics()
+
+    for end in range(400, values.size + 1, 650):
+        energies = [FakeEnergy(values[:end])]
+        online, = iter_time_series_overlays(energies, "PARAMETER", options,
+                                            live=live)
+        offline, = iter_time_series_overlays(energies, "PARAMETER", options)
+
+        np.testing.assert_allclose(online.values, offline.values)
+
+
+def test_overlay_builders_are_registered_for_time_series_features():
+    for key in TIME_SERIES_OVERLAYS:
+        feature = PLOT_FEATURES_BY_KEY[key]
+        assert feature.time_series
+        assert not feature.replaces_main
+
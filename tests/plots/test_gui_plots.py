@@ -1,15 +1,25 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from types import SimpleNamespace
+from unittest.mock import patch
 
+from PQEnalyzer.plots.options import PlotOptions
+from PQEnalyzer.plots.plot_correlation import PlotCorrelation
 from PQEnalyzer.plots.plot_dashboard import PlotDashboard
+from PQEnalyzer.plots.plot_fluctuation import PlotFluctuation
 from PQEnalyzer.plots.plot_histogram import PlotHistogram
+from PQEnalyzer.plots.plot_spectrum import PlotSpectrum
 from PQEnalyzer.plots.plot_time import PlotTime
 from PQEnalyzer.plots.value_readout import (
     ValueReadoutEntry,
     format_readout_value,
     latest_value_label,
 )
+from PQEnalyzer.statistics import (
+    ConservationLimits,
+    kernel_density,
+    subsampling_stride,
+)
 
 
 class FakeFlag:
@@ -78,6 +88,13 @@ class FakeReader:
         return None
 
 
+class GrowingReader(FakeReader):
+
+    def read_last(self):
+        values = self.energies[-1].data["PARAMETER"]
+        self.energies[-1] = FakeEnergy([*values, values[-1] + 1])
+
+
 class FailingReader(FakeReader):
 
     def read_last(self):
@@ -96,6 +113,7 @@ class FakeApp:
         self_correlation_mean=False,
         difference=False,
         running_average=False,
+        rolling_std=False,
         window_size="",
         filenames=None,
     ):
@@ -106,6 +124,7 @@ class FakeApp:
         self.self_correlation_mean = FakeFlag(self_correlation_mean)
         self.difference = FakeFlag(difference)
         self.running_average = FakeFlag(running_average)
+        self.rolling_std = FakeFlag(rolling_std)
         self.window_size = FakeEntry(window_size)
         self.plot_main_data = FakeFlag(False)
         self.info = ["TEMPERATURE", "PRESSURE"]
@@ -134,6 +153,40 @@ def test_histogram_skips_constant_series_and_plots_remaining_data(caplog):
     assert "Data zero. No histogram available." in caplog.text
 
 
+def test_streaming_histogram_extends_live_bins_on_refresh():
+    app = FakeApp([FakeEnergy([1, 2, 2, 3, 3, 3, 4])])
+    app.reader = GrowingReader(app.reader.energies)
+    app.kde_method = "streaming"
+    plot = PlotHistogram(app)
+    plot.info_parameter = "PARAMETER"
+    plot.plot_data()
+
+    plot.refresh(show=False)
+
+    histogram = plot.live_statistics.histogram(
+        ("PARAMETER", "series-0.en"), app.reader.energies[0].data["PARAMETER"])
+    assert histogram.rows == 8
+    assert histogram.counts.sum() == 8
+    assert plot.ax.get_legend_handles_labels()[1] == ["series-0.en KDE"]
+
+
+def test_histogram_estimates_density_on_decorrelated_samples():
+    values = np.repeat(np.arange(50.0), 40) ** 2
+    app = FakeApp([FakeEnergy(values)])
+    app.decorrelate = FakeFlag(True)
+    app.kde_method = "exact"
+    plot = PlotHistogram(app)
+
+    with patch("PQEnalyzer.plots.plot_histogram.kernel_density",
+               wraps=kernel_density) as density:
+        plot.main_data("PARAMETER")
+
+    samples = density.call_args.args[0]
+    assert samples.size == -(-values.size // subsampling_stride(values))
+    assert samples.size < values.size
+    assert plot.ax.get_legend_handles_labels()[1] == ["series-0.en KDE"]
+
+
 def test_histogram_disambiguates_duplicate_filenames():
     app = FakeApp(
         [FakeEnergy([1, 2, 3, 4]), FakeEnergy([2, 3, 4, 5])],
@@ -162,6 +215,18 @@ def test_histogram_statistics_draw_single_mean_and_median_lines():
     assert [line.get_zorder() for line in plot.ax.lines] == [4, 4]
 
 
+def test_histogram_statistics_shade_confidence_interval_spans():
+    app = FakeApp([FakeEnergy(np.arange(40.0) % 7)], mean=True)
+    app.confidence_interval = FakeFlag(True)
+    plot = PlotHistogram(app)
+
+    plot.statistics("PARAMETER")
+
+    assert plot.ax.get_legend_handles_labels()[1] == ["Mean", "Mean 95% CI"]
+    assert len(plot.ax.lines) == 1
+    assert len(plot.ax.patches) == 1
+
+
 def test_histogram_labels_use_distribution_title_and_density_axis():
     app = FakeApp([FakeEnergy([1, 2, 3, 4])])
     plot = PlotHistogram(app)
@@ -277,6 +342,126 @@ def test_time_statistics_draw_expected_overlay_series():
     assert plot.ax.lines[-1].get_zorder() == 4
 
 
+def test_time_confidence_intervals_are_shaded_per_statistic():
+    app = FakeApp([FakeEnergy(np.arange(40.0) % 7)], mean=True, median=True)
+    app.confidence_interval = FakeFlag(True)
+    plot = PlotTime(app)
+    plot.info_parameter = "PARAMETER"
+    plot.plot_data()
+
+    assert list(plot.lines)[-2:] == [
+        ("overlay", "confidence_interval", 0),
+        ("overlay", "confidence_interval", 1),
+    ]
+    assert len(plot.ax.collections) == 2
+    assert plot.update_data() is True
+    assert len(plot.ax.collections) == 2
+
+
+def test_time_ensemble_draws_single_band_instead_of_replica_lines():
+    app = FakeApp([FakeEnergy(np.arange(50.0) + offset)
+                   for offset in range(8)])
+    app.ensemble = FakeFlag(True)
+    app.plot_main_data = FakeFlag(True)
+    plot = PlotTime(app)
+    plot.info_parameter = "PARAMETER"
+
+    plot.plot_data()
+
+    assert not plot.ax.lines
+    assert len(plot.ax.collections) == 1
+    assert plot.ax.get_legend_handles_labels()[1] == [
+        "Ensemble Band mean ± std (8 replicas) (52.5 unit)"]
+
+
+def test_time_refresh_extends_existing_lines_in_place():
+    app = FakeApp([FakeEnergy([1, 2, 3, 4])], cummulative_average=True)
+    app.reader = GrowingReader(app.reader.energies)
+    plot = PlotTime(app)
+    plot.info_parameter = "PARAMETER"
+    plot.plot_data()
+    lines = list(plot.ax.lines)
+
+    plot.refresh(show=False)
+
+    assert list(plot.ax.lines) == lines
+    assert np.all(lines[0].get_xdata() == [1, 2, 3, 4, 5])
+    assert np.allclose(lines[1].get_ydata(), [1, 1.5, 2, 2.5, 3])
+    assert plot.ax.get_legend_handles_labels()[1] == [
+        "series-0.en (5 unit)",
+        "Cumulative Average (3 unit)",
+    ]
+
+
+def test_time_rolling_band_is_shaded_and_replaced_on_refresh():
+    app = FakeApp([FakeEnergy([1, 3, 3, 7])], rolling_std=True,
+                  window_size="2")
+    app.reader = GrowingReader(app.reader.energies)
+    plot = PlotTime(app)
+    plot.info_parameter = "PARAMETER"
+    plot.plot_data()
+    band, = plot.ax.collections
+
+    plot.refresh(show=False)
+
+    refreshed, = plot.ax.collections
+    assert refreshed is not band
+    assert plot.ax.get_legend_handles_labels()[1] == [
+        "series-0.en (8 unit)",
+        "Rolling Std Band (2) (7.5 unit)",
+    ]
+
+
+def test_time_change_points_are_drawn_as_vertical_markers():
+    values = np.r_[np.zeros(40), np.ones(60)] + np.tile([0.05, -0.05], 50)
+    app = FakeApp([FakeEnergy(values)])
+    app.change_points = FakeFlag(True)
+    app.reader = GrowingReader(app.reader.energies)
+    plot = PlotTime(app)
+    plot.info_parameter = "PARAMETER"
+    plot.plot_data()
+    markers, = plot.ax.collections
+
+    assert markers.get_label() == "Change Points (1)"
+    np.testing.assert_array_equal(markers.get_segments()[0][:, 0], [41, 41])
+
+    plot.refresh(show=False)
+
+    refreshed, = plot.ax.collections
+    assert refreshed is not markers
+
+
+def test_time_outliers_are_drawn_as_unconnected_points():
+    values = np.tile([0.05, -0.05, 0.1, -0.1], 50)
+    values[120] = 40.0
+    app = FakeApp([FakeEnergy(values)])
+    app.outliers = FakeFlag(True)
+    plot = PlotTime(app)
+    plot.info_parameter = "PARAMETER"
+    plot.plot_data()
+    _, points = plot.ax.lines
+
+    assert points.get_label() == "Outliers (1)"
+    assert points.get_linestyle() == "None"
+    np.testing.assert_array_equal(points.get_xdata(), [121])
+
+
+def test_time_refresh_redraws_when_series_change():
+    app = FakeApp([FakeEnergy([1, 2, 3, 4])])
+    plot = PlotTime(app)
+    plot.info_parameter = "PARAMETER"
+    plot.plot_data()
+    app.mean.set(True)
+    plot.options = PlotOptions.from_app(app)
+
+    plot.refresh(show=False)
+
+    assert plot.ax.get_legend_handles_labels()[1] == [
+        "series-0.en (4 unit)",
+        "Mean (2.5 unit)",
+    ]
+
+
 def test_time_difference_subtracts_two_aligned_series():
     app = FakeApp(
         [FakeEnergy([5, 6, 7]), FakeEnergy([1, 2, 4])],
@@ -295,17 +480,17 @@ def test_time_difference_subtracts_two_aligned_series():
     assert np.all(line.get_ydata() == [4, 4, 3])
 
 
-def test_time_difference_logs_misaligned_series(caplog):
+def test_time_difference_logs_non_overlapping_series(caplog):
     first = FakeEnergy([5, 6, 7])
     second = FakeEnergy([1, 2, 4])
-    second.simulation_time = np.array([2, 3, 4])
+    second.simulation_time = np.array([4, 5, 6])
     app = FakeApp([first, second], difference=True)
     plot = PlotTime(app)
 
     plot.statistics("PARAMETER")
 
     assert len(plot.ax.lines) == 0
-    assert "matching simulation-time axes" in caplog.text
+    assert "overlapping simulation-time axes" in caplog.text
 
 
 def test_time_self_correlation_mean_uses_data_scale():
@@ -366,6 +551,70 @@ def test_dashboard_multi_value_title_keeps_mixed_units():
     assert title == "302 K | 1.25 bar"
 
 
+def test_correlation_heatmap_annotates_all_parameter_pairs():
+    app = FakeApp([FakeDashboardEnergy()])
+    plot = PlotCorrelation(app)
+
+    plot.redraw()
+    plot.redraw()
+
+    np.testing.assert_allclose(plot.matrix, [[1.0, 0.5], [0.5, 1.0]])
+    assert [text.get_text() for text in plot.ax.texts] == [
+        "1.00", "0.50", "0.50", "1.00"]
+    assert [label.get_text() for label in plot.ax.get_yticklabels()] == [
+        "TEMPERATURE", "PRESSURE"]
+    assert len(plot.figure.axes) == 2
+
+
+def test_spectrum_marks_oscillation_frequency_on_log_axes(caplog):
+    time = np.arange(1, 4097)
+    oscillation = np.sin(2 * np.pi * time / 16)
+    app = FakeApp([FakeEnergy([1, 1, 1, 1]), FakeEnergy(oscillation)])
+    plot = PlotSpectrum(app)
+    plot.info_parameter = "PARAMETER"
+
+    with caplog.at_level("WARNING"):
+        plot.plot_data()
+
+    assert [line.get_label() for line in plot.ax.lines] == [
+        "series-1.en PSD", "peak 0.0625 1/time"]
+    assert plot.ax.lines[0].get_xdata()[0] > 0
+    assert plot.ax.get_xscale() == plot.ax.get_yscale() == "log"
+    assert plot.ax.get_xlabel() == "Frequency / 1/time"
+    assert "Data constant. No spectrum available." in caplog.text
+
+
+def test_fluctuation_plot_shows_convergence_with_block_error(caplog):
+    rng = np.random.default_rng(0)
+    energy = FakeDashboardEnergy()
+    energy.info["E(TOT)"] = "E(TOT)"
+    energy.units["E(TOT)"] = "kcal/mol"
+    energy.data = {
+        "TEMPERATURE": 300 + rng.normal(size=400),
+        "PRESSURE": rng.normal(size=400),
+        "E(TOT)": rng.normal(size=400),
+    }
+    energy.simulation_time = np.arange(400)
+    plot = PlotFluctuation(FakeApp([energy]))
+
+    plot.redraw()
+    plot.redraw()
+
+    ax = plot.axes[0]
+    assert len(plot.axes) == 1
+    assert ax.lines[0].get_xdata().size == 400
+    assert ax.get_ylabel() == "C_V / kcal/mol/K"
+    labels = [text.get_text() for text in ax.get_legend().get_texts()]
+    assert labels[0] == "running estimate"
+    assert labels[1].startswith("C_V: ") and " ± " in labels[1]
+    assert labels[2] == "block error (25 blocks)"
+
+    with caplog.at_level("WARNING"):
+        PlotFluctuation(FakeApp([FakeDashboardEnergy()])).redraw()
+
+    assert "No E(TOT) or VOLUME with TEMPERATURE to plot." in caplog.text
+
+
 def test_readout_value_formatting_uses_scientific_notation_selectively():
     assert format_readout_value(302.123456, "K") == "302.12 K"
     assert format_readout_value(0.0000123, "bar") == "1.2300e-05 bar"
@@ -411,6 +660,38 @@ def test_dashboard_single_click_highlights_panel_without_opening_focus():
     )
 
 
+def test_dashboard_subtitle_shows_conservation_alert():
+    energy = FakeDashboardEnergy()
+    energy.info["E(TOT)"] = "E(TOT)"
+    energy.units["E(TOT)"] = "kcal/mol"
+    energy.data["E(TOT)"] = np.array([-10.0, -9.0, -8.0])
+    app = FakeApp([energy])
+    app.conservation_limits = ConservationLimits(max_drift=0.5)
+    plot = PlotDashboard(app)
+
+    plot.redraw()
+
+    subtitle = plot.subtitle_text.get_text()
+    assert subtitle.startswith("E(TOT) drift 1 kcal/mol/step")
+    assert "ALERT: |drift| > 0.5" in subtitle
+
+
+def test_dashboard_subtitle_shows_throughput_and_eta():
+    energy = FakeDashboardEnergy()
+    energy.info["LOOPTIME"] = "LOOPTIME"
+    energy.units["LOOPTIME"] = "s"
+    energy.data["LOOPTIME"] = np.array([2.0, 2.0, 2.0])
+    app = FakeApp([energy])
+    app.target_time = 5
+    plot = PlotDashboard(app)
+
+    plot.redraw()
+
+    subtitle = plot.subtitle_text.get_text()
+    assert subtitle.startswith(
+        "Throughput 4.32e+04 step/day, 0.5 steps/s, slowdown x1.00, ETA 4s")
+
+
 def test_dashboard_refresh_keeps_existing_plot_on_read_error(caplog):
     app = FakeApp([FakeDashboardEnergy()])
     app.reader = FailingReader([FakeDashboardEnergy()])
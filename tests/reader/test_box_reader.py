@@ -55,6 +55,7 @@ def test_box_reader_supports_multiple_files_and_refresh():
 
     assert reader.energies[0] is original_first
     assert reader.energies[-1] is not original_last
+    assert reader.data_version == 2
     np.testing.assert_allclose(reader.energies[-1].data["BOX-Y"],
                                np.array([22.1, 22.0, 22.3, 22.6, 22.8]))
 
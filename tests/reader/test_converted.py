@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.energy_access import parameter_unit, parameter_values
+from PQEnalyzer.readers import ConvertedReader, DerivedReader, create_reader
+
+
+class FakeEnergy:
+
+    def __init__(self, pressure):
+        self.info = {"SIMULATION-TIME": "TIME", "PRESSURE": "PRESSURE"}
+        self.units = {"SIMULATION-TIME": "ps", "PRESSURE": "bar"}
+        self.data = {"PRESSURE": np.asarray(pressure, dtype=float)}
+        self.simulation_time = np.arange(len(pressure), dtype=float)
+
+
+class FakeReader:
+
+    def __init__(self):
+        self.filenames = ["a.en", "b.en"]
+        self.energies = [FakeEnergy([1e4]), FakeEnergy([2e4])]
+        self.refreshed = [2e4, 3e4]
+
+    def read_last(self):
+        self.energies[-1] = FakeEnergy(self.refreshed)
+
+
+def test_targets_convert_columns_of_every_file():
+    reader = ConvertedReader(
+        create_reader(["tests/data/md-02.en", "tests/data/md-03.en"]),
+        ["PRESSURE=GPa", "E(TOT) = kJ/mol"],
+    )
+    raw = create_reader(["tests/data/md-02.en", "tests/data/md-03.en"])
+
+    for energy, raw_energy in zip(reader.energies, raw.energies):
+        np.testing.assert_allclose(energy.pressure, raw_energy.pressure / 1e4)
+        np.testing.assert_allclose(energy.total_energy,
+                                   raw_energy.total_energy * 4.184)
+        assert parameter_unit(energy, "PRESSURE") == "GPa"
+        assert parameter_unit(energy, "E(TOT)") == "kJ/mol"
+
+
+def test_read_last_converts_only_the_refreshed_energy():
+    raw = FakeReader()
+    reader = ConvertedReader(raw, ["PRESSURE=kbar"])
+    first = reader.energies[0]
+
+    reader.read_last()
+
+    assert reader.energies[0] is first
+    np.testing.assert_allclose(parameter_values(first, "PRESSURE"), [10.0])
+    np.testing.assert_allclose(
+        parameter_values(reader.energies[1], "PRESSURE"), [20.0, 30.0])
+    assert reader.energies[1].units["PRESSURE"] == "kbar"
+    assert reader.data_version is None
+
+
+def test_derived_columns_see_converted_values():
+    reader = DerivedReader(ConvertedReader(FakeReader(), ["PRESSURE=GPa"]),
+                           ["P2=2*PRESSURE"])
+
+    np.testing.assert_allclose(
+        parameter_values(reader.energies[0], "P2"), [2.0])
+
+
+@pytest.mark.parametrize(
+    ("definition", "message"),
+    [
+        ("PRESSURE", "must have the form LABEL=UNIT"),
+        ("VOLUME=nm^3", "Unknown column 'VOLUME'"),
+        ("PRESSURE=K", "Column 'PRESSURE': Cannot convert pressure unit"),
+        ("PRESSURE=psi", "Unknown unit 'psi'"),
+    ],
+)
+def test_invalid_targets_are_rejected(definition, message):
+    with pytest.raises(ValueError, match=message):
+        ConvertedReader(FakeReader(), [definition])
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.energy_access import parameter_unit, parameter_values, series
+from PQEnalyzer.readers import DerivedReader, create_reader
+from PQEnalyzer.readers import derived as derived_module
+from PQEnalyzer.readers.derived import (
+    parse_derived_column,
+    parse_derived_columns,
+)
+
+
+LABELS = ["SIMULATION-TIME", "E(QM)", "N(QM-ATOMS)", "E(TOT)", "PRESSURE"]
+
+
+class FakeEnergy:
+
+    def __init__(self, time, pressure):
+        self.info = {"SIMULATION-TIME": 0, "PRESSURE": 1}
+        self.units = {"SIMULATION-TIME": "ps", "PRESSURE": "bar"}
+        self.data = np.array([time, pressure], dtype=float)
+        self.simulation_time = self.data[0]
+
+
+class GrowingReader:
+
+    def __init__(self, pressure):
+        self.filenames = ["run.en"]
+        self.data_version = 1
+        self.pressure = list(pressure)
+        self.energies = [self.__energy()]
+
+    def append(self, *values):
+        self.pressure.extend(values)
+
+    def read_last(self):
+        self.energies[-1] = self.__energy()
+        self.data_version += 1
+
+    def __energy(self):
+        return FakeEnergy(np.arange(len(self.pressure)), self.pressure)
+
+
+def test_labels_with_parentheses_and_hyphens_need_no_quoting():
+    column = parse_derived_column(
+        "EQM_PER_ATOM = E(QM) / N(QM-ATOMS)", LABELS)
+
+    values = column.evaluate({"E(QM)": np.array([10.0, 9.0]),
+                              "N(QM-ATOMS)": np.array([2.0, 3.0])})
+
+    assert column.name == "EQM_PER_ATOM"
+    assert column.labels == ("E(QM)", "N(QM-ATOMS)")
+    assert column.unit == "-"
+    np.testing.assert_allclose(values, [5.0, 3.0])
+
+
+def test_later_definitions_reference_earlier_ones_and_functions():
+    columns = parse_derived_columns(
+        ["P_ATM[atm]=PRESSURE/1.01325", "P_ABS=sqrt(abs(P_ATM)) ** 2"],
+        LABELS)
+
+    assert [column.unit for column in columns] == ["atm", "-"]
+    assert columns[1].labels == ("P_ATM",)
+    np.testing.assert_allclose(
+        columns[1].evaluate({"P_ATM": np.array([-4.0, 9.0])}), [4.0, 9.0])
+
+
+@pytest.mark.parametrize(
+    ("definition", "message"),
+    [
+        ("E(QM)/2", "must have the form NAME=EXPR"),
+        ("PRESSURE=E(QM)", "already exists"),
+        ("X=E(QM)+", "Invalid expression"),
+        ("X=E(QM)+VOLUME", "unknown column 'VOLUME'"),
+        ("X=__import__('os')", "unsupported function"),
+        ("X=E(QM).real", "unsupported syntax Attribute"),
+        ("X=E(QM) if PRESSURE else 0", "unsupported syntax IfExp"),
+        ("X=E(QM)+'a'", "numeric constants"),
+        ("X=2*3", "at least one column"),
+    ],
+)
+def test_invalid_definitions_are_rejected(definition, message):
+    with pytest.raises(ValueError, match=message):
+        parse_derived_column(definition, LABELS)
+
+
+def test_derived_columns_behave_like_native_columns():
+    reader = DerivedReader(
+        create_reader(["examples/md-01.en"]),
+        ["E_SYS[kcal/mol]=E(TOT)-E(QM)"],
+    )
+    energy = reader.energies[0]
+
+    expected = (parameter_values(energy, "E(TOT)")
+                - parameter_values(energy, "E(QM)"))
+    assert list(energy.info)[-1] == "E_SYS"
+    assert parameter_unit(energy, "E_SYS") == "kcal/mol"
+    np.testing.assert_allclose(series(energy, "E_SYS").values, expected)
+    assert energy.temperature_unit == "K"
+    assert reader.filenames == ["examples/md-01.en"]
+
+
+def test_refresh_evaluates_only_appended_rows(monkeypatch):
+    evaluated = []
+    evaluate = derived_module.DerivedColumn.evaluate
+
+    def spy(self, values):
+        evaluated.append(len(next(iter(values.values()))))
+        return evaluate(self, values)
+
+    monkeypatch.setattr(derived_module.DerivedColumn, "evaluate", spy)
+    raw = GrowingReader([1.0, 2.0, 3.0])
+    reader = DerivedReader(raw, ["P2=2*PRESSURE"])
+
+    raw.append(4.0, 5.0)
+    reader.read_last()
+
+    assert evaluated == [3, 2]
+    assert reader.data_version == 2
+    np.testing.assert_allclose(
+        parameter_values(reader.energies[0], "P2"), [2, 4, 6, 8, 10])
+
+    raw.pressure[4] = 0.0
+    reader.read_last()
+
+    assert evaluated == [3, 2, 5]
+    np.testing.assert_allclose(
+        parameter_values(reader.energies[0], "P2"), [2, 4, 6, 8, 0])
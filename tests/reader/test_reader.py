@@ -1,6 +1,7 @@
 import os
 import shutil
 
+import numpy as np
 import pytest
 
 from PQAnalysis.traj import MDEngineFormat
@@ -86,7 +87,7 @@ class TestReader:
         shutil.copyfile(example_dir + "md-02.en", changed.with_suffix(".en"))
 
         changed_info = (reference.with_suffix(".info").read_text().replace(
-            "A^3", "nm^3", 1))
+            "A^3", "ps", 1))
         changed.with_suffix(".info").write_text(changed_info)
 
         with pytest.raises(ValueError, match="same units"):
@@ -98,6 +99,35 @@ class TestReader:
                 MDEngineFormat.PQ,
             )
 
+    @pytest.mark.parametrize("example_dir", ["tests/data/"], indirect=False)
+    def test_multiple_input_converts_convertible_units(self, tmp_path,
+                                                       example_dir):
+        reference = tmp_path / "reference"
+        changed = tmp_path / "changed"
+        shutil.copyfile(example_dir + "md-02.en", reference.with_suffix(".en"))
+        shutil.copyfile(example_dir + "md-02.info",
+                        reference.with_suffix(".info"))
+        shutil.copyfile(example_dir + "md-02.en", changed.with_suffix(".en"))
+
+        changed_info = (reference.with_suffix(".info").read_text().replace(
+            "A^3", "nm^3", 1))
+        changed.with_suffix(".info").write_text(changed_info)
+
+        reader = Reader(
+            [
+                str(reference.with_suffix(".en")),
+                str(changed.with_suffix(".en")),
+            ],
+            MDEngineFormat.PQ,
+        )
+
+        first, second = reader.energies
+        assert second.units == first.units
+        assert second.volume_unit == "A^3"
+        np.testing.assert_allclose(second.volume, 1000 * first.volume)
+        np.testing.assert_allclose(second.data[second.info["VOLUME"]],
+                                   1000 * first.volume)
+
     def test_empty_input(self):
         list_filenames = []
 
@@ -123,6 +153,7 @@ class TestReader:
         assert energies == reader.energies
         assert energy1 == reader.energies[0]
         assert energy2 != reader.energies[1]
+        assert reader.data_version == 2
 
     @pytest.mark.parametrize("example_dir", ["tests/data/"], indirect=False)
     def test_read_last_rejects_incompatible_refresh(self, tmp_path,
@@ -145,8 +176,9 @@ class TestReader:
         )
 
         changed_info = (changed.with_suffix(".info").read_text().replace(
-            "A^3", "nm^3", 1))
+            "A^3", "ps", 1))
         changed.with_suffix(".info").write_text(changed_info)
 
         with pytest.raises(ValueError, match="same units"):
             reader.read_last()
+        assert reader.data_version == 1
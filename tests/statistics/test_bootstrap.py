@@ -0,0 +1,113 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+from scipy.signal import lfilter
+
+from PQEnalyzer.statistics import block_bootstrap, statistics_executor
+from PQEnalyzer.statistics import bootstrap as bootstrap_module
+
+
+def ar1_series(size, phi, seed=0):
+    noise = np.random.default_rng(seed).normal(size=size)
+    return lfilter([1.0], [1.0, -phi], noise)
+
+
+def test_block_bootstrap_matches_standard_error_of_uncorrelated_mean():
+    values = np.random.default_rng(0).normal(size=4000)
+
+    interval = block_bootstrap(values, block_size=1)
+
+    half_width = (interval.upper - interval.lower) / 2
+    expected = 1.96 * values.std() / np.sqrt(values.size)
+    assert interval.estimate == np.mean(values)
+    assert interval.lower < interval.estimate < interval.upper
+    assert half_width == pytest.approx(expected, rel=0.1)
+
+
+def test_default_blocks_widen_intervals_of_correlated_series():
+    values = ar1_series(16000, 0.9)
+
+    naive = block_bootstrap(values, block_size=1)
+    blocked = block_bootstrap(values)
+
+    # the variance of an AR(1) mean grows by (1 + phi) / (1 - phi) = 19
+    expected = 1.96 * values.std() * np.sqrt(19 / values.size)
+    assert blocked.block_size > 1
+    assert blocked.upper - blocked.lower > 3 * (naive.upper - naive.lower)
+    assert (blocked.upper - blocked.lower) / 2 == pytest.approx(expected,
+                                                                rel=0.25)
+
+
+def test_median_interval_brackets_median():
+    values = ar1_series(5000, 0.5)
+
+    interval = block_bootstrap(values, "median", resamples=200)
+
+    assert interval.estimate == np.median(values)
+    assert interval.lower < interval.estimate < interval.upper
+    assert interval.resamples == 200
+
+
+def test_thinned_mean_keeps_interval_width_of_full_series():
+    values = ar1_series(200000, 0.9)
+
+    full = block_bootstrap(values, max_points=values.size)
+    thinned = block_bootstrap(values, max_points=4096)
+
+    assert thinned.estimate == full.estimate
+    assert thinned.lower < thinned.estimate < thinned.upper
+    assert thinned.upper - thinned.lower == pytest.approx(
+        full.upper - full.lower, rel=0.25)
+
+
+@pytest.mark.parametrize("phi", [0.0, 0.5])
+def test_thinned_median_matches_standard_error_of_full_series(phi):
+    values = ar1_series(20 * bootstrap_module.MAX_BOOTSTRAP_POINTS, phi)
+
+    interval = block_bootstrap(values, "median")
+
+    # the median of normal samples has sqrt(pi / 2) times the mean's error
+    inefficiency = (1 + phi) / (1 - phi)
+    expected = (1.96 * np.sqrt(np.pi / 2) * values.std()
+                * np.sqrt(inefficiency / values.size))
+    assert interval.estimate == np.median(values)
+    assert (interval.upper - interval.lower) / 2 == pytest.approx(
+        expected, rel=0.15)
+
+
+def test_chunked_and_concurrent_resampling_give_identical_intervals(
+        monkeypatch):
+    values = ar1_series(3000, 0.8)
+    expected = block_bootstrap(values, "median", resamples=64)
+
+    monkeypatch.setattr(bootstrap_module, "RESAMPLE_CHUNK_ELEMENTS", 3000)
+    executor = statistics_executor(3)
+    try:
+        threaded = block_bootstrap(values, "median", resamples=64,
+                                   executor=executor)
+    finally:
+        executor.shutdown()
+    with ProcessPoolExecutor(max_workers=2) as processes:
+        spawned = block_bootstrap(values, "median", resamples=64,
+                                  executor=processes)
+
+    assert threaded == expected
+    assert spawned == expected
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"values": []}, "at least one data point"),
+        ({"statistic": "mode"}, "Unknown bootstrap statistic"),
+        ({"confidence": 1.0}, "between zero and one"),
+        ({"resamples": 0}, "at least one"),
+        ({"block_size": 0}, "at least one"),
+    ],
+)
+def test_block_bootstrap_rejects_invalid_arguments(kwargs, message):
+    arguments = {"values": [1.0, 2.0, 3.0], **kwargs}
+
+    with pytest.raises(ValueError, match=message):
+        block_bootstrap(**arguments)
@@ -0,0 +1,61 @@
+import numpy as np
+
+from PQEnalyzer.statistics import StatisticsCache
+from PQEnalyzer.statistics.cache import estimate_nbytes
+
+
+def test_cache_returns_stored_values_and_counts_hits():
+    cache = StatisticsCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return np.arange(4.0)
+
+    first = cache.get_or_compute((1, "TEMPERATURE", "mean"), compute)
+    second = cache.get_or_compute((1, "TEMPERATURE", "mean"), compute)
+    cache.get_or_compute((2, "TEMPERATURE", "mean"), compute)
+
+    assert second is first
+    assert len(calls) == 2
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+    assert stats.nbytes == 64
+    assert stats.hit_rate == 1 / 3
+    assert "33% hits (1/3)" in stats.describe()
+
+
+def test_cache_evicts_least_recently_used_values_over_budget():
+    cache = StatisticsCache(max_bytes=200)
+    cache.get_or_compute("a", lambda: np.zeros(10))
+    cache.get_or_compute("b", lambda: np.zeros(10))
+    cache.get_or_compute("a", lambda: np.zeros(10))
+    cache.get_or_compute("c", lambda: np.zeros(10))
+
+    cache.get_or_compute("a", lambda: np.ones(10))
+    cache.get_or_compute("b", lambda: np.ones(10))
+
+    stats = cache.stats()
+    assert stats.evictions == 2
+    assert stats.nbytes <= 200
+    assert (stats.hits, stats.misses) == (2, 4)
+
+
+def test_cache_skips_values_larger_than_budget_and_can_be_disabled():
+    cache = StatisticsCache(max_bytes=0)
+
+    assert cache.get_or_compute("a", lambda: np.zeros(10)).size == 10
+    assert len(cache) == 0
+    assert cache.stats().hit_rate == 0.0
+
+
+def test_estimate_nbytes_counts_arrays_inside_containers():
+    assert estimate_nbytes((np.zeros(2), [np.zeros(3)])) == 40
+
+
+def test_estimate_nbytes_counts_bases_kept_alive_by_views():
+    values = np.zeros(100)
+
+    assert estimate_nbytes(values[::10]) == 800
+    assert estimate_nbytes((values[:50], values[50:], np.zeros(2))) == 816
+
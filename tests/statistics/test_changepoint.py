@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+from scipy.signal import lfilter
+
+from PQEnalyzer.statistics import (
+    CusumDetector,
+    LiveStatistics,
+    cusum,
+    detect_change_points,
+    long_run_variance,
+)
+
+
+def ar1_series(size, phi, seed=0):
+    noise = np.random.default_rng(seed).normal(size=size)
+    return lfilter([1.0], [1.0, -phi], noise)
+
+
+def stepped_series(phi, seed=0):
+    values = ar1_series(20000, phi, seed)
+    scale = 1.0 / np.sqrt(1.0 - phi**2)
+    values[7000:] += scale
+    values[15000:] -= 2 * scale
+    return values
+
+
+@pytest.mark.parametrize("phi", [0.0, 0.9])
+def test_binary_segmentation_locates_mean_jumps(phi):
+    change_points = detect_change_points(stepped_series(phi))
+
+    assert change_points.size == 2
+    np.testing.assert_allclose(change_points, [7000, 15000], atol=250)
+
+
+@pytest.mark.parametrize("phi", [0.0, 0.9, 0.99])
+def test_binary_segmentation_ignores_correlated_noise(phi):
+    for seed in range(3):
+        assert detect_change_points(ar1_series(20000, phi, seed)).size == 0
+
+
+def test_long_run_variance_scales_with_statistical_inefficiency():
+    # AR(1) long-run variance is 1 / (1 - phi)^2 for unit noise
+    white = long_run_variance(ar1_series(50000, 0.0))
+    correlated = long_run_variance(ar1_series(50000, 0.5))
+
+    assert white == pytest.approx(1.0, rel=0.6)
+    assert correlated == pytest.approx(4.0, rel=0.6)
+
+
+def test_cusum_matches_recursive_definition():
+    steps = np.random.default_rng(1).normal(size=500)
+    expected = []
+    total = 2.0
+    for step in steps:
+        total = max(0.0, total + step)
+        expected.append(total)
+
+    np.testing.assert_allclose(cusum(steps, start=2.0), expected)
+
+
+@pytest.mark.parametrize("phi", [0.0, 0.9])
+def test_cusum_detector_finds_jumps_independent_of_update_blocks(phi):
+    values = stepped_series(phi)
+    detector = CusumDetector()
+    for end in range(0, values.size + 1, 997):
+        detector.update(values[:end])
+    detector.update(values)
+
+    whole = CusumDetector().update(values)
+
+    assert detector.change_points == whole.change_points
+    np.testing.assert_allclose(whole.change_points, [7000, 15000],
+                               atol=500)
+
+
+@pytest.mark.parametrize("phi", [0.0, 0.9, 0.99])
+def test_cusum_detector_ignores_correlated_noise(phi):
+    for seed in range(3):
+        detector = CusumDetector().update(ar1_series(200000, phi, seed))
+        assert detector.change_points == []
+
+
+def test_cusum_detector_reports_python_integer_rows():
+    change_points = CusumDetector().update(stepped_series(0.0)).change_points
+
+    assert len(change_points) == 2
+    assert all(type(row) is int for row in change_points)
+
+
+def test_cusum_detector_restarts_after_rewrite():
+    live = LiveStatistics()
+    values = stepped_series(0.0)
+
+    assert live.change_points("PARAMETER", values)
+    assert live.change_points("PARAMETER", values[:5000]) == []
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"penalty": -1.0}, "must not be negative"),
+        ({"min_size": 0}, "at least one"),
+    ],
+)
+def test_detect_change_points_rejects_invalid_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        detect_change_points(np.arange(10.0), **kwargs)
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.statistics import ConservationLimits, ConservationMonitor
+
+
+class FakeNveEnergy:
+
+    def __init__(self, time, total, kinetic=None):
+        self.info = {"SIMULATION-TIME": "TIME", "E(TOT)": "E(TOT)"}
+        self.units = {"SIMULATION-TIME": "ps", "E(TOT)": "kcal/mol"}
+        self.data = {"E(TOT)": np.asarray(total, dtype=float)}
+        if kinetic is not None:
+            self.info["E(KIN)"] = "E(KIN)"
+            self.data["E(KIN)"] = np.asarray(kinetic, dtype=float)
+        self.simulation_time = np.asarray(time, dtype=float)
+
+
+def nve_run(rows=6000, drift=0.02):
+    rng = np.random.default_rng(0)
+    time = np.arange(rows) * 0.01
+    kinetic = 100 + 5 * rng.normal(size=rows)
+    total = -1000 + drift * time + 0.1 * rng.normal(size=rows)
+    return time, total, kinetic
+
+
+def test_incremental_updates_match_full_least_squares_fit():
+    time, total, kinetic = nve_run()
+    monitor = ConservationMonitor()
+
+    for rows in (1000, 1001, 4500, 6000):
+        status = monitor.update([FakeNveEnergy(time[:rows], total[:rows],
+                                               kinetic[:rows])])
+
+    slope, intercept = np.polyfit(time, total, 1)
+    residual = total - (slope * time + intercept)
+    assert status.rows == 6000
+    assert status.drift == pytest.approx(slope)
+    assert status.fluctuation == pytest.approx(np.std(residual))
+    assert status.kinetic_fluctuation == pytest.approx(np.std(kinetic))
+    assert status.alarm is False
+    assert status.describe().startswith("E(TOT) drift 0.02 kcal/mol/ps")
+
+
+def test_limits_raise_alerts_across_concatenated_files():
+    time, total, kinetic = nve_run()
+    energies = [
+        FakeNveEnergy(time[:3000], total[:3000], kinetic[:3000]),
+        FakeNveEnergy(time[3000:], total[3000:], kinetic[3000:]),
+    ]
+    monitor = ConservationMonitor(ConservationLimits(
+        max_drift=0.01, max_fluctuation_ratio=0.01))
+
+    status = monitor.update(energies)
+
+    assert status.drift == pytest.approx(np.polyfit(time, total, 1)[0])
+    assert status.alerts == ("|drift| > 0.01", "RMS/E(KIN) > 1.00%")
+    assert "ALERT" in status.describe()
+
+
+def test_rewritten_rows_restart_the_monitor():
+    time, total, _ = nve_run(rows=200)
+    monitor = ConservationMonitor()
+    monitor.update([FakeNveEnergy(time, total)])
+
+    status = monitor.update([FakeNveEnergy(time[:100], -total[:100])])
+
+    assert status.rows == 100
+    assert status.drift == pytest.approx(np.polyfit(time[:100],
+                                                    -total[:100], 1)[0])
+    assert np.isnan(status.fluctuation_ratio)
+
+
+def test_monitor_requires_total_energy_column():
+    energy = FakeNveEnergy([0.0, 1.0], [1.0, 1.0])
+
+    assert ConservationMonitor.supports([energy])
+    del energy.info["E(TOT)"]
+    assert not ConservationMonitor.supports([energy])
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.statistics import correlation_matrix, cross_correlation
+
+
+def test_correlation_matrix_matches_numpy_and_skips_incomplete_rows():
+    block = np.random.default_rng(0).normal(size=(400, 4))
+    block[:, 1] += 2 * block[:, 0]
+    expected = np.corrcoef(block.T)
+    block = np.vstack([block, [np.nan, 1.0, 2.0, 3.0]])
+
+    np.testing.assert_allclose(correlation_matrix(block), expected)
+
+
+def test_constant_columns_have_undefined_correlations():
+    matrix = correlation_matrix([[1.0, 5.0], [2.0, 5.0], [4.0, 5.0]])
+
+    assert matrix[0, 0] == pytest.approx(1.0)
+    assert np.isnan(matrix[0, 1]) and np.isnan(matrix[1, 1])
+
+
+def test_cross_correlation_finds_lagged_coupling():
+    rng = np.random.default_rng(1)
+    driver = rng.normal(size=1000)
+    block = np.column_stack([driver, np.roll(driver, 4)
+                             + 0.2 * rng.normal(size=1000)])
+
+    result = cross_correlation(block, max_lag=10)
+
+    centered = block - block.mean(axis=0)
+    scale = np.sqrt(np.sum(centered**2, axis=0))
+    expected = (np.sum(centered[4:, 1] * centered[:-4, 0])
+                / (scale[0] * scale[1]))
+    np.testing.assert_array_equal(result.lags, np.arange(-10, 11))
+    np.testing.assert_allclose(result.matrix, correlation_matrix(block))
+    assert result.values[14, 1, 0] == pytest.approx(expected)
+    assert result.peak_lags()[1, 0] == 4
+    assert result.peak_lags()[0, 1] == -4
+
+    with pytest.raises(ValueError, match="Maximum lag"):
+        cross_correlation(block, max_lag=1000)
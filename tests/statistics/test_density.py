@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from scipy.stats import gaussian_kde
+
+from PQEnalyzer.statistics import kde_bandwidth, kernel_density
+
+
+@pytest.mark.parametrize("bw_method", ["scott", "silverman"])
+@pytest.mark.parametrize("distribution", ["normal", "lognormal"])
+def test_binned_density_matches_gaussian_kde(bw_method, distribution):
+    values = getattr(np.random.default_rng(0), distribution)(size=20000)
+
+    grid, density = kernel_density(values, method="binned",
+                                   bw_method=bw_method)
+    expected = gaussian_kde(values, bw_method=bw_method)(grid)
+
+    assert grid.size >= 1000
+    assert grid[0] == values.min() and grid[-1] == values.max()
+    np.testing.assert_allclose(density, expected, atol=5e-3 * expected.max())
+
+
+def test_binned_grid_is_refined_for_outliers():
+    rng = np.random.default_rng(1)
+    values = np.concatenate([rng.normal(size=20000), [500.0]])
+
+    grid, density = kernel_density(values, method="binned")
+    expected = gaussian_kde(values)(grid)
+
+    assert grid[1] - grid[0] <= kde_bandwidth(values) / 4
+    np.testing.assert_allclose(density, expected, atol=2e-3 * expected.max())
+
+
+def test_auto_density_is_exact_for_small_series():
+    values = np.random.default_rng(2).normal(size=500)
+
+    grid, density = kernel_density(values)
+
+    assert grid.size == 1000
+    np.testing.assert_allclose(density, gaussian_kde(values)(grid))
+
+
+def test_density_rejects_invalid_input():
+    with pytest.raises(ValueError, match="distinct"):
+        kernel_density([1.0, 1.0, 1.0])
+
+    with pytest.raises(ValueError, match="KDE method"):
+        kernel_density([1.0, 2.0], method="histogram")
+
+    with pytest.raises(ValueError, match="bandwidth"):
+        kde_bandwidth([1.0, 2.0], "median")
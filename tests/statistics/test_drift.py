@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from PQEnalyzer.statistics import linear_drift, rolling_drift
+
+
+def test_linear_drift_matches_reference_regression():
+    rng = np.random.default_rng(0)
+    time = 1e6 + 0.5 * np.arange(20000)
+    values = -1e5 + 2e-4 * time + rng.normal(size=time.size)
+
+    result = linear_drift(time, values)
+    reference = stats.linregress(time, values)
+
+    assert result.slope == pytest.approx(reference.slope, rel=1e-8)
+    assert result.stderr == pytest.approx(reference.stderr, rel=1e-6)
+    assert result.intercept == pytest.approx(reference.intercept, rel=1e-8)
+
+
+def test_linear_drift_fits_all_block_columns():
+    time = np.arange(10.0)
+    block = np.column_stack([3 * time + 1, -time])
+
+    result = linear_drift(time, block)
+
+    np.testing.assert_allclose(result.slope, [3.0, -1.0])
+    np.testing.assert_allclose(result.intercept, [1.0, 0.0], atol=1e-12)
+    np.testing.assert_allclose(result.stderr, [0.0, 0.0], atol=1e-12)
+
+
+def test_linear_drift_reports_nan_for_degenerate_series():
+    assert np.isnan(linear_drift([], []).slope)
+    assert np.isnan(linear_drift([1.0, 2.0], [1.0, 3.0]).stderr)
+
+
+def test_rolling_drift_matches_per_window_fits():
+    rng = np.random.default_rng(1)
+    time = np.arange(500.0)
+    values = np.sin(time / 50) + rng.normal(scale=0.1, size=time.size)
+
+    result = rolling_drift(time, np.column_stack([values, 2 * values]), 40)
+
+    assert result.slope.shape == (461, 2)
+    for start in (0, 123, 460):
+        reference = stats.linregress(time[start:start + 40],
+                                     values[start:start + 40])
+        assert result.slope[start, 0] == pytest.approx(reference.slope)
+        assert result.slope[start, 1] == pytest.approx(2 * reference.slope)
+        assert result.stderr[start, 0] == pytest.approx(reference.stderr)
+
+
+def test_rolling_drift_rejects_invalid_windows():
+    with pytest.raises(ValueError, match="positive"):
+        rolling_drift([1.0, 2.0], [1.0, 2.0], 0)
+    with pytest.raises(ValueError, match="larger"):
+        rolling_drift([1.0, 2.0], [1.0, 2.0], 3)
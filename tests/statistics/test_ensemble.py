@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.statistics import ensemble_statistics
+
+
+def test_ensemble_statistics_reduce_along_replica_axis():
+    stack = np.random.default_rng(0).normal(size=(8, 500))
+
+    ensemble = ensemble_statistics(stack)
+
+    assert ensemble.replicas == 8
+    np.testing.assert_allclose(ensemble.mean, stack.mean(axis=0))
+    np.testing.assert_allclose(ensemble.std_dev, stack.std(axis=0, ddof=1))
+    np.testing.assert_array_equal(ensemble.minimum, stack.min(axis=0))
+    np.testing.assert_array_equal(ensemble.maximum, stack.max(axis=0))
+
+
+@pytest.mark.parametrize(
+    ("stack", "message"),
+    [
+        ([1.0, 2.0], "two-dimensional"),
+        ([[1.0, 2.0]], "at least two replicas"),
+    ],
+)
+def test_ensemble_statistics_reject_invalid_stacks(stack, message):
+    with pytest.raises(ValueError, match=message):
+        ensemble_statistics(stack)
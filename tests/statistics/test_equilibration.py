@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.statistics import (
+    autocorrelation,
+    detect_equilibration,
+    statistical_inefficiency,
+)
+
+
+def ar1(size, phi, rng):
+    noise = rng.normal(size=size)
+    values = np.empty(size)
+    values[0] = noise[0]
+    for index in range(1, size):
+        values[index] = phi * values[index - 1] + noise[index]
+    return values
+
+
+def test_autocorrelation_is_normalized_and_handles_constants():
+    correlation = autocorrelation([1.0, 2.0, 1.0, 2.0])
+
+    assert correlation[0] == pytest.approx(1.0)
+    assert correlation[1] == pytest.approx(-0.75)
+    assert autocorrelation(np.ones(4)).tolist() == [1.0, 0.0, 0.0, 0.0]
+
+
+def test_statistical_inefficiency_matches_ar1_expectation():
+    rng = np.random.default_rng(0)
+    values = ar1(200000, 0.9, rng)
+
+    assert statistical_inefficiency(values) == pytest.approx(19.0, rel=0.1)
+    assert statistical_inefficiency(rng.normal(size=10000)) < 1.2
+    assert statistical_inefficiency([1.0]) == 1.0
+
+
+def test_detect_equilibration_finds_transient_end():
+    rng = np.random.default_rng(2)
+    values = np.r_[np.linspace(20, 0, 500), np.zeros(4500)]
+    values += rng.normal(size=values.size)
+
+    result = detect_equilibration(values)
+
+    assert 300 <= result.start <= 700
+    assert result.statistical_inefficiency >= 1.0
+    assert result.effective_samples > 1000
+
+
+def test_detect_equilibration_keeps_stationary_series():
+    rng = np.random.default_rng(3)
+
+    assert detect_equilibration(rng.normal(size=5000)).start < 100
+    assert detect_equilibration([4.0]).start == 0
+
+
+def test_detect_equilibration_rejects_empty_series():
+    with pytest.raises(ValueError, match="empty series"):
+        detect_equilibration([])
+
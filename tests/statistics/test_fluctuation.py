@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+from scipy.signal import lfilter
+
+from PQEnalyzer.statistics import (
+    COMPRESSIBILITY,
+    HEAT_CAPACITY,
+    FluctuationAccumulator,
+    FluctuationMonitor,
+    statistics_executor,
+)
+
+
+class FakeNptEnergy:
+
+    def __init__(self, temperature, total=None, volume=None):
+        self.info = {"SIMULATION-TIME": "TIME", "TEMPERATURE": "TEMPERATURE"}
+        self.data = {"TEMPERATURE": np.asarray(temperature, dtype=float)}
+        for name, values in (("E(TOT)", total), ("VOLUME", volume)):
+            if values is not None:
+                self.info[name] = name
+                self.data[name] = np.asarray(values, dtype=float)
+        self.simulation_time = np.arange(len(temperature), dtype=float)
+
+
+def ar1_series(size, phi, seed=0):
+    noise = np.random.default_rng(seed).normal(size=size)
+    return lfilter([1.0], [1.0, -phi], noise)
+
+
+def test_heat_capacity_matches_energy_variance():
+    rng = np.random.default_rng(0)
+    temperature = 300 + rng.normal(size=20000)
+    total = -186000 + 3 * ar1_series(20000, 0.5)
+
+    estimate = FluctuationAccumulator(HEAT_CAPACITY).update(
+        total, temperature).estimate()
+
+    expected = np.var(total) / (0.0019872043 * np.mean(temperature)**2)
+    assert estimate.value == pytest.approx(expected, rel=1e-9)
+    assert estimate.rows == 20000
+    assert 16 <= estimate.blocks < 32
+    assert 0 < estimate.error < 0.1 * estimate.value
+    assert estimate.describe().startswith("C_V: ")
+    assert estimate.describe().endswith(" kcal/mol/K")
+
+
+def test_compressibility_of_water_like_volume_fluctuations():
+    # var(V) = kappa k_B T <V> for kappa = 4.5e-5 1/bar at 300 K
+    mean = 30000.0
+    scale = np.sqrt(4.5e-5 * 138.0649 * 300 * mean)
+    volume = mean + scale * np.random.default_rng(1).normal(size=50000)
+
+    estimate = FluctuationAccumulator(COMPRESSIBILITY).update(
+        volume, np.full(volume.size, 300.0)).estimate()
+
+    assert estimate.value == pytest.approx(4.5e-5, rel=0.02)
+    assert estimate.error == pytest.approx(4.5e-5 * np.sqrt(2 / 50000),
+                                           rel=0.5)
+
+
+def test_incremental_updates_match_single_pass():
+    temperature = 300 + ar1_series(30000, 0.9, seed=2)
+    total = ar1_series(30000, 0.9, seed=3)
+    whole = FluctuationAccumulator(HEAT_CAPACITY).update(total, temperature)
+    incremental = FluctuationAccumulator(HEAT_CAPACITY)
+
+    for rows in (1, 15, 16, 17, 600, 12345, 30000):
+        incremental.update(total[:rows], temperature[:rows])
+
+    assert incremental.block_size == whole.block_size
+    np.testing.assert_allclose(incremental.blocks, whole.blocks)
+    np.testing.assert_allclose(incremental.convergence, whole.convergence)
+    assert incremental.estimate().error == pytest.approx(
+        whole.estimate().error)
+
+
+def test_block_error_grows_with_correlation_time():
+    temperature = np.full(40000, 300.0)
+    uncorrelated = FluctuationAccumulator(HEAT_CAPACITY).update(
+        ar1_series(40000, 0.0), temperature).estimate()
+    correlated = FluctuationAccumulator(HEAT_CAPACITY).update(
+        ar1_series(40000, 0.95) * np.sqrt(1 - 0.95**2),
+        temperature).estimate()
+
+    assert correlated.value == pytest.approx(uncorrelated.value, rel=0.2)
+    assert correlated.error > 3 * uncorrelated.error
+
+
+def test_missing_rows_are_skipped_and_rewrites_restart():
+    temperature = np.full(100, 300.0)
+    total = np.arange(100.0)
+    total[10] = np.nan
+    accumulator = FluctuationAccumulator(HEAT_CAPACITY)
+
+    accumulator.update(total, temperature)
+
+    assert accumulator.totals[0] == 99
+    assert accumulator.convergence[10] == accumulator.convergence[9]
+    assert accumulator.estimate().value == pytest.approx(
+        np.nanvar(total) / (0.0019872043 * 300.0**2))
+
+    accumulator.update(total[:50] + 1.0, temperature[:50])
+
+    assert accumulator.rows == 50
+    assert accumulator.totals[0] == 49
+
+
+def test_monitor_estimates_available_properties_across_files():
+    temperature = 300 + ar1_series(4000, 0.5, seed=4)
+    total = ar1_series(4000, 0.5, seed=5)
+    volume = 1000 + ar1_series(4000, 0.5, seed=6)
+    energies = [
+        FakeNptEnergy(temperature[:2500], total[:2500], volume[:2500]),
+        FakeNptEnergy(temperature[2500:], total[2500:], volume[2500:]),
+    ]
+    executor = statistics_executor(2)
+    try:
+        status = FluctuationMonitor(executor=executor).update(energies)
+    finally:
+        executor.shutdown()
+
+    assert list(status) == ["E(TOT)", "VOLUME"]
+    assert status["E(TOT)"].value == pytest.approx(
+        np.var(total) / (0.0019872043 * np.mean(temperature)**2))
+    assert status["VOLUME"].value == pytest.approx(
+        np.var(volume) / (138.0649 * np.mean(temperature) * np.mean(volume)))
+
+
+def test_monitor_converts_columns_to_the_property_units():
+    temperature = 300 + ar1_series(4000, 0.5, seed=7)
+    total = ar1_series(4000, 0.5, seed=8)
+    volume = 1000 + ar1_series(4000, 0.5, seed=9)
+    reference = FluctuationMonitor().update(
+        [FakeNptEnergy(temperature, total, volume)])
+    converted = FakeNptEnergy(temperature - 273.15, 4.184 * total,
+                              volume / 1000)
+    converted.units = {"TEMPERATURE": "C", "E(TOT)": "kJ/mol",
+                       "VOLUME": "nm^3"}
+
+    status = FluctuationMonitor().update([converted])
+
+    for column, estimate in status.items():
+        assert estimate.value == pytest.approx(reference[column].value)
+
+
+def test_monitor_needs_temperature_and_a_fluctuating_column():
+    assert FluctuationMonitor.properties(
+        [FakeNptEnergy([300.0], volume=[1.0])]) == [COMPRESSIBILITY]
+    assert not FluctuationMonitor.supports([FakeNptEnergy([300.0])])
+    energy = FakeNptEnergy([300.0], total=[1.0])
+    del energy.info["TEMPERATURE"]
+    assert not FluctuationMonitor.supports([energy])
+    assert not FluctuationMonitor.supports([])
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.statistics import (
+    LiveStatistics,
+    OutlierDetector,
+    Statistic,
+    outlier_mask,
+    rolling_median_mad,
+)
+
+
+def spiky_series(size=5000, seed=0):
+    values = np.random.default_rng(seed).normal(size=size)
+    spikes = np.array([0, 120, 2500, 2501, size - 1])
+    values[spikes] += 50.0
+    return values, spikes
+
+
+def test_outlier_mask_flags_spikes_including_series_edges():
+    values, spikes = spiky_series()
+
+    np.testing.assert_array_equal(np.flatnonzero(outlier_mask(values)),
+                                  spikes)
+
+
+def test_outlier_mask_ignores_constant_windows_and_missing_values():
+    values = np.r_[np.zeros(100), 3.0, np.zeros(100)]
+    noisy = np.random.default_rng(1).normal(size=200)
+    noisy[50] = np.nan
+
+    assert not outlier_mask(values).any()
+    assert not outlier_mask(noisy)[50]
+
+
+def test_rolling_median_mad_matches_window_reductions():
+    values = np.random.default_rng(2).normal(size=300)
+    median, mad = rolling_median_mad(values, 20)
+
+    windows = np.lib.stride_tricks.sliding_window_view(values, 21)
+    np.testing.assert_allclose(median[10:-10], np.median(windows, axis=1))
+    np.testing.assert_allclose(median[:10], median[10])
+    assert mad.shape == values.shape
+
+
+def test_outlier_detector_matches_full_scan_for_any_update_blocks():
+    values, spikes = spiky_series()
+    live = LiveStatistics()
+    for end in (1, 30, 75, 76, 400, 2499, 2502, 4000, values.size):
+        mask = live.outliers("PARAMETER", values[:end])
+        np.testing.assert_array_equal(mask, outlier_mask(values[:end]))
+
+    detector = OutlierDetector().update(values)
+    assert detector.count == spikes.size
+
+
+def test_statistics_skip_masked_rows():
+    values, _ = spiky_series()
+    mask = outlier_mask(values)
+    time = np.arange(values.size)
+
+    mean = Statistic.mean_values(time, values, mask=mask)[1][0]
+    median = Statistic.median_values(time, values, mask=mask)[1][0]
+
+    assert mean == pytest.approx(np.mean(values[~mask]))
+    assert median == pytest.approx(np.median(values[~mask]))
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"window_size": 2}, "at least three rows"),
+        ({"threshold": 0.0}, "must be positive"),
+    ],
+)
+def test_outlier_mask_rejects_invalid_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        outlier_mask(np.arange(10.0), **kwargs)
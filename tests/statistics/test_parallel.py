@@ -0,0 +1,46 @@
+import threading
+
+import pytest
+
+from PQEnalyzer.statistics import (
+    default_workers,
+    ordered_map,
+    statistics_executor,
+)
+
+
+def test_statistics_executor_is_sequential_for_one_worker():
+    assert statistics_executor() is None
+    with pytest.raises(ValueError, match="must not be negative"):
+        statistics_executor(-1)
+
+
+def test_ordered_map_keeps_item_order_on_thread_pool():
+    executor = statistics_executor(4)
+    threads = set()
+
+    def square(value):
+        threads.add(threading.current_thread().name)
+        return value * value
+
+    try:
+        assert ordered_map(square, range(32), executor) == [
+            value * value for value in range(32)]
+    finally:
+        executor.shutdown()
+
+    assert all(name.startswith("pqenalyzer-statistics")
+               for name in threads)
+
+
+def test_zero_workers_use_all_cores():
+    executor = statistics_executor(0)
+    try:
+        expected = default_workers()
+        if expected == 1:
+            assert executor is None
+        else:
+            assert executor._max_workers == expected
+    finally:
+        if executor is not None:
+            executor.shutdown()
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.statistics import (
+    LiveStatistics,
+    QuantileSketch,
+    StreamingQuantiles,
+)
+
+
+def rank_errors(values, estimates, quantiles):
+    sorted_values = np.sort(values)
+    ranks = np.searchsorted(sorted_values, estimates) / sorted_values.size
+    return np.abs(ranks - quantiles)
+
+
+def test_sketch_is_exact_before_compaction():
+    sketch = QuantileSketch()
+    sketch.update([4.0, 1.0, 3.0, 2.0, np.nan])
+
+    assert sketch.count == 4
+    assert sketch.median() == 2.5
+    assert np.allclose(sketch.quantiles([0, 0.25, 1]),
+                       np.quantile([1, 2, 3, 4], [0, 0.25, 1]))
+
+
+def test_sketch_keeps_rank_error_with_bounded_memory():
+    values = np.random.default_rng(1).normal(size=200_000)
+    quantiles = np.array([0.05, 0.25, 0.5, 0.75, 0.95])
+    sketch = QuantileSketch(rank_error=0.01)
+
+    for block in np.array_split(values, 500):
+        sketch.update(block)
+
+    assert sketch.count == values.size
+    assert sketch.size <= 3 * sketch.k
+    assert np.all(rank_errors(values, sketch.quantiles(quantiles),
+                              quantiles) < 0.01)
+    assert sketch.quantile(0) == values.min()
+    assert sketch.quantile(1) == values.max()
+
+
+def test_merged_sketches_match_combined_data():
+    values = np.random.default_rng(2).exponential(size=100_000)
+    first = QuantileSketch()
+    second = QuantileSketch()
+    first.update(values[:30_000])
+    second.update(values[30_000:])
+
+    first.merge(second)
+
+    assert first.count == values.size
+    assert rank_errors(values, [first.median()], [0.5])[0] < 0.01
+
+
+def test_sketch_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        QuantileSketch(rank_error=0)
+
+    with pytest.raises(ValueError):
+        QuantileSketch().quantiles([1.5])
+
+    assert np.isnan(QuantileSketch().median())
+
+
+def test_streaming_quantiles_consume_only_appended_rows():
+    accumulator = StreamingQuantiles()
+
+    accumulator.update([1.0, 2.0, 3.0])
+    accumulator.update([1.0, 2.0, 3.0, 10.0, 11.0])
+
+    assert accumulator.rows == 5
+    assert accumulator.sketch.count == 5
+    assert accumulator.sketch.median() == 3.0
+
+
+def test_streaming_quantiles_restart_after_rewrite():
+    accumulator = StreamingQuantiles()
+
+    accumulator.update([1.0, 2.0, 3.0])
+    accumulator.update([5.0, 6.0])
+    assert accumulator.sketch.count == 2
+
+    accumulator.update([7.0, 8.0, 9.0])
+    assert accumulator.sketch.count == 3
+    assert accumulator.sketch.median() == 8.0
+
+
+def test_live_statistics_reuses_parameter_sketches():
+    live = LiveStatistics()
+
+    first = live.quantiles("PARAMETER", [1.0, 2.0])
+    second = live.quantiles("PARAMETER", [1.0, 2.0, 3.0])
+
+    assert first is second
+    assert second.count == 3
+    assert live.quantiles("OTHER", [1.0]).count == 1
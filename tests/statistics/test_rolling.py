@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from numpy.lib.stride_tricks import sliding_window_view
+
+from PQEnalyzer.statistics import (
+    rolling_max,
+    rolling_mean_std,
+    rolling_min,
+    rolling_quantile,
+    window_centers,
+)
+
+
+@pytest.mark.parametrize("window_size", [1, 2, 7, 64, 1000])
+def test_rolling_statistics_match_window_slices(window_size):
+    values = 300 + np.random.default_rng(0).normal(size=1000).cumsum()
+    windows = sliding_window_view(values, window_size)
+
+    mean, std_dev = rolling_mean_std(values, window_size)
+
+    np.testing.assert_allclose(mean, windows.mean(axis=1))
+    np.testing.assert_allclose(std_dev, windows.std(axis=1), atol=1e-5)
+    np.testing.assert_array_equal(rolling_min(values, window_size),
+                                  windows.min(axis=1))
+    np.testing.assert_array_equal(rolling_max(values, window_size),
+                                  windows.max(axis=1))
+
+
+def test_window_centers_average_time_inside_windows():
+    np.testing.assert_allclose(window_centers([0, 1, 2, 4], 2),
+                               [0.5, 1.5, 3.0])
+
+
+def test_rolling_statistics_reject_invalid_windows():
+    with pytest.raises(ValueError, match="positive"):
+        rolling_min([1.0, 2.0], 0)
+
+    with pytest.raises(ValueError, match="larger"):
+        rolling_mean_std([1.0, 2.0], 3)
+
+    with pytest.raises(ValueError, match="Quantile"):
+        rolling_quantile([1.0, 2.0], 2, 1.5)
+
+    with pytest.raises(ValueError, match="Stride"):
+        rolling_quantile([1.0, 2.0], 2, 0.5, stride=0)
+
+
+@pytest.mark.parametrize("window_size", [1, 4, 15])
+@pytest.mark.parametrize("quantile", [0.0, 0.05, 0.5, 0.95, 1.0])
+def test_rolling_quantile_selects_window_order_statistics(window_size,
+                                                          quantile):
+    values = np.random.default_rng(1).normal(size=200)
+    rank = min(int(quantile * window_size), window_size - 1)
+    expected = np.sort(sliding_window_view(values, window_size),
+                       axis=1)[:, rank]
+
+    np.testing.assert_array_equal(
+        rolling_quantile(values, window_size, quantile), expected)
+    np.testing.assert_array_equal(
+        rolling_quantile(values, window_size, quantile, stride=7),
+        expected[::7])
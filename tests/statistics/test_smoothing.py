@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from scipy.signal import savgol_filter
+
+from PQEnalyzer.statistics import (
+    ExponentialMovingAverage,
+    SavitzkyGolaySmoother,
+    exponential_moving_average,
+    savitzky_golay,
+)
+
+
+def test_exponential_moving_average_matches_recursive_definition():
+    values = np.random.default_rng(0).normal(size=200)
+    alpha = 2 / (10 + 1)
+    expected = np.empty_like(values)
+    expected[0] = values[0]
+    for index in range(1, values.size):
+        expected[index] = (alpha * values[index]
+                           + (1 - alpha) * expected[index - 1])
+
+    np.testing.assert_allclose(exponential_moving_average(values, 10),
+                               expected)
+    assert exponential_moving_average([], 10).size == 0
+
+    with pytest.raises(ValueError, match="Span"):
+        exponential_moving_average(values, 0)
+
+
+@pytest.mark.parametrize("window_size", [5, 20, 501])
+def test_savitzky_golay_matches_scipy_interp_mode(window_size):
+    values = np.random.default_rng(1).normal(size=5000).cumsum()
+    window = window_size | 1
+
+    np.testing.assert_allclose(
+        savitzky_golay(values, window_size),
+        savgol_filter(values, window, 3, mode="interp"),
+        atol=1e-9,
+    )
+
+
+def test_savitzky_golay_shrinks_window_for_short_series():
+    assert savitzky_golay([1.0, 2.0, 3.0], 11).tolist() == [1.0, 2.0, 3.0]
+    assert savitzky_golay(np.arange(6.0), 11).size == 6
+
+
+@pytest.mark.parametrize("window_size", [1, 4, 21])
+def test_smoothing_accumulators_match_batch_results(window_size):
+    values = np.random.default_rng(2).normal(size=2000).cumsum()
+    average = ExponentialMovingAverage(window_size)
+    smoother = SavitzkyGolaySmoother(window_size)
+
+    for rows in (1, 2, 3, 9, 40, 41, 500, 2000):
+        np.testing.assert_allclose(
+            average.update(values[:rows]).values,
+            exponential_moving_average(values[:rows], window_size),
+        )
+        np.testing.assert_allclose(
+            smoother.update(values[:rows]).values,
+            savitzky_golay(values[:rows], window_size),
+            atol=1e-9,
+        )
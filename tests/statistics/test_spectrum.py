@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from scipy.signal import welch
+
+from PQEnalyzer.statistics import (
+    dominant_frequency,
+    sample_spacing,
+    welch_psd,
+)
+
+
+@pytest.mark.parametrize("segment_size", [255, 1000, 4096])
+def test_welch_psd_matches_scipy(segment_size):
+    values = np.random.default_rng(0).normal(size=20001)
+
+    frequencies, psd = welch_psd(values, 0.25, segment_size)
+    expected_frequencies, expected = welch(values, fs=4.0,
+                                           nperseg=segment_size)
+
+    np.testing.assert_allclose(frequencies, expected_frequencies)
+    np.testing.assert_allclose(psd, expected)
+
+
+def test_welch_psd_finds_thermostat_oscillation_and_shrinks_segments():
+    time = np.arange(1000) * 0.002
+    values = 300 + 5 * np.sin(2 * np.pi * 25.0 * time)
+
+    frequencies, psd = welch_psd(values, sample_spacing(time))
+
+    assert frequencies.size == 501
+    assert dominant_frequency(frequencies, psd) == pytest.approx(25.0)
+
+
+def test_sample_spacing_ignores_restart_gaps():
+    assert sample_spacing([0.0, 1.0, 2.0, 3.0, 10.0, 11.0]) == 1.0
+    with pytest.raises(ValueError, match="must increase"):
+        sample_spacing([2.0, 1.0, 0.0])
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"spacing": 0.0}, "spacing must be positive"),
+        ({"segment_size": 1}, "at least two"),
+        ({"overlap": 1.0}, "between zero and one"),
+    ],
+)
+def test_welch_psd_rejects_invalid_arguments(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        welch_psd(np.arange(10.0), **kwargs)
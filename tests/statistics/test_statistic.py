@@ -3,7 +3,7 @@ import numpy as np
 
 from PQAnalysis.traj import MDEngineFormat
 
-from PQEnalyzer.statistics import Statistic
+from PQEnalyzer.statistics import QuantileSketch, Statistic
 from PQEnalyzer.readers import Reader
 
 
@@ -45,6 +45,23 @@ class TestStatistic:
         assert np.all(time == [6, 10])
         assert np.all(median == [8, 8])
 
+    def test_quantile(self):
+        time, quantile = Statistic.quantile_values([1, 2, 3, 4],
+                                                   [1, 2, 3, 4], 0.25)
+        assert np.all(time == [1, 4])
+        assert np.allclose(quantile, [1.75, 1.75])
+
+        sketch = QuantileSketch()
+        sketch.update([1, 2, 3, 4, 5])
+        time, median = Statistic.median_values([1, 2, 3, 4, 5],
+                                               [1, 2, 3, 4, 5],
+                                               sketch=sketch)
+        assert np.all(time == [1, 5])
+        assert np.all(median == [3, 3])
+
+        with pytest.raises(ValueError):
+            Statistic.quantile_values([1, 2], [1, 2], 2)
+
     def test_cumulative_average(self):
         time, cumulative_average = Statistic.cumulative_average_values(
             [1, 2, 3, 4, 5], [1, 2, 3, 4, 5])
@@ -158,3 +175,28 @@ class TestStatistic:
 
         with pytest.raises(ValueError):
             Statistic.running_average(energies2, "SIMULATION-TIME", -1)
+
+    def test_trend_and_rolling_drift_values(self):
+        time, values = Statistic.trend_values([0, 1, 2], [1.0, 2.0, 3.0])
+        np.testing.assert_allclose(time, [0, 2])
+        np.testing.assert_allclose(values, [1.0, 3.0])
+
+        centers, slopes = Statistic.rolling_drift_values(
+            [0, 1, 2, 3], [1.0, 2.0, 4.0, 8.0], 2)
+        np.testing.assert_allclose(centers, [0.5, 1.5, 2.5])
+        np.testing.assert_allclose(slopes, [1.0, 2.0, 4.0])
+
+    def test_rolling_band_values(self):
+        time, mean, std_dev = Statistic.rolling_std_values(
+            [0, 1, 2], [1.0, 3.0, 3.0], 2)
+        np.testing.assert_allclose(time, [0.5, 1.5])
+        np.testing.assert_allclose(mean, [2.0, 3.0])
+        np.testing.assert_allclose(std_dev, [1.0, 0.0])
+
+        time, minimum = Statistic.rolling_min_values([0, 1, 2],
+                                                     [3.0, 1.0, 2.0], 2)
+        _, maximum = Statistic.rolling_max_values([0, 1, 2],
+                                                  [3.0, 1.0, 2.0], 2)
+        np.testing.assert_allclose(time, [0.5, 1.5])
+        np.testing.assert_allclose(minimum, [1.0, 1.0])
+        np.testing.assert_allclose(maximum, [3.0, 2.0])
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.statistics import (
+    CumulativeAverage,
+    LiveStatistics,
+    SeriesAccumulator,
+    StreamingHistogram,
+)
+
+
+def test_cumulative_average_extends_running_sum():
+    live = LiveStatistics()
+
+    first = live.cumulative_average("PARAMETER", [1.0, 2.0, 3.0])
+    second = live.cumulative_average("PARAMETER", [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    assert np.allclose(first, [1, 1.5, 2])
+    assert np.allclose(second, [1, 1.5, 2, 2.5, 3])
+
+
+def test_cumulative_average_restarts_after_rewrite():
+    accumulator = CumulativeAverage()
+
+    accumulator.update([1.0, 2.0, 3.0])
+    accumulator.update([10.0, 20.0])
+
+    assert accumulator.rows == 2
+    assert np.allclose(accumulator.values, [10, 15])
+
+
+def test_accumulator_restarts_when_series_shifts_with_equal_last_row():
+    accumulator = CumulativeAverage()
+    values = np.r_[100.0, np.full(9, 298.15)]
+
+    accumulator.update(values[:5])
+    accumulator.update(values[1:])
+
+    assert accumulator.rows == 9
+    assert np.allclose(accumulator.values, 298.15)
+
+
+def test_live_accumulators_restart_when_series_start_moves():
+    live = LiveStatistics()
+    values = np.r_[100.0, 50.0, np.full(8, 298.15)]
+
+    live.cumulative_average("TEMPERATURE", values[:6])
+    trimmed = live.cumulative_average("TEMPERATURE", values[2:], start=2)
+
+    assert trimmed.size == 8
+    assert np.allclose(trimmed, 298.15)
+
+
+def test_series_accumulator_requires_extend_and_clear():
+    with pytest.raises(TypeError):
+        SeriesAccumulator()
+
+
+def test_running_moments_merge_appended_blocks():
+    live = LiveStatistics()
+    values = np.random.default_rng(0).normal(1e4, 2.0, size=5000)
+
+    for rows in (1, 2, 100, 4999, 5000):
+        moments = live.moments("PARAMETER", values[:rows])
+
+    assert moments.count == 5000
+    assert moments.mean == pytest.approx(values.mean())
+    assert moments.variance == pytest.approx(values.var(ddof=1))
+    assert (moments.minimum, moments.maximum) == (values.min(), values.max())
+
+
+def test_adaptive_histogram_doubles_bins_to_cover_new_values():
+    values = np.random.default_rng(1).standard_t(3, size=20000)
+    histogram = StreamingHistogram(bins=64)
+
+    for rows in range(100, values.size + 1, 3900):
+        histogram.update(values[:rows])
+    histogram.update(values)
+
+    expected, _ = np.histogram(values, bins=histogram.edges)
+    assert histogram.edges[0] <= values.min()
+    assert histogram.edges[-1] >= values.max()
+    np.testing.assert_array_equal(histogram.counts, expected)
+
+
+def test_fixed_histogram_density_is_normalized_over_its_bins():
+    values = np.random.default_rng(2).normal(size=50000)
+    histogram = StreamingHistogram(bins=200, edges=(-6, 6))
+
+    centers, density = histogram.update(values).density()
+
+    assert histogram.counts.sum() == values.size
+    assert centers[0] <= values.min() + histogram.width
+    assert np.sum(density) * histogram.width == pytest.approx(1, abs=1e-3)
+    peak = np.exp(-0.5 * centers**2) / np.sqrt(2 * np.pi)
+    np.testing.assert_allclose(density, peak, atol=0.02)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.statistics import (
+    decorrelated,
+    statistical_inefficiency,
+    subsampling_stride,
+)
+
+
+def ar1_series(size, phi, seed=0):
+    noise = np.random.default_rng(seed).normal(size=size)
+    values = np.empty(size)
+    values[0] = noise[0]
+    for index in range(1, size):
+        values[index] = phi * values[index - 1] + noise[index]
+    return values
+
+
+def test_subsampling_stride_rounds_up_statistical_inefficiency():
+    values = ar1_series(20000, 0.9)
+
+    stride = subsampling_stride(values)
+
+    # g = (1 + phi) / (1 - phi) = 19 for an AR(1) process
+    assert stride == np.ceil(statistical_inefficiency(values))
+    assert 14 <= stride <= 24
+
+
+def test_subsampling_stride_is_one_for_uncorrelated_and_short_series():
+    assert subsampling_stride(ar1_series(20000, 0.0)) in (1, 2)
+    assert subsampling_stride([3.0]) == 1
+    assert subsampling_stride(np.full(10, 2.0)) == 1
+
+
+def test_decorrelated_samples_are_approximately_uncorrelated_view():
+    values = ar1_series(20000, 0.9)
+
+    samples = decorrelated(values)
+
+    assert np.shares_memory(samples, values)
+    assert samples.size == -(-values.size // subsampling_stride(values))
+    lag_one = np.corrcoef(samples[:-1], samples[1:])[0, 1]
+    assert abs(lag_one) < 0.3
+
+
+def test_decorrelated_rejects_invalid_stride():
+    with pytest.raises(ValueError, match="at least one"):
+        decorrelated(np.arange(5.0), stride=0)
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.statistics import statistics_executor, summarize_columns
+
+
+def test_summarize_columns_matches_nan_aware_reductions():
+    rng = np.random.default_rng(0)
+    block = np.asfortranarray(rng.normal(size=(50000, 4)))
+    block[10, 1] = np.nan
+    block[20:30, 3] = np.nan
+
+    summary = summarize_columns(block)
+
+    assert summary.rows == 50000
+    np.testing.assert_array_equal(summary.count, [50000, 49999, 50000, 49990])
+    np.testing.assert_array_equal(summary.latest, block[-1])
+    np.testing.assert_allclose(summary.mean, np.nanmean(block, axis=0))
+    np.testing.assert_allclose(summary.median, np.nanmedian(block, axis=0))
+    np.testing.assert_allclose(summary.std_dev, np.nanstd(block, axis=0))
+    np.testing.assert_array_equal(summary.minimum, np.nanmin(block, axis=0))
+    np.testing.assert_array_equal(summary.maximum, np.nanmax(block, axis=0))
+
+
+def test_summarize_columns_applies_per_column_starts():
+    summary = summarize_columns([[1.0, 5.0], [2.0, 6.0], [3.0, 7.0]],
+                                starts=[1, 2])
+
+    np.testing.assert_array_equal(summary.count, [2, 1])
+    np.testing.assert_array_equal(summary.latest, [3.0, 7.0])
+    np.testing.assert_array_equal(summary.mean, [2.5, 7.0])
+    np.testing.assert_array_equal(summary.minimum, [2.0, 7.0])
+
+
+def test_summarize_columns_leaves_out_excluded_values():
+    block = [[1.0, 5.0], [90.0, 6.0], [3.0, 70.0]]
+    excluded = [[False, False], [True, False], [False, True]]
+
+    summary = summarize_columns(block, excluded=excluded)
+
+    np.testing.assert_array_equal(summary.count, [2, 2])
+    np.testing.assert_array_equal(summary.latest, [3.0, 70.0])
+    np.testing.assert_array_equal(summary.mean, [2.0, 5.5])
+    np.testing.assert_array_equal(summary.maximum, [3.0, 6.0])
+
+
+def test_summarize_columns_can_skip_exact_medians():
+    summary = summarize_columns([[1.0, 4.0], [3.0, 8.0]], median=False)
+
+    np.testing.assert_array_equal(summary.mean, [2.0, 6.0])
+    assert np.isnan(summary.median).all()
+
+
+def test_summarize_columns_on_thread_pool_matches_batched_pass():
+    rng = np.random.default_rng(1)
+    block = np.asfortranarray(rng.normal(size=(5000, 5)))
+    block[7, 2] = np.nan
+    starts = [0, 10, 20, 30, 40]
+    executor = statistics_executor(3)
+
+    try:
+        concurrent = summarize_columns(block, starts, executor=executor,
+                                       excluded=block > 2.5)
+    finally:
+        executor.shutdown()
+    batched = summarize_columns(block, starts, excluded=block > 2.5)
+
+    assert concurrent.rows == batched.rows
+    for name in ("count", "latest", "mean", "median", "std_dev", "minimum",
+                 "maximum"):
+        np.testing.assert_allclose(getattr(concurrent, name),
+                                   getattr(batched, name))
+
+
+def test_summarize_columns_reports_nan_for_empty_columns():
+    summary = summarize_columns([[np.nan, 1.0], [np.nan, 2.0]])
+
+    assert np.isnan(summary.mean[0])
+    assert np.isnan(summary.median[0])
+    assert np.isnan(summary.minimum[0])
+    assert summary.median[1] == 1.5
+
+    empty = summarize_columns(np.empty((0, 2)))
+    assert empty.rows == 0
+    assert np.all(np.isnan(empty.mean))
+
+
+def test_summarize_columns_rejects_one_dimensional_input():
+    with pytest.raises(ValueError, match="two-dimensional"):
+        summarize_columns([1.0, 2.0])
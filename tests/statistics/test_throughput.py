@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.statistics import (
+    RunThroughput,
+    ThroughputMonitor,
+    format_duration,
+    statistics_executor,
+)
+
+
+class FakeLoopEnergy:
+
+    def __init__(self, time, loop_times, unit="ps"):
+        self.info = {"SIMULATION-TIME": "TIME", "LOOPTIME": "LOOPTIME"}
+        self.units = {"SIMULATION-TIME": unit, "LOOPTIME": "s"}
+        self.data = {"LOOPTIME": np.asarray(loop_times, dtype=float)}
+        self.simulation_time = np.asarray(time, dtype=float)
+
+
+def steady_run(rows=1000, step=0.5, loop_time=0.25):
+    time = np.arange(1, rows + 1) * step
+    return time, np.full(rows, loop_time)
+
+
+def test_steady_run_reports_speed_and_eta():
+    time, loop_times = steady_run()
+    monitor = ThroughputMonitor(target_time=1000.0)
+
+    report = monitor.update([FakeLoopEnergy(time, loop_times)])
+
+    status = report.runs[0]
+    # 0.5 ps every 0.25 s is 2 ps/s, 172800 ps/day or 172.8 ns/day
+    assert status.steps_per_second == pytest.approx(4.0)
+    assert status.ns_per_day == pytest.approx(172.8)
+    assert status.slowdown == pytest.approx(1.0)
+    assert status.eta == pytest.approx(250.0)
+    assert report.alarm is False
+    assert report.describe() == (
+        "Throughput 173 ns/day, 4 steps/s, slowdown x1.00, ETA 4m 10s")
+
+
+def test_incremental_updates_match_whole_run():
+    time, loop_times = steady_run()
+    loop_times = loop_times * np.random.default_rng(0).uniform(
+        0.8, 1.2, size=loop_times.size)
+    incremental = RunThroughput(window=50)
+    whole = RunThroughput(window=50)
+
+    for rows in (10, 49, 50, 51, 400, 1000):
+        incremental.update(time[:rows], loop_times[:rows])
+    whole.update(time, loop_times)
+
+    assert incremental.rows == whole.rows == 1000
+    assert incremental.fastest == pytest.approx(whole.fastest)
+    expected = whole.status("run", "ps", 800.0)
+    status = incremental.status("run", "ps", 800.0)
+    assert status.steps_per_second == pytest.approx(expected.steps_per_second)
+    assert status.slowdown == pytest.approx(expected.slowdown)
+    assert status.eta == pytest.approx(expected.eta)
+
+
+def test_slowdown_of_recent_window_raises_alert():
+    time, loop_times = steady_run()
+    loop_times[-100:] *= 2.0
+    monitor = ThroughputMonitor()
+
+    report = monitor.update([FakeLoopEnergy(time, loop_times)])
+
+    assert report.runs[0].slowdown == pytest.approx(2.0)
+    assert report.runs[0].alerts == ("slowdown x2.00",)
+    assert "ALERT: slowdown x2.00" in report.describe()
+
+
+def test_rewritten_file_restarts_accumulator():
+    time, loop_times = steady_run()
+    run = RunThroughput()
+    run.update(time, loop_times * 0.5)
+
+    run.update(time[:500], loop_times[:500])
+
+    assert run.rows == 500
+    assert run.fastest == pytest.approx(0.25)
+    assert run.status("run", "ps").slowdown == pytest.approx(1.0)
+
+
+def test_runs_without_progress_report_unknown_speed():
+    run = RunThroughput()
+    run.update([1.0], [0.0])
+
+    status = run.status("run", "step", target_time=10.0)
+
+    assert np.isnan(status.steps_per_second)
+    assert np.isnan(status.eta)
+    assert status.rate_label() == "nan step/day"
+
+
+def test_concurrent_runs_are_summarized_with_alerts():
+    time, loop_times = steady_run()
+    slow = loop_times.copy()
+    slow[-100:] *= 1.5
+    energies = [FakeLoopEnergy(time, loop_times),
+                FakeLoopEnergy(time, slow, unit="fs")]
+    executor = statistics_executor(2)
+    try:
+        report = ThroughputMonitor(target_time=1000.0, executor=executor
+                                   ).update(energies, ["fast", "slow"])
+    finally:
+        executor.shutdown()
+
+    assert [run.label for run in report.runs] == ["fast", "slow"]
+    assert report.runs[1].ns_per_day == pytest.approx(172.8e-3 / 1.5)
+    assert report.alarm is True
+    assert report.describe().startswith("Throughput 2 runs ")
+    assert "last ETA 6m 15s" in report.describe()
+    assert report.describe().endswith("ALERT: slow slowdown x1.50")
+
+
+def test_monitor_supports_only_energies_with_loop_times():
+    time, loop_times = steady_run(rows=3)
+    energy = FakeLoopEnergy(time, loop_times)
+
+    assert ThroughputMonitor.supports([energy])
+    del energy.info["LOOPTIME"]
+    assert not ThroughputMonitor.supports([energy])
+    assert not ThroughputMonitor.supports([])
+
+
+def test_format_duration_keeps_two_largest_units():
+    assert format_duration(0) == "0s"
+    assert format_duration(90061) == "1d 1h"
+    assert format_duration(3605) == "1h 0m"
@@ -120,3 +120,77 @@ def test_cli_requires_app_mode():
     assert result.returncode == 2
     assert "Traceback" not in result.stderr
     assert "invalid choice" in result.stderr
+
+
+def test_cli_rejects_negative_worker_count():
+    project_root = Path(__file__).resolve().parents[1]
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "PQEnalyzer",
+            "tui",
+            "--workers",
+            "-1",
+            "examples/md-01.en",
+        ],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 2
+    assert "Traceback" not in result.stderr
+    assert "--workers must not be negative" in result.stderr
+
+
+def test_cli_rejects_invalid_derived_column():
+    project_root = Path(__file__).resolve().parents[1]
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "PQEnalyzer",
+            "tui",
+            "--derive",
+            "E_SYS=E(TOT)-VOLUME",
+            "examples/md-01.en",
+        ],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 2
+    assert "Traceback" not in result.stderr
+    assert "--derive: Derived column 'E_SYS' references unknown column" in (
+        result.stderr)
+
+
+def test_cli_rejects_unconvertible_unit():
+    project_root = Path(__file__).resolve().parents[1]
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "PQEnalyzer",
+            "tui",
+            "--unit",
+            "PRESSURE=K",
+            "examples/md-01.en",
+        ],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 2
+    assert "Traceback" not in result.stderr
+    assert "--unit: Column 'PRESSURE': Cannot convert pressure unit" in (
+        result.stderr)
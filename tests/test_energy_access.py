@@ -5,14 +5,17 @@ from PQAnalysis.io import EnergyFileReader
 from PQAnalysis.traj import MDEngineFormat
 
 from PQEnalyzer.energy_access import (
+    concatenate_block,
     concatenate_parameter,
     concatenate_series,
     concatenate_time,
     difference_series,
+    difference_stack,
     parameter_unit,
     parameter_values,
     series,
     simulation_time,
+    stack_series,
 )
 from PQEnalyzer.readers import BoxReader, Reader
 
@@ -80,6 +83,16 @@ def test_concatenate_helpers_join_series_from_multiple_energy_files():
     assert energy_series.unit == "ps"
 
 
+def test_concatenate_block_stacks_parameters_as_columns():
+    energies = [CustomEnergy([1.0, 2.0]), CustomEnergy([3.0])]
+
+    block = concatenate_block(energies, ["CUSTOM", "CUSTOM"])
+
+    np.testing.assert_array_equal(block, [[1.0, 1.0], [2.0, 2.0],
+                                          [3.0, 3.0]])
+    assert block.flags.f_contiguous
+
+
 def test_difference_series_subtracts_two_aligned_series():
     first = CustomEnergy(values=[10.0, 11.0, 12.0])
     second = CustomEnergy(values=[1.0, 2.0, 3.0])
@@ -99,12 +112,55 @@ def test_difference_series_requires_exactly_two_files():
         difference_series([energy], "CUSTOM")
 
 
-def test_difference_series_requires_matching_time_axes():
-    first = CustomEnergy(time=[1.0, 2.0, 3.0])
-    second = CustomEnergy(time=[2.0, 3.0, 4.0])
+def test_difference_series_interpolates_mismatched_time_axes():
+    first = CustomEnergy(values=[10.0, 12.0, 14.0], time=[1.0, 2.0, 3.0])
+    second = CustomEnergy(values=[1.0, 2.0, 3.0], time=[1.5, 2.5, 3.5])
 
-    with pytest.raises(ValueError, match="matching simulation-time axes"):
-        difference_series([first, second], "CUSTOM")
+    energy_series = difference_series([first, second], "CUSTOM")
+
+    np.testing.assert_array_equal(energy_series.time, [1.5, 2.5])
+    np.testing.assert_allclose(energy_series.values, [10.0, 11.0])
+
+
+def test_difference_stack_subtracts_reference_from_every_run():
+    runs = [
+        CustomEnergy(values=[1.0, 2.0, 3.0]),
+        CustomEnergy(values=[10.0, 20.0, 30.0], time=[0.0, 2.0, 4.0]),
+        CustomEnergy(values=[5.0, 5.0, 5.0]),
+    ]
+
+    energy_series = difference_stack(runs, "CUSTOM", reference=0)
+
+    np.testing.assert_array_equal(energy_series.time, [1.0, 2.0, 3.0])
+    np.testing.assert_allclose(energy_series.values,
+                               [[14.0, 18.0, 22.0], [4.0, 3.0, 2.0]])
+
+
+def test_difference_stack_resamples_onto_common_grid():
+    first = CustomEnergy(values=[0.0, 10.0, 20.0], time=[0.0, 1.0, 2.0])
+    second = CustomEnergy(values=[0.0, 3.0], time=[0.5, 2.0])
+
+    energy_series = difference_stack([first, second], "CUSTOM", spacing=0.5)
+
+    np.testing.assert_allclose(energy_series.time, [0.5, 1.0, 1.5, 2.0])
+    np.testing.assert_allclose(energy_series.values,
+                               [[5.0, 9.0, 13.0, 17.0]])
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "time", "message"),
+    [
+        ({"reference": 2}, [1.0, 2.0, 3.0], "not an input file index"),
+        ({"spacing": 0.0}, [1.0, 2.0, 3.0], "spacing must be positive"),
+        ({}, [4.0, 5.0, 6.0], "overlapping simulation-time axes"),
+        ({}, [1.0, 3.0, 2.0], "increasing simulation-time axes"),
+    ],
+)
+def test_difference_stack_rejects_invalid_alignment(kwargs, time, message):
+    runs = [CustomEnergy(time=[1.0, 2.0, 3.0]), CustomEnergy(time=time)]
+
+    with pytest.raises(ValueError, match=message):
+        difference_stack(runs, "CUSTOM", **kwargs)
 
 
 def test_difference_examples_have_nonconstant_difference():
@@ -120,6 +176,28 @@ def test_difference_examples_have_nonconstant_difference():
     assert len(np.unique(np.round(energy_series.values, decimals=6))) > 1
 
 
+def test_stack_series_truncates_replicas_to_common_prefix():
+    energies = [
+        CustomEnergy(values=[10.0, 11.0, 12.0]),
+        CustomEnergy(values=[1.0, 2.0], time=[1.0, 2.0]),
+    ]
+
+    stack = stack_series(energies, "CUSTOM")
+
+    np.testing.assert_array_equal(stack.time, [1.0, 2.0])
+    np.testing.assert_array_equal(stack.values, [[10.0, 11.0], [1.0, 2.0]])
+    assert stack.unit == "arb"
+
+
+def test_stack_series_requires_replicas_with_matching_time_axes():
+    with pytest.raises(ValueError, match="at least two input files"):
+        stack_series([CustomEnergy()], "CUSTOM")
+
+    with pytest.raises(ValueError, match="matching simulation-time axes"):
+        stack_series([CustomEnergy(), CustomEnergy(time=[2.0, 3.0, 4.0])],
+                     "CUSTOM")
+
+
 def test_energy_access_supports_box_reader_adapter():
     box_data = BoxReader(["examples/box-01.box"]).energies[0]
 
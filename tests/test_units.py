@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from PQEnalyzer.readers import create_reader
+from PQEnalyzer.units import convert_energy, convertible, unit_conversion
+
+
+@pytest.mark.parametrize(
+    ("source", "target", "values", "expected"),
+    [
+        ("kJ/mol", "kcal/mol", [4.184, -41.84], [1.0, -10.0]),
+        ("bar", "GPa", [1e4, 2.5e4], [1.0, 2.5]),
+        ("C", "K", [0.0, 25.0], [273.15, 298.15]),
+        ("K", "C", [273.15, 0.0], [0.0, -273.15]),
+        ("fs", "ps", [500.0], [0.5]),
+        ("nm^3", "A^3", [2.0], [2000.0]),
+    ],
+)
+def test_conversion_is_one_affine_map(source, target, values, expected):
+    np.testing.assert_allclose(
+        unit_conversion(source, target).apply(values), expected)
+
+
+def test_conversions_are_cached_per_unit_pair():
+    assert unit_conversion("eV", "kJ/mol") is unit_conversion("eV", "kJ/mol")
+
+
+def test_identical_unknown_units_convert_and_others_do_not():
+    assert unit_conversion("amuA/fs", "amuA/fs").identity
+    assert not convertible("amuA/fs", "kcal/mol")
+    with pytest.raises(ValueError, match="Unknown unit 'furlong'"):
+        unit_conversion("bar", "furlong")
+    with pytest.raises(ValueError, match="Cannot convert pressure unit"):
+        unit_conversion("bar", "K")
+
+
+def test_apply_converts_in_place():
+    values = np.array([1.0, 2.0])
+
+    result = unit_conversion("kcal/mol", "kJ/mol").apply(values, out=values)
+
+    assert result is values
+    np.testing.assert_allclose(values, [4.184, 8.368])
+
+
+def test_convert_energy_updates_values_and_units():
+    energy = create_reader(["examples/md-01.en"]).energies[0]
+    pressure = energy.pressure.copy()
+    total = energy.data[energy.info["E(TOT)"]].copy()
+
+    convert_energy(energy, {"PRESSURE": "GPa", "E(TOT)": "kJ/mol",
+                            "TEMPERATURE": "K"})
+
+    np.testing.assert_allclose(energy.pressure, pressure * 1e-4)
+    np.testing.assert_allclose(energy.total_energy, total * 4.184)
+    assert energy.pressure_unit == "GPa"
+    assert energy.units["E(TOT)"] == "kJ/mol"
+    assert energy.total_energy_with_unit[1] == "kJ/mol"